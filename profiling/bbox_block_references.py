@@ -0,0 +1,55 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import time
+import ezdxf
+from ezdxf import bbox
+from ezdxf.math import BoundingBox
+
+COUNT = 2000
+
+
+def make_doc():
+    doc = ezdxf.new()
+    blk = doc.blocks.new("CHAIR")
+    blk.add_lwpolyline(
+        [(0, 0), (1, 0, -0.5), (1, 1), (0, 1)], format="xyb", close=True
+    )
+    blk.add_circle((0.5, 0.5), radius=0.25)
+    blk.add_spline([(0, 0), (0.3, 0.8), (0.6, 0.2), (1, 1)])
+    msp = doc.modelspace()
+    for index in range(COUNT):
+        msp.add_blockref(
+            "CHAIR", (index % 100, index // 100), {"rotation": index % 360}
+        )
+    return doc
+
+
+def decompose_all(msp):
+    box = BoundingBox()
+    for b in bbox.multi_recursive(msp):
+        box.extend(b)
+    return box
+
+
+def block_hull_extents(msp):
+    return bbox.extents(msp)
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    msp = make_doc().modelspace()
+    t0 = run(decompose_all, msp)
+    print_result(t0, f"decomposition of {COUNT} block references")
+    t1 = run(block_hull_extents, msp)
+    print_result(t1, f"bbox.extents() of {COUNT} block references")
+    print(f"Speedup: {t0/t1:.2f}x")
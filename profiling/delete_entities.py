@@ -0,0 +1,44 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import time
+import ezdxf
+
+COUNT = 100_000
+LAYERS = 10
+
+
+def make_doc():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(COUNT):
+        msp.add_point((index, 0), dxfattribs={"layer": str(index % LAYERS)})
+    return doc
+
+
+def delete_single_entities(msp):
+    for entity in msp.query("*[layer=='0']"):
+        msp.delete_entity(entity)
+
+
+def delete_multiple_entities(msp):
+    msp.delete_entities(msp.query("*[layer=='0']"))
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    count = COUNT // LAYERS
+    t0 = run(delete_single_entities, make_doc().modelspace())
+    print_result(t0, f"delete_entity() of {count} from {COUNT} entities")
+    t1 = run(delete_multiple_entities, make_doc().modelspace())
+    print_result(t1, f"delete_entities() of {count} from {COUNT} entities")
+    print(f"Speedup: {t0/t1:.2f}x")
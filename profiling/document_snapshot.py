@@ -0,0 +1,48 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import os
+import tempfile
+import time
+import ezdxf
+
+COUNT = 50_000
+
+
+def make_dxf(filename):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(COUNT):
+        attribs = {"layer": f"L{index % 20}"}
+        msp.add_line((index, 0), (index, 1), dxfattribs=attribs)
+        if index % 5 == 0:
+            msp.add_lwpolyline(
+                [(index, 0), (index, 1), (index + 1, 1)], dxfattribs=attribs
+            )
+    doc.saveas(filename)
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        dxf = os.path.join(folder, "big.dxf")
+        snapshot = os.path.join(folder, "big.snapshot")
+        make_dxf(dxf)
+        t0 = run(ezdxf.readfile, dxf)
+        print_result(t0, f"loading DXF file with {COUNT} LINE entities")
+        t = run(ezdxf.readfile(dxf).save_snapshot, snapshot)
+        print_result(t, "saving snapshot")
+        t1 = run(ezdxf.load_snapshot, snapshot)
+        print_result(t1, "loading snapshot")
+        print(f"DXF file size: {os.path.getsize(dxf) / 1e6:.1f} MB")
+        print(f"Snapshot file size: {os.path.getsize(snapshot) / 1e6:.1f} MB")
+        print(f"Speedup: {t0/t1:.2f}x")
@@ -0,0 +1,55 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import time
+import ezdxf
+from ezdxf.addons.drawing import Frontend, RenderContext
+from ezdxf.addons.drawing.config import Configuration
+from ezdxf.addons.drawing.debug_backend import PathBackend
+
+COUNT = 2000
+
+
+def make_doc():
+    doc = ezdxf.new()
+    blk = doc.blocks.new("CHAIR")
+    blk.add_lwpolyline(
+        [(0, 0), (1, 0, -0.5), (1, 1), (0, 1)], format="xyb", close=True
+    )
+    blk.add_circle((0.5, 0.5), radius=0.25)
+    blk.add_spline([(0, 0), (0.3, 0.8), (0.6, 0.2), (1, 1)])
+    blk.add_line((0, 0), (1, 1), dxfattribs={"color": 0})
+    msp = doc.modelspace()
+    for index in range(COUNT):
+        msp.add_blockref(
+            "CHAIR", (index % 100, index // 100), {"rotation": index % 360}
+        )
+    return doc
+
+
+def draw(doc, block_instancing: bool):
+    config = Configuration.defaults().with_changes(
+        block_instancing=block_instancing
+    )
+    Frontend(RenderContext(doc), PathBackend(), config).draw_layout(
+        doc.modelspace()
+    )
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    doc = make_doc()
+    t0 = run(draw, doc, False)
+    print_result(t0, f"drawing {COUNT} block references as virtual entities")
+    t1 = run(draw, doc, True)
+    print_result(t1, f"drawing {COUNT} block references by block instancing")
+    print(f"Speedup: {t0/t1:.2f}x")
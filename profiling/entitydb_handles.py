@@ -0,0 +1,49 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import time
+from ezdxf.entitydb import EntityDB
+from ezdxf.entities import factory
+
+COUNT = 500_000
+
+
+def next_handles(db):
+    for _ in range(COUNT):
+        db.next_handle()
+
+
+def add_entities(db, entities):
+    for entity in entities:
+        db.add(entity)
+
+
+def contains(db, handles):
+    for handle in handles:
+        handle in db
+
+
+def purge(db, entities):
+    for entity in entities[::2]:
+        entity.destroy()
+    db.purge()
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    print_result(run(next_handles, EntityDB()), f"{COUNT} x next_handle()")
+    db = EntityDB()
+    entities = [factory.new("POINT") for _ in range(COUNT)]
+    print_result(run(add_entities, db, entities), f"adding {COUNT} entities")
+    handles = [e.dxf.handle for e in entities]
+    print_result(run(contains, db, handles), f"{COUNT} x __contains__()")
+    print_result(run(purge, db, entities), f"purge() of {COUNT//2} entities")
@@ -0,0 +1,105 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import time
+import math
+from ezdxf.math import Vec3, Bezier4P
+from ezdxf.path import Path, Command, flatten_paths, to_lwpolylines
+
+COUNT = 2_000
+SEGMENTS = 20
+REPEAT = 5
+DISTANCE = 0.01
+
+
+def make_paths(count):
+    paths = []
+    delta = math.tau / SEGMENTS
+    for index in range(count):
+        center = Vec3(index % 50, index // 50) * 10
+        path = Path(center + Vec3.from_angle(0, 4))
+        for segment in range(1, SEGMENTS + 1):
+            angle = segment * delta
+            end = center + Vec3.from_angle(angle, 4)
+            if segment % 2:
+                path.line_to(end)
+            else:
+                ctrl1 = center + Vec3.from_angle(angle - delta * 0.66, 4.5)
+                ctrl2 = center + Vec3.from_angle(angle - delta * 0.33, 4.5)
+                path.curve4_to(end, ctrl1, ctrl2)
+        paths.append(path)
+    return paths
+
+
+def flattening(path, distance, segments=16):
+    # Path.flattening() of ezdxf v0.17.1: yields the vertices of the
+    # Bezier4P() flattening of each curve
+    start = path.start
+    yield start
+    for cmd in path:
+        if cmd.type == Command.CURVE4_TO:
+            pts = iter(
+                Bezier4P((start, cmd.ctrl1, cmd.ctrl2, cmd.end)).flattening(
+                    distance, segments
+                )
+            )
+            next(pts)  # skip first vertex
+            yield from pts
+        else:
+            yield cmd.end
+        start = cmd.end
+
+
+def flatten_each_path(paths, count):
+    for _ in range(count):
+        for path in paths:
+            list(flattening(path, DISTANCE))
+
+
+def flatten_all_paths(paths, count):
+    for _ in range(count):
+        flatten_paths(paths, DISTANCE)
+
+
+def convert_each_path(paths, count):
+    # converter implementation of ezdxf v0.17.1
+    from ezdxf.entities import LWPolyline
+
+    for _ in range(count):
+        for path in paths:
+            p = LWPolyline.new()
+            p.append_points(flattening(path, DISTANCE, 4), format="xy")
+
+
+def convert_all_paths(paths, count):
+    for _ in range(count):
+        list(to_lwpolylines(paths, distance=DISTANCE))
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+def profile():
+    paths = make_paths(COUNT)
+    t0 = run(flatten_each_path, paths, REPEAT)
+    print_result(t0, f"{REPEAT}x flattening of {COUNT} paths one by one")
+    t1 = run(flatten_all_paths, paths, REPEAT)
+    print_result(t1, f"{REPEAT}x flatten_paths() of {COUNT} paths")
+    print(f"Speedup: {t0/t1:.2f}x\n")
+
+    t0 = run(convert_each_path, paths, REPEAT)
+    print_result(t0, f"{REPEAT}x convert {COUNT} paths one by one")
+    t1 = run(convert_all_paths, paths, REPEAT)
+    print_result(t1, f"{REPEAT}x to_lwpolylines() of {COUNT} paths")
+    print(f"Speedup: {t0/t1:.2f}x\n")
+
+
+if __name__ == "__main__":
+    profile()
@@ -0,0 +1,52 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import time
+import ezdxf
+from ezdxf import disassemble
+from ezdxf.math import BoundingBox
+
+COUNT = 5000
+
+
+def make_doc():
+    doc = ezdxf.new()
+    blk = doc.blocks.new("CHAIR")
+    blk.add_lwpolyline(
+        [(0, 0), (1, 0, -0.5), (1, 1), (0, 1)], format="xyb", close=True
+    )
+    blk.add_circle((0.5, 0.5), radius=0.25)
+    blk.add_line((0, 0), (1, 1))
+    blk.add_line((0, 1), (1, 0))
+    blk.add_spline([(0, 0), (0.3, 0.8), (0.6, 0.2), (1, 1)])
+    msp = doc.modelspace()
+    for index in range(COUNT):
+        msp.add_blockref(
+            "CHAIR", (index % 100, index // 100), {"rotation": index % 360}
+        )
+    return doc
+
+
+def control_vertices_extents(msp, flyweight):
+    entities = disassemble.recursive_decompose(msp, flyweight=flyweight)
+    primitives = disassemble.to_primitives(entities)
+    return BoundingBox(disassemble.to_control_vertices(primitives))
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    msp = make_doc().modelspace()
+    t0 = run(control_vertices_extents, msp, False)
+    print_result(t0, f"virtual entities of {COUNT} block references")
+    t1 = run(control_vertices_extents, msp, True)
+    print_result(t1, f"flyweight views of {COUNT} block references")
+    print(f"Speedup: {t0/t1:.2f}x")
@@ -0,0 +1,96 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import time
+import math
+from ezdxf.math import Vec2
+from ezdxf.entities.pattern import PatternLine
+from ezdxf.render.forms import circle
+from ezdxf.path import from_vertices
+from ezdxf.render.hatching import hatch_line_segments
+
+VERTEX_COUNT = 2_000
+RADIUS = 100
+SPACING = 0.5
+REPEAT = 3
+
+# ANSI37 like pattern: two continuous lines and a dashed line
+PATTERN = [
+    PatternLine(45, Vec2(0, 0), Vec2.from_deg_angle(135, SPACING), []),
+    PatternLine(135, Vec2(0, 0), Vec2.from_deg_angle(225, SPACING), []),
+    PatternLine(
+        45, Vec2(0, 0), Vec2.from_deg_angle(135, SPACING * 2), [2, -1]
+    ),
+]
+
+
+def make_boundary_paths():
+    # a circular boundary with a circular hole
+    return [
+        from_vertices(circle(VERTEX_COUNT, RADIUS), close=True),
+        from_vertices(circle(VERTEX_COUNT, RADIUS / 2), close=True),
+    ]
+
+
+def clip_each_hatch_line(lines, paths):
+    # brute force approach: intersect each hatch line with all boundary edges
+    polygons = [list(p.flattening(0.01)) for p in paths]
+    segments = []
+    for line in lines:
+        direction = Vec2.from_deg_angle(line.angle)
+        normal = direction.orthogonal()
+        spacing = normal.dot(line.offset)
+        distances = [normal.dot(v) for polygon in polygons for v in polygon]
+        k0 = math.ceil(min(distances) / spacing)
+        k1 = math.floor(max(distances) / spacing)
+        for k in range(min(k0, k1), max(k0, k1) + 1):
+            d = k * spacing
+            intersections = []
+            for polygon in polygons:
+                for v1, v2 in zip(polygon, polygon[1:]):
+                    d1 = normal.dot(v1) - d
+                    d2 = normal.dot(v2) - d
+                    if (d1 < 0.0) != (d2 < 0.0):
+                        ip = Vec2(v1).lerp(v2, d1 / (d1 - d2))
+                        intersections.append(direction.dot(ip))
+            intersections.sort()
+            for index in range(0, len(intersections) - 1, 2):
+                start = intersections[index]
+                end = intersections[index + 1]
+                segments.append((start, end))
+    return segments
+
+
+def brute_force(paths, count):
+    for _ in range(count):
+        clip_each_hatch_line(PATTERN, paths)
+
+
+def scanline(paths, count):
+    for _ in range(count):
+        hatch_line_segments(PATTERN, paths)
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+def profile():
+    paths = make_boundary_paths()
+    count = len(hatch_line_segments(PATTERN, paths)) // 4
+    print(f"Hatch pattern with {count} line segments:\n")
+    t0 = run(brute_force, paths, REPEAT)
+    print_result(t0, f"{REPEAT}x clipping each hatch line")
+    t1 = run(scanline, paths, REPEAT)
+    print_result(t1, f"{REPEAT}x hatch_line_segments()")
+    print(f"Speedup: {t0/t1:.2f}x\n")
+
+
+if __name__ == "__main__":
+    profile()
@@ -0,0 +1,62 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import os
+import tempfile
+import time
+import ezdxf
+from ezdxf.addons import iterdxf
+
+COUNT = 100_000
+LOOKUPS = 100
+
+
+def make_dxf(filename):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(COUNT):
+        attribs = {"layer": f"L{index % 20}"}
+        msp.add_line((index, 0), (index, 1), dxfattribs=attribs)
+    doc.saveas(filename)
+    return [e.dxf.handle for e in msp][:: COUNT // LOOKUPS]
+
+
+def scan_for_handles(filename, handles):
+    # without index: open the DXF file and scan the modelspace for each
+    # requested entity
+    for handle in handles:
+        doc = iterdxf.opendxf(filename)
+        for entity in doc.modelspace():
+            if entity.dxf.handle == handle:
+                break
+        doc.close()
+
+
+def get_handles(filename, handles):
+    for handle in handles:
+        doc = iterdxf.opendxf(filename, sidecar=True)
+        doc.get(handle)
+        doc.close()
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        filename = os.path.join(folder, "big.dxf")
+        handles = make_dxf(filename)
+        t0 = run(scan_for_handles, filename, handles[:10])
+        print_result(t0, "10 lookups by scanning the modelspace")
+        t = run(get_handles, filename, handles[:1])
+        print_result(t, "building the sidecar index")
+        t1 = run(get_handles, filename, handles[:10])
+        print_result(t1, "10 lookups by the sidecar index")
+        print(f"Speedup: {t0/t1:.2f}x")
@@ -0,0 +1,66 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import os
+import tempfile
+import time
+import ezdxf
+from ezdxf.addons import iterdxf
+
+COUNT = 100_000
+
+
+def make_dxf(filename):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(COUNT):
+        attribs = {"layer": f"L{index % 20}"}
+        msp.add_line((index, 0), (index, 1), dxfattribs=attribs)
+        if index % 5 == 0:
+            msp.add_lwpolyline(
+                [(index, 0), (index, 1), (index + 1, 1)], dxfattribs=attribs
+            )
+    doc.saveas(filename)
+
+
+def extract(entity):
+    return entity.dxftype(), entity.dxf.layer
+
+
+def scan_sequential(filename):
+    doc = iterdxf.opendxf(filename)
+    for entity in doc.modelspace():
+        extract(entity)
+    doc.close()
+
+
+def scan_parallel(filename, max_workers):
+    doc = iterdxf.opendxf(filename)
+    for _ in doc.parallel_modelspace(extract, max_workers=max_workers):
+        pass
+    doc.close()
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        filename = os.path.join(folder, "big.dxf")
+        make_dxf(filename)
+        seq_time = run(scan_sequential, filename)
+        print_result(seq_time, "IterDXF.modelspace()")
+        for max_workers in (2, 4, 8, os.cpu_count()):
+            par_time = run(scan_parallel, filename, max_workers)
+            print_result(
+                par_time,
+                f"IterDXF.parallel_modelspace(max_workers={max_workers})",
+            )
+            print(f"Speedup: {seq_time/par_time:.2f}x")
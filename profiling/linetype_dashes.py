@@ -0,0 +1,83 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import time
+import math
+from ezdxf.math import Vec3
+from ezdxf.path import Path, flatten_paths
+from ezdxf.render.linetypes import LineTypeRenderer, dash_segments
+
+COUNT = 1_000
+SEGMENTS = 20
+REPEAT = 5
+DISTANCE = 0.01
+DASHDOT = (0.5, 0.1, 0.1, 0.1)
+
+
+def make_paths(count):
+    paths = []
+    delta = math.tau / SEGMENTS
+    for index in range(count):
+        center = Vec3(index % 50, index // 50) * 10
+        path = Path(center + Vec3.from_angle(0, 4))
+        for segment in range(1, SEGMENTS + 1):
+            angle = segment * delta
+            end = center + Vec3.from_angle(angle, 4)
+            if segment % 2:
+                path.line_to(end)
+            else:
+                ctrl1 = center + Vec3.from_angle(angle - delta * 0.66, 4.5)
+                ctrl2 = center + Vec3.from_angle(angle - delta * 0.33, 4.5)
+                path.curve4_to(end, ctrl1, ctrl2)
+        paths.append(path)
+    return paths
+
+
+def render_each_dash(paths, count):
+    # drawing add-on of ezdxf v0.17.1: a Vec3 pair for each dash
+    for _ in range(count):
+        for path in paths:
+            renderer = LineTypeRenderer(DASHDOT)
+            segments = renderer.line_segments(
+                path.flattening(DISTANCE, segments=16)
+            )
+            [((s.x, s.y), (e.x, e.y)) for s, e in segments]
+
+
+def render_all_dashes(paths, count):
+    for _ in range(count):
+        for path in paths:
+            vertices, _ = flatten_paths([path], DISTANCE, segments=16)
+            dash_segments(vertices, DASHDOT)
+
+
+def render_solid(paths, count):
+    for _ in range(count):
+        for path in paths:
+            vertices, _ = flatten_paths([path], DISTANCE, segments=16)
+            dash_segments(vertices, tuple())
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+def profile():
+    paths = make_paths(COUNT)
+    t0 = run(render_each_dash, paths, REPEAT)
+    print_result(t0, f"{REPEAT}x LineTypeRenderer() of {COUNT} paths")
+    t1 = run(render_all_dashes, paths, REPEAT)
+    print_result(t1, f"{REPEAT}x dash_segments() of {COUNT} paths")
+    print(f"Speedup: {t0/t1:.2f}x\n")
+    t2 = run(render_solid, paths, REPEAT)
+    print_result(t2, f"{REPEAT}x solid segments of {COUNT} paths")
+
+
+if __name__ == "__main__":
+    profile()
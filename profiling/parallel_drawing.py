@@ -0,0 +1,72 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import os
+import pickle
+import time
+import ezdxf
+from ezdxf import EZDXF_TEST_FILES
+from ezdxf.addons.drawing import Frontend, RenderContext
+from ezdxf.addons.drawing.parallel import ParallelFrontend
+from ezdxf.addons.drawing.debug_backend import PathBackend
+
+BIG_FILE = os.path.join(EZDXF_TEST_FILES, "CADKitSamples", "torso_uniform.dxf")
+
+
+def load_document():
+    if os.path.exists(BIG_FILE):
+        return ezdxf.readfile(BIG_FILE)
+    print(f"'{BIG_FILE}' not found, using a generated document\n")
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for x in range(100):
+        for y in range(100):
+            msp.add_lwpolyline(
+                [(x, y), (x + 0.5, y), (x + 0.5, y + 0.5)],
+                format="xy",
+                dxfattribs={"color": (x + y) % 255 + 1},
+            )
+            msp.add_circle((x, y), 0.25)
+    return doc
+
+
+def draw_sequential(doc):
+    Frontend(RenderContext(doc), PathBackend()).draw_layout(doc.modelspace())
+
+
+def draw_parallel(doc, max_workers):
+    ParallelFrontend(
+        RenderContext(doc), PathBackend(), max_workers=max_workers
+    ).draw_layout(doc.modelspace())
+
+
+def pickle_document(doc):
+    return pickle.dumps(doc, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    doc = load_document()
+    cpu_count = os.cpu_count() or 1
+    print(f"CPU count: {cpu_count}\n")
+    # Each worker process gets a pickled copy of the document at startup:
+    pickle_time = run(pickle_document, doc)
+    size = len(pickle_document(doc))
+    print_result(pickle_time, f"pickle document ({size / 1e6:.1f} MB)")
+    seq_time = run(draw_sequential, doc)
+    print_result(seq_time, "Frontend.draw_layout()")
+    for max_workers in sorted({1, 2, 4, 8, cpu_count}):
+        par_time = run(draw_parallel, doc, max_workers)
+        print_result(
+            par_time, f"ParallelFrontend(max_workers={max_workers}).draw_layout()"
+        )
+        print(f"Speedup: {seq_time/par_time:.2f}x\n")
@@ -0,0 +1,36 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import os
+import time
+import ezdxf
+from ezdxf import EZDXF_TEST_FILES
+
+BIG_FILE = os.path.join(EZDXF_TEST_FILES, "CADKitSamples", "torso_uniform.dxf")
+
+
+def load_sequential():
+    ezdxf.readfile(BIG_FILE)
+
+
+def load_parallel(max_workers):
+    ezdxf.readfile(BIG_FILE, max_workers=max_workers)
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    seq_time = run(load_sequential)
+    print_result(seq_time, "readfile()")
+    for max_workers in (2, 4, 8, os.cpu_count()):
+        par_time = run(load_parallel, max_workers)
+        print_result(par_time, f"readfile(max_workers={max_workers})")
+        print(f"Speedup: {seq_time/par_time:.2f}x")
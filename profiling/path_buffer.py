@@ -0,0 +1,120 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import time
+import math
+import tracemalloc
+from ezdxf.math import Vec3, Matrix44, Bezier4P
+from ezdxf.path import Path, Command, LineTo, Curve4To
+
+COUNT = 100_000
+REPEAT = 5
+DISTANCE = 0.01
+
+
+def make_path(count):
+    path = Path()
+    delta = math.tau / count
+    for index in range(count):
+        angle = index * delta
+        end = Vec3.from_angle(angle, 100)
+        if index % 2:
+            path.line_to(end)
+        else:
+            ctrl1 = Vec3.from_angle(angle - delta * 0.66, 101)
+            ctrl2 = Vec3.from_angle(angle - delta * 0.33, 101)
+            path.curve4_to(end, ctrl1, ctrl2)
+    return path
+
+
+def make_command_list(path):
+    # path representation of ezdxf v0.17.1: a list of NamedTuple commands
+    return list(path)
+
+
+def transform_command_list(start, commands, m, count):
+    # transformation of ezdxf v0.17.1: command by command
+    for _ in range(count):
+        new_start = m.transform(start)
+        result = []
+        for cmd in commands:
+            if cmd.type == Command.LINE_TO:
+                result.append(LineTo(end=m.transform(cmd.end)))
+            else:
+                end, ctrl1, ctrl2 = m.transform_vertices(
+                    (cmd.end, cmd.ctrl1, cmd.ctrl2)
+                )
+                result.append(Curve4To(end=end, ctrl1=ctrl1, ctrl2=ctrl2))
+
+
+def flatten_command_list(start, commands, count):
+    for _ in range(count):
+        vertices = [start]
+        prev = start
+        for cmd in commands:
+            if cmd.type == Command.LINE_TO:
+                vertices.append(cmd.end)
+            else:
+                pts = iter(
+                    Bezier4P((prev, cmd.ctrl1, cmd.ctrl2, cmd.end)).flattening(
+                        DISTANCE
+                    )
+                )
+                next(pts)
+                vertices.extend(pts)
+            prev = cmd.end
+
+
+def transform_path(path, m, count):
+    for _ in range(count):
+        path.transform(m)
+
+
+def flatten_path(path, count):
+    for _ in range(count):
+        list(path.flattening(DISTANCE))
+
+
+def memory_usage(func, *args):
+    tracemalloc.start()
+    result = func(*args)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, result
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+def profile():
+    path = make_path(COUNT)
+    print(f"Path with {COUNT} commands:\n")
+    size0, commands = memory_usage(make_command_list, path)
+    print(f"Memory: command list {size0 / 1024 / 1024:.2f} MB")
+    size1, _ = memory_usage(lambda: path.clone())
+    print(f"Memory: packed path {size1 / 1024 / 1024:.2f} MB")
+    print(f"Ratio: {size0 / size1:.2f}x\n")
+
+    m = Matrix44.chain(Matrix44.z_rotate(0.5), Matrix44.translate(1, 2, 3))
+    t0 = run(transform_command_list, path.start, commands, m, REPEAT)
+    print_result(t0, f"{REPEAT}x transform command list")
+    t1 = run(transform_path, path, m, REPEAT)
+    print_result(t1, f"{REPEAT}x transform packed path")
+    print(f"Speedup: {t0/t1:.2f}x\n")
+
+    t0 = run(flatten_command_list, path.start, commands, REPEAT)
+    print_result(t0, f"{REPEAT}x flatten command list")
+    t1 = run(flatten_path, path, REPEAT)
+    print_result(t1, f"{REPEAT}x flatten packed path")
+    print(f"Speedup: {t0/t1:.2f}x\n")
+
+
+if __name__ == "__main__":
+    profile()
@@ -0,0 +1,95 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import time
+from ezdxf.math import BoundingBox2d
+from ezdxf.render.forms import square, translate
+from ezdxf.path import from_vertices, fast_bbox_detection
+
+COUNTS = [10_000, 100_000]
+PARTITION_MAX_COUNT = 10_000  # quadratic runtime
+
+
+def make_loops(count):
+    # "Glyphs" of a text paragraph: an exterior loop with two holes,
+    # one hole contains a nested island
+    paths = []
+    columns = 100
+    for index in range(count // 4):
+        x = (index % columns) * 12
+        y = (index // columns) * 12
+        paths.append(from_vertices(translate(square(10), (x, y))))
+        paths.append(from_vertices(translate(square(4), (x + 1, y + 1))))
+        paths.append(from_vertices(translate(square(2), (x + 2, y + 2))))
+        paths.append(from_vertices(translate(square(4), (x + 5, y + 5))))
+    return paths
+
+
+def partition_detection(paths):
+    # fast_bbox_detection() of ezdxf v0.17.1: partitions the remaining
+    # paths for each exterior path
+    def separate(exterior, candidates):
+        holes = []
+        outside = []
+        for candidate in candidates:
+            (holes if exterior.inside(candidate[0].center) else outside).append(
+                candidate
+            )
+        return holes, outside
+
+    def polygon_structure(outside):
+        polygons = []
+        while outside:
+            exterior = outside.pop()
+            holes, outside = separate(exterior[0], outside)
+            if holes:
+                holes = polygon_structure(holes)
+            polygons.append([exterior, *holes])
+        return polygons
+
+    def as_nested_paths(polygons):
+        return [
+            polygon[1]
+            if isinstance(polygon, tuple)
+            else as_nested_paths(polygon)
+            for polygon in polygons
+        ]
+
+    def area(item):
+        width, height = item[0].size
+        return width * height
+
+    boxed_paths = [
+        (BoundingBox2d(path.control_vertices()), path)
+        for path in paths
+        if len(path)
+    ]
+    boxed_paths.sort(key=area)
+    return as_nested_paths(polygon_structure(boxed_paths))
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    end = time.perf_counter()
+    return end - start
+
+
+def profile():
+    for count in COUNTS:
+        paths = make_loops(count)
+        t1 = run(fast_bbox_detection, paths)
+        print_result(t1, f"fast_bbox_detection() of {count} loops")
+        t2 = run(fast_bbox_detection, paths, exact=True)
+        print_result(t2, f"fast_bbox_detection(exact=True) of {count} loops")
+        if count <= PARTITION_MAX_COUNT:
+            t0 = run(partition_detection, paths)
+            print_result(t0, f"partition detection of {count} loops")
+            print(f"Speedup: {t0/t1:.2f}x\n")
+
+
+if __name__ == "__main__":
+    profile()
@@ -0,0 +1,47 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import time
+import ezdxf
+
+COUNT = 100_000
+LAYERS = 50
+QUERIES = 100
+
+
+def make_doc():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(COUNT):
+        attribs = {"layer": f"L{index % LAYERS}"}
+        if index % 2:
+            msp.add_line((index, 0), (index, 1), dxfattribs=attribs)
+        else:
+            msp.add_point((index, 0), dxfattribs=attribs)
+    return doc
+
+
+def run_queries(msp):
+    for index in range(QUERIES):
+        msp.query(f'LINE[layer=="L{index % LAYERS}"]')
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    msp = make_doc().modelspace()
+    t0 = run(run_queries, msp)
+    print_result(t0, f"{QUERIES} queries of {COUNT} entities")
+    t = run(msp.query_index)
+    print_result(t, f"building the query index of {COUNT} entities")
+    t1 = run(run_queries, msp)
+    print_result(t1, f"{QUERIES} indexed queries of {COUNT} entities")
+    print(f"Speedup: {t0/t1:.2f}x")
@@ -0,0 +1,82 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import time
+import ezdxf
+from ezdxf.query import (
+    EntityQuery,
+    BoolExpression,
+    build_entity_name_matcher,
+    _compile_tokens,
+)
+from ezdxf.queryparser import EntityQueryParser
+
+COUNT = 10_000
+REPEAT = 10
+SMALL_QUERIES = 5_000
+QUERY = 'LINE POINT[layer=="L1" & color<7 | !linetype ? "DASH.*"]i'
+
+
+def make_entities(count):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(count):
+        attribs = {"layer": f"L{index % 5}", "color": index % 10}
+        if index % 2:
+            msp.add_line((index, 0), (index, 1), dxfattribs=attribs)
+        else:
+            msp.add_point((index, 0), dxfattribs=attribs)
+    return list(msp)
+
+
+def interpreted_matcher(query: str):
+    # matcher of ezdxf v0.17.1: parses the query string for each call and
+    # interprets the Relation() and BoolExpression() trees for each entity
+    args = EntityQueryParser.parseString(query, parseAll=True)
+    match_name = build_entity_name_matcher(args.EntityQuery)
+    expr = BoolExpression(
+        _compile_tokens(args.AttribQuery, args.AttribQueryOptions == "i")
+    )
+    return lambda e: match_name(e) and expr.evaluate(e)
+
+
+def interpreted_queries(entities, count):
+    for _ in range(count):
+        match = interpreted_matcher(QUERY)
+        EntityQuery(e for e in entities if match(e))
+
+
+def compiled_queries(entities, count):
+    for _ in range(count):
+        EntityQuery(entities, QUERY)
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+def compare(entities, count, text):
+    t0 = run(interpreted_queries, entities, count)
+    print_result(t0, f"{text}, interpreted")
+    t1 = run(compiled_queries, entities, count)
+    print_result(t1, f"{text}, cached & compiled")
+    print(f"Speedup: {t0/t1:.2f}x\n")
+
+
+if __name__ == "__main__":
+    compare(
+        make_entities(COUNT),
+        REPEAT,
+        f"{REPEAT} queries of {COUNT} entities",
+    )
+    compare(
+        make_entities(10),
+        SMALL_QUERIES,
+        f"{SMALL_QUERIES} queries of 10 entities",
+    )
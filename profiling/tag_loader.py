@@ -1,11 +1,16 @@
-#  Copyright (c) 2020, Manfred Moitzi
+#  Copyright (c) 2020-2021, Manfred Moitzi
 #  License: MIT License
 import os
 import time
-from ezdxf.lldxf.tagger import ascii_tags_loader
+from ezdxf.lldxf.tagger import ascii_tags_loader, tag_compiler
 from ezdxf.recover import bytes_loader, synced_bytes_loader
 from ezdxf import EZDXF_TEST_FILES
 
+try:
+    from ezdxf.acc import tagger as cy_tagger
+except ImportError:
+    cy_tagger = None
+
 BIG_FILE = os.path.join(EZDXF_TEST_FILES, "CADKitSamples", "torso_uniform.dxf")
 
 
@@ -24,6 +29,26 @@ def load_synced_bytes():
         list(synced_bytes_loader(fp))
 
 
+def compile_ascii():
+    with open(BIG_FILE, "rt") as fp:
+        list(tag_compiler(iter(ascii_tags_loader(fp))))
+
+
+def cy_load_ascii():
+    with open(BIG_FILE, "rt") as fp:
+        list(cy_tagger.ascii_tags_loader(fp))
+
+
+def cy_compile_ascii():
+    with open(BIG_FILE, "rt") as fp:
+        list(cy_tagger.tag_compiler(iter(cy_tagger.ascii_tags_loader(fp))))
+
+
+def cy_ascii_tag_compiler():
+    with open(BIG_FILE, "rt") as fp:
+        list(cy_tagger.ascii_tag_compiler(fp))
+
+
 def print_result(time, text):
     print(f"Operation: {text} takes {time:.2f} s\n")
 
@@ -39,3 +64,15 @@ if __name__ == "__main__":
     print_result(run(load_ascii), "ascii_tags_loader()")
     print_result(run(load_bytes), "bytes_loader()")
     print_result(run(load_synced_bytes), "synced_bytes_loader()")
+    py_time = run(compile_ascii)
+    print_result(py_time, "tag_compiler(ascii_tags_loader())")
+    if cy_tagger is None:
+        print("C-extension ezdxf.acc.tagger not available.")
+    else:
+        print_result(run(cy_load_ascii), "Cython ascii_tags_loader()")
+        cy_time = run(cy_compile_ascii)
+        print_result(cy_time, "Cython tag_compiler(ascii_tags_loader())")
+        print(f"Speedup Cython tag_compiler(): {py_time/cy_time:.1f}x")
+        cy_time = run(cy_ascii_tag_compiler)
+        print_result(cy_time, "Cython ascii_tag_compiler()")
+        print(f"Speedup Cython ascii_tag_compiler(): {py_time/cy_time:.1f}x")
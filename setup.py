@@ -59,6 +59,24 @@ ext_modules = [
         optional=True,
         language="c++",
     ),
+    Extension(
+        "ezdxf.acc.tagger",
+        [
+            "src/ezdxf/acc/tagger.pyx",
+        ],
+        optional=True,
+        language="c++",
+    ),
+    Extension(
+        "ezdxf.acc.pathbuffer",
+        [
+            "src/ezdxf/acc/pathbuffer.pyx",
+            "src/ezdxf/acc/_cpp_cubic_bezier.cpp",
+            "src/ezdxf/acc/_cpp_quad_bezier.cpp",
+        ],
+        optional=True,
+        language="c++",
+    ),
 ]
 try:
     from Cython.Distutils import build_ext
@@ -22,7 +22,14 @@ from ezdxf.colors import (
 )
 from ezdxf.lldxf import const
 from ezdxf.lldxf.validator import is_dxf_file, is_dxf_stream
-from ezdxf.filemanagement import readzip, new, read, readfile, decode_base64
+from ezdxf.filemanagement import (
+    readzip,
+    new,
+    read,
+    readfile,
+    decode_base64,
+    load_snapshot,
+)
 from ezdxf.tools.standards import (
     setup_linetypes,
     setup_styles,
@@ -13,6 +13,7 @@ from .vector import X_AXIS, Y_AXIS, Z_AXIS, NULLVEC
 from libc.math cimport fabs, sin, cos, tan
 
 if TYPE_CHECKING:
+    import numpy as np
     from ezdxf.eztypes import Vertex
 
 DEF ABS_TOL = 1e-12
@@ -568,6 +569,15 @@ cdef class Matrix44:
             res.z = x * m[2] + y * m[6] + z * m[10]
             yield v3_normalize(res, 1.0) if _normalize else res
 
+    def transform_array(self, vertices: 'np.ndarray') -> 'np.ndarray':
+        from ezdxf.math._ndarray import transform_array
+        return transform_array(self, vertices)
+
+    def transform_direction_array(self, vertices: 'np.ndarray',
+                                  normalize=False) -> 'np.ndarray':
+        from ezdxf.math._ndarray import transform_direction_array
+        return transform_direction_array(self, vertices, normalize)
+
     def ucs_vertex_from_wcs(self, wcs: Vec3) -> Vec3:
         return self.ucs_direction_from_wcs(wcs - self.origin)
 
@@ -0,0 +1,222 @@
+# cython: language_level=3
+# distutils: language = c++
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+# Bulk operations on the packed representation of Path() objects,
+# keep in sync with the Python implementation: ezdxf/path/_buffer.py
+from typing import List
+from cpython cimport array
+import array
+from .vector cimport Vec3, isclose
+from .matrix44 cimport Matrix44
+from ._cpp_vec3 cimport CppVec3
+from ._cpp_cubic_bezier cimport CppCubicBezier
+from ._cpp_quad_bezier cimport CppQuadBezier
+
+__all__ = [
+    'vec3_list', 'transform_buffer', 'flatten_buffer', 'flatten_to_buffer',
+]
+
+DEF CURVE3_TO = 2
+DEF CURVE4_TO = 3
+DEF ABS_TOL = 1e-12
+DEF REL_TOL = 1e-9
+
+cdef array.array DOUBLE_ARRAY = array.array('d')
+
+
+def vec3_list(const double[:] vertices) -> List[Vec3]:
+    cdef Py_ssize_t i
+    cdef Py_ssize_t count = vertices.shape[0] // 3
+    cdef list result = []
+    cdef Vec3 v
+    for i in range(count):
+        v = Vec3()
+        v.x = vertices[i * 3]
+        v.y = vertices[i * 3 + 1]
+        v.z = vertices[i * 3 + 2]
+        result.append(v)
+    return result
+
+
+def transform_buffer(Matrix44 m, const double[:] vertices) -> array.array:
+    cdef Py_ssize_t i
+    cdef Py_ssize_t size = vertices.shape[0]
+    cdef double x, y, z
+    cdef double *mat = m.m
+    cdef array.array result = array.clone(DOUBLE_ARRAY, size, zero=False)
+    cdef double[:] target = result
+
+    for i in range(0, size - 2, 3):
+        x = vertices[i]
+        y = vertices[i + 1]
+        z = vertices[i + 2]
+        target[i] = x * mat[0] + y * mat[4] + z * mat[8] + mat[12]
+        target[i + 1] = x * mat[1] + y * mat[5] + z * mat[9] + mat[13]
+        target[i + 2] = x * mat[2] + y * mat[6] + z * mat[10] + mat[14]
+    return result
+
+
+def flatten_buffer(
+    const unsigned char[:] commands,
+    const unsigned int[:] index,
+    const double[:] vertices,
+    double distance,
+    int segments,
+) -> List[Vec3]:
+    cdef array.array target = array.clone(DOUBLE_ARRAY, 0, zero=False)
+    flatten_to_buffer(commands, index, vertices, distance, segments, target)
+    return vec3_list(target)
+
+
+def flatten_to_buffer(
+    const unsigned char[:] commands,
+    const unsigned int[:] index,
+    const double[:] vertices,
+    double distance,
+    int segments,
+    array.array target,
+) -> None:
+    cdef Py_ssize_t n
+    cdef unsigned int i, prev = 0
+    cdef unsigned char cmd
+
+    if commands.shape[0] == 0:
+        return
+    append_vertex(target, cpp_vec3(vertices, 0))
+    for n in range(commands.shape[0]):
+        cmd = commands[n]
+        i = index[n]
+        if cmd == CURVE4_TO:
+            flatten_cubic_bezier(
+                CppCubicBezier(
+                    cpp_vec3(vertices, prev),
+                    cpp_vec3(vertices, i - 2),
+                    cpp_vec3(vertices, i - 1),
+                    cpp_vec3(vertices, i),
+                ), distance, segments, target
+            )
+        elif cmd == CURVE3_TO:
+            flatten_quad_bezier(
+                CppQuadBezier(
+                    cpp_vec3(vertices, prev),
+                    cpp_vec3(vertices, i - 1),
+                    cpp_vec3(vertices, i),
+                ), distance, segments, target
+            )
+        else:  # LINE_TO, MOVE_TO
+            append_vertex(target, cpp_vec3(vertices, i))
+        prev = i
+
+
+cdef inline CppVec3 cpp_vec3(const double[:] vertices, unsigned int i):
+    return CppVec3(vertices[i * 3], vertices[i * 3 + 1], vertices[i * 3 + 2])
+
+
+cdef inline void append_vertex(array.array target, CppVec3 v):
+    cdef double xyz[3]
+    xyz[0] = v.x
+    xyz[1] = v.y
+    xyz[2] = v.z
+    array.extend_buffer(target, <char *> xyz, 3)
+
+
+# Adaptive flattening, the same algorithm as Bezier4P.flattening() and
+# Bezier3P.flattening(), without the start point:
+
+cdef void flatten_cubic_bezier(
+    CppCubicBezier curve,
+    double distance,
+    int segments,
+    array.array target,
+):
+    cdef double dt = 1.0 / segments
+    cdef double t0 = 0.0, t1
+    cdef CppVec3 start_point = curve.p0
+    cdef CppVec3 end_point
+
+    while t0 < 1.0:
+        t1 = t0 + dt
+        if isclose(t1, 1.0, REL_TOL, ABS_TOL):
+            end_point = curve.p3
+            t1 = 1.0
+        else:
+            end_point = curve.point(t1)
+        subdiv_cubic_bezier(
+            curve, start_point, end_point, t0, t1, distance, target
+        )
+        t0 = t1
+        start_point = end_point
+
+
+cdef void subdiv_cubic_bezier(
+    CppCubicBezier& curve,
+    CppVec3 start_point,
+    CppVec3 end_point,
+    double start_t,
+    double end_t,
+    double distance,
+    array.array target,
+):
+    cdef double mid_t = (start_t + end_t) * 0.5
+    cdef CppVec3 mid_point = curve.point(mid_t)
+    cdef double d = mid_point.distance(start_point.lerp(end_point, 0.5))
+    # emergency exit if distance d is suddenly very large #574
+    if d < distance or d > 1e12:
+        append_vertex(target, end_point)
+    else:
+        subdiv_cubic_bezier(
+            curve, start_point, mid_point, start_t, mid_t, distance, target
+        )
+        subdiv_cubic_bezier(
+            curve, mid_point, end_point, mid_t, end_t, distance, target
+        )
+
+
+cdef void flatten_quad_bezier(
+    CppQuadBezier curve,
+    double distance,
+    int segments,
+    array.array target,
+):
+    cdef double dt = 1.0 / segments
+    cdef double t0 = 0.0, t1
+    cdef CppVec3 start_point = curve.p0
+    cdef CppVec3 end_point
+
+    while t0 < 1.0:
+        t1 = t0 + dt
+        if isclose(t1, 1.0, REL_TOL, ABS_TOL):
+            end_point = curve.p2
+            t1 = 1.0
+        else:
+            end_point = curve.point(t1)
+        subdiv_quad_bezier(
+            curve, start_point, end_point, t0, t1, distance, target
+        )
+        t0 = t1
+        start_point = end_point
+
+
+cdef void subdiv_quad_bezier(
+    CppQuadBezier& curve,
+    CppVec3 start_point,
+    CppVec3 end_point,
+    double start_t,
+    double end_t,
+    double distance,
+    array.array target,
+):
+    cdef double mid_t = (start_t + end_t) * 0.5
+    cdef CppVec3 mid_point = curve.point(mid_t)
+    cdef double d = mid_point.distance(start_point.lerp(end_point, 0.5))
+    # emergency exit if distance d is suddenly very large #574
+    if d < distance or d > 1e12:
+        append_vertex(target, end_point)
+    else:
+        subdiv_quad_bezier(
+            curve, start_point, mid_point, start_t, mid_t, distance, target
+        )
+        subdiv_quad_bezier(
+            curve, mid_point, end_point, mid_t, end_t, distance, target
+        )
@@ -0,0 +1,292 @@
+# cython: language_level=3
+# distutils: language = c++
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+# Cython implementation of the ASCII DXF tag loader and tag compiler.
+# Produces the same tag stream as the Python implementation in module
+# ezdxf.lldxf.tagger.
+from typing import Iterator, Iterable, TextIO
+from array import array
+from ezdxf.lldxf.types import (
+    DXFTag, DXFVertex, DXFBinaryTag, POINT_CODES, BINARY_DATA, TYPE_TABLE,
+)
+from ezdxf.lldxf.const import DXFStructureError
+
+__all__ = ['ascii_tags_loader', 'tag_compiler', 'ascii_tag_compiler']
+
+# Group code type lookup table, group codes outside of the table range
+# are handled as strings like by TYPE_TABLE.get(code, str):
+DEF MAX_GROUP_CODE = 1071
+DEF TYPE_STR = 0
+DEF TYPE_INT = 1
+DEF TYPE_FLOAT = 2
+DEF TYPE_POINT = 3
+DEF TYPE_BINARY = 4
+
+cdef unsigned char[MAX_GROUP_CODE + 1] GROUP_CODE_TYPE
+
+cdef void init_group_code_types():
+    cdef int code
+    for code in range(MAX_GROUP_CODE + 1):
+        GROUP_CODE_TYPE[code] = TYPE_STR
+    for code, caster in TYPE_TABLE.items():
+        if 0 <= code <= MAX_GROUP_CODE:
+            if caster is int:
+                GROUP_CODE_TYPE[code] = TYPE_INT
+            elif caster is float:
+                GROUP_CODE_TYPE[code] = TYPE_FLOAT
+    # point and binary codes have priority over the type table:
+    for code in POINT_CODES:
+        GROUP_CODE_TYPE[code] = TYPE_POINT
+    for code in BINARY_DATA:
+        GROUP_CODE_TYPE[code] = TYPE_BINARY
+
+init_group_code_types()
+
+cdef inline unsigned char group_code_type(int code):
+    if 0 <= code <= MAX_GROUP_CODE:
+        return GROUP_CODE_TYPE[code]
+    return TYPE_STR
+
+
+def ascii_tags_loader(
+    stream: TextIO, bint skip_comments = True
+) -> Iterator[DXFTag]:
+    """Yields :class:``DXFTag`` objects from a text `stream` (untrusted
+    external source) and does not optimize coordinates. Comment tags (group
+    code == 999) will be skipped if argument `skip_comments` is `True`.
+
+    Same behavior as :func:`ezdxf.lldxf.tagger.ascii_tags_loader`.
+
+    Raises:
+        DXFStructureError: Found invalid group code.
+
+    """
+    cdef int line = 1
+    cdef int group_code
+    cdef bint yield_comments = not skip_comments
+    cdef str code, value
+    readline = stream.readline
+    while True:
+        code = readline()
+        if code:  # empty string indicates EOF
+            try:
+                group_code = int(code)
+            except (ValueError, OverflowError):
+                raise DXFStructureError(
+                    f'Invalid group code "{code}" at line {line}.'
+                )
+        else:
+            return
+
+        value = readline()
+        if value:  # empty string indicates EOF
+            if group_code != 999 or yield_comments:
+                yield new_tag(group_code, value.rstrip("\n"))
+            line += 2
+        else:
+            return
+
+
+def tag_compiler(tags: Iterator[DXFTag]) -> Iterable[DXFTag]:
+    """Compiles DXF tag values imported by ascii_tags_loader() into Python
+    types.
+
+    Same behavior as :func:`ezdxf.lldxf.tagger.tag_compiler`.
+
+    Raises:
+        DXFStructureError: Found invalid DXF tag or unexpected coordinate order.
+
+    """
+    cdef int line = 0
+    cdef int code
+    cdef unsigned char code_type
+    undo_tag = None
+    next_tag = tags.__next__
+    while True:
+        try:
+            if undo_tag is not None:
+                x = undo_tag
+                undo_tag = None
+            else:
+                x = next_tag()
+                line += 2
+            code = x.code
+            code_type = group_code_type(code)
+            if code_type == TYPE_POINT:
+                # y-axis is mandatory
+                y = next_tag()
+                line += 2
+                if y.code != code + 10:  # like 20 for base x-code 10
+                    raise DXFStructureError(
+                        f"Missing required y coordinate near line: {line}."
+                    )
+                # z-axis just for 3d points
+                try:
+                    z = next_tag()
+                except StopIteration:  # 2d point at the end of the tags
+                    yield compile_vertex(code, x.value, y.value, None, line)
+                    return
+                line += 2
+                if z.code == code + 20:
+                    yield compile_vertex(code, x.value, y.value, z.value, line)
+                else:
+                    yield compile_vertex(code, x.value, y.value, None, line)
+                    undo_tag = z
+            elif code_type == TYPE_BINARY:
+                # Maybe pre compiled in low level tagger (binary DXF):
+                if isinstance(x, DXFBinaryTag):
+                    yield x
+                else:
+                    yield compile_binary_tag(code, x.value, line)
+            else:
+                yield compile_tag(code, code_type, x.value, line)
+        except StopIteration:
+            return
+
+
+def ascii_tag_compiler(stream: TextIO) -> Iterator[DXFTag]:
+    """Combines :func:`ascii_tags_loader` and :func:`tag_compiler` in one
+    pass without creating the intermediate raw :class:`DXFTag` objects.
+    Comment tags (group code == 999) will be skipped.
+
+    Yields the same tags as :code:`tag_compiler(ascii_tags_loader(stream))`.
+
+    Raises:
+        DXFStructureError: Found invalid DXF tag or unexpected coordinate order.
+
+    """
+    cdef _TagReader reader = _TagReader(stream.readline)
+    cdef int code
+    cdef unsigned char code_type
+    cdef str x, y
+    while reader.next_tag():
+        code = reader.code
+        code_type = group_code_type(code)
+        if code_type == TYPE_POINT:
+            x = reader.value
+            # y-axis is mandatory
+            if not reader.next_tag():
+                return
+            if reader.code != code + 10:  # like 20 for base x-code 10
+                raise DXFStructureError(
+                    f"Missing required y coordinate near line: {reader.line}."
+                )
+            y = reader.value
+            # z-axis just for 3d points
+            if not reader.next_tag():  # 2d point at the end of the tags
+                yield compile_vertex(code, x, y, None, reader.line)
+                return
+            if reader.code == code + 20:
+                yield compile_vertex(code, x, y, reader.value, reader.line)
+            else:
+                yield compile_vertex(code, x, y, None, reader.line)
+                reader.undo()
+        elif code_type == TYPE_BINARY:
+            yield compile_binary_tag(code, reader.value, reader.line)
+        else:
+            yield compile_tag(code, code_type, reader.value, reader.line)
+
+
+cdef class _TagReader:
+    """Reads raw (code, value) pairs from a text stream, skips comment tags
+    and supports to push back the last tag.
+    """
+    cdef object readline
+    cdef int line
+    cdef int code
+    cdef str value
+    cdef bint has_undo_tag
+
+    def __cinit__(self, readline):
+        self.readline = readline
+        self.line = 0
+        self.code = 0
+        self.value = ""
+        self.has_undo_tag = False
+
+    cdef bint next_tag(self) except -1:
+        """Returns ``False`` at EOF."""
+        cdef str code, value
+        if self.has_undo_tag:
+            self.has_undo_tag = False
+            return True
+        while True:
+            code = self.readline()
+            if not code:  # empty string indicates EOF
+                return False
+            try:
+                self.code = int(code)
+            except (ValueError, OverflowError):
+                raise DXFStructureError(
+                    f'Invalid group code "{code}" at line {self.line + 1}.'
+                )
+            value = self.readline()
+            if not value:  # empty string indicates EOF
+                return False
+            self.line += 2
+            if self.code != 999:
+                self.value = value.rstrip("\n")
+                return True
+
+    cdef void undo(self):
+        self.has_undo_tag = True
+
+
+# Create tags without calling the Python __init__() methods, the group code is
+# already an int and the value is already converted:
+cdef object new_tag(int code, value):
+    cdef object tag = DXFTag.__new__(DXFTag)
+    tag._code = code
+    tag._value = value
+    return tag
+
+
+cdef object new_vertex(int code, point):
+    cdef object tag = DXFVertex.__new__(DXFVertex)
+    tag._code = code
+    tag._value = array("d", point)
+    return tag
+
+
+cdef object compile_vertex(int code, x, y, z, int line):
+    try:
+        if z is None:
+            return new_vertex(code, (float(x), float(y)))
+        return new_vertex(code, (float(x), float(y), float(z)))
+    except ValueError:
+        raise DXFStructureError(
+            f"Invalid floating point values near line: {line}."
+        )
+
+
+cdef object compile_binary_tag(int code, value, int line):
+    try:
+        return DXFBinaryTag.from_string(code, value)
+    except ValueError:
+        raise DXFStructureError(f"Invalid binary data near line: {line}.")
+
+
+cdef object compile_tag(int code, unsigned char code_type, value, int line):
+    if code_type == TYPE_STR:
+        if code == 0:
+            return new_tag(code, value.strip())
+        return new_tag(code, str(value))
+    elif code_type == TYPE_FLOAT:
+        try:
+            return new_tag(code, float(value))
+        except ValueError:
+            raise DXFStructureError(error_msg(code, value, line))
+    else:  # TYPE_INT
+        try:
+            return new_tag(code, int(value))
+        except ValueError:
+            # ProE stores int values as floats :((
+            try:
+                return new_tag(code, int(float(value)))
+            except ValueError:
+                raise DXFStructureError(error_msg(code, value, line))
+
+
+cdef str error_msg(int code, value, int line):
+    return f'Invalid tag (code={code}, value="{value}") near line: {line}.'
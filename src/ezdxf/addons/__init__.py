@@ -7,4 +7,5 @@ from .sierpinski_pyramid import SierpinskyPyramid
 from .dimlines import LinearDimension, AngularDimension, ArcDimension, RadialDimension, dimstyles
 from .importer import Importer
 from .r12writer import r12writer
+from .r2000writer import r2000writer
 from .mtxpl import MTextExplode
@@ -18,7 +18,7 @@ from ezdxf.addons.drawing.type_hints import Color
 from ezdxf.entities import DXFGraphic
 from ezdxf.tools.text import replace_non_printable_characters
 from ezdxf.math import Vec3, Matrix44
-from ezdxf.path import Path, transform_paths
+from ezdxf.path import Path, transform_paths, flatten_paths
 
 if TYPE_CHECKING:
     from ezdxf.tools.fonts import FontFace, FontMeasurements
@@ -187,10 +187,13 @@ class Backend(BackendInterface, metaclass=ABCMeta):
             properties: HATCH properties
 
         """
-        for path in paths:
+        vertices, offsets = flatten_paths(
+            paths, distance=self.config.max_flattening_distance
+        )
+        for start, end in zip(offsets, offsets[1:]):
+            it = iter(vertices[start * 3 : end * 3])
             self.draw_filled_polygon(
-                path.flattening(distance=self.config.max_flattening_distance),
-                properties,
+                [Vec3(x, y, z) for x, y, z in zip(it, it, it)], properties
             )
 
     @abstractmethod
@@ -1,7 +1,7 @@
 import dataclasses
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Optional
+from typing import Optional, Tuple
 
 from ezdxf import disassemble
 
@@ -57,6 +57,10 @@ class HatchPolicy(Enum):
             regardless of the pattern
         SHOW_APPROXIMATE_PATTERN: show HATCH entities using the closest
             approximation available to the current backend
+        SHOW_PATTERN_LINES: show the pattern of HATCH entities as line
+            segments created by the frontend, falls back to
+            SHOW_APPROXIMATE_PATTERN if the count of line segments exceeds
+            the `max_hatch_pattern_segments` budget
 
     """
 
@@ -64,6 +68,7 @@ class HatchPolicy(Enum):
     SHOW_OUTLINE = auto()
     SHOW_SOLID = auto()
     SHOW_APPROXIMATE_PATTERN = auto()
+    SHOW_PATTERN_LINES = auto()
 
 
 @dataclass(frozen=True)
@@ -98,6 +103,8 @@ class Configuration:
         line_policy: the method to use when drawing styled lines (eg dashed,
             dotted etc)
         hatch_policy: the method to use when drawing HATCH entities
+        max_hatch_pattern_segments: max count of line segments of a single
+            HATCH pattern for the hatch policy SHOW_PATTERN_LINES
         infinite_line_length: the length to use when drawing infinite lines
         lineweight_scaling:
             set to 0.0 for a constant minimal width the current result is
@@ -107,6 +114,9 @@ class Configuration:
             let the the backend choose.
         min_dash_length: the minimum length for a dash when drawing a styled line
             (default value is arbitrary)
+        max_linetype_dashes: max count of dashes of a single styled line for
+            the line policy ACCURATE, lines with more dashes are drawn as
+            solid lines
         max_flattening_distance: Max flattening distance in drawing units
             see Path.flattening documentation.
             The backend implementation should calculate an appropriate value,
@@ -115,6 +125,18 @@ class Configuration:
         circle_approximation_count: Approximate a full circle by `n` segments, arcs
             have proportional less segments. Only used for approximation of arcs
             in banded polylines.
+        view_window: draw only entities which bounding boxes intersect the
+            view window defined as (min_x, min_y, max_x, max_y) tuple in WCS
+            coordinates, ``None`` to draw all entities.
+        pixel_size: size of an output pixel in drawing units to enable the
+            level of detail mode: entities smaller than a pixel are drawn as
+            points and the `max_flattening_distance` is at least half a pixel,
+            ``None`` to disable the level of detail mode.
+        block_instancing: draw the content of a block definition only once
+            for all block references with the same properties and replay the
+            recorded backend calls for each block reference transformed by
+            the block reference matrix. The backend gets the DXF entities of
+            the block definition instead of virtual DXF entities.
     """
 
     pdsize: Optional[int]
@@ -124,12 +146,17 @@ class Configuration:
     proxy_graphic_policy: ProxyGraphicPolicy
     line_policy: LinePolicy
     hatch_policy: HatchPolicy
+    max_hatch_pattern_segments: int
     infinite_line_length: float
     lineweight_scaling: float
     min_lineweight: Optional[float]
     min_dash_length: float
+    max_linetype_dashes: int
     max_flattening_distance: float
     circle_approximation_count: int
+    view_window: Optional[Tuple[float, float, float, float]]
+    pixel_size: Optional[float]
+    block_instancing: bool
 
     @staticmethod
     def defaults() -> "Configuration":
@@ -141,12 +168,17 @@ class Configuration:
             proxy_graphic_policy=ProxyGraphicPolicy.SHOW,
             line_policy=LinePolicy.APPROXIMATE,
             hatch_policy=HatchPolicy.SHOW_APPROXIMATE_PATTERN,
+            max_hatch_pattern_segments=100_000,
             infinite_line_length=20,
             lineweight_scaling=1.0,
             min_lineweight=None,
             min_dash_length=0.1,
+            max_linetype_dashes=100_000,
             max_flattening_distance=disassemble.Primitive.max_flattening_distance,
             circle_approximation_count=128,
+            view_window=None,
+            pixel_size=None,
+            block_instancing=False,
         )
 
     def with_changes(self, **kwargs) -> "Configuration":
@@ -0,0 +1,107 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Optional
+from ezdxf import bbox
+from ezdxf.addons.drawing.config import Configuration
+from ezdxf.entities import Insert
+from ezdxf.math import BoundingBox2d, Vec2, Vec3, Z_AXIS
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFGraphic
+
+__all__ = ["ViewCulling"]
+
+
+class ViewCulling:
+    """View window culling and level of detail detection for the frontend,
+    based on the bounding boxes of the persistent spatial index of the drawn
+    layout if the index exists, else on the bounding boxes of the control
+    vertices, and on the cached convex hulls of block definitions.
+
+    Entities without a known bounding box like the virtual entities of block
+    references are never culled.
+    """
+
+    def __init__(self, config: Configuration):
+        self.window: Optional[BoundingBox2d] = None
+        if config.view_window is not None:
+            x1, y1, x2, y2 = config.view_window
+            self.window = BoundingBox2d([(x1, y1), (x2, y2)])
+        self.pixel_size: float = config.pixel_size or 0.0
+        # Caches the convex hulls of the block definitions:
+        self._cache = bbox.Cache()
+
+    def bbox(self, entity: "DXFGraphic") -> Optional[BoundingBox2d]:
+        """Returns the 2D bounding box of `entity` in WCS or ``None`` if
+        unknown.
+        """
+        if isinstance(entity, Insert):
+            return self._insert_bbox(entity)
+        handle = entity.dxf.handle
+        doc = entity.doc
+        if handle is None or doc is None:  # virtual entity
+            return None
+        # Use the persistent spatial index of the layout if it already exists,
+        # but do not create the index implicitly:
+        block_record = doc.entitydb.get(entity.dxf.owner)
+        index = getattr(block_record, "spatial_index", None)
+        if index is not None:
+            return index.bbox(entity)
+        box2d = _simple_bbox(entity)
+        if box2d is not None:
+            return box2d
+        # The control vertices are a fast and conservative approximation:
+        box = bbox.extents([entity], flatten=0)
+        return BoundingBox2d(box) if box.has_data else None
+
+    def is_outside(self, box: BoundingBox2d) -> bool:
+        """Returns ``True`` if `box` is outside of the view window."""
+        window = self.window
+        if window is None:
+            return False
+        wmin, wmax = window.extmin, window.extmax
+        bmin, bmax = box.extmin, box.extmax
+        if wmin is None or wmax is None or bmin is None or bmax is None:
+            return False  # bounding box without data
+        # Touching boxes are not outside:
+        return (
+            bmax.x < wmin.x
+            or bmin.x > wmax.x
+            or bmax.y < wmin.y
+            or bmin.y > wmax.y
+        )
+
+    def is_subpixel(self, box: BoundingBox2d) -> bool:
+        """Returns ``True`` if `box` is smaller than a pixel."""
+        pixel_size = self.pixel_size
+        size = box.size
+        return size.x < pixel_size and size.y < pixel_size
+
+    def _insert_bbox(self, insert: Insert) -> Optional[BoundingBox2d]:
+        # The bounding box module transforms the cached convex hull of the
+        # block definition, the control vertices are a fast and conservative
+        # approximation:
+        box = bbox.extents([insert], flatten=0, cache=self._cache)
+        return BoundingBox2d(box) if box.has_data else None
+
+
+def _simple_bbox(entity: "DXFGraphic") -> Optional[BoundingBox2d]:
+    """Returns the 2D bounding box of simple entities without the overhead of
+    the bounding box module or ``None`` for all other entities.
+    """
+    dxftype = entity.dxftype()
+    dxf = entity.dxf
+    if dxftype == "LINE":
+        return BoundingBox2d((dxf.start, dxf.end))
+    if dxftype == "POINT":
+        return BoundingBox2d((dxf.location,))
+    # The OCS of entities with the default extrusion is the WCS:
+    if not Vec3(dxf.get("extrusion", Z_AXIS)).isclose(Z_AXIS):
+        return None
+    if dxftype in ("CIRCLE", "ARC"):
+        center = Vec2(dxf.center)
+        radius = Vec2(dxf.radius, dxf.radius)
+        return BoundingBox2d((center - radius, center + radius))
+    if dxftype == "LWPOLYLINE" and not entity.has_arc:  # type: ignore
+        return BoundingBox2d(entity.get_points("xy"))  # type: ignore
+    return None
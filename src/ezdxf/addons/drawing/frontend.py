@@ -1,6 +1,7 @@
 # Copyright (c) 2020-2021, Matthew Broadway
 # License: MIT License
 import math
+import copy
 from typing import (
     Iterable,
     cast,
@@ -19,6 +20,8 @@ from ezdxf.addons.drawing.config import (
     HatchPolicy,
 )
 from ezdxf.addons.drawing.backend import BackendInterface
+from ezdxf.addons.drawing.culling import ViewCulling
+from ezdxf.addons.drawing.recorder import Recorder, Commands, replay
 from ezdxf.addons.drawing.properties import (
     RenderContext,
     VIEWPORT_COLOR,
@@ -47,10 +50,11 @@ from ezdxf.entities import (
     Point,
 )
 from ezdxf.entities.attrib import BaseAttrib
+from ezdxf.entities.ltype import CONTINUOUS_PATTERN
 from ezdxf.entities.polygon import DXFPolygon
 from ezdxf.entities.boundary_paths import AbstractBoundaryPath
-from ezdxf.layouts import Layout
-from ezdxf.math import Vec3, OCS, NULLVEC
+from ezdxf.layouts import Layout, BlockLayout
+from ezdxf.math import Vec3, OCS, NULLVEC, Z_AXIS, BoundingBox2d, Matrix44
 from ezdxf.path import (
     Path,
     make_path,
@@ -58,8 +62,14 @@ from ezdxf.path import (
     fast_bbox_detection,
     winding_deconstruction,
     from_vertices,
+    transform_paths_to_ocs,
 )
 from ezdxf.render import MeshBuilder, TraceBuilder
+from ezdxf.render.hatching import (
+    hatch_line_segments,
+    to_wcs_lines,
+    DenseHatchingLinesError,
+)
 from ezdxf import reorder
 from ezdxf.proxygraphic import ProxyGraphic, ProxyGraphicError
 from ezdxf.protocols import SupportsVirtualEntities, virtual_entities
@@ -71,6 +81,9 @@ __all__ = ["Frontend"]
 
 # typedef
 TDispatchTable = Dict[str, Callable[[DXFGraphic, Properties], None]]
+# Recorded block content by block record handle and block reference
+# properties:
+TBlockInstances = Dict[Tuple, "BlockInstance"]
 POST_ISSUE_MSG = "Please post sample DXF file at https://github.com/mozman/ezdxf/issues."
 
 
@@ -101,8 +114,24 @@ class Frontend:
             self.log_message("relative point size is not supported")
             self.config = self.config.with_changes(pdsize=1)
 
+        # View window culling and level of detail mode:
+        self._culling: Optional[ViewCulling] = None
+        pixel_size = self.config.pixel_size
+        if pixel_size:
+            max_flattening_distance = max(
+                self.config.max_flattening_distance, pixel_size / 2.0
+            )
+            self.config = self.config.with_changes(
+                max_flattening_distance=max_flattening_distance
+            )
+        if self.config.view_window is not None or pixel_size:
+            self._culling = ViewCulling(self.config)
+
         self.out.configure(self.config)
 
+        # Recorded block content for block instancing:
+        self._block_instances: TBlockInstances = dict()
+
         # Parents entities of current entity/sub-entity
         self.parent_stack: List[DXFGraphic] = []
 
@@ -171,6 +200,7 @@ class Frontend:
         else:
             self.ctx.set_current_layout(layout)
         self.parent_stack = []
+        self._block_instances.clear()
         handle_mapping = list(layout.get_redraw_order())
         if handle_mapping:
             self.draw_entities(
@@ -196,6 +226,7 @@ class Frontend:
     ) -> None:
         if filter_func is not None:
             entities = filter(filter_func, entities)
+        culling = self._culling
         for entity in entities:
             if not isinstance(entity, DXFGraphic):
                 if (
@@ -206,12 +237,29 @@ class Frontend:
                 else:
                     self.skip_entity(entity, "Cannot parse DXF entity")
                     continue
+            box = None
+            if culling is not None:
+                box = culling.bbox(entity)
+                if box is not None and culling.is_outside(box):
+                    continue
             properties = self.ctx.resolve_all(entity)
             self.override_properties(entity, properties)
-            if properties.is_visible:
-                self.draw_entity(entity, properties)
-            else:
+            if not properties.is_visible:
                 self.skip_entity(entity, "invisible")
+            elif box is not None and culling.is_subpixel(box):  # type: ignore
+                self.draw_subpixel_entity(entity, properties, box)
+            else:
+                self.draw_entity(entity, properties)
+
+    def draw_subpixel_entity(
+        self, entity: DXFGraphic, properties: Properties, box: BoundingBox2d
+    ) -> None:
+        """Draw an entity smaller than a pixel as point in the level of detail
+        mode.
+        """
+        self.out.enter_entity(entity, properties)
+        self.out.draw_point(Vec3(box.center), properties)
+        self.out.exit_entity(entity)
 
     def draw_entity(self, entity: DXFGraphic, properties: Properties) -> None:
         """Draw a single DXF entity.
@@ -423,6 +471,16 @@ class Frontend:
             )
             external_paths, holes = winding_deconstruction(polygons)
 
+        if (
+            self.config.hatch_policy == HatchPolicy.SHOW_PATTERN_LINES
+            and not polygon.dxf.solid_fill
+            and polygon.pattern is not None
+            and self.draw_hatch_pattern_lines(
+                polygon, external_paths + holes, properties
+            )
+        ):
+            return
+
         if external_paths:
             self.out.draw_filled_paths(
                 ignore_text_boxes(external_paths), holes, properties
@@ -431,6 +489,34 @@ class Frontend:
             # First path is the exterior path, everything else is a hole
             self.out.draw_filled_paths([holes[0]], holes[1:], properties)
 
+    def draw_hatch_pattern_lines(
+        self, polygon: DXFPolygon, loops: List[Path], properties: Properties
+    ) -> bool:
+        """Draw the hatch pattern as line segments, returns ``False`` if the
+        pattern exceeds the segment budget.
+        """
+        ocs = polygon.ocs()
+        if ocs.transform:
+            loops = transform_paths_to_ocs(loops, ocs)
+        try:
+            segments = hatch_line_segments(
+                polygon.pattern.lines,  # type: ignore
+                loops,
+                distance=self.config.max_flattening_distance,
+                max_segments=self.config.max_hatch_pattern_segments,
+            )
+        except DenseHatchingLinesError:
+            return False
+        line_properties = copy.copy(properties)
+        line_properties.linetype_name = "CONTINUOUS"
+        line_properties.linetype_pattern = CONTINUOUS_PATTERN
+        line_properties.filling = None
+        for start, end in to_wcs_lines(
+            segments, ocs, polygon.dxf.elevation.z
+        ):
+            self.out.draw_line(start, end, line_properties)
+        return True
+
     def draw_mpolygon_entity(self, entity: DXFGraphic, properties: Properties):
         def resolve_fill_color() -> str:
             return self.ctx.resolve_aci_color(
@@ -614,6 +700,10 @@ class Frontend:
 
         def draw_insert(insert: Insert):
             self.draw_entities(insert.attribs)
+            if self.config.block_instancing and self.draw_block_instance(
+                insert, properties
+            ):
+                return
             # draw_entities() includes the visibility check:
             self.draw_entities(
                 insert.virtual_entities(
@@ -639,6 +729,56 @@ class Frontend:
         else:
             raise TypeError(entity.dxftype())
 
+    def draw_block_instance(self, insert: Insert, properties: Properties) -> bool:
+        """Draw the block content of `insert` by replaying the recorded
+        backend calls of the block definition. Returns ``False`` if the
+        block reference has to be drawn by its virtual entities.
+
+        Args:
+            insert: block reference, the render context state is already
+                pushed
+            properties: resolved properties of the block reference
+
+        """
+        if not is_instanceable(insert):
+            return False
+        block = insert.block()
+        if block is None:
+            return False
+        key = (block.block_record_handle,) + block_reference_key(properties)
+        try:
+            instance = self._block_instances[key]
+        except KeyError:
+            instance = self._record_block_instance(block)
+            self._block_instances[key] = instance
+        scale = insert.dxf.xscale
+        if instance.is_scale_dependent and not math.isclose(scale, 1.0):
+            return False
+        self.replay_block_instance(instance.commands, insert.matrix44())
+        return True
+
+    def replay_block_instance(self, commands: Commands, m: Matrix44) -> None:
+        """Replay the recorded backend calls of a block definition transformed
+        by the block reference matrix `m`. Backends which support native
+        instancing can be supported by overriding this method.
+        """
+        replay(commands, self.out, transform=m)
+
+    def _record_block_instance(self, block: BlockLayout) -> "BlockInstance":
+        out = self.out
+        culling = self._culling
+        recorder = Recorder(measurement_backend=out)
+        self.out = recorder
+        # The block content is drawn in block coordinates, the view culling is
+        # done for the block reference:
+        self._culling = None
+        try:
+            self.draw_entities(e for e in block if e.dxftype() != "ATTDEF")
+        finally:
+            self.out = out
+            self._culling = culling
+        return BlockInstance(recorder.commands)
+
     def draw_proxy_graphic(self, data: bytes, doc) -> None:
         if data:
             try:
@@ -648,6 +788,53 @@ class Frontend:
                 print(POST_ISSUE_MSG)
 
 
+class BlockInstance:
+    """Recorded backend calls of a block definition in block coordinates."""
+
+    def __init__(self, commands: Commands):
+        self.commands = commands
+        # Hatch patterns are defined in drawing units and have to be scaled
+        # by the frontend:
+        self.is_scale_dependent = any(
+            isinstance(arg, Properties)
+            and arg.filling is not None
+            and arg.filling.type == Filling.PATTERN
+            for command in commands
+            for arg in command[1:]
+        )
+
+
+def is_instanceable(insert: Insert) -> bool:
+    """Returns ``True`` if the block content of `insert` can be drawn by
+    transforming the recorded block content: positive uniform scaling and
+    the extrusion has to be parallel to the WCS z-axis.
+    """
+    dxf = insert.dxf
+    sx = dxf.xscale
+    return (
+        sx > 0.0
+        and math.isclose(sx, dxf.yscale)
+        and math.isclose(sx, dxf.zscale)
+        and Z_AXIS.isclose(dxf.extrusion)
+    )
+
+
+def block_reference_key(properties: Properties) -> Tuple:
+    """Returns the properties of a block reference which are inherited by the
+    block content as hashable key.
+    """
+    return (
+        properties.layer,
+        properties.color,
+        properties.linetype_name,
+        tuple(properties.linetype_pattern),
+        properties.linetype_scale,
+        properties.lineweight,
+        properties.font,
+        properties.units,
+    )
+
+
 def is_spatial_text(extrusion: Vec3) -> bool:
     # note: the magnitude of the extrusion vector has no effect on text scale
     return not math.isclose(extrusion.x, 0) or not math.isclose(extrusion.y, 0)
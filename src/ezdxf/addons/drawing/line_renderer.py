@@ -2,8 +2,10 @@
 #  License: MIT License
 import abc
 from typing import Sequence, Optional, Dict, Tuple
+from array import array
 
 from ezdxf.math import Vec3
+from ezdxf.render.linetypes import dash_segments, DenseLineTypeError
 from .config import Configuration, LinePolicy
 from .properties import Properties
 
@@ -67,6 +69,20 @@ class AbstractLineRenderer(abc.ABC):
                 pattern.pop()
             return pattern
 
+    def dash_segments(
+        self, vertices: Sequence[float], pattern: Sequence[float]
+    ) -> array:
+        """Returns the dash segments of the flat vertex buffer `vertices` as
+        float64 array of consecutive x0, y0, z0, x1, y1, z1 values, falls back
+        to a solid line if the pattern exceeds the dash budget.
+        """
+        try:
+            return dash_segments(
+                vertices, pattern, max_dashes=self._config.max_linetype_dashes
+            )
+        except DenseLineTypeError:
+            return dash_segments(vertices, tuple())
+
     def lineweight(self, properties: Properties) -> float:
         """Set lineweight_scaling=0 to use a constant minimal lineweight."""
         assert self._config.min_lineweight is not None
@@ -8,6 +8,7 @@ from typing import (
     Optional,
     Dict,
     Any,
+    Sequence,
 )
 from collections import defaultdict
 from functools import lru_cache
@@ -28,8 +29,7 @@ from ezdxf.tools.fonts import FontMeasurements
 from ezdxf.addons.drawing.type_hints import Color
 from ezdxf.tools import fonts
 from ezdxf.math import Vec3, Matrix44
-from ezdxf.path import Command
-from ezdxf.render.linetypes import LineTypeRenderer as EzdxfLineTypeRenderer
+from ezdxf.path import Command, flatten_paths
 from .config import Configuration, LinePolicy, HatchPolicy
 from .matplotlib_hatch import HATCH_NAME_MAPPING
 from .line_renderer import AbstractLineRenderer
@@ -274,8 +274,9 @@ class MatplotlibBackend(Backend):
             if self.config.hatch_policy == HatchPolicy.SHOW_OUTLINE:
                 fill = False
                 hatch = False
-            elif (
-                self.config.hatch_policy == HatchPolicy.SHOW_APPROXIMATE_PATTERN
+            elif self.config.hatch_policy in (
+                HatchPolicy.SHOW_APPROXIMATE_PATTERN,
+                HatchPolicy.SHOW_PATTERN_LINES,
             ):
                 # Use predefined hatch pattern by name matching:
                 fill = False
@@ -567,18 +568,7 @@ class EzdxfLineRenderer(MatplotlibLineRenderer):
                 )
             )
         else:
-            renderer = EzdxfLineTypeRenderer(pattern)
-            lines = LineCollection(
-                [
-                    ((s.x, s.y), (e.x, e.y))
-                    for s, e in renderer.line_segment(start, end)
-                ],
-                linewidths=lineweight,
-                color=color,
-                zorder=z,
-            )
-            lines.set_capstyle("butt")
-            self.ax.add_collection(lines)
+            self._draw_dashes((*start, *end), pattern, properties, z)
 
     def draw_path(self, path, properties: Properties, z: float):
         pattern = self.pattern(properties)
@@ -595,17 +585,28 @@ class EzdxfLineRenderer(MatplotlibLineRenderer):
             )
             self.ax.add_patch(patch)
         else:
-            renderer = EzdxfLineTypeRenderer(pattern)
-            segments = renderer.line_segments(
-                path.flattening(
-                    self._config.max_flattening_distance, segments=16
-                )
+            vertices, _ = flatten_paths(
+                [path], self._config.max_flattening_distance, segments=16
             )
-            lines = LineCollection(
-                [((s.x, s.y), (e.x, e.y)) for s, e in segments],
-                linewidths=lineweight,
-                color=color,
-                zorder=z,
-            )
-            lines.set_capstyle("butt")
-            self.ax.add_collection(lines)
+            self._draw_dashes(vertices, pattern, properties, z)
+
+    def _draw_dashes(
+        self,
+        vertices: Sequence[float],
+        pattern: Sequence[float],
+        properties: Properties,
+        z: float,
+    ):
+        buffer = self.dash_segments(vertices, pattern)
+        if len(buffer) == 0:
+            return
+        # all dashes of the polyline as (n, 2, 3) array without copying:
+        segments = np.frombuffer(buffer).reshape(-1, 2, 3)
+        lines = LineCollection(
+            segments[:, :, :2],
+            linewidths=self.lineweight(properties),
+            color=properties.color,
+            zorder=z,
+        )
+        lines.set_capstyle("butt")
+        self.ax.add_collection(lines)
@@ -0,0 +1,304 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+"""
+Parallel Frontend Pipeline
+==========================
+
+The top level entities of a layout are distributed in chunks across a pool of
+worker processes. Each worker process runs the frontend on its own copy of
+the DXF document: resolves the entity properties and converts the geometry
+into paths. The backend calls are recorded as pickled commands for each top
+level entity and the main process replays these commands to the real backend
+in the original draw order.
+
+The DXF document and the database entities are transferred as references
+and resolved to the objects of the DXF document of the main process, the
+backend gets the real DXF entities.
+
+Entities which require text measurements of the real backend, like TEXT,
+MTEXT and block references with text or attributes, are drawn by the main
+process.
+
+Experimental module, not part of the public API: each worker process gets a
+pickled copy of the DXF document and the recorded backend calls have to be
+pickled and replayed, on a single core the ParallelFrontend is about 1.5x
+slower than the Frontend. A speedup on multiple cores is not yet measured,
+see profiling/parallel_drawing.py.
+
+"""
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    List,
+    Optional,
+    Any,
+    Sequence,
+    Dict,
+    Callable,
+)
+import concurrent.futures
+import gc
+import io
+import os
+import pickle
+
+from ezdxf.addons.drawing.backend import BackendInterface
+from ezdxf.addons.drawing.config import Configuration
+from ezdxf.addons.drawing.frontend import Frontend
+from ezdxf.addons.drawing.properties import RenderContext
+from ezdxf.addons.drawing.recorder import (
+    Recorder,
+    Commands,
+    replay,
+    _entity_classes,
+)
+from ezdxf.addons.drawing.type_hints import FilterFunc
+from ezdxf.entities import DXFEntity, DXFGraphic
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Drawing, Layout
+    from ezdxf.addons.drawing.properties import LayoutProperties
+    from ezdxf.tools.fonts import FontFace, FontMeasurements
+
+__all__ = ["ParallelFrontend", "MIN_CHUNK_SIZE"]
+
+# Minimum count of top level entities per chunk, layouts with less than two
+# chunks are drawn by the main process:
+MIN_CHUNK_SIZE = 200
+
+class ParallelFrontend(Frontend):
+    """Drawing frontend which distributes the property resolution and the
+    geometry conversion of the top level entities of a layout across a pool of
+    worker processes. The backend calls are merged into the original draw
+    order by the main process.
+
+    The frontend class is instantiated in each worker process by the
+    signature ``cls(ctx, out, config)``, therefore a subclass of the
+    :class:`ParallelFrontend` has to be importable and to support this
+    signature, the :meth:`override_properties` filter is applied in the
+    worker processes.
+
+    Args:
+        ctx: the properties relevant to rendering derived from a DXF document
+        out: the backend to draw to
+        config: settings to configure the drawing frontend and backend
+        max_workers: count of worker processes, ``None`` for the count of
+            processors of the machine
+        chunk_size: count of top level entities per chunk, ``None`` for
+            an automatic chunk size
+
+    """
+
+    def __init__(
+        self,
+        ctx: RenderContext,
+        out: BackendInterface,
+        config: Configuration = Configuration.defaults(),
+        *,
+        max_workers: int = None,
+        chunk_size: int = None,
+    ):
+        super().__init__(ctx, out, config)
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self._doc: Optional["Drawing"] = None
+
+    def draw_layout(
+        self,
+        layout: "Layout",
+        finalize: bool = True,
+        *,
+        filter_func: FilterFunc = None,
+        layout_properties: Optional["LayoutProperties"] = None,
+    ) -> None:
+        # Only the top level entities of the layout are drawn in parallel,
+        # which is the first call of draw_entities():
+        self._doc = layout.doc
+        try:
+            super().draw_layout(
+                layout,
+                finalize,
+                filter_func=filter_func,
+                layout_properties=layout_properties,
+            )
+        finally:
+            self._doc = None
+
+    def draw_entities(
+        self,
+        entities: Iterable[DXFGraphic],
+        *,
+        filter_func: FilterFunc = None,
+    ) -> None:
+        doc = self._doc
+        if doc is None:
+            super().draw_entities(entities, filter_func=filter_func)
+            return
+        # nested calls are drawn by the main process:
+        self._doc = None
+        if filter_func is not None:
+            entities = filter(filter_func, entities)
+        entities = list(entities)
+        chunks = self._chunks(entities)
+        if len(chunks) < 2:
+            super().draw_entities(entities)
+            return
+        payload = pickle.dumps(
+            (type(self), self.ctx, self.config, doc),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        db = doc.entitydb
+        with concurrent.futures.ProcessPoolExecutor(
+            self.max_workers,
+            initializer=_init_worker,
+            initargs=(payload,),
+        ) as pool:
+            # Entities which are not stored in the entity database of the
+            # document are drawn by the main process:
+            tasks = [
+                [
+                    e.dxf.handle if db.get(e.dxf.handle) is e else None
+                    for e in chunk
+                ]
+                for chunk in chunks
+            ]
+            # Executor.map() returns the results in chunk order:
+            for chunk, data in zip(chunks, pool.map(_draw_chunk, tasks)):
+                results = _loads(data, doc)
+                for entity, commands in zip(chunk, results):
+                    if commands is None:
+                        super().draw_entities([entity])
+                    else:
+                        self._replay(commands)
+
+    def _chunks(self, entities: List[DXFGraphic]) -> List[List[DXFGraphic]]:
+        size = self.chunk_size
+        if size is None:
+            # 4 chunks per worker process for load balancing:
+            workers = self.max_workers or os.cpu_count() or 1
+            size = max(len(entities) // (workers * 4), MIN_CHUNK_SIZE)
+        size = max(int(size), 1)
+        return [
+            entities[start : start + size]
+            for start in range(0, len(entities), size)
+        ]
+
+    def _replay(self, commands: Commands) -> None:
+        replay(commands, self.out)
+
+
+# The DXF document of the main process while unpickling the recorded commands:
+_main_document: Optional["Drawing"] = None
+
+
+def _document() -> "Drawing":
+    assert _main_document is not None
+    return _main_document
+
+
+def _database_entity(handle: str) -> DXFEntity:
+    return _document().entitydb[handle]
+
+
+def _dumps(obj: Any, doc: "Drawing") -> bytes:
+    """Pickle `obj`, the DXF document `doc` and database entities of `doc` are
+    stored as references.
+    """
+    # The dispatch table is used instead of Pickler.persistent_id(), which
+    # would be called for each pickled object including all floats:
+    db = doc.entitydb
+
+    def reduce_entity(entity: DXFEntity):
+        handle = entity.dxf.handle
+        if handle is not None and db.get(handle) is entity:
+            return _database_entity, (handle,)
+        return entity.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+
+    dispatch_table: Dict[type, Callable] = dict.fromkeys(
+        _entity_classes(), reduce_entity
+    )
+    dispatch_table[type(doc)] = lambda _: (_document, ())
+    stream = io.BytesIO()
+    pickler = pickle.Pickler(stream, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = dispatch_table  # type: ignore
+    pickler.dump(obj)
+    return stream.getvalue()
+
+
+def _loads(data: bytes, doc: "Drawing") -> Any:
+    """Unpickle `data` created by :func:`_dumps` and resolve the references
+    to the DXF document `doc` and its database entities.
+    """
+    global _main_document
+    _main_document = doc
+    # Unpickling creates many container objects, the garbage collector
+    # would traverse the whole DXF document several times:
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(data)
+    finally:
+        _main_document = None
+        if gc_enabled:
+            gc.enable()
+
+
+class _BackendRequired(Exception):
+    pass
+
+
+class _CommandRecorder(Recorder):
+    """Records the backend calls of the frontend in a worker process."""
+
+    def __init__(self, doc: "Drawing"):
+        super().__init__()
+        self.doc = doc
+
+    def get_font_measurements(
+        self, cap_height: float, font: "FontFace" = None
+    ) -> "FontMeasurements":
+        raise _BackendRequired
+
+    def get_text_line_width(
+        self, text: str, cap_height: float, font: "FontFace" = None
+    ) -> float:
+        raise _BackendRequired
+
+
+_frontend: Optional[Frontend] = None
+
+
+def _init_worker(payload: bytes) -> None:
+    global _frontend
+    cls, ctx, config, doc = pickle.loads(payload)
+    _frontend = cls(ctx, _CommandRecorder(doc), config)
+
+
+def _draw_chunk(handles: Sequence[Optional[str]]) -> bytes:
+    """Returns the recorded commands for each entity of the chunk as pickled
+    list, ``None`` for entities which have to be drawn by the main process.
+    """
+    frontend = _frontend
+    assert frontend is not None, "worker process not initialized"
+    recorder: _CommandRecorder = frontend.out  # type: ignore
+    ctx = frontend.ctx
+    db = recorder.doc.entitydb
+    results: List[Optional[Commands]] = []
+    for handle in handles:
+        if handle is None:
+            results.append(None)
+            continue
+        recorder.commands = []
+        saved_states = list(ctx._saved_states)
+        block_reference_properties = ctx.current_block_reference_properties
+        try:
+            frontend.draw_entities([db[handle]])
+        except _BackendRequired:
+            # restore render context of aborted block references:
+            ctx._saved_states = saved_states
+            ctx.current_block_reference_properties = block_reference_properties
+            results.append(None)
+        else:
+            results.append(recorder.commands)
+    # One pickle for the whole chunk to share the pickle memo:
+    return _dumps(results, recorder.doc)
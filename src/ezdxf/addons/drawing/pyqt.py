@@ -2,7 +2,15 @@
 # License: MIT License
 import math
 from abc import ABCMeta
-from typing import Optional, Iterable, Dict, Union, Tuple, no_type_check
+from typing import (
+    Optional,
+    Iterable,
+    Dict,
+    Union,
+    Tuple,
+    Sequence,
+    no_type_check,
+)
 from collections import defaultdict
 from functools import lru_cache
 from ezdxf.addons.xqt import QtCore as qc, QtGui as qg, QtWidgets as qw
@@ -15,11 +23,11 @@ from ezdxf.addons.drawing.properties import Properties
 from ezdxf.addons.drawing.line_renderer import AbstractLineRenderer
 from ezdxf.tools import fonts
 from ezdxf.math import Vec3, Matrix44
-from ezdxf.path import Path, Command
-from ezdxf.render.linetypes import LineTypeRenderer as EzdxfLineTypeRenderer
+from ezdxf.path import Path, Command, flatten_paths
 from ezdxf.tools.pattern import PatternAnalyser
 
 PatternKey = Tuple[str, float]
+SHORT_LINE = 1e-12
 
 
 class _Point(qw.QAbstractGraphicsShapeItem):
@@ -139,9 +147,9 @@ class PyQtBackend(Backend):
         filling = properties.filling
         if filling:
             if filling.type == filling.PATTERN:
-                if (
-                    self.config.hatch_policy
-                    == HatchPolicy.SHOW_APPROXIMATE_PATTERN
+                if self.config.hatch_policy in (
+                    HatchPolicy.SHOW_APPROXIMATE_PATTERN,
+                    HatchPolicy.SHOW_PATTERN_LINES,
                 ):
                     # Default pattern scaling is not supported by PyQt:
                     key: PatternKey = (filling.name, filling.angle)
@@ -568,14 +576,7 @@ class EzdxfLineRenderer(PyQtLineRenderer):
         if len(pattern) < 2:
             return self.scene.addLine(start.x, start.y, end.x, end.y, pen)
         else:
-            add_line = self.scene.addLine
-            renderer = EzdxfLineTypeRenderer(pattern)
-            return [
-                add_line(s.x, s.y, e.x, e.y, pen)
-                for s, e in renderer.line_segment(start, end)
-                # PyQt has problems with very short lines:
-                if not s.isclose(e)
-            ]
+            return self._draw_dashes((*start, *end), pattern, pen)
 
     def draw_path(self, path, properties: Properties, z=0):
         pattern = self.pattern(properties)
@@ -585,16 +586,22 @@ class EzdxfLineRenderer(PyQtLineRenderer):
             _extend_qt_path(qt_path, path)
             return self.scene.addPath(qt_path, pen, self.no_fill)
         else:
-            add_line = self.scene.addLine
-            renderer = EzdxfLineTypeRenderer(pattern)
-            segments = renderer.line_segments(
-                path.flattening(
-                    self._config.max_flattening_distance, segments=16
-                )
+            vertices, _ = flatten_paths(
+                [path], self._config.max_flattening_distance, segments=16
             )
-            return [
-                add_line(s.x, s.y, e.x, e.y, pen)
-                for s, e in segments
-                # PyQt has problems with very short lines:
-                if not s.isclose(e)
-            ]
+            return self._draw_dashes(vertices, pattern, pen)
+
+    def _draw_dashes(
+        self,
+        vertices: Sequence[float],
+        pattern: Sequence[float],
+        pen: qg.QPen,
+    ):
+        add_line = self.scene.addLine
+        it = iter(self.dash_segments(vertices, pattern))
+        return [
+            add_line(x0, y0, x1, y1, pen)
+            for x0, y0, _, x1, y1, _ in zip(it, it, it, it, it, it)
+            # PyQt has problems with very short lines:
+            if abs(x1 - x0) > SHORT_LINE or abs(y1 - y0) > SHORT_LINE
+        ]
@@ -0,0 +1,354 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+"""
+Recorder Backend
+================
+
+The :class:`Recorder` backend records the backend calls of the frontend as a
+command list, which can be replayed to any other backend multiple times with
+an optional transformation and layer filter, without walking the DXF
+document again.
+
+"""
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Dict,
+    Callable,
+    Set,
+)
+import copy
+import io
+import pickle
+
+from ezdxf.addons.drawing.backend import BackendInterface
+from ezdxf.addons.drawing.config import Configuration
+from ezdxf.addons.drawing.properties import Properties, layer_key
+from ezdxf.addons.drawing.type_hints import Color
+from ezdxf.entities import DXFEntity, DXFGraphic
+from ezdxf.math import Vec3, Matrix44
+from ezdxf.path import Path
+from ezdxf.tools import fonts
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Drawing
+
+__all__ = [
+    "Recorder",
+    "RecordedEntity",
+    "replay",
+    "dumps",
+    "loads",
+    "Commands",
+]
+
+# Recorded backend calls as (method name, *args) tuples:
+Commands = List[Tuple]
+
+DRAW_COMMANDS = {
+    "draw_point",
+    "draw_line",
+    "draw_path",
+    "draw_filled_paths",
+    "draw_filled_polygon",
+    "draw_text",
+}
+
+
+class Recorder(BackendInterface):
+    """Backend which records all backend calls of the frontend as a command
+    list in :attr:`commands`.
+
+    The frontend requires text measurements to layout TEXT and MTEXT entities,
+    these measurements are delegated to the `measurement_backend` if given.
+    Use the same kind of backend as the replay target for exact text placement,
+    e.g. a :class:`MatplotlibBackend` for PNG output, else the measurements
+    are done by the :mod:`ezdxf.tools.fonts` module.
+
+    Args:
+        measurement_backend: optional backend for text measurements
+
+    """
+
+    def __init__(self, measurement_backend: BackendInterface = None):
+        self.measurement_backend = measurement_backend
+        self.commands: Commands = []
+        self._last_properties: Optional[Properties] = None
+        self._fonts: Dict[Tuple[str, float], fonts.AbstractFont] = dict()
+
+    def record(self, *command) -> None:
+        self.commands.append(command)
+
+    def replay(
+        self,
+        backend: BackendInterface,
+        *,
+        transform: Matrix44 = None,
+        layers: Iterable[str] = None,
+    ) -> None:
+        """Replay the recorded commands to `backend`, see function
+        :func:`replay`.
+        """
+        replay(self.commands, backend, transform=transform, layers=layers)
+
+    def dumps(self) -> bytes:
+        """Returns the recorded commands as pickled :class:`bytes`.
+        DXF entities are stored as handle and DXF type, see :meth:`loads`.
+        """
+        return dumps(self.commands)
+
+    @classmethod
+    def loads(cls, data: bytes, doc: "Drawing" = None) -> "Recorder":
+        """Returns a new :class:`Recorder` from pickled commands created by
+        :meth:`dumps`. The recorded DXF entities are resolved by the entity
+        database of the DXF document `doc`, entities which do not exist in
+        `doc` or if `doc` is ``None`` are replaced by :class:`RecordedEntity`
+        placeholders.
+        """
+        recorder = cls()
+        recorder.commands = loads(data, doc)
+        return recorder
+
+    def snapshot(self, properties: Properties) -> Properties:
+        # The frontend modifies the properties between the backend calls,
+        # e.g. color and filling of MPOLYGON entities. Consecutive commands
+        # share the same snapshot if the properties are unchanged:
+        last = self._last_properties
+        if last is not None and _equal_properties(last, properties):
+            return last
+        snapshot = copy.copy(properties)
+        if snapshot.filling is not None:
+            snapshot.filling = copy.copy(snapshot.filling)
+        self._last_properties = snapshot
+        return snapshot
+
+    def configure(self, config: Configuration) -> None:
+        if self.measurement_backend is not None:
+            self.measurement_backend.configure(config)
+        self.record("configure", config)
+
+    def enter_entity(self, entity: DXFGraphic, properties: Properties) -> None:
+        if self.measurement_backend is not None:
+            self.measurement_backend.enter_entity(entity, properties)
+        self.record("enter_entity", entity, self.snapshot(properties))
+
+    def exit_entity(self, entity: DXFGraphic) -> None:
+        if self.measurement_backend is not None:
+            self.measurement_backend.exit_entity(entity)
+        self.record("exit_entity", entity)
+
+    def set_background(self, color: Color) -> None:
+        self.record("set_background", color)
+
+    def draw_point(self, pos: Vec3, properties: Properties) -> None:
+        self.record("draw_point", pos, self.snapshot(properties))
+
+    def draw_line(self, start: Vec3, end: Vec3, properties: Properties) -> None:
+        self.record("draw_line", start, end, self.snapshot(properties))
+
+    def draw_path(self, path: Path, properties: Properties) -> None:
+        self.record("draw_path", path, self.snapshot(properties))
+
+    def draw_filled_paths(
+        self,
+        paths: Iterable[Path],
+        holes: Iterable[Path],
+        properties: Properties,
+    ) -> None:
+        self.record(
+            "draw_filled_paths",
+            list(paths),
+            list(holes),
+            self.snapshot(properties),
+        )
+
+    def draw_filled_polygon(
+        self, points: Iterable[Vec3], properties: Properties
+    ) -> None:
+        self.record(
+            "draw_filled_polygon", list(points), self.snapshot(properties)
+        )
+
+    def draw_text(
+        self,
+        text: str,
+        transform: Matrix44,
+        properties: Properties,
+        cap_height: float,
+    ) -> None:
+        self.record(
+            "draw_text", text, transform, self.snapshot(properties), cap_height
+        )
+
+    def _font(self, cap_height: float, font: fonts.FontFace = None):
+        key = (font.ttf if font else "", cap_height)
+        abstract_font = self._fonts.get(key)
+        if abstract_font is None:
+            abstract_font = fonts.make_font(key[0], cap_height)
+            self._fonts[key] = abstract_font
+        return abstract_font
+
+    def get_font_measurements(
+        self, cap_height: float, font: fonts.FontFace = None
+    ) -> fonts.FontMeasurements:
+        if self.measurement_backend is not None:
+            return self.measurement_backend.get_font_measurements(
+                cap_height, font
+            )
+        return self._font(cap_height, font).measurements
+
+    def get_text_line_width(
+        self, text: str, cap_height: float, font: fonts.FontFace = None
+    ) -> float:
+        if self.measurement_backend is not None:
+            return self.measurement_backend.get_text_line_width(
+                text, cap_height, font
+            )
+        return self._font(cap_height, font).text_width(text)
+
+    def clear(self) -> None:
+        self.commands = []
+        self._last_properties = None
+
+    def finalize(self) -> None:
+        self.record("finalize")
+
+
+def _equal_properties(p1: Properties, p2: Properties) -> bool:
+    f1 = p1.filling
+    f2 = p2.filling
+    if (f1 is None) != (f2 is None):
+        return False
+    if f1 is not None and vars(f1) != vars(f2):
+        return False
+    d1 = dict(vars(p1))
+    d2 = dict(vars(p2))
+    del d1["filling"]
+    del d2["filling"]
+    return d1 == d2
+
+
+def replay(
+    commands: Commands,
+    backend: BackendInterface,
+    *,
+    transform: Matrix44 = None,
+    layers: Iterable[str] = None,
+) -> None:
+    """Replay the recorded `commands` to `backend`.
+
+    Args:
+        commands: recorded commands of a :class:`Recorder`
+        backend: target backend
+        transform: optional transformation matrix applied to all geometries
+        layers: optional names of the layers to draw, the geometry of all
+            other layers is ignored, the names are case insensitive
+
+    """
+    layer_keys: Optional[Set[str]] = None
+    if layers is not None:
+        layer_keys = set(layer_key(name) for name in layers)
+    for name, *args in commands:
+        if name in DRAW_COMMANDS:
+            if layer_keys is not None:
+                # properties are the 2nd last or last argument:
+                properties = args[-2] if name == "draw_text" else args[-1]
+                if layer_key(properties.layer) not in layer_keys:
+                    continue
+            if transform is not None:
+                args = _TRANSFORMATIONS[name](transform, *args)
+        getattr(backend, name)(*args)
+
+
+_TRANSFORMATIONS: Dict[str, Callable] = {
+    "draw_point": lambda m, pos, p: (m.transform(pos), p),
+    "draw_line": lambda m, s, e, p: (m.transform(s), m.transform(e), p),
+    "draw_path": lambda m, path, p: (path.transform(m), p),
+    "draw_filled_paths": lambda m, paths, holes, p: (
+        [path.transform(m) for path in paths],
+        [path.transform(m) for path in holes],
+        p,
+    ),
+    "draw_filled_polygon": lambda m, points, p: (
+        list(m.transform_vertices(points)),
+        p,
+    ),
+    "draw_text": lambda m, text, t, p, cap_height: (
+        text,
+        t * m,
+        p,
+        cap_height,
+    ),
+}
+
+
+class RecordedEntity:
+    """Placeholder for DXF entities of loaded commands, which do not exist
+    in the DXF document. Supports the :meth:`dxftype` method and the
+    :attr:`handle` attribute.
+    """
+
+    def __init__(self, handle: Optional[str], dxftype: str):
+        self.handle = handle
+        self._dxftype = dxftype
+
+    def dxftype(self) -> str:
+        return self._dxftype
+
+    def __reduce__(self):
+        return _load_entity, (self.handle, self._dxftype)
+
+    def __repr__(self):
+        return f"RecordedEntity({self.handle!r}, {self._dxftype!r})"
+
+
+def _entity_classes() -> Set[type]:
+    classes = [DXFEntity]
+    for cls in classes:
+        classes.extend(cls.__subclasses__())
+    return set(classes)
+
+
+def _reduce_entity(entity: DXFEntity):
+    return _load_entity, (entity.dxf.handle, entity.dxftype())
+
+
+def dumps(commands: Commands) -> bytes:
+    """Returns the recorded `commands` as pickled :class:`bytes`, DXF
+    entities are stored as handle and DXF type.
+    """
+    stream = io.BytesIO()
+    pickler = pickle.Pickler(stream, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = dict.fromkeys(  # type: ignore
+        _entity_classes(), _reduce_entity
+    )
+    pickler.dump(commands)
+    return stream.getvalue()
+
+
+# The DXF document to resolve the entity handles while loading commands:
+_document: Optional["Drawing"] = None
+
+
+def _load_entity(handle: Optional[str], dxftype: str):
+    if _document is not None and handle is not None:
+        entity = _document.entitydb.get(handle)
+        if entity is not None and entity.dxftype() == dxftype:
+            return entity
+    return RecordedEntity(handle, dxftype)
+
+
+def loads(data: bytes, doc: "Drawing" = None) -> Commands:
+    """Returns the recorded commands from pickled `data` created by
+    :func:`dumps`, the DXF entities are resolved by the entity database of
+    the DXF document `doc`.
+    """
+    global _document
+    _document = doc
+    try:
+        return pickle.loads(data)
+    finally:
+        _document = None
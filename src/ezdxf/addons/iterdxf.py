@@ -12,15 +12,24 @@ from typing import (
     Set,
     Union,
     Any,
+    Callable,
+    Deque,
+    NamedTuple,
 )
+from collections import deque
 from io import StringIO
 from pathlib import Path
+import concurrent.futures
+import json
+import logging
+import os
 from ezdxf.lldxf.const import DXFStructureError
 from ezdxf.lldxf.extendedtags import ExtendedTags, DXFTag
 from ezdxf.lldxf.tagwriter import TagWriter
 from ezdxf.lldxf.tagger import tag_compiler, ascii_tags_loader
 from ezdxf.filemanagement import dxf_file_info
 from ezdxf.lldxf import fileindex
+from ezdxf.lldxf.lazyloader import _split_entities
 
 from ezdxf.entities import DXFGraphic, DXFEntity, Polyline, Insert
 from ezdxf.entities import factory
@@ -29,6 +38,8 @@ from ezdxf.tools.codepage import toencoding
 
 __all__ = ["opendxf", "single_pass_modelspace", "modelspace"]
 
+logger = logging.getLogger("ezdxf")
+
 SUPPORTED_TYPES = {
     "ARC",
     "LINE",
@@ -64,6 +75,28 @@ SUPPORTED_TYPES = {
 
 Filename = Union[Path, str]
 
+# Minimum size of a chunk in bytes for the parallel modelspace iteration:
+MIN_CHUNK_SIZE = 1 << 20
+# Linked entities are never separated from their main entity:
+LINKED_TYPES = {"VERTEX", "SEQEND", "ATTRIB"}
+
+SIDECAR_EXTENSION = ".dxfidx"
+SIDECAR_SIGNATURE = "EZDXF-IterDXF-INDEX"
+SIDECAR_VERSION = 1
+
+
+class EntityRecord(NamedTuple):
+    """Index entry of a DXF entity of the ENTITIES section, the file range
+    from `start` to `end` includes the linked entities.
+    """
+
+    handle: str
+    dxftype: str
+    layer: str
+    paperspace: int
+    start: int
+    end: int
+
 
 class IterDXF:
     """Iterator for DXF entities stored in the modelspace.
@@ -76,19 +109,44 @@ class IterDXF:
             - "ignore" to use the replacement char U+FFFD "\ufffd" for invalid data
             - "strict" to raise an :class:`UnicodeDecodeError`exception  for invalid data
 
+        sidecar: store the file index and the entity index in a sidecar file
+            with the extension ".dxfidx" beside the DXF file, reopening the
+            DXF file loads the sidecar file instead of scanning the DXF file
+            again, outdated sidecar files are replaced
+
     Raises:
         DXFStructureError: invalid or incomplete DXF file
         UnicodeDecodeError: if `errors` is "strict" and a decoding error occurs
 
     """
 
-    def __init__(self, name: Filename, errors: str = "surrogateescape"):
-        self.structure, self.sections = self._load_index(str(name))
+    def __init__(
+        self,
+        name: Filename,
+        errors: str = "surrogateescape",
+        *,
+        sidecar: bool = False,
+    ):
+        self.name = str(name)
+        self.sidecar = sidecar
+        # Columns of the entity index (handle, dxftype, layer, paperspace,
+        # start, end), see EntityRecord, built on demand:
+        self._columns: Optional[List[list]] = None
+        self._records: Optional[List[EntityRecord]] = None
+        # Row of the entity index by handle:
+        self._handles: Dict[str, int] = dict()
+        # Columns of the file index loaded from the sidecar file:
+        self._structure_columns: Optional[List[list]] = None
+        if not (sidecar and self._load_sidecar()):
+            self._structure, self.sections = self._load_index(self.name)
         self.errors = errors
         self.file: BinaryIO = open(name, mode="rb")
+        # Separate file handle for the random access of the entity index,
+        # which does not disturb the sequential reading of self.file:
+        self._random_access_file: Optional[BinaryIO] = None
         if "ENTITIES" not in self.sections:
             raise DXFStructureError("ENTITIES section not found.")
-        if self.structure.version > "AC1009" and "OBJECTS" not in self.sections:
+        if self.dxfversion > "AC1009" and "OBJECTS" not in self.sections:
             raise DXFStructureError("OBJECTS section not found.")
 
     def _load_index(
@@ -106,13 +164,210 @@ class IterDXF:
         structure.index = new_index
         return structure, sections
 
+    @property
+    def sidecar_name(self) -> str:
+        """Returns the file name of the sidecar file."""
+        return str(Path(self.name).with_suffix(SIDECAR_EXTENSION))
+
+    def _file_stamp(self) -> List[int]:
+        stat = os.stat(self.name)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    @property
+    def structure(self) -> fileindex.FileStructure:
+        """The file index of the DXF file."""
+        columns = self._structure_columns
+        if columns is not None:
+            self._structure.index = list(
+                map(fileindex.IndexEntry._make, zip(*columns))
+            )
+            self._structure_columns = None
+        return self._structure
+
+    def _load_sidecar(self) -> bool:
+        """Load the file index and the entity index from the sidecar file,
+        returns ``False`` if the sidecar file does not exist or is outdated.
+        """
+        # The indexes are stored as columns, which is much faster to load
+        # than a list of rows:
+        try:
+            with open(self.sidecar_name, "rt", encoding="utf8") as fp:
+                data = json.load(fp)
+            if (
+                data["signature"] != SIDECAR_SIGNATURE
+                or data["version"] != SIDECAR_VERSION
+                or data["stamp"] != self._file_stamp()
+            ):
+                return False
+            structure = fileindex.FileStructure(self.name)
+            structure.version = data["dxfversion"]
+            structure.encoding = data["encoding"]
+            structure_columns = data["structure"]
+            entity_columns = data["entities"]
+            if len(structure_columns) != 4 or len(entity_columns) != 6:
+                return False
+            self._structure = structure
+            self._structure_columns = structure_columns
+            self.sections = data["sections"]
+            self._set_columns(entity_columns)
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        return True
+
+    def _save_sidecar(self) -> None:
+        structure = self.structure
+        data = {
+            "signature": SIDECAR_SIGNATURE,
+            "version": SIDECAR_VERSION,
+            "stamp": self._file_stamp(),
+            "dxfversion": structure.version,
+            "encoding": structure.encoding,
+            "sections": self.sections,
+            "structure": _to_columns(structure.index, 4),
+            "entities": self._columns,
+        }
+        name = self.sidecar_name
+        try:
+            with open(name + ".tmp", "wt", encoding="utf8") as fp:
+                json.dump(data, fp, separators=(",", ":"))
+            os.replace(name + ".tmp", name)
+        except OSError as e:
+            logger.warning(f"cannot write sidecar file '{name}': {str(e)}")
+
+    def _set_columns(self, columns: List[list]) -> None:
+        self._columns = columns
+        self._records = None
+        handles = columns[0]
+        self._handles = dict(zip(handles, range(len(handles))))
+        self._handles.pop("", None)  # DXF R12 without handles
+
+    def _entity_columns(self) -> List[list]:
+        if self._columns is None:
+            self._set_columns(_to_columns(self._scan_records(), 6))
+            if self.sidecar:
+                self._save_sidecar()
+        return self._columns  # type: ignore
+
+    def entity_records(self) -> List[EntityRecord]:
+        """Returns the index of the main entities of the ENTITIES section in
+        file order, linked entities like VERTEX and ATTRIB are included in the
+        file range of their main entity. The index is created by the first
+        call of :meth:`entity_records`, :meth:`get` or :meth:`query` and is
+        stored in the sidecar file if enabled.
+        """
+        columns = self._entity_columns()
+        if self._records is None:
+            self._records = list(map(EntityRecord._make, zip(*columns)))
+        return self._records
+
+    @property
+    def _index_file(self) -> BinaryIO:
+        if self._random_access_file is None:
+            self._random_access_file = open(self.name, mode="rb")
+        return self._random_access_file
+
+    def _scan_records(self) -> Iterator[EntityRecord]:
+        encoding = self.encoding
+        errors = self.errors
+        file = self._index_file
+        index = self.structure.index
+        first = self.sections["ENTITIES"] + 1
+        try:
+            last = self.structure.get(0, "ENDSEC", first)
+        except ValueError:
+            raise DXFStructureError(f"ENDSEC of ENTITIES section not found.")
+        mains = [
+            num
+            for num in range(first, last)
+            if index[num].value not in LINKED_TYPES
+        ]
+        mains.append(last)
+        # The file content is read in chunks of at least MIN_CHUNK_SIZE:
+        data = b""
+        data_start = 0
+        for num, next_main in zip(mains, mains[1:]):
+            start = index[num].location
+            # The common attributes are stored in the main entity:
+            end_of_main = index[num + 1].location
+            if end_of_main > data_start + len(data):
+                file.seek(start)
+                data = file.read(max(MIN_CHUNK_SIZE, end_of_main - start))
+                data_start = start
+            handle, layer, paperspace = _common_attribs(
+                data[start - data_start : end_of_main - data_start]
+            )
+            yield EntityRecord(
+                handle.decode(encoding, errors=errors),
+                index[num].value,
+                layer.decode(encoding, errors=errors),
+                paperspace,
+                start,
+                index[next_main].location,
+            )
+
+    def get(self, handle: str) -> Optional[DXFGraphic]:
+        """Returns the DXF entity `handle` of the ENTITIES section including
+        the linked entities or ``None`` if `handle` does not exist, the
+        handles of linked entities are not indexed. The entity is loaded from
+        its indexed file location, see :meth:`entity_records`.
+        """
+        columns = self._entity_columns()
+        row = self._handles.get(handle)
+        if row is None:
+            return None
+        return self._load_range(columns[4][row], columns[5][row])
+
+    def query(
+        self, types: Iterable[str] = None, layers: Iterable[str] = None
+    ) -> Iterator[DXFGraphic]:
+        """Returns an iterator for the supported DXF entities in the
+        modelspace by the indexed DXF type and layer name, only the matching
+        entities are loaded from their indexed file locations, see
+        :meth:`entity_records`.
+
+        Args:
+            types: DXF types like ``['LINE', '3DFACE']`` which should be
+                returned, ``None`` returns all supported types.
+            layers: layer names, ``None`` for all layers, the layer names are
+                case insensitive
+
+        """
+        requested_types = _requested_types(types)
+        layer_keys = None
+        if layers is not None:
+            layer_keys = set(layer.lower() for layer in layers)
+        _, dxftypes, layers_, paperspace, starts, ends = self._entity_columns()
+        for row, dxftype in enumerate(dxftypes):
+            if paperspace[row] or dxftype not in requested_types:
+                continue
+            if layer_keys is not None and layers_[row].lower() not in layer_keys:
+                continue
+            yield self._load_range(starts[row], ends[row])
+
+    def _load_range(self, start: int, end: int) -> DXFGraphic:
+        file = self._index_file
+        file.seek(start)
+        text = (
+            file.read(end - start)
+            .decode(self.encoding, errors=self.errors)
+            .replace("\r\n", "\n")
+        )
+        linked_entity = entity_linker()
+        entity = None
+        for data in _split_entities(text):
+            e = factory.load(ExtendedTags.from_text(data))
+            if entity is None:
+                entity = e
+            linked_entity(e)
+        return cast(DXFGraphic, entity)
+
     @property
     def encoding(self):
-        return self.structure.encoding
+        return self._structure.encoding
 
     @property
     def dxfversion(self):
-        return self.structure.version
+        return self._structure.version
 
     def export(self, name: Filename) -> "IterDXFWriter":
         """Returns a companion object to export parts from the source DXF file
@@ -179,6 +434,115 @@ class IterDXF:
         if queued:
             yield queued
 
+    def parallel_modelspace(
+        self,
+        func: Callable[[DXFGraphic], Any],
+        types: Iterable[str] = None,
+        *,
+        max_workers: int = None,
+        chunk_size: int = None,
+    ) -> Iterator[Any]:
+        """Returns an iterator of the results of function `func` applied to
+        all supported DXF entities in the modelspace, in the same order as
+        the entities of the :meth:`modelspace` iterator.
+
+        The ENTITIES section is split into chunks at DXF entity boundaries,
+        linked entities like VERTEX and ATTRIB stay with their main entity.
+        A pool of worker processes loads the DXF entities of the chunks and
+        applies the function `func` to them. Only the results are
+        transferred to the main process, and only a few chunks are processed
+        ahead of the consumer of the results. Reduce the results by
+        :func:`functools.reduce` if required.
+
+        The function `func` and its results have to be picklable, e.g.
+        a function defined at module level, which returns the required
+        attributes of the entity.
+
+        Args:
+            func: function to apply to each entity
+            types: DXF types like ``['LINE', '3DFACE']`` which should be
+                processed, ``None`` processes all supported types.
+            max_workers: count of worker processes, ``None`` for the count
+                of processors of the machine
+            chunk_size: size of a chunk in bytes, ``None`` for an automatic
+                chunk size with a minimum size of 1MB
+
+        """
+        workers = max_workers or os.cpu_count() or 1
+        chunks = self.chunks(chunk_size, count=workers * 4)
+        requested_types = _requested_types(types)
+        if len(chunks) < 2:  # processed by the main process
+            with open(self.name, mode="rb") as file:
+                for start, end in chunks:
+                    yield from _scan(
+                        file,
+                        self.encoding,
+                        self.errors,
+                        requested_types,
+                        func,
+                        start,
+                        end,
+                    )
+            return
+
+        pending: Deque[concurrent.futures.Future] = deque()
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers,
+            initializer=_init_worker,
+            initargs=(
+                self.name,
+                self.encoding,
+                self.errors,
+                requested_types,
+                func,
+            ),
+        ) as pool:
+            try:
+                for start, end in chunks:
+                    pending.append(pool.submit(_scan_chunk, start, end))
+                    # limit the count of processed chunks ahead:
+                    if len(pending) > workers * 2:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def chunks(self, size: int = None, count: int = 1) -> List[Tuple[int, int]]:
+        """Returns the file locations (start, end) of the chunks of the
+        ENTITIES section for the :meth:`parallel_modelspace` iteration.
+        (internal API)
+
+        Args:
+            size: chunk size in bytes, ``None`` to split the section into
+                `count` chunks with a minimum chunk size of 1MB
+            count: count of chunks for the automatic chunk size
+
+        """
+        index = self.structure.index
+        first = self.sections["ENTITIES"] + 1
+        try:
+            last = self.structure.get(0, "ENDSEC", first)
+        except ValueError:
+            raise DXFStructureError(f"ENDSEC of ENTITIES section not found.")
+        chunk_start = index[first].location
+        if size is None:
+            total = index[last].location - chunk_start
+            size = max(total // max(count, 1) + 1, MIN_CHUNK_SIZE)
+        size = max(int(size), 1)
+        chunks: List[Tuple[int, int]] = []
+        for entry in index[first + 1 : last + 1]:
+            location = entry.location
+            if entry.value in LINKED_TYPES or location - chunk_start < size:
+                continue
+            chunks.append((chunk_start, location))
+            chunk_start = location
+        end = index[last].location
+        if chunk_start < end:
+            chunks.append((chunk_start, end))
+        return chunks
+
     def load_entities(
         self, start: int, requested_types: Set[str]) -> Iterable[DXFGraphic]:
         def to_str(data: bytes) -> str:
@@ -202,6 +566,9 @@ class IterDXF:
     def close(self):
         """Safe closing source DXF file."""
         self.file.close()
+        if self._random_access_file is not None:
+            self._random_access_file.close()
+            self._random_access_file = None
 
 
 class IterDXFWriter:
@@ -265,7 +632,12 @@ class IterDXFWriter:
         self.file.close()
 
 
-def opendxf(filename: Filename, errors: str = "surrogateescape") -> IterDXF:
+def opendxf(
+    filename: Filename,
+    errors: str = "surrogateescape",
+    *,
+    sidecar: bool = False,
+) -> IterDXF:
     """Open DXF file for iterating, be sure to open valid DXF files, no DXF
     structure checks will be applied.
 
@@ -279,12 +651,15 @@ def opendxf(filename: Filename, errors: str = "surrogateescape") -> IterDXF:
             - "ignore" to use the replacement char U+FFFD "\ufffd" for invalid data
             - "strict" to raise an :class:`UnicodeDecodeError` exception for invalid data
 
+        sidecar: store the file index and the entity index in a ".dxfidx"
+            sidecar file for a fast reopening, see :class:`IterDXF`
+
     Raises:
         DXFStructureError: invalid or incomplete DXF file
         UnicodeDecodeError: if `errors` is "strict" and a decoding error occurs
 
     """
-    return IterDXF(filename, errors=errors)
+    return IterDXF(filename, errors=errors, sidecar=sidecar)
 
 
 def modelspace(
@@ -464,6 +839,102 @@ def binary_tagger(
             return
 
 
+# The arguments of the worker process for the parallel modelspace iteration:
+WorkerArgs = Tuple[BinaryIO, str, str, Set[str], Callable[[DXFGraphic], Any]]
+_worker_args: Optional[WorkerArgs] = None
+
+
+def _init_worker(
+    name: str,
+    encoding: str,
+    errors: str,
+    requested_types: Set[str],
+    func: Callable[[DXFGraphic], Any],
+) -> None:
+    global _worker_args
+    file = open(name, mode="rb")
+    _worker_args = (file, encoding, errors, requested_types, func)
+
+
+def _scan_chunk(start: int, end: int) -> List[Any]:
+    assert _worker_args is not None, "worker process is not initialized"
+    file, encoding, errors, requested_types, func = _worker_args
+    return _scan(file, encoding, errors, requested_types, func, start, end)
+
+
+def _scan(
+    file: BinaryIO,
+    encoding: str,
+    errors: str,
+    requested_types: Set[str],
+    func: Callable[[DXFGraphic], Any],
+    start: int,
+    end: int,
+) -> List[Any]:
+    """Returns the results of function `func` for all modelspace entities
+    of the requested types in the file range from `start` to `end`.
+    """
+    file.seek(start)
+    text = (
+        file.read(end - start)
+        .decode(encoding, errors=errors)
+        .replace("\r\n", "\n")
+    )
+    results: List[Any] = []
+    linked_entity = entity_linker()
+    queued: Optional[DXFGraphic] = None
+    for data in _split_entities(text):
+        # The 2nd line is the DXF type of the entity:
+        dxftype = data.split("\n", 2)[1].strip()
+        if dxftype not in requested_types:
+            continue
+        entity = cast(DXFGraphic, factory.load(ExtendedTags.from_text(data)))
+        if not linked_entity(entity) and entity.dxf.paperspace == 0:
+            # queue one entity for collecting linked entities:
+            # VERTEX, ATTRIB
+            if queued:
+                results.append(func(queued))
+            queued = entity
+    if queued:
+        results.append(func(queued))
+    return results
+
+
+def _to_columns(rows: Iterable[Tuple], count: int) -> List[list]:
+    columns: List[list] = [[] for _ in range(count)]
+    appenders = [column.append for column in columns]
+    for row in rows:
+        for append, value in zip(appenders, row):
+            append(value)
+    return columns
+
+
+def _common_attribs(data: bytes) -> Tuple[bytes, bytes, int]:
+    """Returns the handle, the layer name and the paperspace flag of the DXF
+    entity `data` without linked entities.
+    """
+    handle = b""
+    layer = b"0"
+    paperspace = 0
+    lines = data.split(b"\n")
+    for index in range(2, len(lines) - 1, 2):
+        try:
+            code = int(lines[index])
+        except ValueError:
+            raise DXFStructureError(f"Invalid group code")
+        value = lines[index + 1].rstrip(b"\r")
+        if code == 5:
+            handle = value
+        elif code == 8:
+            layer = value
+        elif code == 67:
+            paperspace = int(value)
+        elif code == 100 and value != b"AcDbEntity":
+            # the common attributes are stored before the entity subclass
+            break
+    return handle, layer, paperspace
+
+
 def _requested_types(types: Optional[Iterable[str]]) -> Set[str]:
     if types:
         requested = SUPPORTED_TYPES.intersection(set(types))
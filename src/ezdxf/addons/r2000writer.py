@@ -0,0 +1,244 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+# Purpose: fast stream writer for DXF R2000 and later, without an in-memory
+# representation of the ENTITIES section.
+# The HEADER, CLASSES, TABLES and BLOCKS sections are written from a template
+# document, the OBJECTS section of the template document is written at closing.
+from typing import (
+    TYPE_CHECKING,
+    TextIO,
+    BinaryIO,
+    Union,
+    Iterator,
+    Optional,
+    Dict,
+    cast,
+)
+from contextlib import contextmanager
+from pathlib import Path
+import io
+
+import ezdxf
+from ezdxf.lldxf.const import (
+    DXF2000,
+    DXF2013,
+    DXFVersionError,
+    DXFTypeError,
+)
+from ezdxf.entities import factory, DXFGraphic
+from ezdxf.entities.subentity import LinkedEntities
+from ezdxf.graphicsfactory import CreatorInterface
+from ezdxf.tools.handle import HandleGenerator
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Drawing, Insert
+    from ezdxf.lldxf.tagwriter import AbstractTagWriter
+
+__all__ = ["r2000writer", "R2000FastStreamWriter", "HANDSEED"]
+
+# The $HANDSEED header variable has to be written before the first entity, but
+# the final count of entities is unknown at this point of time. The handle
+# seed is set to the upper limit of handles which can be allocated by the
+# stream writer, which is valid because a handle seed has to be greater than
+# all existing handles:
+HANDSEED = "FFFFFFFFFFFF"
+
+# These entities create new resources (blocks, objects) in the template
+# document, which can not be written after the BLOCKS section:
+UNSUPPORTED_TYPES = {
+    "DIMENSION",
+    "ARC_DIMENSION",
+    "LARGE_RADIAL_DIMENSION",
+    "MULTILEADER",
+}
+
+
+@contextmanager
+def r2000writer(
+    stream: Union[TextIO, BinaryIO, str, Path],
+    doc: "Drawing" = None,
+    dxfversion: str = DXF2013,
+    fmt: str = "asc",
+) -> Iterator["R2000FastStreamWriter"]:
+    """Context manager for writing DXF entities of DXF R2000 and later to a
+    stream/file. `stream` can be any file like object with a :func:`write`
+    method or just a string for writing DXF entities to the file system.
+
+    The HEADER, TABLES and BLOCKS sections are written from the template
+    document `doc`, which has to contain all required resources like layers,
+    text styles, linetypes and block definitions. A new minimal template
+    document of the given `dxfversion` is created if `doc` is ``None``,
+    the argument `dxfversion` is ignored if a template document is given.
+
+    Set argument `fmt` to "asc" to write ASCII DXF file (default) or "bin" to
+    write Binary DXF files. ASCII DXF require a :class:`TextIO` stream and
+    Binary DXF require a :class:`BinaryIO` stream. The text stream has to be
+    opened with the :attr:`~ezdxf.document.Drawing.output_encoding` of the
+    template document and the error handler ``"dxfreplace"``.
+
+    The writer sets the header variable $HANDSEED of the template document
+    `doc` to the upper handle limit :attr:`HANDSEED`, see
+    :class:`R2000FastStreamWriter`.
+
+    """
+    if doc is None:
+        doc = ezdxf.new(dxfversion)
+    _stream: Union[TextIO, BinaryIO, None] = None
+    if isinstance(stream, (str, Path)):
+        if fmt.startswith("asc"):
+            _stream = io.open(
+                stream,
+                mode="wt",
+                encoding=doc.output_encoding,
+                errors="dxfreplace",
+            )
+        elif fmt.startswith("bin"):
+            _stream = open(stream, "wb")
+        else:
+            raise ValueError(f"Unknown format '{fmt}'.")
+        stream = _stream
+    writer = R2000FastStreamWriter(stream, doc, fmt=fmt)
+    try:
+        yield writer
+    finally:
+        writer.close()
+        if _stream:
+            _stream.close()
+
+
+class R2000FastStreamWriter(CreatorInterface):
+    """Fast stream writer to create DXF R2000 and later drawings with an
+    unlimited count of entities at constant memory usage.
+
+    The writer supports the entity factory methods of the
+    :class:`~ezdxf.layouts.BaseLayout` class like :meth:`add_line`,
+    :meth:`add_lwpolyline`, :meth:`add_mtext` or :meth:`add_hatch`.
+    The entities are virtual DXF entities without an assigned DXF document,
+    the handles are allocated by the writer. Each entity is written to the
+    stream when the next entity is added or the writer is closed, therefore
+    the returned entity can be modified until the next entity is added,
+    e.g. to add boundary paths to a HATCH entity.
+
+    All resources like layers, text styles, linetypes and block definitions
+    have to exist in the template document before the writer is created.
+    The DIMENSION and MULTILEADER entities and the :meth:`add_auto_blockref`
+    method are not supported, because they create new resources.
+
+    The $HANDSEED header variable has to be written before the first entity,
+    therefore the writer sets the $HANDSEED of the template document `doc`
+    to the upper handle limit :attr:`HANDSEED` and the written DXF file
+    contains this handle seed too. A document loaded from the output file
+    allocates new handles starting at this limit "FFFFFFFFFFFF".
+
+    Args:
+        stream: a text stream for ASCII DXF or a binary stream for
+            Binary DXF
+        doc: template document
+        fmt: ``'asc'`` for ASCII DXF (default) or ``'bin'`` for Binary DXF
+
+    """
+
+    def __init__(
+        self,
+        stream: Union[TextIO, BinaryIO],
+        doc: "Drawing",
+        fmt: str = "asc",
+    ):
+        if doc.dxfversion < DXF2000:
+            raise DXFVersionError("DXF R2000 or later required.")
+        # Entities are virtual entities without an assigned DXF document:
+        super().__init__(None)  # type: ignore
+        self._doc = doc
+        self._handles: HandleGenerator = doc.entitydb.handles
+        self._owner: str = doc.modelspace().block_record_handle  # type: ignore
+        self._pending: Optional[DXFGraphic] = None
+        self._tagwriter: Optional[
+            "AbstractTagWriter"
+        ] = self._write_preface(stream, fmt)
+
+    @property
+    def dxfversion(self) -> str:
+        return self._doc.dxfversion
+
+    def _write_preface(
+        self, stream: Union[TextIO, BinaryIO], fmt: str
+    ) -> "AbstractTagWriter":
+        doc = self._doc
+        tagwriter = doc._setup_export(stream, fmt)
+        doc.header["$HANDSEED"] = HANDSEED
+        doc.header.export_dxf(tagwriter)
+        doc.classes.export_dxf(tagwriter)
+        doc.tables.export_dxf(tagwriter)
+        doc.blocks.export_dxf(tagwriter)
+        tagwriter.write_str("  0\nSECTION\n  2\nENTITIES\n")
+        # The existing entities of the template document come first:
+        layouts = doc.layouts
+        layouts.modelspace().entity_space.export_dxf(tagwriter)
+        layouts.active_layout().entity_space.export_dxf(tagwriter)
+        return tagwriter
+
+    def close(self) -> None:
+        """Writes the pending entity, the OBJECTS section of the template
+        document and the DXF tail. Call is not necessary when using the
+        context manager :func:`r2000writer`.
+        """
+        tagwriter = self._tagwriter
+        if tagwriter is None:
+            return
+        self._flush()
+        tagwriter.write_tag2(0, "ENDSEC")
+        doc = self._doc
+        doc.objects.export_dxf(tagwriter)
+        if doc.acdsdata.is_valid:
+            doc.acdsdata.export_dxf(tagwriter)
+        for section in doc.stored_sections:
+            section.export_dxf(tagwriter)
+        tagwriter.write_tag2(0, "EOF")
+        self._tagwriter = None
+
+    def new_entity(self, type_: str, dxfattribs: Dict) -> "DXFGraphic":
+        """Create a new virtual DXF entity, which will be written to the
+        stream when the next entity is added or the writer is closed.
+
+        Args:
+            type_ : DXF type string, like "LINE", "CIRCLE" or "LWPOLYLINE"
+            dxfattribs: DXF attributes for the new entity
+
+        """
+        if type_ in UNSUPPORTED_TYPES:
+            raise DXFTypeError(f"{type_} entity not supported.")
+        entity = cast(DXFGraphic, factory.new(type_, dxfattribs))
+        self.add_entity(entity)
+        return entity
+
+    def add_entity(self, entity: "DXFGraphic") -> None:
+        """Add a virtual DXF entity without an assigned DXF document, e.g.
+        from the :mod:`~ezdxf.addons.iterdxf` add-on or
+        :meth:`~ezdxf.entities.DXFGraphic.virtual_entities`. The entity has
+        to be a copy, if the source entity is used elsewhere, because the
+        handle and the owner of the entity will be replaced.
+        """
+        if self._tagwriter is None:
+            raise IOError("Writer is closed.")
+        self._flush()
+        self._pending = entity
+
+    def add_auto_blockref(self, *args, **kwargs) -> "Insert":
+        """Not supported, creates a new anonymous block definition."""
+        raise DXFTypeError("add_auto_blockref() not supported.")
+
+    def _flush(self) -> None:
+        entity = self._pending
+        if entity is None:
+            return
+        self._pending = None
+        handles = self._handles
+        entity.dxf.handle = handles.next()
+        if isinstance(entity, LinkedEntities):
+            if entity.seqend is None:
+                entity.new_seqend()
+            for sub_entity in entity.all_sub_entities():
+                sub_entity.dxf.handle = handles.next()
+        # set owner of all sub-entities and reset the paperspace flag:
+        entity.set_owner(self._owner)
+        entity.export_dxf(self._tagwriter)  # type: ignore
@@ -1,11 +1,18 @@
 #  Copyright (c) 2021, Manfred Moitzi
 #  License: MIT License
-from typing import TYPE_CHECKING, Iterable, Dict, Optional
+from typing import TYPE_CHECKING, Iterable, Dict, Optional, List, Tuple
+import math
 from ezdxf import disassemble
-from ezdxf.math import BoundingBox, Vec3
+from ezdxf.entities import Insert
+from ezdxf.explode import BlockEntityView
+from ezdxf.math import BoundingBox, Vec2, Vec3, convex_hull_2d
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import DXFEntity
+    from ezdxf.eztypes import DXFEntity, BlockLayout
+
+# Convex hull of the block content in block coordinates by block record handle
+# and flattening distance, ``None`` if the block content is not planar:
+BlockHulls = Dict[Tuple[str, float], Optional[List[Vec3]]]
 
 MAX_FLATTENING_DISTANCE = disassemble.Primitive.max_flattening_distance
 
@@ -20,6 +27,9 @@ class Cache:
 
     def __init__(self, uuid=False):
         self._boxes: Dict[str, BoundingBox] = dict()
+        # The convex hulls of block definitions are not invalidated by
+        # invalidate(), use a new cache if block definitions were changed:
+        self._block_hulls: BlockHulls = dict()
         self._use_uuid = bool(uuid)
         self.hits: int = 0
         self.misses: int = 0
@@ -68,6 +78,10 @@ class Cache:
                 pass
 
     def _get_key(self, entity: "DXFEntity") -> Optional[str]:
+        if isinstance(entity, BlockEntityView):
+            # The views of block entities share the handle of the source
+            # entity in the block definition:
+            return None
         if entity.dxftype() == "HATCH":
             # Special treatment for multiple primitives for the same
             # HATCH entity - all have the same handle:
@@ -98,14 +112,7 @@ def multi_recursive(
 
     """
 
-    def vertices(p: disassemble.Primitive) -> Iterable[Vec3]:
-        if flatten:
-            primitive.max_flattening_distance = abs(flatten)
-            return primitive.vertices()
-        else:
-            return disassemble.to_control_vertices([p])
-
-    flat_entities = disassemble.recursive_decompose(entities)
+    flat_entities = disassemble.recursive_decompose(entities, flyweight=True)
     primitives = disassemble.to_primitives(flat_entities)
     for primitive in primitives:
         if primitive.is_empty:
@@ -115,11 +122,11 @@ def multi_recursive(
         if cache is not None:
             box = cache.get(entity)
             if box is None:
-                box = BoundingBox(vertices(primitive))
+                box = BoundingBox(_vertices(primitive, flatten))
                 if box.has_data:
                     cache.store(entity, box)
         else:
-            box = BoundingBox(vertices(primitive))
+            box = BoundingBox(_vertices(primitive, flatten))
 
         if box.has_data:
             yield box
@@ -162,15 +169,89 @@ def multi_flat(
             _extends.extend(_box)
         return _extends
 
+    # The block hulls of a given cache are reused by subsequent calls:
+    block_hulls: BlockHulls = cache._block_hulls if cache else dict()
     for entity in entities:
         box = None
         if cache:
             box = cache.get(entity)
 
         if box is None:
-            box = extends_([entity])
+            if isinstance(entity, Insert):
+                box = _insert_extents(entity, flatten, cache, block_hulls)
+            else:
+                box = extends_([entity])
             if cache:
                 cache.store(entity, box)
 
         if box.has_data:
             yield box
+
+
+def _vertices(primitive: disassemble.Primitive, flatten: float) -> Iterable[Vec3]:
+    if flatten:
+        primitive.max_flattening_distance = abs(flatten)
+        return primitive.vertices()
+    else:
+        return disassemble.to_control_vertices([primitive])
+
+
+def _insert_extents(
+    insert: Insert, flatten: float, cache: Optional[Cache], hulls: BlockHulls
+) -> BoundingBox:
+    """Returns the extents of a block reference by transforming the cached
+    convex hull of the block content. Falls back to the decomposition of the
+    block reference for non-uniform scaling and non-planar block content.
+    """
+    if insert.mcount > 1:
+        box = BoundingBox()
+        for virtual_insert in insert.multi_insert():
+            box.extend(_insert_extents(virtual_insert, flatten, cache, hulls))
+        return box
+
+    block = insert.block()
+    hull = None
+    if block is not None and insert.has_uniform_scaling:
+        key = (block.block_record_handle, flatten)
+        try:
+            hull = hulls[key]
+        except KeyError:
+            hull = _block_hull(block, flatten)
+            hulls[key] = hull
+    box = BoundingBox()
+    if hull is None:  # exact fallback
+        for _box in multi_recursive([insert], flatten=flatten, cache=cache):
+            box.extend(_box)
+        return box
+
+    if hull:
+        box.extend(insert.matrix44().transform_vertices(hull))
+    for _box in multi_recursive(insert.attribs, flatten=flatten, cache=cache):
+        box.extend(_box)
+    return box
+
+
+def _block_hull(block: "BlockLayout", flatten: float) -> Optional[List[Vec3]]:
+    """Returns the convex hull of the block content in block coordinates as
+    a list of vertices, ``None`` if the block content is not located in a
+    plane parallel to the xy-plane of the block coordinate system.
+    """
+    # ATTDEF entities are not a part of the block reference content:
+    entities = (e for e in block if e.dxftype() != "ATTDEF")
+    primitives = disassemble.to_primitives(
+        disassemble.recursive_decompose(entities, flyweight=True)
+    )
+    vertices: List[Vec3] = []
+    for primitive in primitives:
+        if not primitive.is_empty:
+            vertices.extend(_vertices(primitive, flatten))
+    if not vertices:
+        return []
+    z = vertices[0].z
+    if not all(math.isclose(v.z, z, abs_tol=1e-9) for v in vertices):
+        return None
+    try:
+        hull = [Vec2(v) for v in convex_hull_2d(vertices)]
+    except ValueError:  # less than 3 unique vertices
+        hull = [Vec2(v) for v in vertices]
+    return [Vec3(v.x, v.y, z) for v in hull]
@@ -1,12 +1,13 @@
 #  Copyright (c) 2021, Manfred Moitzi
 #  License: MIT License
-from typing import Iterable, Optional, cast, TYPE_CHECKING, List
+from typing import Iterable, Optional, cast, TYPE_CHECKING, List, Dict
 import abc
 import math
 from ezdxf.entities import DXFEntity, Insert, get_font_name
+from ezdxf.explode import BlockEntityView, virtual_block_reference_views
 
 from ezdxf.lldxf import const
-from ezdxf.math import Vec3, UCS, Z_AXIS, X_AXIS
+from ezdxf.math import Vec3, UCS, Z_AXIS, X_AXIS, Y_AXIS
 from ezdxf.path import Path, make_path, from_vertices
 from ezdxf.render import MeshBuilder, MeshVertexMerger, TraceBuilder
 from ezdxf.protocols import SupportsVirtualEntities, virtual_entities
@@ -453,6 +454,60 @@ class ViewportPrimitive(ConvertedPrimitive):
         self._path = make_path(vp)
 
 
+class TransformedPrimitive(Primitive):
+    """Primitive of a :class:`~ezdxf.explode.BlockEntityView`, the path/mesh
+    representation of the source entity is transformed on demand.
+
+    """
+
+    def __init__(self, view: BlockEntityView, source: Primitive = None):
+        super().__init__(view)  # type: ignore
+        # The primitive of the source entity can be shared by all views of
+        # the same block entity:
+        if source is None:
+            source = make_primitive(view.source)
+        self._source = source
+        self._matrix = view.matrix
+        self._transformed = False
+
+    def _transform(self):
+        self._transformed = True
+        source = self._source
+        if source.path is not None:
+            self._path = source.path.transform(self._matrix)
+        elif source.mesh is not None:
+            self._mesh = source.mesh.copy().transform(self._matrix)
+
+    @property
+    def is_empty(self) -> bool:
+        return self._source.is_empty
+
+    @property
+    def path(self) -> Optional[Path]:
+        if not self._transformed:
+            self._transform()
+        return self._path
+
+    @property
+    def mesh(self) -> Optional[MeshBuilder]:
+        if not self._transformed:
+            self._transform()
+        return self._mesh
+
+    def vertices(self) -> Iterable[Vec3]:
+        # The flattening of the source entity is more efficient or accurate
+        # than the flattening of the transformed path, the max flattening
+        # distance in block coordinates is adjusted to the max scaling factor:
+        m = self._matrix
+        scale = max(
+            v.magnitude for v in m.transform_directions((X_AXIS, Y_AXIS, Z_AXIS))
+        )
+        source = self._source
+        if scale > 0:
+            source.max_flattening_distance = self.max_flattening_distance / scale
+        return m.transform_vertices(source.vertices())
+
+
 # SHAPE is not supported, could not create any SHAPE entities in BricsCAD
 _PRIMITIVE_CLASSES = {
     "3DFACE": QuadrilateralPrimitive,
@@ -497,21 +552,36 @@ def make_primitive(
     .. versionchanged:: 0.17
         regular support for the :class:`~ezdxf.entities.Hatch` entity.
 
+    .. versionchanged:: 0.17.2
+        support for :class:`~ezdxf.explode.BlockEntityView` objects.
+
     """
-    cls = _PRIMITIVE_CLASSES.get(entity.dxftype(), EmptyPrimitive)
-    primitive = cls(entity)
+    if isinstance(entity, BlockEntityView):
+        primitive: Primitive = TransformedPrimitive(entity)
+    else:
+        cls = _PRIMITIVE_CLASSES.get(entity.dxftype(), EmptyPrimitive)
+        primitive = cls(entity)
     if max_flattening_distance:
         primitive.max_flattening_distance = max_flattening_distance
     return primitive
 
 
-def recursive_decompose(entities: Iterable[DXFEntity]) -> Iterable[DXFEntity]:
+def recursive_decompose(
+    entities: Iterable[DXFEntity], *, flyweight: bool = False
+) -> Iterable[DXFEntity]:
     """Recursive decomposition of the given DXF entity collection into a flat
     DXF entity stream. All block references (INSERT) and entities which provide
     a :meth:`virtual_entities` method will be disassembled into simple DXF
     sub-entities, therefore the returned entity stream does not contain any
     INSERT entity.
 
+    If argument `flyweight` is ``True``, the entities of block references with
+    an exact path or mesh representation are yielded as lightweight read-only
+    :class:`~ezdxf.explode.BlockEntityView` objects instead of transformed
+    copies of the block entities. These views are supported by the
+    :func:`make_primitive` and :func:`to_primitives` functions, but do not
+    provide the DXF entity interface.
+
     Point entities will **not** be disassembled into DXF sub-entities,
     as defined by the current point style $PDMODE.
 
@@ -526,18 +596,32 @@ def recursive_decompose(entities: Iterable[DXFEntity]) -> Iterable[DXFEntity]:
 
     Decomposition of XREF, UNDERLAY and ACAD_TABLE entities is not supported.
 
+    .. versionchanged:: 0.17.2
+        argument `flyweight`
+
     """
     for entity in entities:
         if isinstance(entity, Insert):
             if entity.mcount > 1:
-                yield from recursive_decompose(entity.multi_insert())
+                yield from recursive_decompose(
+                    entity.multi_insert(), flyweight=flyweight
+                )
             else:
                 yield from entity.attribs
-                yield from recursive_decompose(virtual_entities(entity))
+                if flyweight:
+                    for e in virtual_block_reference_views(entity):
+                        if isinstance(e, BlockEntityView):
+                            yield e  # type: ignore
+                        else:
+                            yield from recursive_decompose([e], flyweight=True)
+                else:
+                    yield from recursive_decompose(virtual_entities(entity))
         # has a required __virtual_entities__() to be rendered?
         elif isinstance(entity, SupportsVirtualEntities):
             # could contain block references:
-            yield from recursive_decompose(virtual_entities(entity))
+            yield from recursive_decompose(
+                virtual_entities(entity), flyweight=flyweight
+            )
         else:
             yield entity
 
@@ -553,8 +637,22 @@ def to_primitives(
         max_flattening_distance: override the default value
 
     """
+    # The views of the same block entity share the primitive of the block
+    # entity, the primitive references the block entity, which keeps the
+    # id() of the block entity unique:
+    sources: Dict[int, Primitive] = dict()
     for e in entities:
-        yield make_primitive(e, max_flattening_distance)
+        if isinstance(e, BlockEntityView):
+            source = sources.get(id(e.source))
+            if source is None:
+                source = make_primitive(e.source)
+                sources[id(e.source)] = source
+            primitive = TransformedPrimitive(e, source)
+            if max_flattening_distance:
+                primitive.max_flattening_distance = max_flattening_distance
+            yield primitive
+        else:
+            yield make_primitive(e, max_flattening_distance)
 
 
 def to_vertices(primitives: Iterable[Primitive]) -> Iterable[Vec3]:
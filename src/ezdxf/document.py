@@ -35,7 +35,11 @@ from ezdxf.lldxf.const import (
     DXF2013,
 )
 from ezdxf.lldxf import loader
-from ezdxf.lldxf.tagwriter import TagWriter, BinaryTagWriter
+from ezdxf.lldxf.tagwriter import (
+    TagWriter,
+    BinaryTagWriter,
+    AbstractTagWriter,
+)
 
 from ezdxf.entitydb import EntityDB
 from ezdxf.layouts.layouts import Layouts
@@ -109,6 +113,20 @@ def _validate_handle_seed(seed: str) -> str:
     return seed
 
 
+def _cython_tagger():
+    """Returns the Cython tagger module :mod:`ezdxf.acc.tagger` or ``None``
+    if C-extensions are disabled or not available.
+    """
+    if ezdxf.options.use_c_ext:
+        try:
+            from ezdxf.acc import tagger
+
+            return tagger
+        except ImportError:
+            pass
+    return None
+
+
 class Drawing:
     def __init__(self, dxfversion=DXF2013):
         self.entitydb = EntityDB()
@@ -126,6 +144,9 @@ class Drawing:
 
         # Status flag which is True while loading content from a DXF file:
         self.is_loading = False
+        # Status flag which is True if any layout has a spatial index, avoids
+        # the owner lookup of transformed entities without a spatial index:
+        self.has_spatial_index = False
         self.encoding: str = "cp1252"  # read/write
         self.filename: Optional[str] = None
 
@@ -331,6 +352,13 @@ class Drawing:
              stream: text stream yielding text (unicode) strings by readline()
 
         """
+        cy_tagger = _cython_tagger()
+        if cy_tagger is not None:
+            # load and compile tags in one pass:
+            doc = cls()
+            doc._load(cy_tagger.ascii_tag_compiler(stream))
+            return doc
+
         from .lldxf.tagger import ascii_tags_loader
 
         tag_loader = ascii_tags_loader(stream)
@@ -345,13 +373,81 @@ class Drawing:
             tag_loader: DXF tag loader
 
         """
-        from .lldxf.tagger import tag_compiler
+        cy_tagger = _cython_tagger()
+        if cy_tagger is not None:
+            tag_loader = cy_tagger.tag_compiler(tag_loader)
+        else:
+            from .lldxf.tagger import tag_compiler
 
-        tag_loader = tag_compiler(tag_loader)  # type: ignore
+            tag_loader = tag_compiler(tag_loader)  # type: ignore
         doc = cls()
         doc._load(tag_loader)
         return doc
 
+    @classmethod
+    def read_lazy(
+        cls, filename: str, encoding: str, errors: str = "surrogateescape"
+    ) -> "Drawing":
+        """Open an existing ASCII DXF file and load the DXF entities of the
+        ENTITIES section on demand from the memory mapped file. Package users
+        should use the factory function :func:`ezdxf.readfile` with argument
+        `lazy` set to ``True``. (internal API)
+
+        Args:
+            filename: file system name of the ASCII DXF file
+            encoding: text encoding of the DXF file
+            errors: decoding error handler
+
+        """
+        from .lldxf.lazyloader import LazyEntityLoader
+
+        lazy_loader = LazyEntityLoader(filename, encoding, errors)
+        doc = cls()
+        lazy_loader.bind(doc)
+        stream = lazy_loader.structure_stream()
+        try:
+            cy_tagger = _cython_tagger()
+            if cy_tagger is not None:
+                doc._load(cy_tagger.ascii_tag_compiler(stream))
+            else:
+                from .lldxf.tagger import ascii_tags_loader, tag_compiler
+
+                doc._load(tag_compiler(ascii_tags_loader(stream)))  # type: ignore
+        except Exception:
+            lazy_loader.close()
+            raise
+        if lazy_loader.pending_count == 0:
+            # lazy loading not possible or no entities in the ENTITIES section
+            doc.entitydb.load_pending_entities()
+        return doc
+
+    @classmethod
+    def read_parallel(
+        cls,
+        filename: str,
+        encoding: str,
+        errors: str = "surrogateescape",
+        max_workers: int = None,
+    ) -> "Drawing":
+        """Open an existing ASCII DXF file and compile the tags of the
+        ENTITIES and OBJECTS section by a pool of `max_workers` processes.
+        Package users should use the factory function :func:`ezdxf.readfile`
+        with argument `max_workers`. (internal API)
+
+        Args:
+            filename: file system name of the ASCII DXF file
+            encoding: text encoding of the DXF file
+            errors: decoding error handler
+            max_workers: count of worker processes, ``None`` for the count of
+                processors of the machine
+
+        """
+        from .lldxf.parallelloader import ParallelLoader
+
+        doc = cls()
+        ParallelLoader(filename, encoding, errors, max_workers).load(doc)
+        return doc
+
     @classmethod
     def from_tags(cls, compiled_tags: Iterable["DXFTag"]) -> "Drawing":
         """Create new drawing from compiled tags. (internal API)"""
@@ -420,6 +516,10 @@ class Drawing:
         self.objects = ObjectsSection(
             self, sections.get("OBJECTS", None)  # type: ignore
         )
+        lazy_loader = self.entitydb.lazy_loader
+        if lazy_loader is not None and lazy_loader.pending_count:
+            # DXF entities of the ENTITIES section are loaded on demand:
+            lazy_loader.setup_entity_spaces()
 
         # only DXF R2013+
         self.acdsdata = AcDsDataSection(
@@ -466,7 +566,9 @@ class Drawing:
 
         """
         db = self.entitydb
-        for entity in db.values():
+        # Pending entities of lazy loaded documents execute the
+        # post_load_hook() when loaded:
+        for entity in db.loaded_values():
             # The post_load_hook() can return a callable, which should be
             # executed, when the DXF document is fully initialized.
             cmd = entity.post_load_hook(self)
@@ -538,6 +640,13 @@ class Drawing:
             # different than AutoCAD
             enc = encoding
 
+        lazy_loader = self.entitydb.lazy_loader
+        if lazy_loader is not None and lazy_loader.is_source_file(
+            self.filename  # type: ignore
+        ):
+            # Pending entities of lazy loaded documents are exported from
+            # the source file, which will be overwritten:
+            lazy_loader.detach()
         if fmt.startswith("asc"):
             fp = io.open(
                 self.filename, mode="wt", encoding=enc, errors="dxfreplace"  # type: ignore
@@ -551,6 +660,23 @@ class Drawing:
         finally:
             fp.close()
 
+    def save_snapshot(self, filename: Union[str, "Path"]) -> None:
+        """Write a snapshot of the loaded DXF document to the file system,
+        the snapshot can be reloaded by the function
+        :func:`ezdxf.load_snapshot` much faster than the DXF file.
+
+        The snapshot is a binary file of the pickled entity graph and is only
+        compatible to the ezdxf version which created it.
+        All pending entities of a lazy loaded DXF document are loaded.
+
+        Args:
+            filename: file name of the snapshot
+
+        """
+        from ezdxf import snapshot
+
+        snapshot.save(self, filename)
+
     def encode(self, s: str) -> bytes:
         """Encode string `s` with correct encoding and error handler."""
         return s.encode(encoding=self.output_encoding, errors="dxfreplace")
@@ -573,6 +699,14 @@ class Drawing:
             stream: output text stream or binary stream
             fmt: ``'asc'`` for ASCII DXF (default) or ``'bin'`` for binary DXF
 
+        """
+        self.export_sections(self._setup_export(stream, fmt))
+
+    def _setup_export(
+        self, stream: Union[TextIO, BinaryIO], fmt: str
+    ) -> AbstractTagWriter:
+        """Prepare document for export and returns the tag writer for `stream`.
+        (internal API)
         """
         dxfversion = self.dxfversion
         if dxfversion == DXF12:
@@ -594,6 +728,11 @@ class Drawing:
                 write_handles=handles,
                 dxfversion=dxfversion,
             )
+            # Unmodified entities loaded from a DXF file of the same DXF
+            # version are written back from their DXF source data:
+            tagwriter.export_dxf_source = (
+                handles and dxfversion == self._loaded_dxfversion
+            )
         elif fmt.startswith("bin"):
             tagwriter = BinaryTagWriter(  # type: ignore
                 stream,  # type: ignore
@@ -604,8 +743,7 @@ class Drawing:
             tagwriter.write_signature()  # type: ignore
         else:
             raise ValueError(f"Unknown output format: '{fmt}'.")
-
-        self.export_sections(tagwriter)
+        return tagwriter
 
     def encode_base64(self) -> bytes:
         """Returns DXF document as base64 encoded binary data."""
@@ -616,7 +754,7 @@ class Drawing:
         # Create Windows line endings and do base64 encoding:
         return base64.encodebytes(binary_data.replace(b"\n", b"\r\n"))
 
-    def export_sections(self, tagwriter: "TagWriter") -> None:
+    def export_sections(self, tagwriter: AbstractTagWriter) -> None:
         """DXF export sections. (internal API)"""
         dxfversion = tagwriter.dxfversion
         self.header.export_dxf(tagwriter)
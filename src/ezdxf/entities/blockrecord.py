@@ -1,6 +1,6 @@
 # Copyright (c) 2019-2021, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Iterable
 import logging
 from ezdxf.lldxf import validator
 from ezdxf.lldxf.attributes import (
@@ -30,7 +30,9 @@ if TYPE_CHECKING:
         EntitySpace,
         BlockLayout,
         Block,
-        EndBlk
+        EndBlk,
+        SpatialIndex,
+        QueryIndex,
     )
 
 __all__ = ["BlockRecord"]
@@ -104,6 +106,10 @@ class BlockRecord(DXFEntity):
         self.endblk: Optional["EndBlk"] = None
         # stores also the block layout structure
         self.block_layout: Optional[BlockLayout] = None
+        # persistent spatial index of the layout, see BaseLayout.spatial_index()
+        self.spatial_index: Optional["SpatialIndex"] = None
+        # persistent query index of the layout, see BaseLayout.query_index()
+        self.query_index: Optional["QueryIndex"] = None
 
     def set_block(self, block: "Block", endblk: "EndBlk"):
         self.block = block
@@ -184,6 +190,8 @@ class BlockRecord(DXFEntity):
         del self.block
         del self.endblk
         del self.block_layout
+        del self.spatial_index
+        del self.query_index
         super().destroy()
 
     @property
@@ -240,6 +248,10 @@ class BlockRecord(DXFEntity):
         # Add unexpected entities also to the entity space - auditor should fix
         # errors!
         self.entity_space.add(entity)
+        if self.spatial_index is not None:
+            self.spatial_index.add(entity)
+        if self.query_index is not None:
+            self.query_index.add(entity)
 
     def unlink_entity(self, entity: "DXFGraphic") -> None:
         """Unlink `entity` from BLOCK_RECORD.
@@ -253,6 +265,33 @@ class BlockRecord(DXFEntity):
         """
         if entity.is_alive:
             self.entity_space.remove(entity)
+            if self.spatial_index is not None:
+                self.spatial_index.discard(entity)
+            if self.query_index is not None:
+                self.query_index.discard(entity)
+            try:
+                entity.set_owner(None)
+            except AttributeError:
+                pass  # unsupported entities as DXFTagStorage
+
+    def unlink_entities(self, entities: Iterable["DXFGraphic"]) -> None:
+        """Unlink multiple `entities` from BLOCK_RECORD in a single pass of the
+        entity space. Raises :class:`ValueError` if an entity is not a part of
+        this BLOCK_RECORD, nothing is unlinked in this case.
+
+        Args:
+            entities: iterable of :class:`DXFGraphic`
+
+        """
+        entities = [e for e in entities if e.is_alive]
+        self.entity_space.remove_entities(entities)
+        spatial_index = self.spatial_index
+        query_index = self.query_index
+        for entity in entities:
+            if spatial_index is not None:
+                spatial_index.discard(entity)
+            if query_index is not None:
+                query_index.discard(entity)
             try:
                 entity.set_owner(None)
             except AttributeError:
@@ -267,3 +306,16 @@ class BlockRecord(DXFEntity):
         """
         self.unlink_entity(entity)  # 1. unlink from entity space
         entity.destroy()
+
+    def delete_entities(self, entities: Iterable["DXFGraphic"]) -> None:
+        """Delete multiple `entities` from BLOCK_RECORD entity space and
+        drawing database in a single pass of the entity space.
+
+        Args:
+            entities: iterable of :class:`DXFGraphic`
+
+        """
+        entities = [e for e in entities if e.is_alive]
+        self.unlink_entities(entities)  # 1. unlink from entity space
+        for entity in entities:
+            entity.destroy()
@@ -68,6 +68,7 @@ class Circle(DXFGraphic):
 
     DXFTYPE = "CIRCLE"
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_circle)
+    SOURCE_EXPORT = True
 
     def load_dxf_attribs(
         self, processor: SubclassProcessor = None
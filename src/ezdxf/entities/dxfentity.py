@@ -37,7 +37,7 @@ from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass
 from ezdxf.tools import set_flag_state
 from . import factory
 from .appdata import AppData, Reactors
-from .dxfns import DXFNamespace, SubclassProcessor
+from .dxfns import DXFNamespace, SubclassProcessor, DYN_DXF_SOURCE_ATTRIBUTE
 from .xdata import XData
 from .xdict import ExtensionDict
 
@@ -63,6 +63,9 @@ DYN_UUID_ATTRIBUTE = "_uuid"
 # Source block reference, which created the virtual entity, bound entities can
 # not have such an attribute:
 DYN_SOURCE_BLOCK_REFERENCE_ATTRIBUTE = "_source_block_reference"
+# DXF source data of unmodified entities loaded from a DXF file, discarded by
+# any modification of the DXF namespace:
+# DYN_DXF_SOURCE_ATTRIBUTE, defined in module dxfns
 
 base_class: DefSubclass = DefSubclass(
     None,
@@ -96,6 +99,10 @@ class DXFEntity:
     # an existing object in the dxf namespace.
     DEFAULT_ATTRIBS: Dict[str, Any] = {}
     MIN_DXF_VERSION_FOR_EXPORT = const.DXF12
+    # True if the DXF namespace stores the complete state of the entity, the
+    # DXF namespace tracks all modifications of such entities and unmodified
+    # entities can be exported from their DXF source data:
+    SOURCE_EXPORT = False
 
     def __init__(self):
         """Default constructor. (internal API)"""
@@ -116,6 +123,7 @@ class DXFEntity:
         # DYN_SOURCE_OF_COPY_ATTRIBUTE
         # DYN_UUID_ATTRIBUTE
         # DYN_SOURCE_BLOCK_REFERENCE_ATTRIBUTE
+        # DYN_DXF_SOURCE_ATTRIBUTE
 
     @property
     def uuid(self) -> uuid.UUID:
@@ -423,6 +431,41 @@ class DXFEntity:
             memodict[id(self)] = copy
             return copy
 
+    def set_dxf_source(self, source: str) -> None:
+        """Set the DXF `source` data of an entity loaded from a DXF file.
+        Unmodified entities are exported from their DXF source data if the
+        DXF version of the export is the DXF version of the source document.
+        Entities without support for the source export ignore the
+        DXF source data.
+
+        (internal API)
+        """
+        if self.SOURCE_EXPORT:
+            setattr(self, DYN_DXF_SOURCE_ATTRIBUTE, source)
+
+    def discard_dxf_source(self) -> None:
+        """Discard the DXF source data, the entity will be exported by the
+        regular export process. The DXF namespace calls this method for all
+        modifications of DXF attributes, call this method for modifications
+        which are not tracked by the DXF namespace.
+
+        (internal API)
+        """
+        if DYN_DXF_SOURCE_ATTRIBUTE in self.__dict__:
+            delattr(self, DYN_DXF_SOURCE_ATTRIBUTE)
+
+    @property
+    def has_dxf_source(self) -> bool:
+        """Is ``True`` if the entity is unmodified and can be exported from
+        the DXF source data.
+        """
+        return (
+            self.xdata is None
+            and self.appdata is None
+            and self.extension_dict is None
+            and getattr(self, DYN_DXF_SOURCE_ATTRIBUTE, None) is not None
+        )
+
     def update_dxf_attribs(self, dxfattribs: Dict) -> None:
         """Set DXF attributes by a ``dict`` like :code:`{'layer': 'test',
         'color': 4}`.
@@ -660,6 +703,7 @@ class DXFEntity:
         # Remove dynamic attributes, which reference other entities:
         self.del_source_of_copy()
         self.del_source_block_reference()
+        self.discard_dxf_source()
 
     def preprocess_export(self, tagwriter: "TagWriter") -> bool:
         """Pre requirement check and pre processing for export.
@@ -687,6 +731,10 @@ class DXFEntity:
             return
         if not self.preprocess_export(tagwriter):
             return
+        if tagwriter.export_dxf_source and self.has_dxf_source:
+            # write unmodified entity as loaded from the DXF file
+            tagwriter.write_str(getattr(self, DYN_DXF_SOURCE_ATTRIBUTE))
+            return
         # write handle, AppData, Reactors, ExtensionDict, owner
         self.export_base_class(tagwriter)
 
@@ -941,12 +989,14 @@ class DXFEntity:
         if self.reactors is None:
             self.reactors = Reactors()
         self.reactors.set(handles)
+        self.discard_dxf_source()
 
     def append_reactor_handle(self, handle: str) -> None:
         """Append `handle` to reactors."""
         if self.reactors is None:
             self.reactors = Reactors()
         self.reactors.add(handle)
+        self.discard_dxf_source()
 
     def discard_reactor_handle(self, handle: str) -> None:
         """Discard `handle` from reactors. Does not raise an exception if
@@ -954,6 +1004,7 @@ class DXFEntity:
         """
         if self.reactors:
             self.reactors.discard(handle)
+            self.discard_dxf_source()
 
 
 @factory.set_default_class
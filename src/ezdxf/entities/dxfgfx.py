@@ -38,6 +38,8 @@ if TYPE_CHECKING:
         DXFNamespace,
         Vertex,
         Drawing,
+        SpatialIndex,
+        QueryIndex,
     )
 
 __all__ = [
@@ -487,11 +489,35 @@ class DXFGraphic(DXFEntity):
         """Should be called if the main entity transformation was successful."""
         if self.xdata is not None:
             self.xdata.transform(m)
+        spatial_index = self._get_spatial_index()
+        if spatial_index is not None:
+            spatial_index.update(self)
 
     @property
     def is_post_transform_required(self) -> bool:
         """Check if post transform call is required."""
-        return self.xdata is not None
+        return self.xdata is not None or self._get_spatial_index() is not None
+
+    def _get_spatial_index(self) -> Optional["SpatialIndex"]:
+        # The spatial index of the owner layout is stored in the BLOCK_RECORD:
+        doc = self.doc
+        if doc is None or not doc.has_spatial_index:
+            return None
+        owner = doc.entitydb.get(self.dxf.owner)
+        return getattr(owner, "spatial_index", None)
+
+    def on_layer_change(self, layer: str) -> None:
+        """Event handler for layer change, updates the query index of the owner
+        layout. (internal API)
+        """
+        if self.doc is None:
+            return
+        owner = self.doc.entitydb.get(self.dxf.owner)
+        query_index: Optional["QueryIndex"] = getattr(
+            owner, "query_index", None
+        )
+        if query_index is not None:
+            query_index.update(self)
 
     def translate(self, dx: float, dy: float, dz: float) -> "DXFGraphic":
         """Translate entity inplace about `dx` in x-axis, `dy` in y-axis and
@@ -650,6 +676,7 @@ class DXFGraphic(DXFEntity):
 @factory.register_entity
 class SeqEnd(DXFGraphic):
     DXFTYPE = "SEQEND"
+    SOURCE_EXPORT = True
 
 
 def add_entity(entity: DXFGraphic, layout: "BaseLayout") -> None:
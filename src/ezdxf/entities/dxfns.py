@@ -38,7 +38,15 @@ SETTER_EVENTS = {
     "style": "on_style_change",
     "dimstyle": "on_dimstyle_change",
 }
+# supported event handler called by deleting DXF attributes, the handler gets
+# the DXF default value of the deleted attribute as argument:
+DELETER_EVENTS = {
+    "layer": "on_layer_change",
+}
 EXCLUDE_FROM_UPDATE = frozenset(["_entity", "handle", "owner"])
+# Dynamic DXFEntity attribute, which stores the DXF source data of unmodified
+# entities loaded from a DXF file:
+DYN_DXF_SOURCE_ATTRIBUTE = "_dxf_source"
 
 
 class DXFNamespace:
@@ -89,6 +97,13 @@ class DXFNamespace:
     def __deepcopy__(self, memodict: dict = None):
         return self.copy(self._entity)
 
+    def __getstate__(self) -> dict:
+        return self.__dict__
+
+    def __setstate__(self, state: dict) -> None:
+        # bypass __setattr__(), pickle support
+        self.__dict__.update(state)
+
     def reset_handles(self):
         """Reset handle and owner to None."""
         self.__dict__["handle"] = None
@@ -182,6 +197,7 @@ class DXFNamespace:
                 ERR_INVALID_DXF_ATTRIB.format(key, self.dxftype)
             )
 
+        self._discard_dxf_source()
         if key in SETTER_EVENTS:
             handler = getattr(self._entity, SETTER_EVENTS[key], None)
             if handler:
@@ -196,6 +212,8 @@ class DXFNamespace:
         """
         if self.hasattr(key):
             del self.__dict__[key]
+            self._discard_dxf_source()
+            self._on_delete(key)
         else:
             raise const.DXFAttributeError(ERR_DXF_ATTRIB_NOT_EXITS.format(key))
 
@@ -239,7 +257,8 @@ class DXFNamespace:
     def unprotected_set(self, key: str, value: Any) -> None:
         """Set DXF attribute `key` to `value` without any validity checks.
 
-        Used for fast attribute setting without validity checks at loading time.
+        Used for fast attribute setting without validity checks at loading time,
+        does not discard the DXF source data of the entity.
 
         (internal API)
         """
@@ -279,6 +298,21 @@ class DXFNamespace:
             del self.__dict__[key]
         except KeyError:
             pass
+        else:
+            self._discard_dxf_source()
+            self._on_delete(key)
+
+    def _on_delete(self, key: str) -> None:
+        if key in DELETER_EVENTS:
+            handler = getattr(self._entity, DELETER_EVENTS[key], None)
+            if handler:
+                handler(self.dxf_default_value(key))
+
+    def _discard_dxf_source(self) -> None:
+        # Modified entities can not be exported from their DXF source data:
+        entity = self._entity
+        if entity is not None:
+            entity.__dict__.pop(DYN_DXF_SOURCE_ATTRIBUTE, None)
 
     def is_supported(self, key: str) -> bool:
         """Returns True if DXF attribute `key` is supported else False.
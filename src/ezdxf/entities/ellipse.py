@@ -91,6 +91,7 @@ class Ellipse(DXFGraphic):
     DXFTYPE = "ELLIPSE"
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_ellipse)
     MIN_DXF_VERSION_FOR_EXPORT = DXF2000
+    SOURCE_EXPORT = True
 
     def load_dxf_attribs(
         self, processor: SubclassProcessor = None
@@ -21,7 +21,15 @@ from .factory import register_entity
 from .polygon import DXFPolygon
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, Drawing, DXFEntity, RGB
+    from ezdxf.eztypes import (
+        TagWriter,
+        Drawing,
+        DXFEntity,
+        RGB,
+        Line,
+        BaseLayout,
+        EntityQuery,
+    )
 
 __all__ = ["Hatch"]
 
@@ -314,3 +322,67 @@ class Hatch(DXFPolygon):
             )
         self.seeds = list(points)
         self.dxf.n_seed_points = len(self.seeds)
+
+    def virtual_entities(
+        self, max_segments: int = None, distance: float = 0.01
+    ) -> Iterable["Line"]:
+        """Yields the hatch pattern lines as virtual LINE entities, yields
+        nothing for solid filled hatches.
+
+        This entities are located at the original location, but are not stored
+        in the entity database, have no handle and are not assigned to any
+        layout.
+
+        Args:
+            max_segments: max count of pattern lines, ``None`` for the default
+                budget of the :mod:`ezdxf.render.hatching` module
+            distance: max flattening distance of the boundary paths
+
+        Raises:
+            DenseHatchingLinesError: hatch pattern exceeds the `max_segments`
+                budget
+
+        .. versionadded:: 0.17.2
+
+        """
+        from ezdxf.render import hatching
+        from ezdxf.entities import factory
+
+        if max_segments is None:
+            max_segments = hatching.MAX_SEGMENTS
+        dxfattribs = self.graphic_properties()
+        dxfattribs["linetype"] = "CONTINUOUS"
+        for start, end in hatching.hatch_entity(
+            self, distance=distance, max_segments=max_segments
+        ):
+            dxfattribs["start"] = start
+            dxfattribs["end"] = end
+            line = factory.new("LINE", dxfattribs=dxfattribs, doc=self.doc)
+            line.set_source_of_copy(self)
+            yield line  # type: ignore
+
+    def explode(self, target_layout: "BaseLayout" = None) -> "EntityQuery":
+        """Explode the hatch pattern as LINE entities into target layout, if
+        the target layout is ``None``, the target layout is the layout of the
+        source entity. The source HATCH entity is destroyed.
+
+        Returns an :class:`~ezdxf.query.EntityQuery` container with all LINE
+        entities.
+
+        Args:
+            target_layout: target layout for the LINE entities, ``None`` for
+                same layout as the source entity
+
+        Raises:
+            DXFTypeError: can not explode a solid filled hatch
+            DenseHatchingLinesError: hatch pattern exceeds the default segment
+                budget
+
+        .. versionadded:: 0.17.2
+
+        """
+        from ezdxf.explode import explode_entity
+
+        if self.dxf.solid_fill:
+            raise const.DXFTypeError("Can not explode a solid filled HATCH.")
+        return explode_entity(self, target_layout)
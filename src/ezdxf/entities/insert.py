@@ -160,6 +160,7 @@ class Insert(LinkedEntities):
 
     DXFTYPE = "INSERT"
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_block_reference)
+    SOURCE_EXPORT = True
 
     @property
     def attribs(self) -> List[Attrib]:
@@ -407,6 +408,8 @@ class Insert(LinkedEntities):
         dxfattribs["insert"] = insert
         attrib = cast("Attrib", self._new_compound_entity("ATTRIB", dxfattribs))
         self.attribs.append(attrib)
+        # The "attribs follow" flag is not tracked by the DXF namespace:
+        self.discard_dxf_source()
 
         # This case is only possible if INSERT is read from file without
         # attached ATTRIBS:
@@ -432,6 +435,7 @@ class Insert(LinkedEntities):
             if attrib.dxf.tag == tag:
                 del self.attribs[index]
                 attrib.destroy()
+                self.discard_dxf_source()
                 return
         if not ignore:
             raise DXFKeyError(tag)
@@ -444,6 +448,7 @@ class Insert(LinkedEntities):
         for attrib in self.attribs:
             attrib.destroy()
         self._sub_entities = []
+        self.discard_dxf_source()
 
     def transform(self, m: "Matrix44") -> "Insert":
         """Transform INSERT entity by transformation matrix `m` inplace.
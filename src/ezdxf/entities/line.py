@@ -50,6 +50,7 @@ class Line(DXFGraphic):
 
     DXFTYPE = "LINE"
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_line)
+    SOURCE_EXPORT = True
 
     def load_dxf_attribs(
         self, processor: SubclassProcessor = None
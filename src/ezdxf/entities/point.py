@@ -73,6 +73,7 @@ class Point(DXFGraphic):
 
     DXFTYPE = "POINT"
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_point)
+    SOURCE_EXPORT = True
 
     def load_dxf_attribs(
         self, processor: SubclassProcessor = None
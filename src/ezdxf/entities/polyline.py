@@ -131,6 +131,7 @@ class Polyline(LinkedEntities):
 
     DXFTYPE = "POLYLINE"
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_polyline)
+    SOURCE_EXPORT = True
     # polyline flags (70)
     CLOSED = 1
     MESH_CLOSED_M_DIRECTION = CLOSED
@@ -201,6 +202,7 @@ class Polyline(LinkedEntities):
         """
         for v in self.vertices:
             v.dxf.layer = layer
+        super().on_layer_change(layer)
 
     def on_linetype_change(self, linetype: str):
         """Event handler for linetype change. Changes also the linetype of all
@@ -1004,6 +1006,7 @@ class DXFVertex(DXFGraphic):
     DXFTYPE = "VERTEX"
 
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_vertex)
+    SOURCE_EXPORT = True
     # Extra vertex created by curve-fitting:
     EXTRA_VERTEX_CREATED = 1
 
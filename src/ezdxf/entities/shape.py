@@ -68,6 +68,7 @@ class Shape(DXFGraphic):
 
     DXFTYPE = "SHAPE"
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_shape)
+    SOURCE_EXPORT = True
 
     def load_dxf_attribs(
         self, processor: SubclassProcessor = None
@@ -60,6 +60,8 @@ acdb_trace_group_codes = group_code_mapping(acdb_trace)
 
 
 class _Base(DXFGraphic):
+    SOURCE_EXPORT = True
+
     def __getitem__(self, num):
         return self.dxf.get(VERTEXNAMES[num])
 
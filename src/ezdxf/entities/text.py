@@ -145,6 +145,7 @@ class Text(DXFGraphic):
 
     DXFTYPE = "TEXT"
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_text, acdb_text2)
+    SOURCE_EXPORT = True
     # horizontal align values
     LEFT = 0
     CENTER = 1
@@ -44,6 +44,7 @@ class XLine(DXFGraphic):
     DXFTYPE = "XLINE"
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_xline)
     MIN_DXF_VERSION_FOR_EXPORT = DXF2000
+    SOURCE_EXPORT = True
     XLINE_SUBCLASS = "AcDbXline"
 
     def load_dxf_attribs(
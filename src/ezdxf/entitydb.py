@@ -9,6 +9,7 @@ from typing import (
     Set,
     List,
     Iterator,
+    Union,
 )
 from contextlib import contextmanager
 from ezdxf.tools.handle import HandleGenerator
@@ -21,6 +22,7 @@ from ezdxf.entities import factory
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import TagWriter
+    from ezdxf.lldxf.lazyloader import LazyEntityLoader
 
 DATABASE_EXCLUDE = {
     "SECTION",
@@ -76,12 +78,20 @@ class EntityDB:
         # DXF handles of entities to delete later:
         self.handles = HandleGenerator()
         self.locked: bool = False  # used only for debugging
+        # Source of the pending entities of lazy loaded DXF documents:
+        self._lazy_loader: Optional["LazyEntityLoader"] = None
 
     def __getitem__(self, handle: str) -> DXFEntity:
         """Get entity by `handle`, does not filter destroyed entities nor
         entities in the trashcan.
         """
-        return self._database[handle]
+        try:
+            return self._database[handle]
+        except KeyError:
+            entity = self._load_pending_entity(handle)
+            if entity is None:
+                raise
+            return entity
 
     def __setitem__(self, handle: str, entity: DXFEntity) -> None:
         """Set `entity` for `handle`."""
@@ -108,11 +118,19 @@ class EntityDB:
         if handle is None:
             return False
         assert isinstance(handle, str), type(handle)
-        return handle in self._database
+        if handle in self._database:
+            return True
+        loader = self._lazy_loader
+        return loader is not None and loader.is_pending(handle)
 
     def __len__(self) -> int:
-        """Count of database items."""
-        return len(self._database)
+        """Count of database items including pending entities of lazy loaded
+        DXF documents.
+        """
+        count = len(self._database)
+        if self._lazy_loader is not None:
+            count += self._lazy_loader.pending_count
+        return count
 
     def __iter__(self) -> Iterator[str]:
         """Iterable of all handles, does filter destroyed entities but not
@@ -124,15 +142,66 @@ class EntityDB:
         """Returns entity for `handle` or ``None`` if no entry exist, does
         not filter destroyed entities.
         """
-        return self._database.get(handle)
+        entity = self._database.get(handle)
+        if entity is None and self._lazy_loader is not None:
+            entity = self._load_pending_entity(handle)
+        return entity
 
     def next_handle(self) -> str:
         """Returns next unique handle."""
+        # Inlined __contains__(), the handle generator creates only valid
+        # handles and this method is called for each new entity:
+        db = self._database
+        loader = self._lazy_loader
+        next_ = self.handles.next
         while True:
-            handle = self.handles.next()
-            if handle not in self._database:
+            handle = next_()
+            if handle in db:
+                continue
+            if loader is None or not loader.is_pending(handle):
                 return handle
 
+    @property
+    def lazy_loader(self) -> Optional["LazyEntityLoader"]:
+        """Returns the loader of pending entities or ``None`` if all entities
+        are loaded. (internal API)
+        """
+        return self._lazy_loader
+
+    def set_lazy_loader(self, loader: Optional["LazyEntityLoader"]) -> None:
+        """Set loader for pending entities of a lazy loaded DXF document.
+        (internal API)
+        """
+        self._lazy_loader = loader
+
+    def _load_pending_entity(self, handle: str) -> Optional[DXFEntity]:
+        loader = self._lazy_loader
+        if loader is None or not loader.is_pending(handle):
+            return None
+        loader.load(handle)
+        if loader.pending_count == 0:
+            self.load_pending_entities()
+        return self._database.get(handle)
+
+    def load_pending_entities(self) -> None:
+        """Load all pending entities of a lazy loaded DXF document and close
+        the memory mapped DXF file.
+        """
+        loader = self._lazy_loader
+        if loader is None:
+            return
+        for location in loader.locations():
+            loader.load(location.handle)
+        loader.close()
+        self._lazy_loader = None
+
+    def loaded_values(self) -> List[DXFEntity]:
+        """Returns all loaded entities, does filter destroyed entities but
+        does not load pending entities of lazy loaded DXF documents.
+        (internal API)
+        """
+        return [e for e in self._database.values() if e.is_alive]
+
     def keys(self) -> Iterable[str]:
         """Iterable of all handles, does filter destroyed entities."""
         return (handle for handle, entity in self.items())
@@ -143,8 +212,10 @@ class EntityDB:
 
     def items(self) -> Iterable[Tuple[str, DXFEntity]]:
         """Iterable of all (handle, entities) pairs, does filter destroyed
-        entities.
+        entities. Loads all pending entities of lazy loaded DXF documents.
         """
+        if self._lazy_loader is not None:
+            self.load_pending_entities()
         return (
             (handle, entity)
             for handle, entity in self._database.items()
@@ -165,9 +236,15 @@ class EntityDB:
             return
         handle: str = entity.dxf.handle
         if handle is None:
+            assert entity.is_alive, "Can not store destroyed entity."
+            if self.locked:
+                raise DXFInternalEzdxfError("Locked entity database.")
             handle = self.next_handle()
             entity.update_handle(handle)
-        self[handle] = entity
+            # The validation of __setitem__() is not required for new handles:
+            self._database[handle] = entity
+        else:
+            self[handle] = entity
 
         # Add sub entities ATTRIB, VERTEX and SEQEND to database:
         # Add linked MTEXT columns to database:
@@ -298,14 +375,18 @@ class EntityDB:
             del db[handle]
 
     def dxf_types_in_use(self) -> Set[str]:
-        return set(entity.dxftype() for entity in self.values())
+        types = set(entity.dxftype() for entity in self.loaded_values())
+        if self._lazy_loader is not None:
+            # does not load pending entities:
+            types.update(self._lazy_loader.pending_dxftypes())
+        return types
 
     def reset_handle(self, entity: DXFEntity, handle: str) -> bool:
         """Try to reset the entity handle to a certain value.
         Returns ``True`` if successful and ``False`` otherwise.
 
         """
-        if handle in self._database:
+        if handle in self:
             return False
         self.discard(entity)
         entity.dxf.handle = handle
@@ -381,7 +462,159 @@ class EntitySpace:
         """Remove `entity`."""
         self.entities.remove(entity)
 
+    def remove_entities(self, entities: Iterable[DXFEntity]) -> None:
+        """Remove multiple `entities` in a single pass and preserves the order
+        of the remaining entities. Raises :class:`ValueError` if an entity is
+        not present, the entity space is unchanged in this case.
+        """
+        # The entities are alive until the end of this method,
+        # therefore the ids are unique:
+        ids = set(map(id, entities))
+        self.entities = _remove_by_id(self.entities, ids)
+
     def clear(self) -> None:
         """Remove all entities."""
         # Do not destroy entities!
         self.entities = list()
+
+
+class LazyEntitySpace(EntitySpace):
+    """:class:`EntitySpace` of a lazy loaded DXF document, stores the handles
+    of pending entities, which are loaded from the entity database at the
+    first access.
+
+    """
+
+    def __init__(self, db: EntityDB, handles: Iterable[str]):
+        super().__init__()
+        self._entitydb = db
+        self.entities: List[Union[DXFEntity, str]] = list(handles)  # type: ignore
+
+    def _load(self, index: int) -> Optional[DXFEntity]:
+        entity = self.entities[index]
+        if isinstance(entity, str):
+            entity = self._entitydb.get(entity)  # type: ignore
+            if entity is None:  # deleted by the entity database
+                return None
+            self.entities[index] = entity
+        return entity  # type: ignore
+
+    def __iter__(self) -> Iterator[DXFEntity]:
+        """Iterable of all entities, filters destroyed entities and loads
+        pending entities.
+        """
+        index = 0
+        while index < len(self.entities):
+            entity = self._load(index)
+            if entity is not None and entity.is_alive:
+                yield entity
+            index += 1
+
+    def loaded_entities(self) -> Iterator[DXFEntity]:
+        """Iterable of all loaded entities, filters destroyed entities."""
+        return (
+            e
+            for e in self.entities
+            if not isinstance(e, str) and e.is_alive  # type: ignore
+        )
+
+    def __getitem__(self, index) -> DXFEntity:
+        """Get entity at index `item`, loads pending entities, does not filter
+        destroyed entities.
+        """
+        if isinstance(index, slice):
+            for i in range(*index.indices(len(self.entities))):
+                self._load(i)
+        else:
+            self._load(index)
+        return self.entities[index]  # type: ignore
+
+    def has_handle(self, handle: str) -> bool:
+        """``True`` if `handle` is present, does filter destroyed entities."""
+        assert isinstance(handle, str), type(handle)
+        for entity in self.entities:
+            if isinstance(entity, str):
+                if entity == handle and handle in self._entitydb:
+                    return True
+            elif entity.is_alive and entity.dxf.handle == handle:
+                return True
+        return False
+
+    def purge(self):
+        """Remove all destroyed entities from entity space, does not load
+        pending entities.
+        """
+        db = self._entitydb
+        self.entities = [
+            e
+            for e in self.entities
+            if (e in db if isinstance(e, str) else e.is_alive)  # type: ignore
+        ]
+
+    def export_dxf(self, tagwriter: "TagWriter") -> None:
+        """Export all entities into DXF file by `tagwriter`, pending entities
+        are exported from their DXF source data without loading if supported
+        by the `tagwriter`.
+
+        (internal API)
+        """
+        loader = self._entitydb.lazy_loader
+        export_dxf_source = tagwriter.export_dxf_source and loader is not None
+        index = 0
+        while index < len(self.entities):
+            entity = self.entities[index]
+            if isinstance(entity, str):
+                source = None
+                if export_dxf_source:
+                    source = loader.dxf_source(entity)  # type: ignore
+                if source is not None:
+                    tagwriter.write_str(source)
+                    index += 1
+                    continue
+                entity = self._load(index)  # type: ignore
+            if isinstance(entity, DXFEntity) and entity.is_alive:
+                entity.export_dxf(tagwriter)
+            index += 1
+
+    def remove(self, entity: DXFEntity) -> None:
+        """Remove `entity`."""
+        try:
+            self.entities.remove(entity)
+        except ValueError:
+            # entity was loaded by the entity database:
+            self.entities.remove(entity.dxf.handle)
+
+    def remove_entities(self, entities: Iterable[DXFEntity]) -> None:
+        """Remove multiple `entities` in a single pass and preserves the order
+        of the remaining entities, does not load pending entities. Raises
+        :class:`ValueError` if an entity is not present, the entity space is
+        unchanged in this case.
+        """
+        entities = list(entities)
+        ids = set(map(id, entities))
+        # Entities loaded by the entity database are still stored as handles:
+        handles = set(e.dxf.handle for e in entities)
+        remaining: List[Union[DXFEntity, str]] = []
+        removed = set()
+        for e in self.entities:
+            key = id(e)
+            if isinstance(e, str):
+                if e in handles:
+                    key = id(self._entitydb.get(e))
+                else:
+                    remaining.append(e)
+                    continue
+            if key in ids:
+                removed.add(key)
+            else:
+                remaining.append(e)
+        if len(removed) != len(ids):
+            raise ValueError("entity not in entity space")
+        self.entities = remaining
+
+
+def _remove_by_id(entities: List, ids: Set[int]) -> List:
+    remaining = [e for e in entities if id(e) not in ids]
+    if len(entities) - len(remaining) != len(ids):
+        raise ValueError("entity not in entity space")
+    return remaining
@@ -10,6 +10,7 @@ from typing import (
     Dict,
     List,
     Any,
+    Union,
 )
 
 from ezdxf.entities import factory
@@ -40,10 +41,13 @@ if TYPE_CHECKING:
         Attrib,
         Text,
         LWPolyline,
+        Matrix44,
     )
 
 __all__ = [
     "virtual_block_reference_entities",
+    "virtual_block_reference_views",
+    "BlockEntityView",
     "virtual_boundary_path_entities",
     "explode_block_reference",
     "explode_entity",
@@ -183,70 +187,217 @@ def virtual_block_reference_entities(
 
     """
     assert block_ref.dxftype() == "INSERT"
-    from ezdxf.entities import Ellipse
-
     skipped_entity_callback = (
         skipped_entity_callback or default_logging_callback
     )
 
-    def disassemble(layout) -> Iterable["DXFGraphic"]:
-        for entity in layout:
-            # Do not explode ATTDEF entities. Already available in Insert.attribs
-            if entity.dxftype() == "ATTDEF":
-                continue
-            try:
-                copy = entity.copy()
-            except DXFTypeError:
-                if hasattr(entity, "virtual_entities"):
-                    yield from entity.virtual_entities()
-                else:
-                    skipped_entity_callback(entity, "non copyable")  # type: ignore
+    m = block_ref.matrix44()
+    block_layout = block_ref.block()
+    if block_layout is None:
+        raise DXFStructureError(
+            f'Required block definition for "{block_ref.dxf.name}" does not exist.'
+        )
+
+    yield from _transform_entities(
+        _copy_entities(block_layout, skipped_entity_callback),
+        m,
+        skipped_entity_callback,
+    )
+
+
+def _copy_entities(
+    entities: Iterable["DXFGraphic"],
+    skipped_entity_callback: Callable[["DXFGraphic", str], None],
+) -> Iterable["DXFGraphic"]:
+    for entity in entities:
+        # Do not explode ATTDEF entities. Already available in Insert.attribs
+        if entity.dxftype() == "ATTDEF":
+            continue
+        try:
+            copy = entity.copy()
+        except DXFTypeError:
+            if hasattr(entity, "virtual_entities"):
+                yield from entity.virtual_entities()  # type: ignore
             else:
-                if hasattr(copy, "remove_association"):
-                    copy.remove_association()
-                yield copy
-
-    def transform(entities):
-        for entity in entities:
-            try:
-                entity.transform(m)
-            except NotImplementedError:
-                skipped_entity_callback(entity, "non transformable")
-            except NonUniformScalingError:
-                dxftype = entity.dxftype()
-                if dxftype in {"ARC", "CIRCLE"}:
-                    if abs(entity.dxf.radius) > ABS_TOL:
-                        yield Ellipse.from_arc(entity).transform(m)
-                    else:
-                        skipped_entity_callback(
-                            entity, f"Invalid radius in entity {str(entity)}."
-                        )
-                elif dxftype in {"LWPOLYLINE", "POLYLINE"}:  # has arcs
-                    yield from transform(entity.virtual_entities())
+                skipped_entity_callback(entity, "non copyable")
+        else:
+            if hasattr(copy, "remove_association"):
+                copy.remove_association()
+            yield copy
+
+
+def _transform_entities(
+    entities: Iterable["DXFGraphic"],
+    m: "Matrix44",
+    skipped_entity_callback: Callable[["DXFGraphic", str], None],
+) -> Iterable["DXFGraphic"]:
+    from ezdxf.entities import Ellipse
+
+    for entity in entities:
+        try:
+            entity.transform(m)
+        except NotImplementedError:
+            skipped_entity_callback(entity, "non transformable")
+        except NonUniformScalingError:
+            dxftype = entity.dxftype()
+            if dxftype in {"ARC", "CIRCLE"}:
+                if abs(entity.dxf.radius) > ABS_TOL:
+                    yield Ellipse.from_arc(entity).transform(m)
                 else:
                     skipped_entity_callback(
-                        entity, "unsupported non-uniform scaling"
-                    )
-            except InsertTransformationError:
-                # INSERT entity can not represented in the target coordinate
-                # system defined by transformation matrix `m`.
-                # Yield transformed sub-entities of the INSERT entity:
-                yield from transform(
-                    virtual_block_reference_entities(
-                        entity, skipped_entity_callback
+                        entity, f"Invalid radius in entity {str(entity)}."
                     )
+            elif dxftype in {"LWPOLYLINE", "POLYLINE"}:  # has arcs
+                yield from _transform_entities(
+                    entity.virtual_entities(),  # type: ignore
+                    m,
+                    skipped_entity_callback,
                 )
             else:
-                yield entity
+                skipped_entity_callback(
+                    entity, "unsupported non-uniform scaling"
+                )
+        except InsertTransformationError:
+            # INSERT entity can not represented in the target coordinate
+            # system defined by transformation matrix `m`.
+            # Yield transformed sub-entities of the INSERT entity:
+            yield from _transform_entities(
+                virtual_block_reference_entities(
+                    entity, skipped_entity_callback  # type: ignore
+                ),
+                m,
+                skipped_entity_callback,
+            )
+        else:
+            yield entity
+
+
+# Entity types of block definitions, which are represented by flyweight views
+# of the source entity, the path and mesh representations of these types are
+# transformed exactly by the transformation matrix of the block reference:
+FLYWEIGHT_TYPES = {
+    "3DFACE",
+    "ARC",
+    "CIRCLE",
+    "ELLIPSE",
+    "HATCH",
+    "HELIX",
+    "IMAGE",
+    "LINE",
+    "LWPOLYLINE",
+    "MESH",
+    "MPOLYGON",
+    "POINT",
+    "POLYLINE",
+    "SOLID",
+    "SPLINE",
+    "TRACE",
+    "WIPEOUT",
+}
 
-    m = block_ref.matrix44()
+
+class BlockEntityView:
+    """Lightweight read-only view of the entity `source` of a block
+    definition located in the WCS by the transformation `matrix` of a block
+    reference. The view shares all attributes with the source entity and does
+    not copy or transform any data, the :mod:`ezdxf.disassemble` module
+    applies the transformation on demand to the path and mesh representation
+    of the source entity.
+
+    (internal API)
+
+    """
+
+    __slots__ = ("source", "matrix")
+
+    def __init__(self, source: "DXFGraphic", matrix: "Matrix44"):
+        self.source = source
+        self.matrix = matrix
+
+    def dxftype(self) -> str:
+        return self.source.dxftype()
+
+    def virtual_entities(self) -> Iterable["DXFGraphic"]:
+        """Yields the view as transformed virtual DXF entities, like the
+        virtual entities of a block reference.
+        """
+        return _transform_entities(
+            _copy_entities([self.source], default_logging_callback),
+            self.matrix,
+            default_logging_callback,
+        )
+
+    def __repr__(self):
+        return f"BlockEntityView({str(self.source)})"
+
+
+def virtual_block_reference_views(
+    block_ref: "Insert",
+    skipped_entity_callback: Optional[
+        Callable[["DXFGraphic", str], None]
+    ] = None,
+) -> Iterable[Union[BlockEntityView, "DXFGraphic"]]:
+    """Yields the parts of block reference `block_ref` like
+    :func:`virtual_block_reference_entities`, but the entity types of
+    :attr:`FLYWEIGHT_TYPES` are yielded as :class:`BlockEntityView` objects
+    instead of transformed copies. Nested block references are resolved
+    recursively into the parts of the nested block definitions, which means
+    the yielded entities do not contain any INSERT entity. The ATTRIB entities
+    of nested block references and all other entity types are yielded as
+    transformed virtual entities.
+
+    Args:
+        block_ref: Block reference entity (INSERT)
+        skipped_entity_callback: called whenever the transformation of an entity
+            is not supported and so was skipped.
+
+    (internal API)
+
+    """
+    assert block_ref.dxftype() == "INSERT"
+    skipped_entity_callback = (
+        skipped_entity_callback or default_logging_callback
+    )
+    return _block_reference_views(
+        block_ref, block_ref.matrix44(), skipped_entity_callback
+    )
+
+
+def _block_reference_views(
+    block_ref: "Insert",
+    m: "Matrix44",
+    skipped_entity_callback: Callable[["DXFGraphic", str], None],
+) -> Iterable[Union[BlockEntityView, "DXFGraphic"]]:
     block_layout = block_ref.block()
     if block_layout is None:
         raise DXFStructureError(
             f'Required block definition for "{block_ref.dxf.name}" does not exist.'
         )
-
-    yield from transform(disassemble(block_layout))
+    for entity in block_layout:
+        dxftype = entity.dxftype()
+        if dxftype in FLYWEIGHT_TYPES:
+            yield BlockEntityView(entity, m)
+        elif dxftype == "INSERT":
+            insert = cast("Insert", entity)
+            if insert.mcount > 1:
+                inserts: Iterable["Insert"] = insert.multi_insert()
+            else:
+                inserts = [insert]
+            for insert in inserts:
+                yield from _transform_entities(
+                    (attrib.copy() for attrib in insert.attribs),
+                    m,
+                    skipped_entity_callback,
+                )
+                yield from _block_reference_views(
+                    insert, insert.matrix44() * m, skipped_entity_callback
+                )
+        else:
+            yield from _transform_entities(
+                _copy_entities([entity], skipped_entity_callback),
+                m,
+                skipped_entity_callback,
+            )
 
 
 EXCLUDE_FROM_EXPLODE = {"POINT"}
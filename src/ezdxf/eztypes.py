@@ -27,6 +27,8 @@ if TYPE_CHECKING:
     from ezdxf.lldxf.tagwriter import AbstractTagWriter as TagWriter
     from ezdxf.tools.complex_ltype import ComplexLineTypePart
     from ezdxf.query import EntityQuery
+    from ezdxf.spatialindex import SpatialIndex
+    from ezdxf.queryindex import QueryIndex
     from ezdxf.entities.xdict import ExtensionDict
     from ezdxf.entities.appdata import AppData
 
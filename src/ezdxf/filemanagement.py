@@ -1,6 +1,6 @@
 # Copyright (C) 2018-2021, Manfred Moitzi
 # License: MIT License
-from typing import TextIO, TYPE_CHECKING, Union, Sequence
+from typing import TextIO, TYPE_CHECKING, Union, Sequence, Optional
 import base64
 import io
 from ezdxf.tools.standards import setup_drawing
@@ -96,6 +96,8 @@ def readfile(
     filename: Union[str, "Path"],
     encoding: str = None,
     errors: str = "surrogateescape",
+    lazy: bool = False,
+    max_workers: Optional[int] = 1,
 ) -> "Drawing":
     """Read the DXF document `filename` from the file-system.
 
@@ -121,6 +123,18 @@ def readfile(
             - "ignore" to use the replacement char U+FFFD "\ufffd" for invalid data
             - "strict" to raise an :class:`UnicodeDecodeError` exception for invalid data
 
+        lazy: load the DXF entities of the ENTITIES section on demand from
+            the memory mapped ASCII DXF file, the file stays open until all
+            entities are loaded, argument is ignored for Binary DXF files.
+            Unmodified entities of the ENTITIES section are written back from
+            their DXF source data by saving the document as ASCII DXF file
+            of the same DXF version.
+        max_workers: count of worker processes to compile the tags of the
+            ENTITIES and OBJECTS section in parallel, ``None`` for the count
+            of processors of the machine, 1 to load the DXF file without
+            worker processes (default), argument is ignored for Binary DXF
+            files and lazy loading
+
     Raises:
         IOError: not a DXF file or file does not exist
         DXFStructureError: for invalid or corrupted DXF structures
@@ -145,8 +159,17 @@ def readfile(
     if encoding is not None:
         # override default encodings if absolute necessary
         info.encoding = encoding
-    with open(filename, mode="rt", encoding=info.encoding, errors=errors) as fp:  # type: ignore
-        doc = read(fp)  # type: ignore
+    if lazy:
+        doc = Drawing.read_lazy(filename, info.encoding, errors)
+    elif max_workers != 1:
+        doc = Drawing.read_parallel(
+            filename, info.encoding, errors, max_workers
+        )
+    else:
+        with open(
+            filename, mode="rt", encoding=info.encoding, errors=errors
+        ) as fp:
+            doc = read(fp)  # type: ignore
 
     doc.filename = filename
     if encoding is not None and is_supported_encoding(encoding):
@@ -211,6 +234,29 @@ def readzip(
     return doc
 
 
+def load_snapshot(filename: Union[str, "Path"]) -> "Drawing":
+    """Load a DXF document from the snapshot file `filename` created by
+    :meth:`Drawing.save_snapshot`. Reloading a snapshot is much faster than
+    loading the DXF file, because the DXF document is stored as pickled
+    entity graph.
+
+    Snapshots are only compatible to the ezdxf version which created them.
+    Load only snapshot files from trusted sources, unpickling data can execute
+    arbitrary code!
+
+    Args:
+        filename: file name of the snapshot
+
+    Raises:
+        IOError: not a snapshot file, an incompatible snapshot version or
+            file does not exist
+
+    """
+    from ezdxf import snapshot
+
+    return snapshot.load(filename)
+
+
 def decode_base64(data: bytes, errors: str = "surrogateescape") -> "Drawing":
     """Load a DXF document from base64 encoded binary data, like uploaded data
     to web applications.
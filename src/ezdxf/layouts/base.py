@@ -1,6 +1,6 @@
 # Copyright (c) 2019-2021, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Iterator
+from typing import TYPE_CHECKING, Iterator, Iterable
 from ezdxf.entities import factory, is_graphic_entity
 from ezdxf.lldxf.const import (
     DXFValueError,
@@ -19,6 +19,8 @@ if TYPE_CHECKING:
         DXFGraphic,
         KeyFunc,
         ExtensionDict,
+        SpatialIndex,
+        QueryIndex,
     )
 
 SUPPORTED_FOREIGN_ENTITY_TYPES = {
@@ -183,6 +185,43 @@ class BaseLayout(_AbstractLayout):
         else:
             return block_record.new_extension_dict()
 
+    def spatial_index(self) -> "SpatialIndex":
+        """Returns the persistent :class:`~ezdxf.spatialindex.SpatialIndex` of
+        this layout, the index is created at the first call and is updated
+        automatically for added, deleted and transformed entities.
+
+        """
+        block_record = self.block_record
+        if block_record.spatial_index is None:
+            from ezdxf.spatialindex import SpatialIndex
+
+            block_record.spatial_index = SpatialIndex(self)
+            self.doc.has_spatial_index = True
+        return block_record.spatial_index
+
+    def query_index(self) -> "QueryIndex":
+        """Returns the persistent :class:`~ezdxf.queryindex.QueryIndex` of
+        this layout, the index is created at the first call and is updated
+        automatically for added and deleted entities and for layer changes.
+        The :meth:`query` method of the layout uses this index if it exists.
+
+        .. versionadded:: 0.17.2
+
+        """
+        block_record = self.block_record
+        if block_record.query_index is None:
+            from ezdxf.queryindex import QueryIndex
+
+            block_record.query_index = QueryIndex(self)
+        return block_record.query_index
+
+    def query(self, query: str = "*") -> EntityQuery:
+        """Get all DXF entities matching the :ref:`entity query string`."""
+        query_index = self.block_record.query_index
+        if query_index is not None:
+            return query_index.query(query)
+        return super().query(query)
+
     def add_entity(self, entity: "DXFGraphic") -> None:
         """Add an existing :class:`DXFGraphic` entity to a layout, but be sure
         to unlink (:meth:`~BaseLayout.unlink_entity`) entity from the previous
@@ -280,14 +319,33 @@ class BaseLayout(_AbstractLayout):
         """
         self.block_record.delete_entity(entity)
 
+    def delete_entities(self, entities: Iterable["DXFGraphic"]) -> None:
+        """Delete multiple `entities` from layout entity space and the entity
+        database in a single pass of the layout entity space, this destroys
+        the `entities` and preserves the order of the remaining entities.
+        Raises :class:`DXFValueError` if an entity is not a part of this
+        layout, nothing is deleted in this case.
+
+        Deleting many entities by this method is much faster than calling
+        :meth:`delete_entity` for each entity::
+
+            msp.delete_entities(msp.query("*[layer=='OBSOLETE']"))
+
+        .. versionadded:: 0.17.2
+
+        """
+        try:
+            self.block_record.delete_entities(entities)
+        except ValueError:
+            raise DXFValueError("Layout does not contain entity.")
+
     def delete_all_entities(self) -> None:
         """Delete all entities from this layout and from entity database,
         this destroys all entities in this layout.
         """
         # Create list, because delete modifies the base data structure of
         # the iterator:
-        for entity in list(self):
-            self.delete_entity(entity)
+        self.delete_entities(list(self))
 
     def move_to_layout(
         self, entity: "DXFGraphic", layout: "BaseLayout"
@@ -352,6 +410,9 @@ class VirtualLayout(_AbstractLayout):
     def delete_entity(self, entity: "DXFGraphic") -> None:
         self.entity_space.remove(entity)
 
+    def delete_entities(self, entities: Iterable["DXFGraphic"]) -> None:
+        self.entity_space.remove_entities(entities)
+
     def delete_all_entities(self) -> None:
         self.entity_space.clear()
 
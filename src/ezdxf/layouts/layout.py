@@ -12,7 +12,7 @@ from typing import (
     Dict,
 )
 from ezdxf.math import Vec2
-from ezdxf.entitydb import EntitySpace
+from ezdxf.entitydb import EntitySpace, LazyEntitySpace
 from ezdxf.lldxf import const
 from .base import BaseLayout
 
@@ -150,7 +150,11 @@ class Layout(BaseLayout):
         """
         layout_key = self.layout_key
         paperspace = 0 if self.is_modelspace else 1
-        for entity in self:
+        entities: Iterable["DXFGraphic"] = self
+        if isinstance(self.entity_space, LazyEntitySpace):
+            # Pending entities get the correct owner tags when loaded:
+            entities = self.entity_space.loaded_entities()  # type: ignore
+        for entity in entities:
             if entity.dxf.owner != layout_key:
                 entity.dxf.owner = layout_key
             if entity.dxf.paperspace != paperspace:
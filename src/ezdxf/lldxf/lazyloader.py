@@ -0,0 +1,473 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+"""
+Lazy loading of the ENTITIES section
+====================================
+
+The DXF file is memory mapped and the ENTITIES section is indexed by the
+file locations of the DXF entities. All other sections are loaded as usual,
+but the DXF entities of the ENTITIES section are just materialized when they
+are accessed the first time by the entity database or a layout.
+
+Linked entities like VERTEX, ATTRIB and SEQEND are stored in the same file
+location as their parent entity (POLYLINE or INSERT) and are loaded together.
+
+The loaded entities store their DXF source data and unmodified entities are
+written back from their DXF source data by :meth:`Drawing.save`, pending
+entities are written back without loading them at all.
+
+"""
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+import io
+import mmap
+import os
+import sys
+
+from .const import DXFStructureError, DXF12
+from .extendedtags import ExtendedTags
+from .tags import group_tags
+from .tagger import ascii_tags_loader, tag_compiler
+from ezdxf.entities import factory, entity_linker
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Drawing, DXFEntity, BlockRecord
+
+__all__ = ["EntityLocation", "LazyEntityLoader"]
+
+LINKED_ENTITY_TYPES = {"VERTEX", "ATTRIB", "SEQEND"}
+
+
+class EntityLocation(NamedTuple):
+    """File location of a DXF entity of the ENTITIES section, the location
+    includes the linked entities VERTEX, ATTRIB and SEQEND.
+    """
+
+    handle: str
+    dxftype: str
+    owner: str
+    paperspace: int
+    start: int
+    end: int
+
+
+class LazyEntityLoader:
+    """Loads the DXF entities of the ENTITIES section on demand from a memory
+    mapped DXF file.
+
+    Lazy loading is not possible for DXF files without entity handles, in this
+    case the ENTITIES section is loaded as usual by the :meth:`structure_stream`.
+
+    Args:
+        filename: file system name of the ASCII DXF file
+        encoding: text encoding of the DXF file
+        errors: decoding error handler
+
+    Raises:
+        DXFStructureError: invalid DXF structure in the ENTITIES section
+
+    """
+
+    def __init__(
+        self, filename: str, encoding: str, errors: str = "surrogateescape"
+    ):
+        self.filename = filename
+        self.encoding = encoding
+        self.errors = errors
+        self.doc: Optional["Drawing"] = None
+        # BLOCK_RECORD entities of the modelspace and the active paperspace:
+        self._msp: Optional["BlockRecord"] = None
+        self._psp: Optional["BlockRecord"] = None
+        self._file = open(filename, "rb")
+        # Memory mapped DXF file or the file content after detaching:
+        self._mm: Union[mmap.mmap, bytes] = mmap.mmap(
+            self._file.fileno(), 0, access=mmap.ACCESS_READ
+        )
+        # Locations of all pending entities in file order, linked entities
+        # are stored by the handle of their parent entity:
+        self._index: Dict[str, EntityLocation] = dict()
+        # File location (start, end) of the ENTITIES section content:
+        self._skip: Tuple[int, int] = (-1, -1)
+        self._build_index()
+
+    @property
+    def pending_count(self) -> int:
+        """Count of pending (not loaded) entities including linked entities."""
+        return len(self._index)
+
+    @property
+    def is_closed(self) -> bool:
+        return self._mm is None
+
+    def is_pending(self, handle: str) -> bool:
+        """Returns ``True`` if the entity `handle` is not loaded yet."""
+        return handle in self._index
+
+    def locations(self) -> List[EntityLocation]:
+        """Returns the locations of all pending main entities in file order."""
+        locations = []
+        handle: str
+        location: EntityLocation
+        for handle, location in self._index.items():
+            if location.handle == handle:  # exclude linked entities
+                locations.append(location)
+        return locations
+
+    def pending_dxftypes(self) -> Set[str]:
+        """Returns the DXF types of all pending main entities, the types of
+        the linked entities VERTEX, ATTRIB and SEQEND are not included.
+        """
+        return set(location.dxftype for location in self._index.values())
+
+    def close(self) -> None:
+        """Close the memory mapped DXF file, all pending entities are lost."""
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+            self._file.close()
+        self._mm = None  # type: ignore
+        self._index.clear()
+
+    def is_source_file(self, filename: str) -> bool:
+        """Returns ``True`` if `filename` is the source file of the pending
+        entities.
+        """
+        if not isinstance(self._mm, mmap.mmap) or not os.path.exists(filename):
+            return False  # closed or detached
+        return os.path.samefile(filename, self.filename)
+
+    def detach(self) -> None:
+        """Copy the content of the memory mapped DXF file into memory and
+        close the DXF file, this is required to overwrite the source file.
+        """
+        mm = self._mm
+        if isinstance(mm, mmap.mmap):
+            self._mm = mm[:]
+            mm.close()
+            self._file.close()
+
+    def dxf_source(self, handle: str) -> Optional[str]:
+        """Returns the DXF source data of the pending entity `handle`
+        including the linked entities or ``None`` if the entity is not pending
+        or requires modifications by the loading process.
+        """
+        location = self._index.get(handle)
+        if location is None or location.handle != handle:
+            return None
+        if not self._is_valid_owner(location.owner, location.paperspace):
+            return None
+        return self._text(location)
+
+    def _text(self, location: EntityLocation) -> str:
+        data = self._mm[location.start : location.end]
+        text = data.decode(self.encoding, errors=self.errors)
+        return text.replace("\r\n", "\n")
+
+    def bind(self, doc: "Drawing") -> None:
+        """Bind loader to DXF document `doc`, the loader is the handle source
+        for all pending entities of the entity database.
+        """
+        self.doc = doc
+        doc.entitydb.set_lazy_loader(self)
+
+    def structure_stream(self) -> "_StructureStream":
+        """Returns a text stream of the DXF file without the content of the
+        ENTITIES section, the stream supports the :meth:`readline` method
+        required by the :func:`ascii_tags_loader`.
+        """
+        return _StructureStream(self._mm, self.encoding, self.errors, self._skip)
+
+    def setup_entity_spaces(self) -> None:
+        """Setup lazy entity spaces for the modelspace and the active
+        paperspace. (internal API)
+        """
+        from ezdxf.entitydb import LazyEntitySpace
+
+        doc = self.doc
+        assert doc is not None, "loader is not bound to a DXF document"
+        msp = cast("BlockRecord", doc.block_records.get("*Model_Space"))
+        psp = cast("BlockRecord", doc.block_records.get("*Paper_Space"))
+        self._msp = msp
+        self._psp = psp
+        msp_handles: List[str] = []
+        psp_handles: List[str] = []
+        for location in self.locations():
+            # higher priority for owner handle
+            if location.owner == msp.dxf.handle:
+                paperspace = 0
+            elif location.owner == psp.dxf.handle:
+                paperspace = 1
+            else:  # paperspace flag as fallback
+                paperspace = location.paperspace
+            if paperspace:
+                psp_handles.append(location.handle)
+            else:
+                msp_handles.append(location.handle)
+        # The ENTITIES section is the only source for these entity spaces:
+        msp.set_entity_space(LazyEntitySpace(doc.entitydb, msp_handles))
+        psp.set_entity_space(LazyEntitySpace(doc.entitydb, psp_handles))
+
+    def load(self, handle: str) -> None:
+        """Load the pending entity `handle` and its linked entities and store
+        them in the entity database of the bound DXF document.
+        """
+        location = self._index.get(handle)
+        if location is None:
+            return
+        doc = self.doc
+        assert doc is not None, "loader is not bound to a DXF document"
+        text = self._text(location)
+        stream = io.StringIO(text)
+        entities = [
+            factory.load(ExtendedTags(tags), doc)
+            for tags in group_tags(tag_compiler(ascii_tags_loader(stream)))
+        ]
+        for entity in entities:
+            self._index.pop(entity.dxf.handle, None)
+        self._index.pop(location.handle, None)
+        if len(entities) == 0:
+            return
+
+        # Bind entities like in the 1st loading stage:
+        is_loading = doc.is_loading
+        doc.is_loading = True
+        try:
+            for entity in entities:
+                factory.bind(entity, doc)
+        finally:
+            doc.is_loading = is_loading
+
+        linked_entities = entity_linker()
+        for entity in entities:
+            linked_entities(entity)
+        if self._set_owner(entities[0]):
+            sources = _split_entities(text) if len(entities) > 1 else [text]
+            if len(sources) == len(entities):
+                for entity, source in zip(entities, sources):
+                    entity.set_dxf_source(source)
+
+        # Load resources like in the 2nd loading stage:
+        for entity in entities:
+            cmd = entity.post_load_hook(doc)
+            if cmd is not None:
+                if doc.is_loading:
+                    doc._post_init_commands.append(cmd)
+                else:
+                    cmd()
+
+    def _set_owner(self, entity: "DXFEntity") -> bool:
+        # Returns True if the DXF source data of the entity is still valid.
+        msp = self._msp
+        psp = self._psp
+        if msp is None or psp is None:  # entity spaces not set up yet
+            return False
+        dxf = entity.dxf
+        owner = dxf.owner
+        if owner == msp.dxf.handle:
+            paperspace = 0
+        elif owner == psp.dxf.handle:
+            paperspace = 1
+        else:
+            paperspace = dxf.get("paperspace", 0)
+        block_record = psp if paperspace else msp
+        is_valid = self._is_valid_owner(owner, dxf.get("paperspace", 0))
+        try:
+            entity.set_owner(  # type: ignore
+                block_record.dxf.handle,
+                paperspace=int(block_record.is_any_paperspace),
+            )
+        except AttributeError:
+            pass  # unsupported entities as DXFTagStorage
+        return is_valid
+
+    def _is_valid_owner(self, owner: str, paperspace: int) -> bool:
+        # Returns True if the loading process does not change the exported
+        # owner tags of an entity with the given `owner` and `paperspace`
+        # tags, requires the setup of the entity spaces:
+        msp = self._msp
+        psp = self._psp
+        if msp is None or psp is None:
+            return False
+        if owner == msp.dxf.handle:
+            return not paperspace
+        if owner == psp.dxf.handle:
+            return paperspace == 1
+        # DXF R12 does not export the owner handle:
+        return self.doc.dxfversion <= DXF12  # type: ignore
+
+    def _build_index(self) -> None:
+        mm = self._mm
+        size = len(mm)
+        find = mm.find
+        intern = sys.intern
+        pos = 0
+        line = 1
+        prev_value = b""
+        inside_entities = False
+        entities_start = -1
+
+        # Main entity data: [handle, dxftype, owner, paperspace, start]
+        mains: List[list] = []
+        linked: Dict[str, str] = dict()  # linked handle -> main handle
+        current: Optional[list] = None
+        expect_linked_entities = False
+        has_attribs = False
+        app_data = False
+        missing_handles = False
+
+        def close_entity(end: int) -> None:
+            nonlocal current, expect_linked_entities, missing_handles
+            if current is None:
+                return
+            handle, dxftype = current[0], current[1]
+            if handle is None:
+                missing_handles = True
+            if expect_linked_entities and dxftype in LINKED_ENTITY_TYPES:
+                if mains and handle is not None:
+                    linked[handle] = mains[-1][0]
+                if dxftype == "SEQEND":
+                    expect_linked_entities = False
+            else:
+                mains.append(current)
+                expect_linked_entities = dxftype == "POLYLINE" or (
+                    dxftype == "INSERT" and has_attribs
+                )
+            current = None
+
+        while pos < size:
+            tag_start = pos
+            end = find(b"\n", pos)
+            if end == -1:
+                break
+            code_str = mm[pos:end]
+            pos = end + 1
+            end = find(b"\n", pos)
+            if end == -1:
+                end = size
+            value = mm[pos:end].rstrip(b"\r")
+            pos = end + 1
+            try:
+                code = int(code_str)
+            except ValueError:
+                raise DXFStructureError(
+                    f'Invalid group code "{code_str!r}" at line {line}.'
+                )
+            line += 2
+            if code == 0:
+                value = value.strip()
+                if inside_entities:
+                    close_entity(tag_start)
+                    if value == b"ENDSEC":
+                        self._skip = (entities_start, tag_start)
+                        break
+                    current = [
+                        None,
+                        intern(value.decode(self.encoding, self.errors)),
+                        "0",
+                        0,
+                        tag_start,
+                    ]
+                    has_attribs = False
+                    app_data = False
+            elif code == 2 and prev_value == b"SECTION":
+                if value.strip() == b"ENTITIES":
+                    inside_entities = True
+                    entities_start = pos
+            elif current is not None:
+                if code == 5:
+                    if current[0] is None:
+                        current[0] = value.strip().decode()
+                elif code == 102:
+                    app_data = value.startswith(b"{")
+                elif code == 330:
+                    if not app_data and current[2] == "0":
+                        current[2] = intern(value.strip().decode())
+                elif code == 67:
+                    current[3] = _safe_int(value)
+                elif code == 66:
+                    has_attribs = bool(_safe_int(value))
+            prev_value = value
+
+        if missing_handles or self._skip[0] == -1:
+            # Lazy loading is not possible, load the ENTITIES section by the
+            # structure stream:
+            self._skip = (-1, -1)
+            return
+
+        index = self._index
+        end_of_section = self._skip[1]
+        for num, data in enumerate(mains):
+            try:
+                end = mains[num + 1][4]
+            except IndexError:
+                end = end_of_section
+            location = EntityLocation(*data, end)  # type: ignore
+            index[location.handle] = location
+        for linked_handle, main_handle in linked.items():
+            index[linked_handle] = index[main_handle]
+
+
+def _split_entities(text: str) -> List[str]:
+    """Split the DXF source `text` at the structure tags (0, ...)."""
+    lines = text.split("\n")
+    parts: List[str] = []
+    start = 0
+    # group code lines have an even index:
+    for index in range(2, len(lines) - 1, 2):
+        if lines[index].strip() == "0":
+            parts.append("\n".join(lines[start:index]) + "\n")
+            start = index
+    parts.append("\n".join(lines[start:]))
+    return parts
+
+
+def _safe_int(value: bytes) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
+class _StructureStream:
+    """Text stream of a memory mapped DXF file or its content as bytes,
+    which skips the file range `skip`.
+    """
+
+    def __init__(
+        self,
+        mm: Union[mmap.mmap, bytes],
+        encoding: str,
+        errors: str,
+        skip: Tuple[int, int],
+    ):
+        self._mm = mm
+        self._encoding = encoding
+        self._errors = errors
+        self._skip_start, self._skip_end = skip
+        self._pos = 0
+
+    def readline(self) -> str:
+        mm = self._mm
+        pos = self._pos
+        if pos == self._skip_start:
+            pos = self._skip_end
+        if pos >= len(mm):
+            return ""
+        end = mm.find(b"\n", pos)
+        if end == -1:
+            end = len(mm)
+        else:
+            end += 1
+        self._pos = end
+        line = mm[pos:end].decode(self._encoding, errors=self._errors)
+        if line.endswith("\r\n"):
+            line = line[:-2] + "\n"
+        return line
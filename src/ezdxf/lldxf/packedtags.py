@@ -1,7 +1,7 @@
 # Copyright (c) 2018-2021 Manfred Moitzi
 # License: MIT License
 from array import array
-from typing import Iterable, MutableSequence, Sequence, Iterator
+from typing import Iterable, MutableSequence, Sequence, Iterator, TYPE_CHECKING
 
 from .types import DXFTag
 from .const import DXFTypeError, DXFIndexError, DXFValueError
@@ -10,6 +10,9 @@ from ezdxf.tools.indexing import Index
 from ezdxf.lldxf.tagwriter import TagWriter
 from ezdxf.math import Matrix44
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class TagList:
     """Store data in a standard Python ``list``."""
@@ -226,3 +229,40 @@ class VertexArray:
         for vertex in m.transform_vertices(self):
             values.extend(vertex)
         self.values = values
+
+    def as_ndarray(self) -> "np.ndarray":
+        """Returns the vertices as NumPy array of shape (N, VERTEX_SIZE).
+        The NumPy array is a view of the underlying ``array.array`` without
+        copying, changes of the NumPy array change the vertices and vice versa.
+        The count of vertices can not be changed as long as a view exist,
+        methods which replace the underlying ``array.array`` like
+        :meth:`transform` or :meth:`set_ndarray` detach existing views.
+
+        Requires NumPy.
+
+        """
+        import numpy as np
+
+        return np.frombuffer(self.values, dtype=np.float64).reshape(
+            -1, self.VERTEX_SIZE
+        )
+
+    def set_ndarray(self, vertices: "np.ndarray") -> None:
+        """Replace all vertices by the NumPy array `vertices` of shape
+        (N, VERTEX_SIZE). The data is copied as one memory block without
+        creating Python objects for the vertices.
+
+        Requires NumPy.
+
+        """
+        import numpy as np
+
+        vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+        if vertices.ndim != 2 or vertices.shape[1] != self.VERTEX_SIZE:
+            raise DXFValueError(
+                f"expected array of shape (N, {self.VERTEX_SIZE}), "
+                f"got {vertices.shape}"
+            )
+        values = array("d")
+        values.frombytes(memoryview(vertices).cast("B"))  # type: ignore
+        self.values = values
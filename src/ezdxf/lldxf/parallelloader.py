@@ -0,0 +1,279 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+"""
+Parallel loading of the ENTITIES and OBJECTS section
+====================================================
+
+The content of the ENTITIES and OBJECTS section is split into chunks at DXF
+entity boundaries and the chunks are decoded and compiled into DXF tags by a
+pool of worker processes. Meanwhile the main process loads the remaining DXF
+structure. The compiled tags are transferred as simple (code, value) tuples,
+which are much cheaper to pickle than :class:`DXFTag` objects, and are merged
+into the section dict in file order.
+
+The DXF entities itself are created and bound to the DXF document in the main
+process by the usual loading process, the handle references are resolved in
+the 2nd loading stage of the DXF document.
+
+"""
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+import concurrent.futures
+import io
+import os
+import re
+
+from .const import DXFStructureError
+from .tags import group_tags, Tags
+from .types import DXFTag, DXFVertex, DXFBinaryTag, POINT_CODES, BINARY_DATA
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Drawing
+
+__all__ = ["ParallelLoader", "MIN_CHUNK_SIZE"]
+
+# Minimum size of a chunk in bytes, smaller sections are compiled as one chunk:
+MIN_CHUNK_SIZE = 1 << 20
+PARALLEL_SECTIONS = (b"ENTITIES", b"OBJECTS")
+
+SECTION_START = re.compile(
+    rb"^[ \t]*0[ \t]*\r?\nSECTION[ \t]*\r?\n[ \t]*2[ \t]*\r?\n([A-Z_]+)[ \t]*\r?\n",
+    re.MULTILINE,
+)
+SECTION_END = re.compile(rb"[ \t]*0[ \t]*\r?\nENDSEC[ \t]*\r?$", re.MULTILINE)
+STRUCTURE_TAG = re.compile(rb"^[ \t]*0[ \t]*\r?$", re.MULTILINE)
+
+TagData = List[Tuple[int, Any]]
+SectionRange = Tuple[str, int, int]
+
+
+class ParallelLoader:
+    """Loads an ASCII DXF file by a pool of worker processes.
+
+    The tag compilation of the ENTITIES and OBJECTS section is distributed
+    across the worker processes, the DXF document is created in the main
+    process.
+
+    Args:
+        filename: file system name of the ASCII DXF file
+        encoding: text encoding of the DXF file
+        errors: decoding error handler
+        max_workers: count of worker processes, ``None`` for the count of
+            processors of the machine
+        min_chunk_size: minimum chunk size in bytes
+
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        encoding: str,
+        errors: str = "surrogateescape",
+        max_workers: int = None,
+        min_chunk_size: int = MIN_CHUNK_SIZE,
+    ):
+        self.filename = filename
+        self.encoding = encoding
+        self.errors = errors
+        self.max_workers = max_workers
+        self.min_chunk_size = max(int(min_chunk_size), 1)
+        with open(filename, "rb") as fp:
+            self._data = fp.read()
+        # Content ranges (name, start, end) of the parallel loaded sections:
+        self.sections: List[SectionRange] = _find_sections(
+            self._data, PARALLEL_SECTIONS
+        )
+
+    @property
+    def chunk_count(self) -> int:
+        """Returns the count of chunks to split a section into, this is the
+        count of worker processes.
+        """
+        return self.max_workers or os.cpu_count() or 1
+
+    def chunks(self, section: SectionRange, count: int) -> List[Tuple[int, int]]:
+        """Split the content range of `section` into `count` or less chunks
+        at DXF entity boundaries, each chunk has a minimum size of
+        `min_chunk_size` bytes except the last chunk.
+        """
+        _, start, end = section
+        size = end - start
+        chunk_size = max(size // max(count, 1) + 1, self.min_chunk_size)
+        chunks: List[Tuple[int, int]] = []
+        data = self._data
+        chunk_start = start
+        while end - chunk_start > chunk_size:
+            split = _next_structure_tag(
+                data, chunk_start, chunk_start + chunk_size, end
+            )
+            if split >= end:
+                break
+            chunks.append((chunk_start, split))
+            chunk_start = split
+        if chunk_start < end:
+            chunks.append((chunk_start, end))
+        return chunks
+
+    def structure_stream(self) -> io.StringIO:
+        """Returns a text stream of the DXF file without the content of the
+        parallel loaded sections.
+        """
+        data = self._data
+        parts = []
+        pos = 0
+        for _, start, end in self.sections:
+            parts.append(data[pos:start])
+            pos = end
+        parts.append(data[pos:])
+        return _text_stream(b"".join(parts), self.encoding, self.errors)
+
+    def load(self, doc: "Drawing") -> None:
+        """Load the DXF file into the new and empty DXF document `doc`."""
+        from ezdxf.document import _cython_tagger
+        from . import loader
+
+        cy_tagger = _cython_tagger()
+        use_c_ext = cy_tagger is not None
+        count = self.chunk_count
+        with concurrent.futures.ProcessPoolExecutor(self.max_workers) as pool:
+            futures = []
+            for section in self.sections:
+                chunk_futures = [
+                    pool.submit(
+                        compile_chunk,
+                        self.filename,
+                        start,
+                        end,
+                        self.encoding,
+                        self.errors,
+                        use_c_ext,
+                    )
+                    for start, end in self.chunks(section, count)
+                ]
+                futures.append((section[0], chunk_futures))
+            # Load the remaining DXF structure meanwhile:
+            stream = self.structure_stream()
+            if use_c_ext:
+                tagger = cy_tagger.ascii_tag_compiler(stream)  # type: ignore
+            else:
+                from .tagger import ascii_tags_loader, tag_compiler
+
+                tagger = tag_compiler(ascii_tags_loader(stream))
+            doc.is_loading = True
+            sections = loader.load_dxf_structure(tagger)
+            # Merge compiled chunks in file order:
+            for name, chunk_futures in futures:
+                section_tags = sections.get(name)
+                if section_tags is None:
+                    raise DXFStructureError(
+                        f"DXFStructureError: invalid {name} section."
+                    )
+                for future in chunk_futures:
+                    section_tags.extend(restore_tags(future.result()))
+        if "THUMBNAILIMAGE" in sections:
+            del sections["THUMBNAILIMAGE"]
+        doc._load_section_dict(sections)
+
+
+def compile_chunk(
+    filename: str,
+    start: int,
+    end: int,
+    encoding: str,
+    errors: str,
+    use_c_ext: bool = False,
+) -> List[TagData]:
+    """Compiles the DXF tags of the file range `start` to `end` and returns
+    the DXF tags grouped by DXF entities as picklable (code, value) tuples.
+    Vertices are stored as tuples of floats and binary data as bytes.
+    (worker process function)
+    """
+    with open(filename, "rb") as fp:
+        fp.seek(start)
+        data = fp.read(end - start)
+    stream = _text_stream(data, encoding, errors)
+    if use_c_ext:
+        from ezdxf.acc.tagger import ascii_tag_compiler
+
+        tagger = ascii_tag_compiler(stream)
+    else:
+        from .tagger import ascii_tags_loader, tag_compiler
+
+        tagger = tag_compiler(ascii_tags_loader(stream))  # type: ignore
+    return [[(tag.code, tag.value) for tag in tags] for tags in group_tags(tagger)]
+
+
+def restore_tags(entities: List[TagData]) -> List[Tags]:
+    """Restore the DXF tags from the data returned by :func:`compile_chunk`."""
+    vertex_codes = POINT_CODES
+    binary_codes = BINARY_DATA
+    result: List[Tags] = []
+    for data in entities:
+        tags = Tags()
+        append = tags.append
+        for code, value in data:
+            if code in vertex_codes:
+                append(DXFVertex(code, value))
+            elif code in binary_codes:
+                append(DXFBinaryTag(code, value))
+            else:
+                append(DXFTag(code, value))
+        result.append(tags)
+    return result
+
+
+def _text_stream(data: bytes, encoding: str, errors: str) -> io.StringIO:
+    text = data.decode(encoding, errors=errors)
+    return io.StringIO(text.replace("\r\n", "\n"))
+
+
+def _is_group_code_line(data: bytes, base: int, pos: int) -> bool:
+    # All DXF tags have exact two lines, therefore the count of lines between
+    # the group code line at location `base` and a group code line at
+    # location `pos` is even:
+    return data.count(b"\n", base, pos) % 2 == 0
+
+
+def _next_structure_tag(data: bytes, base: int, pos: int, end: int) -> int:
+    """Returns the start location of the next structure tag (0, ...) at or
+    after `pos` or `end` if no structure tag exist. The location `base` has to
+    be the start of a group code line before `pos`.
+    """
+    while True:
+        match = STRUCTURE_TAG.search(data, pos, end)
+        if match is None:
+            return end
+        start = match.start()
+        if _is_group_code_line(data, base, start):
+            return start
+        # The value "0" of a tag, like the layer name "0", the next line is a
+        # group code line:
+        base = match.end() + 1
+        pos = base
+
+
+def _find_sections(data: bytes, names) -> List[SectionRange]:
+    """Returns the content ranges (name, start, end) of the sections `names`
+    in file order.
+    """
+    sections: List[SectionRange] = []
+    pos = 0
+    while True:
+        match = SECTION_START.search(data, pos)
+        if match is None:
+            break
+        if not _is_group_code_line(data, 0, match.start()):
+            pos = match.start() + 1
+            continue
+        pos = match.end()
+        end = _next_structure_tag(data, pos, pos, len(data))
+        end_match: Optional[re.Match] = SECTION_END.match(data, end)
+        while end_match is None and end < len(data):
+            end = _next_structure_tag(data, end, end + 1, len(data))
+            end_match = SECTION_END.match(data, end)
+        if end_match is None:
+            raise DXFStructureError("DXFStructureError: missing ENDSEC tag.")
+        name = match.group(1)
+        if name in names:
+            sections.append((name.decode(), pos, end_match.start()))
+        pos = end_match.end()
+    return sections
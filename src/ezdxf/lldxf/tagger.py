@@ -14,6 +14,7 @@ from .types import (
     POINT_CODES,
     TYPE_TABLE,
     BINARY_DATA,
+    NONE_TAG,
 )
 from .const import DXFStructureError
 from ezdxf.tools.codepage import toencoding
@@ -298,7 +299,8 @@ def tag_compiler(tags: Iterator[DXFTag]) -> Iterable[DXFTag]:
                         f"Missing required y coordinate near line: {line}."
                     )
                 # z-axis just for 3d points
-                z = next(tags)
+                # NONE_TAG for a 2d point at the end of the tag stream
+                z = next(tags, NONE_TAG)
                 line += 2
                 try:
                     # z-axis like (30, 0.0) for base x-code 10
@@ -306,7 +308,8 @@ def tag_compiler(tags: Iterator[DXFTag]) -> Iterable[DXFTag]:
                         point = (float(x.value), float(y.value), float(z.value))  # type: ignore
                     else:
                         point = (float(x.value), float(y.value))  # type: ignore
-                        undo_tag = z
+                        if z is not NONE_TAG:
+                            undo_tag = z
                 except ValueError:
                     raise DXFStructureError(
                         f"Invalid floating point values near line: {line}."
@@ -29,6 +29,9 @@ class AbstractTagWriter:
     # Force writing optional values if equal to default value when True.
     # True is only used for testing scenarios!
     force_optional = False
+    # Export unmodified DXF entities from their DXF source data when True,
+    # requires the DXF version of the source document:
+    export_dxf_source = False
 
     # Start of low level interface:
     @abc.abstractmethod
@@ -30,6 +30,7 @@ from .transformtools import *
 from .curvetools import *
 from .clipping import *
 from .polyline import *
+from .rtree import *
 
 AnyVec = Union[Vec2, Vec3]
 Vertex = Union[Sequence[float], AnyVec]
@@ -13,6 +13,7 @@ from itertools import chain
 from ._vector import Vec3, X_AXIS, Y_AXIS, Z_AXIS, NULLVEC
 
 if TYPE_CHECKING:
+    import numpy as np
     from ezdxf.eztypes import Vertex
 
 __all__ = ["Matrix44"]
@@ -609,6 +610,38 @@ class Matrix44:
             # fmt: on
             yield v.normalize() if normalize else v
 
+    def transform_array(self, vertices: "np.ndarray") -> "np.ndarray":
+        """Returns the transformed `vertices` as new NumPy array of shape
+        (N, 3). The `vertices` argument is a NumPy array of shape (N, 3) or any
+        object convertible into such an array, float64 arrays are processed
+        without copying.
+
+        Requires NumPy.
+
+        Raises:
+            ValueError: invalid array shape
+
+        """
+        from ._ndarray import transform_array
+
+        return transform_array(self._matrix, vertices)
+
+    def transform_direction_array(
+        self, vertices: "np.ndarray", normalize=False
+    ) -> "np.ndarray":
+        """Returns the transformed direction `vertices` without translation
+        as new NumPy array of shape (N, 3).
+
+        Requires NumPy.
+
+        Raises:
+            ValueError: invalid array shape
+
+        """
+        from ._ndarray import transform_direction_array
+
+        return transform_direction_array(self._matrix, vertices, normalize)
+
     def ucs_vertex_from_wcs(self, wcs: Vec3) -> Vec3:
         """Returns an UCS vector from WCS vertex.
 
@@ -0,0 +1,64 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+# Optional NumPy support for batch transformations of vertices, this module
+# requires NumPy and is therefore not imported by the ezdxf.math package.
+# The functions are shared by the Python and the Cython implementation of
+# Matrix44.
+from typing import Iterable
+import numpy as np
+
+__all__ = [
+    "vertex_array",
+    "transform_array",
+    "transform_direction_array",
+    "ucs_direction_array_from_wcs",
+]
+
+
+def vertex_array(vertices) -> np.ndarray:
+    """Returns `vertices` as float64 array of shape (N, 3). An existing array
+    of this type and shape is returned without copying.
+
+    Raises:
+        ValueError: invalid array shape
+
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    if vertices.ndim != 2 or vertices.shape[1] != 3:
+        raise ValueError(
+            f"expected vertex array of shape (N, 3), got {vertices.shape}"
+        )
+    return vertices
+
+
+def _matrix(matrix: Iterable[float]) -> np.ndarray:
+    return np.fromiter(matrix, dtype=np.float64, count=16).reshape(4, 4)
+
+
+def transform_array(matrix: Iterable[float], vertices) -> np.ndarray:
+    """Returns the `vertices` transformed by the row-major 4x4 `matrix`."""
+    m = _matrix(matrix)
+    return vertex_array(vertices) @ m[:3, :3] + m[3, :3]
+
+
+def transform_direction_array(
+    matrix: Iterable[float], vertices, normalize=False
+) -> np.ndarray:
+    """Returns the direction `vertices` transformed by the row-major 4x4
+    `matrix` without translation.
+    """
+    result = vertex_array(vertices) @ _matrix(matrix)[:3, :3]
+    if normalize:
+        lengths = np.linalg.norm(result, axis=1)
+        lengths[lengths == 0.0] = 1.0
+        result /= lengths[:, np.newaxis]
+    return result
+
+
+def ucs_direction_array_from_wcs(
+    matrix: Iterable[float], vertices
+) -> np.ndarray:
+    """Returns the UCS directions of the WCS `vertices` for the cartesian UCS
+    defined by the row-major 4x4 `matrix`.
+    """
+    return vertex_array(vertices) @ _matrix(matrix)[:3, :3].T
@@ -216,6 +216,9 @@ class Vec3:
         """:func:`copy.deepcopy` support."""
         return self  # immutable!
 
+    def __reduce__(self):
+        return Vec3, self.xyz
+
     def __getitem__(self, index: int) -> float:
         """
         Support for indexing:
@@ -651,6 +654,9 @@ class Vec2:
             memodict[id(self)] = v
             return v
 
+    def __reduce__(self):
+        return Vec2, (self.x, self.y)
+
     def __getitem__(self, index: int) -> float:
         if isinstance(index, slice):
             raise TypeError("slicing not supported")
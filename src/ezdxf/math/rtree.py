@@ -0,0 +1,196 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
+import heapq
+import math
+
+from .bbox import BoundingBox2d
+
+if TYPE_CHECKING:
+    from ezdxf.math import Vertex
+
+__all__ = ["RTree"]
+
+# Leaf entries: (xmin, ymin, xmax, ymax, item)
+# Nodes: (xmin, ymin, xmax, ymax, children, is_leaf)
+Entry = Tuple[float, float, float, float, Any]
+Node = Tuple[float, float, float, float, List[Any], bool]
+
+
+class RTree:
+    """Immutable spatial search tree for 2D bounding boxes. The tree is
+    build by the Sort-Tile-Recursive (STR) bulk loading algorithm, which
+    creates a nearly optimal tree for static data. Items without valid
+    bounding boxes are ignored.
+
+    Args:
+        items: iterable of (bounding box, item) tuples, the bounding box can
+            be any object with :attr:`extmin` and :attr:`extmax` attributes
+            like :class:`BoundingBox` or :class:`BoundingBox2d`
+        max_node_size: max. count of children per node
+
+    """
+
+    def __init__(self, items: Iterable[Tuple[Any, Any]], max_node_size: int = 16):
+        if max_node_size < 2:
+            raise ValueError("max node size has to be > 1")
+        self._max_node_size = int(max_node_size)
+        entries: List[Entry] = []
+        for box, item in items:
+            extmin = box.extmin
+            extmax = box.extmax
+            if extmin is None or extmax is None:
+                continue
+            entries.append((extmin[0], extmin[1], extmax[0], extmax[1], item))
+        self._count = len(entries)
+        self._root = self._build(entries)
+
+    def __len__(self) -> int:
+        """Returns the count of stored items."""
+        return self._count
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yields all stored items."""
+        for entry in self._entries():
+            yield entry[4]
+
+    @property
+    def extents(self) -> BoundingBox2d:
+        """Returns the bounding box of all stored items."""
+        root = self._root
+        if root is None:
+            return BoundingBox2d()
+        return BoundingBox2d([root[:2], root[2:4]])
+
+    def crossing(self, extmin: "Vertex", extmax: "Vertex") -> Iterator[Any]:
+        """Yields all items which bounding boxes intersect or are inside the
+        search window defined by the corner vertices `extmin` and `extmax`.
+        Touching bounding boxes are intersecting.
+        """
+        x0, y0, x1, y1 = _normalize(extmin, extmax)
+        for entry in self._search(x0, y0, x1, y1):
+            if entry[0] <= x1 and entry[2] >= x0:
+                if entry[1] <= y1 and entry[3] >= y0:
+                    yield entry[4]
+
+    def window(self, extmin: "Vertex", extmax: "Vertex") -> Iterator[Any]:
+        """Yields all items which bounding boxes are completely inside the
+        search window defined by the corner vertices `extmin` and `extmax`.
+        Bounding boxes at the window border are inside.
+        """
+        x0, y0, x1, y1 = _normalize(extmin, extmax)
+        for entry in self._search(x0, y0, x1, y1):
+            if entry[0] >= x0 and entry[2] <= x1:
+                if entry[1] >= y0 and entry[3] <= y1:
+                    yield entry[4]
+
+    def nearest(self, location: "Vertex") -> Iterator[Tuple[float, Any]]:
+        """Yields all items as (distance, item) tuples sorted by the distance
+        of their bounding boxes to the given `location`. The distance is 0 for
+        locations inside a bounding box. The search is lazy evaluated,
+        stop the iteration if enough items are found.
+        """
+        root = self._root
+        if root is None:
+            return
+        x = float(location[0])
+        y = float(location[1])
+        counter = 0  # tie breaker, nodes and items are not comparable
+        heap: List[Tuple[float, int, bool, Any]] = [
+            (_distance(root, x, y), counter, False, root)
+        ]
+        while heap:
+            distance, _, is_entry, data = heapq.heappop(heap)
+            if is_entry:
+                yield distance, data[4]
+                continue
+            is_leaf = data[5]
+            for child in data[4]:
+                counter += 1
+                heapq.heappush(
+                    heap, (_distance(child, x, y), counter, is_leaf, child)
+                )
+
+    def _entries(self) -> Iterator[Entry]:
+        if self._root is None:
+            return
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node[5]:
+                yield from node[4]
+            else:
+                stack.extend(node[4])
+
+    def _search(
+        self, x0: float, y0: float, x1: float, y1: float
+    ) -> Iterator[Entry]:
+        # Yields the entries of all leaf nodes intersecting the search window
+        if self._root is None:
+            return
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node[0] > x1 or node[2] < x0 or node[1] > y1 or node[3] < y0:
+                continue
+            if node[5]:
+                yield from node[4]
+            else:
+                stack.extend(node[4])
+
+    def _build(self, entries: List[Entry]):
+        if len(entries) == 0:
+            return None
+        nodes = _str_pack(entries, self._max_node_size, True)
+        while len(nodes) > 1:
+            nodes = _str_pack(nodes, self._max_node_size, False)
+        return nodes[0]
+
+
+def _str_pack(entries: Sequence, size: int, is_leaf: bool) -> List[Node]:
+    """Pack `entries` into nodes of max. `size` children by the
+    Sort-Tile-Recursive algorithm.
+    """
+    count = len(entries)
+    node_count = math.ceil(count / size)
+    slice_count = math.ceil(math.sqrt(node_count))
+    slice_size = slice_count * size
+    nodes: List[Node] = []
+    by_x = sorted(entries, key=lambda e: e[0] + e[2])
+    for start in range(0, count, slice_size):
+        by_y = sorted(by_x[start : start + slice_size], key=lambda e: e[1] + e[3])
+        for index in range(0, len(by_y), size):
+            children = by_y[index : index + size]
+            nodes.append(
+                (
+                    min(c[0] for c in children),
+                    min(c[1] for c in children),
+                    max(c[2] for c in children),
+                    max(c[3] for c in children),
+                    children,
+                    is_leaf,
+                )
+            )
+    return nodes
+
+
+def _normalize(
+    extmin: "Vertex", extmax: "Vertex"
+) -> Tuple[float, float, float, float]:
+    x0, x1 = sorted((float(extmin[0]), float(extmax[0])))
+    y0, y1 = sorted((float(extmin[1]), float(extmax[1])))
+    return x0, y0, x1, y1
+
+
+def _distance(box: Sequence, x: float, y: float) -> float:
+    dx = max(box[0] - x, 0.0, x - box[2])
+    dy = max(box[1] - y, 0.0, y - box[3])
+    return math.hypot(dx, dy)
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Tuple, Sequence, Iterable
 from ezdxf.math import Vec3, X_AXIS, Y_AXIS, Z_AXIS, Matrix44
 
 if TYPE_CHECKING:
+    import numpy as np
     from ezdxf.eztypes import Vertex, BaseLayout, RGB
 
 __all__ = ["OCS", "UCS", "PassTroughUCS"]
@@ -89,6 +90,34 @@ class OCS:
         else:
             yield from points
 
+    def from_wcs_array(self, points: "np.ndarray") -> "np.ndarray":
+        """Returns the OCS vertices for the WCS `points` as NumPy array of
+        shape (N, 3). Returns a float64 array of shape (N, 3) as input array
+        without copying, if no transformation is required.
+
+        Requires NumPy.
+
+        """
+        from ._ndarray import vertex_array, ucs_direction_array_from_wcs
+
+        if self.transform:
+            return ucs_direction_array_from_wcs(self.matrix, points)
+        return vertex_array(points)
+
+    def to_wcs_array(self, points: "np.ndarray") -> "np.ndarray":
+        """Returns the WCS vertices for the OCS `points` as NumPy array of
+        shape (N, 3). Returns a float64 array of shape (N, 3) as input array
+        without copying, if no transformation is required.
+
+        Requires NumPy.
+
+        """
+        from ._ndarray import vertex_array
+
+        if self.transform:
+            return self.matrix.transform_direction_array(points)
+        return vertex_array(points)
+
     def render_axis(
         self,
         layout: "BaseLayout",
@@ -213,6 +242,29 @@ class UCS:
         """Returns UCS vector for WCS `vector` without origin adjustment."""
         return self.matrix.ucs_direction_from_wcs(vector)
 
+    def to_wcs_array(self, points: "np.ndarray") -> "np.ndarray":
+        """Returns the WCS vertices for the UCS `points` as new NumPy array of
+        shape (N, 3).
+
+        Requires NumPy.
+
+        """
+        return self.matrix.transform_array(points)
+
+    def from_wcs_array(self, points: "np.ndarray") -> "np.ndarray":
+        """Returns the UCS vertices for the WCS `points` as new NumPy array of
+        shape (N, 3).
+
+        Requires NumPy.
+
+        """
+        from ._ndarray import vertex_array, ucs_direction_array_from_wcs
+
+        origin = tuple(self.origin)
+        return ucs_direction_array_from_wcs(
+            self.matrix, vertex_array(points) - origin
+        )
+
     def to_ocs(self, point: Vec3) -> Vec3:
         """Returns OCS vector for UCS `point`.
 
@@ -508,5 +560,15 @@ class PassTroughUCS(UCS):
     def from_wcs(self, point: Vec3) -> Vec3:
         return point
 
+    def to_wcs_array(self, points: "np.ndarray") -> "np.ndarray":
+        from ._ndarray import vertex_array
+
+        return vertex_array(points)
+
+    def from_wcs_array(self, points: "np.ndarray") -> "np.ndarray":
+        from ._ndarray import vertex_array
+
+        return vertex_array(points)
+
     def points_from_wcs(self, points: Iterable[Vec3]) -> Iterable[Vec3]:
         return points
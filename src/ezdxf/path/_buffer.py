@@ -0,0 +1,208 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+"""
+Bulk operations on the packed representation of :class:`~ezdxf.path.Path`
+objects, keep in sync with the Cython implementation: ezdxf/acc/pathbuffer.pyx
+
+The control vertices of a path are stored in a flat float64 buffer of type
+:class:`array.array` as x, y, z triples, the command types are stored as
+:class:`bytearray` and the vertex index of the end vertex of each command
+is stored in an :class:`array.array` of type "I".
+
+"""
+from typing import List, Sequence, Tuple, Callable, TYPE_CHECKING
+from array import array
+import math
+
+from ezdxf.math import Vec3
+
+if TYPE_CHECKING:
+    from ezdxf.math import Matrix44
+
+__all__ = [
+    "vec3_list",
+    "transform_buffer",
+    "flatten_buffer",
+    "flatten_to_buffer",
+]
+
+LINE_TO = 1
+CURVE3_TO = 2
+CURVE4_TO = 3
+MOVE_TO = 4
+
+
+def vec3_list(vertices: array) -> List[Vec3]:
+    """Returns the vertex `buffer` as list of :class:`Vec3`."""
+    it = iter(vertices)
+    return [Vec3(x, y, z) for x, y, z in zip(it, it, it)]
+
+
+def transform_buffer(m: "Matrix44", vertices: array) -> array:
+    """Returns the vertex buffer `vertices` transformed by matrix `m` as new
+    vertex buffer.
+    """
+    # fmt: off
+    (
+        m0, m1, m2, m3,
+        m4, m5, m6, m7,
+        m8, m9, m10, m11,
+        m12, m13, m14, m15,
+    ) = m
+    # fmt: on
+    result = array("d")
+    extend = result.extend
+    it = iter(vertices)
+    for x, y, z in zip(it, it, it):
+        extend(
+            (
+                x * m0 + y * m4 + z * m8 + m12,
+                x * m1 + y * m5 + z * m9 + m13,
+                x * m2 + y * m6 + z * m10 + m14,
+            )
+        )
+    return result
+
+
+def flatten_buffer(
+    commands: bytes,
+    index: Sequence[int],
+    vertices: array,
+    distance: float,
+    segments: int,
+) -> List[Vec3]:
+    """Returns the flattened path of the packed representation as list of
+    :class:`Vec3`, see :meth:`ezdxf.path.Path.flattening`.
+    """
+    target = array("d")
+    flatten_to_buffer(commands, index, vertices, distance, segments, target)
+    return vec3_list(target)
+
+
+def flatten_to_buffer(
+    commands: bytes,
+    index: Sequence[int],
+    vertices: array,
+    distance: float,
+    segments: int,
+    target: array,
+) -> None:
+    """Appends the flattened path of the packed representation as x, y, z
+    triples to the float64 vertex buffer `target`, see
+    :func:`ezdxf.path.flatten_paths`.
+    """
+    if not commands:
+        return
+    extend = target.extend
+    extend(vertices[0:3])
+    prev = 0
+    for cmd, i in zip(commands, index):
+        if cmd == CURVE4_TO:
+            _flatten_curve(
+                _cubic_bezier(vertices[prev * 3 : i * 3 + 3]),
+                _point(vertices, prev),
+                _point(vertices, i),
+                distance,
+                segments,
+                extend,
+            )
+        elif cmd == CURVE3_TO:
+            _flatten_curve(
+                _quadratic_bezier(vertices[prev * 3 : i * 3 + 3]),
+                _point(vertices, prev),
+                _point(vertices, i),
+                distance,
+                segments,
+                extend,
+            )
+        else:  # LINE_TO, MOVE_TO
+            extend(vertices[i * 3 : i * 3 + 3])
+        prev = i
+
+
+Point = Tuple[float, float, float]
+
+
+def _point(vertices: array, i: int) -> Point:
+    i *= 3
+    return vertices[i], vertices[i + 1], vertices[i + 2]
+
+
+def _cubic_bezier(v: array) -> Callable[[float], Point]:
+    x0, y0, z0, x1, y1, z1, x2, y2, z2, x3, y3, z3 = v
+
+    def point(t: float) -> Point:
+        # same calculation as Bezier4P(), bernstein polynom of 3rd degree:
+        t2 = t * t
+        _1_minus_t = 1.0 - t
+        _1_minus_t_square = _1_minus_t * _1_minus_t
+        a = _1_minus_t_square * _1_minus_t
+        b = 3.0 * _1_minus_t_square * t
+        c = 3.0 * _1_minus_t * t2
+        d = t2 * t
+        return (
+            x0 * a + x1 * b + x2 * c + x3 * d,
+            y0 * a + y1 * b + y2 * c + y3 * d,
+            z0 * a + z1 * b + z2 * c + z3 * d,
+        )
+
+    return point
+
+
+def _quadratic_bezier(v: array) -> Callable[[float], Point]:
+    x0, y0, z0, x1, y1, z1, x2, y2, z2 = v
+
+    def point(t: float) -> Point:
+        # same calculation as Bezier3P():
+        _1_minus_t = 1.0 - t
+        a = _1_minus_t * _1_minus_t
+        b = 2.0 * t * _1_minus_t
+        c = t * t
+        return (
+            x0 * a + x1 * b + x2 * c,
+            y0 * a + y1 * b + y2 * c,
+            z0 * a + z1 * b + z2 * c,
+        )
+
+    return point
+
+
+def _flatten_curve(
+    point: Callable[[float], Point],
+    start_point: Point,
+    end_point: Point,
+    distance: float,
+    segments: int,
+    extend: Callable[[Point], None],
+) -> None:
+    """Adaptive flattening of a Bézier curve, the same algorithm as
+    :meth:`Bezier4P.flattening`, without the start point.
+    """
+    dt = 1.0 / segments
+    t0 = 0.0
+    s = start_point
+    while t0 < 1.0:
+        t1 = t0 + dt
+        if math.isclose(t1, 1.0):
+            e = end_point
+            t1 = 1.0
+        else:
+            e = point(t1)
+        # subdivision by a stack in the order of the recursive implementation:
+        stack = [(s, e, t0, t1)]
+        while stack:
+            s0, e0, start_t, end_t = stack.pop()
+            mid_t = (start_t + end_t) * 0.5
+            m = point(mid_t)
+            dx = m[0] - (s0[0] + (e0[0] - s0[0]) * 0.5)
+            dy = m[1] - (s0[1] + (e0[1] - s0[1]) * 0.5)
+            dz = m[2] - (s0[2] + (e0[2] - s0[2]) * 0.5)
+            d = (dx * dx + dy * dy + dz * dz) ** 0.5
+            # emergency exit if distance d is suddenly very large #574
+            if d < distance or d > 1e12:
+                extend(e0)
+            else:
+                stack.append((m, e0, mid_t, end_t))
+                stack.append((s0, m, start_t, mid_t))
+        t0 = t1
+        s = e
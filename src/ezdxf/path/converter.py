@@ -56,7 +56,7 @@ from ezdxf.entities import (
     EllipseEdge,
     SplineEdge,
 )
-from .path import Path
+from .path import Path, vec3_list
 from .commands import Command
 from . import tools
 from .nesting import group_paths
@@ -543,11 +543,22 @@ def to_lwpolylines(
     elif reference_point.z != 0:
         dxfattribs["elevation"] = reference_point.z
 
-    for path in tools.single_paths(paths):
-        if len(path) > 0:
-            p = LWPolyline.new(dxfattribs=dxfattribs)
-            p.append_points(path.flattening(distance, segments), format="xy")
-            yield p
+    for vertices in _flatten_single_paths(paths, distance, segments):
+        p = LWPolyline.new(dxfattribs=dxfattribs)
+        p.append_points(vertices, format="xy")
+        yield p
+
+
+def _flatten_single_paths(
+    paths: Iterable[Path], distance: float, segments: int
+) -> Iterable[List[Vec3]]:
+    """Yields the flattened vertices of all none-empty single paths, all paths
+    are flattened in a single pass by :func:`tools.flatten_paths`.
+    """
+    paths = [p for p in tools.single_paths(paths) if len(p) > 0]
+    vertices, offsets = tools.flatten_paths(paths, distance, segments)
+    for start, end in zip(offsets, offsets[1:]):
+        yield vec3_list(vertices[start * 3 : end * 3])
 
 
 def _get_ocs(extrusion: Vec3, reference_point: Vec3) -> Tuple[OCS, float]:
@@ -602,11 +613,10 @@ def to_polylines2d(
     elif reference_point.z != 0:
         dxfattribs["elevation"] = Vec3(0, 0, reference_point.z)
 
-    for path in tools.single_paths(paths):
-        if len(path) > 0:
-            p = Polyline.new(dxfattribs=dxfattribs)
-            p.append_vertices(path.flattening(distance, segments))
-            yield p
+    for vertices in _flatten_single_paths(paths, distance, segments):
+        p = Polyline.new(dxfattribs=dxfattribs)
+        p.append_vertices(vertices)
+        yield p
 
 
 def to_hatches(
@@ -813,11 +823,10 @@ def to_polylines3d(
 
     dxfattribs = dxfattribs or {}
     dxfattribs["flags"] = const.POLYLINE_3D_POLYLINE
-    for path in tools.single_paths(paths):
-        if len(path) > 0:
-            p = Polyline.new(dxfattribs=dxfattribs)
-            p.append_vertices(path.flattening(distance, segments))
-            yield p
+    for vertices in _flatten_single_paths(paths, distance, segments):
+        p = Polyline.new(dxfattribs=dxfattribs)
+        p.append_vertices(vertices)
+        yield p
 
 
 def to_lines(
@@ -844,19 +853,13 @@ def to_lines(
     if isinstance(paths, Path):
         paths = [paths]
     dxfattribs = dxfattribs or {}
-    prev_vertex = None
-    for path in tools.single_paths(paths):
-        if len(path) == 0:
-            continue
-        for vertex in path.flattening(distance, segments):
-            if prev_vertex is None:
-                prev_vertex = vertex
-                continue
+    for vertices in _flatten_single_paths(paths, distance, segments):
+        prev_vertex = vertices[0]
+        for vertex in vertices[1:]:
             dxfattribs["start"] = prev_vertex
             dxfattribs["end"] = vertex
             yield Line.new(dxfattribs=dxfattribs)
             prev_vertex = vertex
-        prev_vertex = None
 
 
 PathParts = Union[BSpline, List[Vec3]]
@@ -91,10 +91,20 @@ Sort by Area
 It is not possible for a path to contain another path with a larger area.
 
 """
-from typing import Tuple, Optional, List, Iterable, TypeVar
+from typing import (
+    Tuple,
+    Optional,
+    List,
+    Iterable,
+    TypeVar,
+    Dict,
+    Sequence,
+    Any,
+    cast,
+)
 from collections import namedtuple
 from .path import Path
-from ezdxf.math import BoundingBox2d
+from ezdxf.math import Vec2, RTree, is_point_in_polygon_2d
 
 __all__ = [
     "fast_bbox_detection",
@@ -106,63 +116,113 @@ __all__ = [
 Exterior = Path
 Polygon = TypeVar("Polygon")
 Polygon = Tuple[Exterior, Optional[List[Polygon]]]  # type: ignore
-BoxStruct = namedtuple("BoxStruct", "bbox, path")
+BoxStruct = namedtuple("BoxStruct", "extmin, extmax")
+ROOT = -1
 
 
-def fast_bbox_detection(paths: Iterable[Path]) -> List[Polygon]:
+def fast_bbox_detection(
+    paths: Iterable[Path], *, exact: bool = False, distance: float = 0.01
+) -> List[Polygon]:
     """Create a nested polygon structure from iterable `paths`, using 2D
     bounding boxes as fast detection objects.
 
-    """
+    A path is inside of another path if the center of its bounding box is
+    inside the bounding box of the other path. The candidates for the
+    inside check are located by a spatial search tree, which avoids testing
+    each path against all other paths.
 
-    # Implements fast bounding box construction and fast inside check.
-    def area(item: BoxStruct) -> float:
-        width, height = item.bbox.size
-        return width * height
+    The optional `exact` mode checks if the start point of a path is inside
+    the flattened polygon of the other path, which detects paths inside of
+    concave paths correctly. The argument `distance` is the max. flattening
+    distance of the exact mode, see :meth:`Path.flattening`.
 
-    def separate(
-        exterior: BoundingBox2d, candidates: List[BoxStruct]
-    ) -> Tuple[List[BoxStruct], List[BoxStruct]]:
-        holes: List[BoxStruct] = []
-        outside: List[BoxStruct] = []
-        for candidate in candidates:
-            # Fast inside check:
-            (
-                holes if exterior.inside(candidate.bbox.center) else outside
-            ).append(candidate)
-        return holes, outside
-
-    def polygon_structure(outside: List[BoxStruct]) -> List[List]:
-        polygons = []
-        while outside:
-            exterior = outside.pop()  # path with largest area
-            # Get holes inside of exterior and returns the remaining paths
-            # outside of exterior:
-            holes, outside = separate(exterior.bbox, outside)
-            if holes:
-                # build nested hole structure:
-                # the largest hole could contain the smaller holes,
-                # and so on ...
-                holes = polygon_structure(holes)  # type: ignore
-            polygons.append([exterior, *holes])
-        return polygons
-
-    def as_nested_paths(polygons) -> List:
-        return [
-            polygon.path
-            if isinstance(polygon, BoxStruct)
-            else as_nested_paths(polygon)
-            for polygon in polygons
-        ]
+    .. versionchanged:: 0.17.2
+        spatial search tree and argument `exact`
 
-    boxed_paths = [
-        # Fast bounding box construction:
-        BoxStruct(BoundingBox2d(path.control_vertices()), path)
-        for path in paths
-        if len(path)
-    ]
-    boxed_paths.sort(key=area)
-    return as_nested_paths(polygon_structure(boxed_paths))
+    """
+    paths = [path for path in paths if len(path)]
+    # Fast bounding box construction from the control vertices:
+    boxes = [_extents(path) for path in paths]
+    if exact:
+        points = [path.start for path in paths]
+    else:
+        points = [_center(box) for box in boxes]
+
+    # Processing order: descending area, paths of equal size in reversed
+    # order, a path can only be inside of a path with a larger area:
+    order = sorted(range(len(paths)), key=lambda i: _area(boxes[i]))
+    order.reverse()
+    rank = [0] * len(order)
+    for position, index in enumerate(order):
+        rank[index] = position
+
+    tree = RTree(zip(boxes, range(len(boxes))))
+    polygons: List[List[Any]] = []
+    nodes: List[List[Any]] = [[path] for path in paths]
+    parents = [ROOT] * len(paths)
+    flattened: Dict[int, List[Vec2]] = dict()
+    for index in order:
+        point = points[index]
+        # All larger paths which bounding boxes contain the test point:
+        candidates = [
+            candidate
+            for candidate in tree.crossing(point, point)
+            if rank[candidate] < rank[index]
+        ]
+        if exact:
+            candidates = [
+                candidate
+                for candidate in candidates
+                if _is_inside(paths, flattened, candidate, point, distance)
+            ]
+        candidates.sort(key=rank.__getitem__)
+        # Descend the nested polygon structure: the path is inside of the
+        # first (largest) polygon at each level which contains the test point:
+        parent = ROOT
+        for candidate in candidates:
+            if parents[candidate] == parent:
+                parent = candidate
+        parents[index] = parent
+        if parent == ROOT:
+            polygons.append(nodes[index])
+        else:
+            nodes[parent].append(nodes[index])
+    return cast(List[Polygon], polygons)
+
+
+def _extents(path: Path) -> BoxStruct:
+    vertices = path._vertices
+    x = vertices[0::3]
+    y = vertices[1::3]
+    return BoxStruct((min(x), min(y)), (max(x), max(y)))
+
+
+def _center(box: BoxStruct) -> Tuple[float, float]:
+    (x0, y0), (x1, y1) = box
+    return x0 + (x1 - x0) * 0.5, y0 + (y1 - y0) * 0.5
+
+
+def _area(box: BoxStruct) -> float:
+    (x0, y0), (x1, y1) = box
+    return (x1 - x0) * (y1 - y0)
+
+
+def _is_inside(
+    paths: Sequence[Path],
+    flattened: Dict[int, List[Vec2]],
+    index: int,
+    point: Vec2,
+    distance: float,
+) -> bool:
+    polygon = flattened.get(index)
+    if polygon is None:
+        polygon = Vec2.list(paths[index].flattening(distance))
+        flattened[index] = polygon
+    try:
+        # points on the boundary line are inside:
+        return is_point_in_polygon_2d(Vec2(point), polygon) >= 0
+    except ValueError:  # less than 3 vertices
+        return False
 
 
 def winding_deconstruction(
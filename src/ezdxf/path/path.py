@@ -9,7 +9,9 @@ from typing import (
     Any,
 )
 from collections import abc
+from array import array
 
+from ezdxf.acc import USE_C_EXT
 from ezdxf.math import (
     Vec3,
     NULLVEC,
@@ -28,10 +30,33 @@ from .commands import (
     MoveTo,
     Curve3To,
     Curve4To,
-    AnyCurve,
     PathElement,
 )
 
+# Import of Python or Cython implementations of the bulk operations:
+if USE_C_EXT:
+    try:
+        from ezdxf.acc.pathbuffer import (
+            vec3_list,
+            transform_buffer,
+            flatten_buffer,
+            flatten_to_buffer,
+        )
+    except ImportError:
+        from ._buffer import (
+            vec3_list,
+            transform_buffer,
+            flatten_buffer,
+            flatten_to_buffer,
+        )
+else:
+    from ._buffer import (
+        vec3_list,
+        transform_buffer,
+        flatten_buffer,
+        flatten_to_buffer,
+    )
+
 __all__ = ["Path"]
 
 MAX_DISTANCE = 0.01
@@ -40,32 +65,117 @@ G1_TOL = 1e-4
 
 
 class Path(abc.Sequence):
-    __slots__ = ("_start", "_commands", "_has_sub_paths", "_user_data")
+    """The path commands are stored in a packed representation: the command
+    types in a :class:`bytearray`, the start point and the control vertices
+    as x, y, z triples in a flat float64 :class:`array.array` and the vertex
+    index of the end vertex of each command in an :class:`array.array` of
+    type "I".
+
+    The sequence interface returns the path elements :class:`LineTo`,
+    :class:`Curve3To`, :class:`Curve4To` and :class:`MoveTo` as views of the
+    packed representation.
+
+    """
+
+    __slots__ = (
+        "_vertices",
+        "_commands",
+        "_index",
+        "_has_sub_paths",
+        "_user_data",
+    )
 
     def __init__(self, start: Vertex = NULLVEC):
-        self._start = Vec3(start)
+        self._vertices = array("d", Vec3(start).xyz)
+        self._commands = bytearray()
+        self._index = array("I")
         self._has_sub_paths = False
-        self._commands: List[PathElement] = []
         self._user_data: Any = None  # should be immutable data!
 
     def __len__(self) -> int:
         return len(self._commands)
 
-    def __getitem__(self, item) -> PathElement:
-        return self._commands[item]
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._element(i) for i in range(len(self._commands))[item]]
+        # raises IndexError for invalid indices:
+        return self._element(range(len(self._commands))[item])
 
     def __iter__(self) -> Iterator[PathElement]:
-        return iter(self._commands)
+        vertices = vec3_list(self._vertices)
+        # localize variables:
+        line_to = Command.LINE_TO
+        curve3_to = Command.CURVE3_TO
+        curve4_to = Command.CURVE4_TO
+        for cmd, i in zip(self._commands, self._index):
+            if cmd == line_to:
+                yield LineTo(end=vertices[i])
+            elif cmd == curve3_to:
+                yield Curve3To(end=vertices[i], ctrl=vertices[i - 1])
+            elif cmd == curve4_to:
+                yield Curve4To(
+                    end=vertices[i],
+                    ctrl1=vertices[i - 2],
+                    ctrl2=vertices[i - 1],
+                )
+            else:  # move_to
+                yield MoveTo(end=vertices[i])
+
+    def _vertex(self, index: int) -> Vec3:
+        i = index * 3
+        v = self._vertices
+        return Vec3(v[i], v[i + 1], v[i + 2])
+
+    def _element(self, index: int) -> PathElement:
+        cmd = self._commands[index]
+        i = self._index[index]
+        vertex = self._vertex
+        if cmd == Command.LINE_TO:
+            return LineTo(end=vertex(i))
+        elif cmd == Command.CURVE3_TO:
+            return Curve3To(end=vertex(i), ctrl=vertex(i - 1))
+        elif cmd == Command.CURVE4_TO:
+            return Curve4To(
+                end=vertex(i), ctrl1=vertex(i - 2), ctrl2=vertex(i - 1)
+            )
+        else:  # MOVE_TO
+            return MoveTo(end=vertex(i))
+
+    def _append(self, cmd: int, *vertices: Vertex) -> None:
+        extend = self._vertices.extend
+        for vertex in vertices:
+            extend(Vec3(vertex).xyz)
+        self._commands.append(cmd)
+        self._index.append(len(self._vertices) // 3 - 1)
+
+    def _extend(self, path: "Path") -> None:
+        """Extend the packed representation by the commands of `path`, the
+        start point of `path` is replaced by the current end point.
+        """
+        base = len(self._vertices) // 3 - 1
+        self._vertices.extend(path._vertices[3:])
+        self._commands.extend(path._commands)
+        self._index.extend(i + base for i in path._index)
+
+    def _new_path(
+        self, vertices: array, commands: bytearray, index: array
+    ) -> "Path":
+        path = self.__class__()
+        path._vertices = vertices
+        path._commands = commands
+        path._index = index
+        path._has_sub_paths = self._has_sub_paths
+        path._user_data = self._user_data
+        return path
 
     def __copy__(self) -> "Path":
         """Returns a new copy of :class:`Path` with shared immutable data."""
-        copy = Path(self._start)
-        copy._has_sub_paths = self._has_sub_paths
-        # immutable data
-        copy._commands = list(self._commands)
         # copy by reference: user data should be immutable data!
-        copy._user_data = self._user_data
-        return copy
+        return self._new_path(
+            array("d", self._vertices),
+            bytearray(self._commands),
+            array("I", self._index),
+        )
 
     clone = __copy__
 
@@ -86,37 +196,36 @@ class Path(abc.Sequence):
         """:class:`Path` start point, resetting the start point of an empty
         path is possible.
         """
-        return self._start
+        return self._vertex(0)
 
     @start.setter
     def start(self, location: Vertex) -> None:
         if self._commands:
             raise ValueError("Requires an empty path.")
         else:
-            self._start = Vec3(location)
+            self._vertices = array("d", Vec3(location).xyz)
 
     @property
     def end(self) -> Vec3:
         """:class:`Path` end point."""
-        if self._commands:
-            return self._commands[-1].end
-        else:
-            return self._start
+        x, y, z = self._vertices[-3:]
+        return Vec3(x, y, z)
 
     @property
     def is_closed(self) -> bool:
         """Returns ``True`` if the start point is close to the end point."""
-        return self._start.isclose(self.end)
+        return self.start.isclose(self.end)
 
     @property
     def has_lines(self) -> bool:
         """Returns ``True`` if the path has any line segments."""
-        return any(cmd.type == Command.LINE_TO for cmd in self._commands)
+        return Command.LINE_TO in self._commands
 
     @property
     def has_curves(self) -> bool:
         """Returns ``True`` if the path has any curve segments."""
-        return any(cmd.type in AnyCurve for cmd in self._commands)
+        commands = self._commands
+        return Command.CURVE3_TO in commands or Command.CURVE4_TO in commands
 
     @property
     def has_sub_paths(self) -> bool:
@@ -142,7 +251,7 @@ class Path(abc.Sequence):
 
     def line_to(self, location: Vertex) -> None:
         """Add a line from actual path end point to `location`."""
-        self._commands.append(LineTo(end=Vec3(location)))
+        self._append(Command.LINE_TO, location)
 
     def move_to(self, location: Vertex) -> None:
         """Start a new sub-path at `location`. This creates a gap between the
@@ -157,19 +266,21 @@ class Path(abc.Sequence):
         """
         commands = self._commands
         if not commands:
-            self._start = Vec3(location)
+            self._vertices = array("d", Vec3(location).xyz)
         else:
             self._has_sub_paths = True
-            if commands[-1].type == Command.MOVE_TO:
+            if commands[-1] == Command.MOVE_TO:
                 # replace last move to command
                 commands.pop()
-            commands.append(MoveTo(end=Vec3(location)))
+                self._index.pop()
+                del self._vertices[-3:]
+            self._append(Command.MOVE_TO, location)
 
     def curve3_to(self, location: Vertex, ctrl: Vertex) -> None:
         """Add a quadratic Bèzier-curve from actual path end point to
         `location`, `ctrl` is the control point for the quadratic Bèzier-curve.
         """
-        self._commands.append(Curve3To(end=Vec3(location), ctrl=Vec3(ctrl)))
+        self._append(Command.CURVE3_TO, ctrl, location)
 
     def curve4_to(
         self, location: Vertex, ctrl1: Vertex, ctrl2: Vertex
@@ -177,9 +288,7 @@ class Path(abc.Sequence):
         """Add a cubic Bèzier-curve from actual path end point to `location`,
         `ctrl1` and `ctrl2` are the control points for the cubic Bèzier-curve.
         """
-        self._commands.append(
-            Curve4To(end=Vec3(location), ctrl1=Vec3(ctrl1), ctrl2=Vec3(ctrl2))
-        )
+        self._append(Command.CURVE4_TO, ctrl1, ctrl2, location)
 
     curve_to = curve4_to  # TODO: 2021-01-30, remove compatibility alias
 
@@ -209,15 +318,10 @@ class Path(abc.Sequence):
             self.close()
 
     def _start_of_last_sub_path(self) -> Optional[Vec3]:
-        move_to = Command.MOVE_TO
-        commands = self._commands
-        index = len(commands) - 1
+        index = self._commands.rfind(Command.MOVE_TO)
         # The first command at index 0 is never MOVE_TO!
-        while index > 0:
-            cmd = commands[index]
-            if cmd.type == move_to:
-                return cmd.end
-            index -= 1
+        if index > 0:
+            return self._vertex(self._index[index])
         return None
 
     @no_type_check
@@ -231,22 +335,20 @@ class Path(abc.Sequence):
             return Path(self.start)
         path = Path(start=self.end)
         path._user_data = self._user_data
+        vertices = vec3_list(self._vertices)
+        index = self._index
         # localize variables:
         _, line_to, curve3_to, curve4_to, move_to = Command
-        commands = self._commands
-        for index in range(len(commands) - 1, -1, -1):
-            cmd = commands[index]
-            if index:
-                prev_end = commands[index - 1].end
-            else:
-                prev_end = self.start
-            t = cmd.type
+        for i in range(len(commands) - 1, -1, -1):
+            t = commands[i]
+            end = index[i]
+            prev_end = vertices[index[i - 1]] if i else vertices[0]
             if t == line_to:
                 path.line_to(prev_end)
             elif t == curve3_to:
-                path.curve3_to(prev_end, cmd.ctrl)
+                path.curve3_to(prev_end, vertices[end - 1])
             elif t == curve4_to:
-                path.curve4_to(prev_end, cmd.ctrl2, cmd.ctrl1)
+                path.curve4_to(prev_end, vertices[end - 1], vertices[end - 2])
             elif t == move_to:
                 path.move_to(prev_end)
 
@@ -277,6 +379,7 @@ class Path(abc.Sequence):
         else:
             return self.clone()
 
+    @no_type_check
     def approximate(self, segments: int = 20) -> Iterable[Vec3]:
         """Approximate path by vertices, `segments` is the count of
         approximation segments for each Bézier curve.
@@ -288,14 +391,39 @@ class Path(abc.Sequence):
         indistinguishable from line segments.
 
         """
+        if not self._commands:
+            return
 
-        def approx_curve3(s, c, e) -> Iterable[Vec3]:
-            return Bezier3P((s, c, e)).approximate(segments)
+        vertices = vec3_list(self._vertices)
+        start = vertices[0]
+        yield start
 
-        def approx_curve4(s, c1, c2, e) -> Iterable[Vec3]:
-            return Bezier4P((s, c1, c2, e)).approximate(segments)
+        # localize variables:
+        line_to = Command.LINE_TO
+        curve3_to = Command.CURVE3_TO
+        curve4_to = Command.CURVE4_TO
 
-        yield from self._approximate(approx_curve3, approx_curve4)
+        for t, i in zip(self._commands, self._index):
+            end_location = vertices[i]
+            if t == curve3_to:
+                pts = iter(
+                    Bezier3P(
+                        (start, vertices[i - 1], end_location)
+                    ).approximate(segments)
+                )
+                next(pts)  # skip first vertex
+                yield from pts
+            elif t == curve4_to:
+                pts = iter(
+                    Bezier4P(
+                        (start, vertices[i - 2], vertices[i - 1], end_location)
+                    ).approximate(segments)
+                )
+                next(pts)  # skip first vertex
+                yield from pts
+            else:  # line_to, move_to
+                yield end_location
+            start = end_location
 
     def flattening(self, distance: float, segments: int = 16) -> Iterable[Vec3]:
         """Approximate path by vertices and use adaptive recursive flattening
@@ -317,48 +445,10 @@ class Path(abc.Sequence):
             segments: minimum segment count per Bézier curve
 
         """
+        return flatten_buffer(
+            self._commands, self._index, self._vertices, distance, segments
+        )
 
-        def approx_curve3(s, c, e) -> Iterable[Vec3]:
-            return Bezier3P((s, c, e)).flattening(distance, segments)
-
-        def approx_curve4(s, c1, c2, e) -> Iterable[Vec3]:
-            return Bezier4P((s, c1, c2, e)).flattening(distance, segments)
-
-        yield from self._approximate(approx_curve3, approx_curve4)
-
-    @no_type_check
-    def _approximate(self, approx_curve3, approx_curve4) -> Iterable[Vec3]:
-        if not self._commands:
-            return
-
-        start = self._start
-        yield start
-
-        # localize variables:
-        _, line_to, curve3_to, curve4_to, move_to = Command
-
-        for cmd in self._commands:
-            end_location = cmd.end
-            t = cmd.type
-            if t == line_to:
-                yield end_location
-            elif t == curve3_to:
-                pts = iter(approx_curve3(start, cmd.ctrl, end_location))
-                next(pts)  # skip first vertex
-                yield from pts
-            elif t == curve4_to:
-                pts = iter(
-                    approx_curve4(start, cmd.ctrl1, cmd.ctrl2, end_location)
-                )
-                next(pts)  # skip first vertex
-                yield from pts
-            elif t == move_to:
-                yield end_location
-            else:
-                raise ValueError(f"Invalid command: {cmd.type}")
-            start = end_location
-
-    @no_type_check
     def transform(self, m: "Matrix44") -> "Path":
         """Returns a new transformed path.
 
@@ -366,34 +456,18 @@ class Path(abc.Sequence):
              m: transformation matrix of type :class:`~ezdxf.math.Matrix44`
 
         """
-        new_path = self.__class__(m.transform(self.start))
-        new_path._user_data = self._user_data
-        # localize variables:
-        _, line_to, curve3_to, curve4_to, move_to = Command
-
-        for cmd in self._commands:
-            t = cmd.type
-            if t == line_to:
-                new_path.line_to(m.transform(cmd.end))
-            elif t == curve3_to:
-                loc, ctrl = m.transform_vertices((cmd.end, cmd.ctrl))
-                new_path.curve3_to(loc, ctrl)
-            elif t == curve4_to:
-                loc, ctrl1, ctrl2 = m.transform_vertices(
-                    (cmd.end, cmd.ctrl1, cmd.ctrl2)
-                )
-                new_path.curve4_to(loc, ctrl1, ctrl2)
-            elif t == move_to:
-                new_path.move_to(m.transform(cmd.end))
-            else:
-                raise ValueError(f"Invalid command: {cmd.type}")
-        return new_path
+        return self._new_path(
+            transform_buffer(m, self._vertices),
+            bytearray(self._commands),
+            array("I", self._index),
+        )
 
     def to_wcs(self, ocs: OCS, elevation: float):
         """Transform path from given `ocs` to WCS coordinates inplace."""
-        self._start = ocs.to_wcs(self._start.replace(z=elevation))
-        for i, cmd in enumerate(self._commands):
-            self._commands[i] = cmd.to_wcs(ocs, elevation)
+        vertices = self._vertices
+        vertices[2::3] = array("d", (elevation,)) * (len(vertices) // 3)
+        if ocs.transform:
+            self._vertices = transform_buffer(ocs.matrix, vertices)
 
     def sub_paths(self) -> Iterable["Path"]:
         """Yield sub-path as :term:`Single-Path` objects.
@@ -404,18 +478,27 @@ class Path(abc.Sequence):
         .. versionadded:: 0.17
 
         """
-        path = self.__class__(start=self.start)
-        path._user_data = self._user_data
+        commands = self._commands
+        index = self._index
+        vertices = self._vertices
         move_to = Command.MOVE_TO
-        for cmd in self._commands:
-
-            if cmd.type == move_to:
-                yield path
-                path = self.__class__(start=cmd.end)
-                path._user_data = self._user_data
-            else:
-                path._commands.append(cmd)  # immutable data!
-        yield path
+        first = 0  # first command of the sub-path
+        base = 0  # vertex index of the start point of the sub-path
+        while True:
+            last = commands.find(move_to, first)
+            if last == -1:
+                last = len(commands)
+            end = index[last - 1] if last > first else base
+            path = self.__class__()
+            path._vertices = vertices[base * 3 : end * 3 + 3]
+            path._commands = commands[first:last]
+            path._index = array("I", (i - base for i in index[first:last]))
+            path._user_data = self._user_data
+            yield path
+            if last == len(commands):
+                return
+            base = index[last]
+            first = last + 1
 
     def all_lines_to_curve3(self) -> None:
         """Inline conversion of all LINE_TO commands into CURVE3_TO commands."""
@@ -439,11 +522,14 @@ class Path(abc.Sequence):
         size = len(commands)
         if size == 0:  # empty path
             return
-        remove = set()
-        start = self.start
-        for index, cmd in enumerate(commands):
-            if cmd.type == Command.LINE_TO:
-                if start.isclose(cmd.end):
+        vertices = vec3_list(self._vertices)
+        path = Path(vertices[0])
+        start = vertices[0]
+        prev_end = 0
+        for cmd, end in zip(commands, self._index):
+            end_location = vertices[end]
+            if cmd == Command.LINE_TO:
+                if start.isclose(end_location):
                     if size == 1:
                         # Path has only one LINE_TO command which should not be
                         # removed:
@@ -451,47 +537,26 @@ class Path(abc.Sequence):
                         # 2. removing the last segment turns the path into
                         #    an empty path - unexpected behavior?
                         return
-                    remove.add(index)
+                    prev_end = end
                     continue  # keep start deliberately unchanged!
                 else:
-                    vertices = linear_vertex_spacing(start, cmd.end, count)
+                    v = linear_vertex_spacing(start, end_location, count)
                     if count == 3:
-                        commands[index] = Curve3To(
-                            end=vertices[2], ctrl=vertices[1]
-                        )
+                        path._append(Command.CURVE3_TO, v[1], v[2])
                     else:  # count == 4
-                        commands[index] = Curve4To(
-                            end=vertices[3],
-                            ctrl1=vertices[1],
-                            ctrl2=vertices[2],
-                        )
-            start = cmd.end
-
-        if remove:
-            self._commands = [
-                cmd for index, cmd in enumerate(commands) if index not in remove
-            ]
+                        path._append(Command.CURVE4_TO, v[1], v[2], v[3])
+            else:  # copy control vertices
+                path._append(cmd, *vertices[prev_end + 1 : end + 1])
+            start = end_location
+            prev_end = end
+        self._vertices = path._vertices
+        self._commands = path._commands
+        self._index = path._index
 
     def control_vertices(self):
         """Yields all path control vertices in consecutive order."""
-        # localize variables:
-        _, line_to, curve3_to, curve4_to, move_to = Command
-
         if self._commands:
-            yield self.start
-            for cmd in self._commands:
-                t = cmd.type
-                if t == line_to:
-                    yield cmd.end
-                elif t == curve3_to:
-                    yield cmd.ctrl
-                    yield cmd.end
-                elif t == curve4_to:
-                    yield cmd.ctrl1
-                    yield cmd.ctrl2
-                    yield cmd.end
-                elif t == move_to:
-                    yield cmd.end
+            yield from vec3_list(self._vertices)
 
     def extend_multi_path(self, path: "Path") -> None:
         """Extend the path by another path. The source path is automatically a
@@ -504,7 +569,7 @@ class Path(abc.Sequence):
         """
         if len(path):
             self.move_to(path.start)
-            self._commands.extend(path._commands)  # immutable data!
+            self._extend(path)
 
     def append_path(self, path: "Path") -> None:
         """Append another path to this path. Adds a :code:`self.line_to(path.start)`
@@ -519,5 +584,5 @@ class Path(abc.Sequence):
             if not self.end.isclose(path.start):
                 self.line_to(path.start)
         else:
-            self._start = path.start
-        self._commands.extend(path._commands)  # immutable data!
+            self.start = path.start
+        self._extend(path)
@@ -12,6 +12,7 @@ from typing import (
 
 import math
 import itertools
+from array import array
 from ezdxf.math import (
     Vec3,
     Z_AXIS,
@@ -29,7 +30,7 @@ from ezdxf.math import (
 
 from ezdxf.query import EntityQuery
 
-from .path import Path
+from .path import Path, flatten_to_buffer
 from .commands import Command
 from . import converter
 
@@ -56,6 +57,7 @@ __all__ = [
     "to_multi_path",
     "single_paths",
     "have_close_control_vertices",
+    "flatten_paths",
 ]
 
 MAX_DISTANCE = 0.01
@@ -177,14 +179,64 @@ def bbox(
 
     """
     box = BoundingBox()
-    for p in paths:
-        if flatten:
-            box.extend(p.flattening(distance=abs(flatten), segments=segments))
-        else:
+    if flatten:
+        vertices, _ = flatten_paths(paths, abs(flatten), segments)
+        if vertices:
+            x = vertices[0::3]
+            y = vertices[1::3]
+            z = vertices[2::3]
+            box.extend(
+                [(min(x), min(y), min(z)), (max(x), max(y), max(z))]
+            )
+    else:
+        for p in paths:
             box.extend(p.control_vertices())
     return box
 
 
+def flatten_paths(
+    paths: Iterable[Path], distance: float = 0.01, segments: int = 16
+) -> Tuple[array, array]:
+    """Flattening of multiple paths in a single pass, returns the vertices of
+    all flattened paths as contiguous vertex buffer and the vertex offsets of
+    the paths.
+
+    The vertex buffer is a float64 :class:`array.array` of consecutive x, y, z
+    values. The offsets are an :class:`array.array` of type "I" with
+    ``len(paths) + 1`` items, the vertices of path `i` are the values
+    ``vertices[offsets[i] * 3 : offsets[i + 1] * 3]``. Empty paths have no
+    vertices, like the :meth:`Path.flattening` method. The optional C-extension
+    :mod:`ezdxf.acc.pathbuffer` is used if available.
+
+    Both buffers support the buffer protocol and can be converted into NumPy
+    arrays without copying::
+
+        vertices, offsets = flatten_paths(paths)
+        points = numpy.frombuffer(vertices).reshape(-1, 3)
+
+    Args:
+        paths: iterable of :class:`Path` objects
+        distance: maximum distance, see :meth:`Path.flattening`
+        segments: minimum segment count per Bézier curve
+
+    .. versionadded:: 0.17.2
+
+    """
+    vertices = array("d")
+    offsets = array("I", [0])
+    for path in paths:
+        flatten_to_buffer(
+            path._commands,
+            path._index,
+            path._vertices,
+            distance,
+            segments,
+            vertices,
+        )
+        offsets.append(len(vertices) // 3)
+    return vertices, offsets
+
+
 def fit_paths_into_box(
     paths: Iterable[Path],
     size: Tuple[float, float, float],
@@ -13,6 +13,7 @@ from typing import (
     Union,
     cast
 )
+import functools
 import re
 import operator
 
@@ -198,7 +199,15 @@ class EntityQuery(abc.Sequence):
         return groupby(self.entities, dxfattrib, key)
 
 
+# Count of compiled query strings to keep:
+QUERY_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
 def entity_matcher(query: str) -> Callable[["DXFEntity"], bool]:
+    """Returns a compiled matcher function for the `query` string, the
+    matcher functions of the last used query strings are cached.
+    """
     query_args = EntityQueryParser.parseString(query, parseAll=True)
     entity_matcher_ = build_entity_name_matcher(query_args.EntityQuery)
     attrib_matcher = build_entity_attributes_matcher(
@@ -321,12 +330,76 @@ def build_entity_attributes_matcher(
     if not len(tokens):
         return lambda x: True
     ignore_case = "i" == options  # at this time just one option is supported
-    expr = BoolExpression(_compile_tokens(tokens, ignore_case))  # type: ignore
+    return _compile_predicate(tokens, ignore_case)
+
+
+Predicate = Callable[["DXFEntity"], bool]
+
+
+def _compile_predicate(tokens: Sequence, ignore_case: bool) -> Predicate:
+    """Compiles the parsed attribute query `tokens` into nested Python
+    functions, same results as the evaluation of :class:`BoolExpression`, but
+    the bool operators short circuit.
+    """
+    tokens = tuple(tokens)
+    if len(tokens) == 3 and tokens[1] in Relation.VALID_CMP_OPERATORS:
+        return _compile_relation(tokens, ignore_case)
+    if tokens[0] == "!":
+        return _not(_compile_predicate(tokens[1], ignore_case))
+    # left associative operators of the same precedence level:
+    predicate = _compile_predicate(tokens[0], ignore_case)
+    for index in range(1, len(tokens), 2):
+        operand = _compile_predicate(tokens[index + 1], ignore_case)
+        if tokens[index] == "&":
+            predicate = _and(predicate, operand)
+        else:
+            predicate = _or(predicate, operand)
+    return predicate
+
+
+def _compile_relation(relation: Sequence, ignore_case: bool) -> Predicate:
+    name, op, value = relation
+    compare = Relation.CMP_OPERATORS[op]
+    if "?" in op:  # always match whole pattern
+        value = re.compile(
+            value + "$", flags=re.IGNORECASE if ignore_case else 0
+        )
+    elif ignore_case:
+        value = to_lower(value)
+
+    if ignore_case:
+
+        def match(entity: "DXFEntity") -> bool:
+            try:
+                return compare(to_lower(entity.dxf.get_default(name)), value)
+            except AttributeError:  # entity does not support this attribute
+                return False
+            except ValueError:  # entity supports this attribute, but has no value for it
+                return False
+
+    else:
+
+        def match(entity: "DXFEntity") -> bool:
+            try:
+                return compare(entity.dxf.get_default(name), value)
+            except AttributeError:  # entity does not support this attribute
+                return False
+            except ValueError:  # entity supports this attribute, but has no value for it
+                return False
+
+    return match
+
+
+def _not(predicate: Predicate) -> Predicate:
+    return lambda entity: not predicate(entity)
+
+
+def _and(predicate1: Predicate, predicate2: Predicate) -> Predicate:
+    return lambda entity: predicate1(entity) and predicate2(entity)
 
-    def match_bool_expr(entity: "DXFEntity") -> bool:
-        return expr.evaluate(entity)
 
-    return match_bool_expr
+def _or(predicate1: Predicate, predicate2: Predicate) -> Predicate:
+    return lambda entity: predicate1(entity) or predicate2(entity)
 
 
 def unique_entities(entities: Iterable["DXFEntity"]) -> Iterable["DXFEntity"]:
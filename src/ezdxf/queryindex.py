@@ -0,0 +1,241 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+import functools
+import heapq
+import itertools
+
+from ezdxf.query import EntityQuery, entity_matcher, QUERY_CACHE_SIZE
+from ezdxf.queryparser import EntityQueryParser
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFGraphic
+
+__all__ = ["QueryIndex"]
+
+# Entities by handle, ordered by their layout position:
+Bucket = Dict[str, "DXFGraphic"]
+
+
+class QueryIndex:
+    """Secondary indexes of the DXF type and the layer name for the
+    :class:`~ezdxf.query.EntityQuery` of a layout.
+
+    The :meth:`query` method uses the indexes to preselect the candidates for
+    entity queries of DXF types like ``"LINE CIRCLE"`` and for equality
+    relations of the layer name like ``'*[layer=="WALLS"]'``, which are joined
+    by the ``&`` operator to the attribute query. The complete query is
+    evaluated for all preselected candidates, all other queries are evaluated
+    for all entities of the layout. The result contains the entities in the
+    same order as the query result of the layout.
+
+    The index of a layout returned by :meth:`BaseLayout.query_index` is
+    persistent and will be updated automatically for added and deleted
+    entities and for layer changes by setting, deleting or discarding the
+    :attr:`dxf.layer` attribute. Changing the layer by internal methods like
+    :meth:`DXFNamespace.unprotected_set` requires a manual :meth:`update` call.
+
+    Args:
+        entities: DXF entities to index in layout order
+
+    """
+
+    def __init__(self, entities: Iterable["DXFGraphic"]):
+        self._counter = itertools.count()
+        # Layout position and the indexed keys of all entities by handle in
+        # layout order:
+        self._entries: Dict[str, Tuple[int, "DXFGraphic", str, str]] = dict()
+        self._types: Dict[str, Bucket] = dict()
+        self._layers: Dict[str, Bucket] = dict()
+        # Layer buckets with entities out of layout order:
+        self._unordered: Set[str] = set()
+        for entity in entities:
+            self.add(entity)
+
+    def __getstate__(self) -> dict:
+        # pickle support: pickling itertools.count() is deprecated
+        state = dict(self.__dict__)
+        state["_counter"] = next(self._counter)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._counter = itertools.count(state["_counter"])
+
+    def __len__(self) -> int:
+        """Returns the count of indexed entities."""
+        return len(self._entries)
+
+    def __contains__(self, entity: "DXFGraphic") -> bool:
+        """Returns ``True`` if `entity` is indexed."""
+        if not entity.is_alive:
+            return False
+        entry = self._entries.get(entity.dxf.handle)
+        return entry is not None and entry[1] is entity
+
+    def add(self, entity: "DXFGraphic") -> None:
+        """Add `entity` at the end of the layout order to the index."""
+        handle = entity.dxf.handle
+        if handle is None:
+            return
+        self.discard(entity)
+        dxftype = entity.dxftype()
+        layer = _layer_key(entity)
+        self._entries[handle] = (next(self._counter), entity, dxftype, layer)
+        self._types.setdefault(dxftype, dict())[handle] = entity
+        self._layers.setdefault(layer, dict())[handle] = entity
+
+    def update(self, entity: "DXFGraphic") -> None:
+        """Update the indexed layer of a modified `entity`, preserves the
+        layout order.
+        """
+        handle = entity.dxf.handle
+        entry = self._entries.get(handle)
+        if entry is None:
+            return
+        position, _, dxftype, old_layer = entry
+        layer = _layer_key(entity)
+        if layer == old_layer:
+            return
+        self._entries[handle] = (position, entity, dxftype, layer)
+        _pop(self._layers, old_layer, handle)
+        self._layers.setdefault(layer, dict())[handle] = entity
+        self._unordered.add(layer)
+
+    def discard(self, entity: "DXFGraphic") -> None:
+        """Remove `entity` from the index, does nothing if `entity` is not
+        indexed.
+        """
+        entry = self._entries.pop(entity.dxf.handle, None)
+        if entry is not None:
+            _, _, dxftype, layer = entry
+            handle = entity.dxf.handle
+            _pop(self._types, dxftype, handle)
+            _pop(self._layers, layer, handle)
+
+    def query(self, query: str = "*") -> EntityQuery:
+        """Returns all indexed entities matching the `query` string, see
+        :class:`~ezdxf.query.EntityQuery`.
+        """
+        match = entity_matcher(query)
+        candidates = self._candidates(*_preselection(query))
+        return EntityQuery(e for e in candidates if e.is_alive and match(e))
+
+    def _candidates(
+        self, types: Optional[FrozenSet[str]], layers: Optional[FrozenSet[str]]
+    ) -> Iterable["DXFGraphic"]:
+        selections: List[List[Bucket]] = []
+        if types is not None:
+            selections.append([self._types.get(t, {}) for t in types])
+        if layers is not None:
+            if len(layers) > 1:  # contradicting equality relations
+                return []
+            layer = next(iter(layers))
+            if layer in self._unordered:
+                self._sort_layer(layer)
+            selections.append([self._layers.get(layer, {})])
+        if not selections:
+            return self._all()
+        # Preselect the candidates by the smallest selection:
+        buckets = min(selections, key=lambda s: sum(len(b) for b in s))
+        if len(buckets) == 1:
+            return list(buckets[0].values())
+        entries = self._entries
+        items = heapq.merge(
+            *(b.items() for b in buckets),
+            key=lambda item: entries[item[0]][0],
+        )
+        return (entity for _, entity in items)
+
+    def _all(self) -> Iterable["DXFGraphic"]:
+        # The entries are stored in layout order:
+        return [entry[1] for entry in self._entries.values()]
+
+    def _sort_layer(self, layer: str) -> None:
+        self._unordered.discard(layer)
+        bucket = self._layers.get(layer)
+        if bucket:
+            entries = self._entries
+            self._layers[layer] = dict(
+                sorted(bucket.items(), key=lambda item: entries[item[0]][0])
+            )
+
+
+def _layer_key(entity: "DXFGraphic") -> str:
+    # Layer names are case insensitive:
+    return str(entity.dxf.get("layer", "0")).lower()
+
+
+def _pop(buckets: Dict[str, Bucket], key: str, handle: str) -> None:
+    bucket = buckets.get(key)
+    if bucket is not None:
+        bucket.pop(handle, None)
+        if not bucket:
+            del buckets[key]
+
+
+@functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _preselection(
+    query: str,
+) -> Tuple[Optional[FrozenSet[str]], Optional[FrozenSet[str]]]:
+    """Returns the indexed DXF types and layer keys of the `query` string,
+    the results of the last used query strings are cached.
+    """
+    args = EntityQueryParser.parseString(query, parseAll=True)
+    return _type_terms(args.EntityQuery), _layer_terms(args.AttribQuery)
+
+
+def _type_terms(names: Sequence[str]) -> Optional[FrozenSet[str]]:
+    """Returns the queried DXF types or ``None`` if the entity query includes
+    all DXF types.
+    """
+    types = set(name.upper() for name in names)
+    if "*" in types:
+        return None
+    return frozenset(name for name in types if not name.startswith("!"))
+
+
+def _layer_terms(tokens: Sequence) -> Optional[FrozenSet[str]]:
+    """Returns the layer keys of the equality relations of the layer name
+    joined by the ``&`` operator to the attribute query, returns ``None`` if
+    the attribute query has no such relations.
+    """
+    if not tokens:
+        return None
+    tokens = tokens.asList() if hasattr(tokens, "asList") else list(tokens)
+    # pyparsing 3 groups the whole attribute query as a single token:
+    while len(tokens) == 1 and isinstance(tokens[0], list):
+        tokens = tokens[0]
+    if _is_relation(tokens):
+        terms = [tokens]
+    elif all(token == "&" for token in tokens[1::2]) and not any(
+        token == "!" for token in tokens[0::2]
+    ):
+        terms = [t for t in tokens[0::2] if _is_relation(t)]
+    else:
+        return None
+    layers = frozenset(
+        value.lower()
+        for name, op, value in terms
+        if name == "layer" and op == "==" and isinstance(value, str)
+    )
+    return layers or None
+
+
+def _is_relation(tokens) -> bool:
+    return (
+        isinstance(tokens, list)
+        and len(tokens) == 3
+        and isinstance(tokens[0], str)
+        and tokens[1] in ("==", "!=", "<", "<=", ">", ">=", "?", "!?")
+    )
@@ -0,0 +1,300 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    Sequence,
+    List,
+    Tuple,
+    Dict,
+    DefaultDict,
+)
+from array import array
+from collections import defaultdict
+import math
+
+from ezdxf.math import Vec3
+from ezdxf.path import (
+    Path,
+    single_paths,
+    flatten_paths,
+    from_hatch_boundary_path,
+)
+
+if TYPE_CHECKING:
+    from ezdxf.entities.polygon import DXFPolygon
+    from ezdxf.entities.pattern import PatternLine
+
+__all__ = [
+    "hatch_line_segments",
+    "hatch_entity",
+    "to_wcs_lines",
+    "DenseHatchingLinesError",
+    "MAX_SEGMENTS",
+]
+
+MAX_SEGMENTS = 1_000_000
+ABS_TOL = 1e-12
+
+# Line segments are stored as consecutive x0, y0, x1, y1 values:
+SEGMENT_SIZE = 4
+
+Polygon = Tuple[List[float], List[float]]  # x-, and y-coordinates
+
+
+class DenseHatchingLinesError(Exception):
+    """Raised if the count of the generated hatch line segments exceeds the
+    segment budget.
+    """
+
+
+def hatch_line_segments(
+    lines: Iterable["PatternLine"],
+    paths: Iterable[Path],
+    *,
+    distance: float = 0.01,
+    max_segments: int = MAX_SEGMENTS,
+) -> array:
+    """Returns the line segments of the hatch pattern `lines` clipped by the
+    boundary `paths` as float64 :class:`array.array` of consecutive x0, y0, x1,
+    y1 values. The pattern lines and the boundary paths have to be located in
+    the same 2D coordinate system, which is the :ref:`OCS` for the HATCH
+    entity, the z-axis of the boundary paths is ignored.
+
+    The boundary paths are flattened in a single pass and the hatch lines are
+    clipped by the even-odd rule, nested boundary paths are holes and islands
+    in holes. The edges of the boundary paths are intersected only with the
+    hatch lines crossing the edge (scanline algorithm) and all pattern lines
+    with the same angle share the transformation of the boundary edges into
+    the hatch line direction. Dots of the pattern are line segments of zero
+    length.
+
+    Args:
+        lines: pattern definition as :class:`~ezdxf.entities.PatternLine`
+            objects, as stored in the :attr:`Hatch.pattern.lines` attribute
+        paths: boundary paths as :class:`~ezdxf.path.Path` objects
+        distance: max flattening distance for the boundary paths
+        max_segments: max count of line segments to generate
+
+    Raises:
+        DenseHatchingLinesError: the generated line segments exceed the
+            `max_segments` budget
+
+    .. versionadded:: 0.17.2
+
+    """
+    segments = array("d")
+    polygons = _polygons(paths, distance)
+    if not polygons:
+        return segments
+    limit = max(int(max_segments), 0) * SEGMENT_SIZE
+    for angle, group in _group_by_angle(lines).items():
+        # transform boundary edges into the hatch line direction, hatch lines
+        # are parallel to the x-axis in this coordinate system:
+        c = math.cos(angle)
+        s = math.sin(angle)
+        rotated = [
+            (
+                [x * c + y * s for x, y in zip(xs, ys)],
+                [y * c - x * s for x, y in zip(xs, ys)],
+            )
+            for xs, ys in polygons
+        ]
+        for line in group:
+            _hatch_line(line, rotated, c, s, segments, limit)
+    return segments
+
+
+def hatch_entity(
+    polygon: "DXFPolygon",
+    *,
+    distance: float = 0.01,
+    max_segments: int = MAX_SEGMENTS,
+) -> List[Tuple[Vec3, Vec3]]:
+    """Returns the pattern line segments of a HATCH or MPOLYGON entity as
+    (start, end) tuples in :ref:`WCS` coordinates. Returns an empty list for
+    solid filled entities.
+
+    Args:
+        polygon: HATCH or MPOLYGON entity
+        distance: max flattening distance for the boundary paths
+        max_segments: max count of line segments to generate
+
+    Raises:
+        DenseHatchingLinesError: the generated line segments exceed the
+            `max_segments` budget
+
+    .. versionadded:: 0.17.2
+
+    """
+    if polygon.dxf.solid_fill or polygon.pattern is None:
+        return []
+    if polygon.dxftype() == "HATCH":
+        boundaries = polygon.paths.rendering_paths(polygon.dxf.hatch_style)
+    else:  # MPOLYGON does not support hatch styles
+        boundaries = polygon.paths
+    segments = hatch_line_segments(
+        polygon.pattern.lines,
+        (from_hatch_boundary_path(boundary) for boundary in boundaries),
+        distance=distance,
+        max_segments=max_segments,
+    )
+    return to_wcs_lines(segments, polygon.ocs(), polygon.dxf.elevation.z)
+
+
+def to_wcs_lines(
+    segments: Sequence[float], ocs, elevation: float
+) -> List[Tuple[Vec3, Vec3]]:
+    """Returns the line segments created by :func:`hatch_line_segments` as
+    (start, end) tuples in :ref:`WCS` coordinates.
+
+    Args:
+        segments: line segments as consecutive x0, y0, x1, y1 values
+        ocs: :class:`~ezdxf.math.OCS` of the hatch pattern
+        elevation: z-axis of the hatch pattern in OCS
+
+    """
+    it = iter(segments)
+    vertices = [Vec3(x, y, elevation) for x, y in zip(it, it)]
+    if ocs.transform:
+        vertices = list(ocs.points_to_wcs(vertices))
+    it = iter(vertices)
+    return list(zip(it, it))
+
+
+def _polygons(paths: Iterable[Path], distance: float) -> List[Polygon]:
+    vertices, offsets = flatten_paths(single_paths(paths), distance)
+    polygons = []
+    for index in range(len(offsets) - 1):
+        start = offsets[index] * 3
+        end = offsets[index + 1] * 3
+        if end - start < 9:  # less than 3 vertices
+            continue
+        xs = vertices[start:end:3].tolist()
+        ys = vertices[start + 1 : end : 3].tolist()
+        polygons.append((xs, ys))
+    return polygons
+
+
+def _group_by_angle(
+    lines: Iterable["PatternLine"],
+) -> Dict[float, List["PatternLine"]]:
+    groups: DefaultDict[float, List["PatternLine"]] = defaultdict(list)
+    for line in lines:
+        groups[math.radians(round(line.angle % 360.0, 9))].append(line)
+    return groups
+
+
+def _dash_pattern(
+    items: Sequence[float],
+) -> Tuple[float, List[Tuple[float, float]]]:
+    # Returns the pattern length and the (start, length) tuples of the dashes
+    # and dots, gaps are skipped:
+    period = sum(abs(item) for item in items)
+    dashes = []
+    start = 0.0
+    for item in items:
+        if item >= 0.0:
+            dashes.append((start, item))
+        start += abs(item)
+    return period, dashes
+
+
+def _hatch_line(
+    line: "PatternLine",
+    polygons: List[Polygon],
+    c: float,
+    s: float,
+    segments: array,
+    limit: int,
+) -> None:
+    # All coordinates in the hatch line direction system, see
+    # hatch_line_segments().
+    bx, by = line.base_point
+    ox, oy = line.offset
+    base_x = bx * c + by * s
+    base_y = by * c - bx * s
+    shift = ox * c + oy * s  # shifting of the dash pattern from line to line
+    spacing = oy * c - ox * s  # normal distance between the hatch lines
+    if abs(spacing) < ABS_TOL:
+        return  # all hatch lines are coincident
+    if spacing < 0.0:
+        spacing = -spacing
+        shift = -shift
+
+    period, dashes = _dash_pattern(line.dash_length_items)
+    solid = period < ABS_TOL  # continuous line
+    if not (solid or dashes):
+        return  # only gaps
+
+    # Scanline intersection of all boundary edges with the hatch lines:
+    max_intersections = limit * 2 // SEGMENT_SIZE
+    intersections: DefaultDict[int, List[float]] = defaultdict(list)
+    count = 0
+    ceil = math.ceil
+    for xs, ys in polygons:
+        x1 = xs[-1]
+        y1 = ys[-1]
+        for x2, y2 in zip(xs, ys):
+            if y1 != y2:
+                if y1 < y2:
+                    sx, sy, ex, ey = x1, y1, x2, y2
+                else:
+                    sx, sy, ex, ey = x2, y2, x1, y1
+                # half-open range [sy, ey) of crossing hatch lines:
+                k0 = ceil((sy - base_y) / spacing)
+                k1 = ceil((ey - base_y) / spacing)
+                if k0 < k1:
+                    count += k1 - k0
+                    if count > max_intersections:
+                        raise DenseHatchingLinesError(
+                            f"hatch pattern exceeds {limit // SEGMENT_SIZE} "
+                            f"line segments"
+                        )
+                    slope = (ex - sx) / (ey - sy)
+                    for k in range(k0, k1):
+                        intersections[k].append(
+                            sx + (base_y + k * spacing - sy) * slope
+                        )
+            x1 = x2
+            y1 = y2
+
+    # Even-odd filling of the hatch lines and applying the dash pattern:
+    floor = math.floor
+    for k in sorted(intersections):
+        xs = intersections[k]
+        xs.sort()
+        y = base_y + k * spacing
+        origin = base_x + k * shift
+        spans = []
+        for index in range(0, len(xs) - 1, 2):
+            start = xs[index]
+            end = xs[index + 1]
+            if solid:
+                spans.append(start)
+                spans.append(end)
+                continue
+            pos = origin + floor((start - origin) / period) * period
+            while pos <= end:
+                for dash_start, dash_length in dashes:
+                    dash_start += pos
+                    if dash_start > end:
+                        break
+                    dash_end = dash_start + dash_length
+                    if dash_end < start:
+                        continue
+                    spans.append(start if dash_start < start else dash_start)
+                    spans.append(end if dash_end > end else dash_end)
+                pos += period
+                if len(spans) * 2 + len(segments) > limit:
+                    break
+        # Transform spans back into the coordinate system of the pattern:
+        y_sin = y * s
+        y_cos = y * c
+        for x in spans:
+            segments.append(x * c - y_sin)
+            segments.append(x * s + y_cos)
+        if len(segments) > limit:
+            raise DenseHatchingLinesError(
+                f"hatch pattern exceeds {limit // SEGMENT_SIZE} line segments"
+            )
@@ -1,6 +1,7 @@
 #  Copyright (c) 2020-2021, Manfred Moitzi
 #  License: MIT License
-from typing import Tuple, Iterable
+from typing import Tuple, Iterable, Sequence
+from array import array
 import math
 from ezdxf.math import Vec3, Vertex
 
@@ -67,3 +68,125 @@ class LineTypeRenderer:
         self._current_dash = (self._current_dash + 1) % self._dash_count
         self._current_dash_length = self._dashes[self._current_dash]
         self._is_dash = not self._is_dash
+
+
+MAX_DASHES = 100_000
+
+# Dash segments are stored as consecutive x0, y0, z0, x1, y1, z1 values:
+SEGMENT_SIZE = 6
+
+
+class DenseLineTypeError(Exception):
+    """Raised if the count of dashes exceeds the dash budget."""
+
+
+def dash_segments(
+    vertices: Sequence[float],
+    dashes: Sequence[float],
+    *,
+    max_dashes: int = MAX_DASHES,
+) -> array:
+    """Returns the dash segments of the polyline `vertices` rendered by the
+    line pattern `dashes` as float64 :class:`array.array` of consecutive x0,
+    y0, z0, x1, y1, z1 values. Renders the whole polyline in a single pass,
+    the same way as :meth:`LineTypeRenderer.line_segments`, but without
+    creating :class:`Vec3` objects for each dash.
+
+    The `vertices` are a flat sequence of consecutive x, y, z values, like the
+    vertex buffer returned by :func:`ezdxf.path.flatten_paths`. The `dashes`
+    are the simplified line pattern line-gap-line-gap in drawing units, a
+    pattern with less than two elements is a solid line, which returns the
+    polyline segments. Dashes crossing polyline vertices are split into
+    multiple segments and zero-length polyline segments are skipped.
+
+    Args:
+        vertices: flat sequence of x, y, z values
+        dashes: line pattern as line-gap-line-gap... sequence
+        max_dashes: max count of dashes to generate
+
+    Raises:
+        DenseLineTypeError: the estimated count of dashes exceeds the
+            `max_dashes` budget
+
+    .. versionadded:: 0.17.2
+
+    """
+    segments = array("d")
+    count = len(vertices) // 3 - 1
+    if count < 1:
+        return segments
+    # edges as (x0, y0, z0, dx, dy, dz, length) tuples with normalized
+    # direction vectors (dx, dy, dz):
+    edges = []
+    total_length = 0.0
+    x0, y0, z0 = vertices[0], vertices[1], vertices[2]
+    for index in range(3, (count + 1) * 3, 3):
+        x1 = vertices[index]
+        y1 = vertices[index + 1]
+        z1 = vertices[index + 2]
+        dx = x1 - x0
+        dy = y1 - y0
+        dz = z1 - z0
+        length = math.sqrt(dx * dx + dy * dy + dz * dz)
+        if length > 0.0:
+            edges.append(
+                (x0, y0, z0, dx / length, dy / length, dz / length, length)
+            )
+            total_length += length
+        x0 = x1
+        y0 = y1
+        z0 = z1
+
+    dash_count = len(dashes)
+    period = sum(dashes)
+    if dash_count < 2 or period <= 0.0:  # solid line
+        for x0, y0, z0, dx, dy, dz, length in edges:
+            x1 = x0 + dx * length
+            y1 = y0 + dy * length
+            z1 = z0 + dz * length
+            segments.extend((x0, y0, z0, x1, y1, z1))
+        return segments
+
+    estimation = (total_length / period + 1.0) * ((dash_count + 1) // 2)
+    if estimation > max_dashes:
+        raise DenseLineTypeError(f"line pattern exceeds {max_dashes} dashes")
+
+    index = 0
+    is_dash = True
+    remaining = dashes[0]  # remaining length of the current dash or gap
+    append = segments.extend
+    for x0, y0, z0, dx, dy, dz, length in edges:
+        start = 0.0
+        while length - start >= remaining:
+            end = start + remaining
+            if is_dash:
+                append(
+                    (
+                        x0 + dx * start,
+                        y0 + dy * start,
+                        z0 + dz * start,
+                        x0 + dx * end,
+                        y0 + dy * end,
+                        z0 + dz * end,
+                    )
+                )
+            start = end
+            index += 1
+            if index == dash_count:
+                index = 0
+            remaining = dashes[index]
+            is_dash = not is_dash
+        if start < length:
+            if is_dash:
+                append(
+                    (
+                        x0 + dx * start,
+                        y0 + dy * start,
+                        z0 + dz * start,
+                        x0 + dx * length,
+                        y0 + dy * length,
+                        z0 + dz * length,
+                    )
+                )
+            remaining -= length - start
+    return segments
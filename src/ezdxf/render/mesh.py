@@ -11,6 +11,7 @@ from typing import (
     TypeVar,
     Type,
 )
+from itertools import chain
 from ezdxf.lldxf.const import DXFValueError
 from ezdxf.math import (
     Matrix44,
@@ -23,6 +24,7 @@ from ezdxf.math import (
 )
 
 if TYPE_CHECKING:
+    import numpy as np
     from ezdxf.eztypes import (
         Vertex,
         UCS,
@@ -124,6 +126,36 @@ class MeshBuilder:
         self.vertices.extend(Vec3.generate(vertices))
         return tuple(range(start_index, len(self.vertices)))
 
+    def add_ndarray_vertices(self, vertices: "np.ndarray") -> Sequence[int]:
+        """Add new vertices from a NumPy array of shape (N, 3) to the mesh,
+        returns the indices of the `vertices` added to the :attr:`vertices`
+        list like :meth:`add_vertices`.
+
+        Requires NumPy.
+
+        """
+        from ezdxf.math._ndarray import vertex_array
+
+        start_index = len(self.vertices)
+        self.vertices.extend(
+            Vec3(x, y, z) for x, y, z in vertex_array(vertices).tolist()
+        )
+        return tuple(range(start_index, len(self.vertices)))
+
+    def vertices_as_ndarray(self) -> "np.ndarray":
+        """Returns the :attr:`vertices` as new NumPy array of shape (N, 3).
+
+        Requires NumPy.
+
+        """
+        import numpy as np
+
+        return np.fromiter(
+            chain.from_iterable(self.vertices),
+            dtype=np.float64,
+            count=len(self.vertices) * 3,
+        ).reshape(-1, 3)
+
     def add_mesh(
         self,
         vertices: List[Vec3] = None,
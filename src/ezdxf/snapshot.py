@@ -0,0 +1,98 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+"""
+Document Snapshots
+==================
+
+A snapshot stores the loaded entity graph of a DXF document as pickled
+binary data. Reloading a snapshot skips the tag parsing, the tag compiling,
+the entity binding and the 2nd loading stage of the DXF loader.
+
+The snapshot file starts with a header line, which contains the snapshot
+format version and the ezdxf version, followed by the pickled document.
+Snapshots are bound to the ezdxf version which created them, because the
+pickled data depends on the internal structure of the ezdxf classes.
+
+"""
+from typing import TYPE_CHECKING, Union
+import gc
+import io
+import pickle
+
+from ezdxf.version import __version__
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from ezdxf.document import Drawing
+
+__all__ = ["dumps", "loads", "save", "load", "SNAPSHOT_VERSION"]
+
+SNAPSHOT_SIGNATURE = b"EZDXF-SNAPSHOT"
+SNAPSHOT_VERSION = 1
+
+
+def _header() -> bytes:
+    return b"%s %d %s\n" % (
+        SNAPSHOT_SIGNATURE,
+        SNAPSHOT_VERSION,
+        __version__.encode("ascii"),
+    )
+
+
+def dumps(doc: "Drawing") -> bytes:
+    """Returns the snapshot of the DXF document `doc` as :class:`bytes`.
+
+    All pending entities of lazy loaded DXF documents are loaded and the
+    memory mapped DXF file is closed, because an open file can not be stored.
+
+    """
+    doc.entitydb.load_pending_entities()
+    stream = io.BytesIO()
+    stream.write(_header())
+    pickle.dump(doc, stream, protocol=pickle.HIGHEST_PROTOCOL)
+    return stream.getvalue()
+
+
+def loads(data: bytes) -> "Drawing":
+    """Returns the DXF document of the snapshot `data` created by
+    :func:`dumps`.
+
+    Raises:
+        IOError: `data` is not a snapshot or was created by another
+            snapshot format version or ezdxf version
+
+    """
+    header, sep, _ = data[:256].partition(b"\n")
+    if not sep or not header.startswith(SNAPSHOT_SIGNATURE):
+        raise IOError("Invalid snapshot data.")
+    if header + sep != _header():
+        raise IOError(
+            f"Incompatible snapshot version: "
+            f"'{header.decode('ascii', errors='replace')}'"
+        )
+    # Unpickling creates many container objects, the garbage collector
+    # would traverse the whole DXF document several times:
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(memoryview(data)[len(header) + 1 :])
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def save(doc: "Drawing", filename: Union[str, "Path"]) -> None:
+    """Save the snapshot of the DXF document `doc` as file `filename`, see
+    :func:`dumps`.
+    """
+    data = dumps(doc)
+    with open(filename, "wb") as fp:
+        fp.write(data)
+
+
+def load(filename: Union[str, "Path"]) -> "Drawing":
+    """Load the DXF document from the snapshot file `filename`, see
+    :func:`loads`.
+    """
+    with open(filename, "rb") as fp:
+        return loads(fp.read())
@@ -0,0 +1,215 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+import heapq
+
+from ezdxf import bbox
+from ezdxf.math import RTree, BoundingBox2d
+from ezdxf.query import EntityQuery
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFGraphic, Vertex
+
+__all__ = ["SpatialIndex"]
+
+# Rebuild the search tree if the count of modified entities exceeds this
+# fraction of the indexed entities:
+REBUILD_RATIO = 0.25
+MIN_REBUILD_COUNT = 64
+
+
+class SpatialIndex:
+    """Spatial search index for the DXF `entities` of a layout based on the
+    bounding boxes calculated by the :mod:`ezdxf.bbox` module. The index
+    supports 2D window, crossing and nearest neighbor queries in the xy-plane.
+
+    The index of a layout returned by :meth:`BaseLayout.spatial_index` is
+    persistent and will be updated automatically for added, deleted and
+    transformed entities. Changing the geometry of entities by other means
+    requires a manual :meth:`update` call.
+
+    Entities without a bounding box, like XLINE, RAY or empty TEXT entities,
+    can not be found by the spatial index.
+
+    Args:
+        entities: DXF entities to index
+        flatten: max. flattening distance for the bounding box calculation,
+            see :func:`ezdxf.bbox.extents`
+        cache: optional :class:`ezdxf.bbox.Cache` for the bounding boxes
+
+    """
+
+    def __init__(
+        self,
+        entities: Iterable["DXFGraphic"],
+        *,
+        flatten: float = bbox.MAX_FLATTENING_DISTANCE,
+        cache: bbox.Cache = None,
+    ):
+        self._flatten = flatten
+        self._cache = cache
+        # Current bounding boxes of all indexed entities:
+        self._boxes: Dict[str, Tuple[BoundingBox2d, "DXFGraphic"]] = dict()
+        # Entities added or modified after the last commit:
+        self._pending: Dict[str, "DXFGraphic"] = dict()
+        # Entities modified after the last tree rebuild:
+        self._extra: Dict[str, Tuple[BoundingBox2d, "DXFGraphic"]] = dict()
+        self._extra_tree: Optional[RTree] = None
+        # Entities stored in the tree with invalid bounding boxes:
+        self._stale: Set[str] = set()
+        for entity in entities:
+            self._store(entity)
+        self._rebuild()
+
+    def __len__(self) -> int:
+        """Returns the count of indexed entities."""
+        self._commit()
+        return len(self._boxes)
+
+    def __contains__(self, entity: "DXFGraphic") -> bool:
+        """Returns ``True`` if `entity` is indexed."""
+        self._commit()
+        return entity.dxf.handle in self._boxes
+
+    def bbox(self, entity: "DXFGraphic") -> Optional[BoundingBox2d]:
+        """Returns the indexed 2D bounding box of `entity` or ``None`` if
+        `entity` is not indexed or has no bounding box.
+        """
+        self._commit()
+        entry = self._boxes.get(entity.dxf.handle)
+        if entry is None or entry[1] is not entity:
+            return None
+        return entry[0]
+
+    def add(self, entity: "DXFGraphic") -> None:
+        """Add `entity` to the index, the bounding box is calculated at the
+        next query.
+        """
+        handle = entity.dxf.handle
+        if handle is not None:
+            self._pending[handle] = entity
+
+    def update(self, entity: "DXFGraphic") -> None:
+        """Update the bounding box of a modified `entity`, the bounding box is
+        calculated at the next query.
+        """
+        self.add(entity)
+
+    def discard(self, entity: "DXFGraphic") -> None:
+        """Remove `entity` from the index, does nothing if `entity` is not
+        indexed.
+        """
+        self._discard(entity.dxf.handle)
+
+    def crossing(self, extmin: "Vertex", extmax: "Vertex") -> EntityQuery:
+        """Returns all entities which bounding boxes intersect or are inside
+        the search window defined by the corner vertices `extmin` and
+        `extmax`.
+        """
+        tree, extra_tree = self._trees()
+        entities = list(self._live(tree.crossing(extmin, extmax)))
+        extra = extra_tree.crossing(extmin, extmax)
+        entities.extend(self._live(extra, check_stale=False))
+        return EntityQuery(entities)
+
+    def window(self, extmin: "Vertex", extmax: "Vertex") -> EntityQuery:
+        """Returns all entities which bounding boxes are completely inside the
+        search window defined by the corner vertices `extmin` and `extmax`.
+        """
+        tree, extra_tree = self._trees()
+        entities = list(self._live(tree.window(extmin, extmax)))
+        extra = extra_tree.window(extmin, extmax)
+        entities.extend(self._live(extra, check_stale=False))
+        return EntityQuery(entities)
+
+    def nearest(self, location: "Vertex", count: int = 1) -> List["DXFGraphic"]:
+        """Returns the `count` entities which bounding boxes are nearest to
+        `location`, sorted by distance. The distance is 0 for all bounding
+        boxes which contain `location`.
+        """
+        result: List["DXFGraphic"] = []
+        if count < 1:
+            return result
+        tree, extra_tree = self._trees()
+        stale = self._stale
+        tree_result = (
+            (distance, entity)
+            for distance, entity in tree.nearest(location)
+            if entity.is_alive and entity.dxf.handle not in stale
+        )
+        extra_result = extra_tree.nearest(location)
+        for _, entity in heapq.merge(
+            tree_result, extra_result, key=lambda e: e[0]
+        ):
+            if entity.is_alive:
+                result.append(entity)
+                if len(result) >= count:
+                    break
+        return result
+
+    def _trees(self) -> Tuple[RTree, RTree]:
+        self._commit()
+        return self._rtree, self._extra_tree  # type: ignore
+
+    def _live(
+        self, entities: Iterable["DXFGraphic"], check_stale=True
+    ) -> Iterator["DXFGraphic"]:
+        stale = self._stale if check_stale else set()
+        for entity in entities:
+            if entity.is_alive and entity.dxf.handle not in stale:
+                yield entity
+
+    def _store(self, entity: "DXFGraphic") -> None:
+        box = bbox.extents([entity], flatten=self._flatten, cache=self._cache)
+        handle = entity.dxf.handle
+        if box.has_data:
+            self._boxes[handle] = BoundingBox2d(box), entity
+        else:
+            self._boxes.pop(handle, None)
+
+    def _discard(self, handle: str) -> None:
+        self._pending.pop(handle, None)
+        if self._extra.pop(handle, None) is not None:
+            self._extra_tree = None
+        if self._boxes.pop(handle, None) is not None:
+            self._stale.add(handle)
+
+    def _commit(self) -> None:
+        if self._pending:
+            self._commit_pending_entities()
+        if self._extra_tree is None:
+            self._extra_tree = RTree(self._extra.values())
+
+    def _commit_pending_entities(self) -> None:
+        pending = self._pending
+        self._pending = dict()
+        for handle, entity in pending.items():
+            self._discard(handle)
+            if not entity.is_alive:
+                continue
+            if self._cache is not None:
+                self._cache.invalidate([entity])
+            self._store(entity)
+            entry = self._boxes.get(handle)
+            if entry is not None:
+                self._extra[handle] = entry
+                self._extra_tree = None
+        modified = len(self._extra) + len(self._stale)
+        if modified > max(len(self._boxes) * REBUILD_RATIO, MIN_REBUILD_COUNT):
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._rtree = RTree(self._boxes.values())
+        self._extra_tree = None
+        self._extra.clear()
+        self._stale.clear()
+
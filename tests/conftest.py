@@ -0,0 +1,31 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+
+
+@pytest.fixture(scope="module", params=["R12", "R2000"])
+def dxf(request, tmpdir_factory) -> str:
+    """Returns the file name of a DXF R12 and a DXF R2000 test file.
+
+    The modelspace contains 10 LINE entities, a POLYLINE with 3 vertices and
+    an INSERT with an attached ATTRIB, the paperspace contains a CIRCLE.
+    A test module can add entities by a module function named
+    ``add_test_entities(doc)``, which is called before saving the document.
+
+    """
+    doc = ezdxf.new()
+    doc.blocks.new("BLK").add_attdef("TAG", (0, 0))
+    msp = doc.modelspace()
+    for x in range(10):
+        msp.add_line((x, 0), (x, 1))
+    msp.add_polyline3d([(0, 0, 0), (1, 0, 1), (1, 1, 2)])
+    msp.add_blockref("BLK", (0, 0)).add_attrib("TAG", "VALUE")
+    doc.layout().add_circle((0, 0), 1)
+    add_test_entities = getattr(request.module, "add_test_entities", None)
+    if add_test_entities is not None:
+        add_test_entities(doc)
+    filename = tmpdir_factory.mktemp(request.param).join("test.dxf")
+    doc.dxfversion = request.param
+    doc.saveas(filename)
+    return str(filename)
@@ -145,6 +145,12 @@ def test_ext_read_2D_points():
     assert "check mark 2" == tag.value
 
 
+def test_2d_point_at_the_end_of_the_tag_stream():
+    text = " 10\n1.0\n 20\n2.0\n 10\n3.0\n 20\n4.0\n"
+    tags = list(external_tag_compiler(text))
+    assert tags == [(10, (1, 2)), (10, (3, 4))]
+
+
 def test_ext_error_tag():
     tags = list(external_tag_compiler(TAGS_WITH_ERROR))
     assert 1 == len(tags)
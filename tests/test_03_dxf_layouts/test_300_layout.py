@@ -44,6 +44,28 @@ def test_delete_entity():
     assert line3.is_alive is False
 
 
+def test_delete_multiple_entities():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    lines = [msp.add_line((x, 0), (x, 1)) for x in range(10)]
+    index = msp.spatial_index()
+    msp.delete_entities(lines[::2])
+    assert list(msp) == lines[1::2], "expected unchanged draw order"
+    assert all(line.is_alive is False for line in lines[::2])
+    assert len(index.crossing((0, 0), (10, 1))) == 5
+
+
+def test_delete_entities_of_another_layout():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    line = msp.add_line((0, 0), (1, 0))
+    circle = doc.layout().add_circle((0, 0), 1)
+    with pytest.raises(ezdxf.DXFValueError):
+        msp.delete_entities([line, circle])
+    assert list(msp) == [line], "expected unchanged layout"
+    assert line.is_alive is True
+
+
 def test_delete_all_entities(doc):
     paperspace = doc.layout()
     paperspace_count = len(paperspace)
@@ -3,7 +3,15 @@
 import pytest
 import ezdxf
 
-from ezdxf.query import EntityQuery, name_query
+from ezdxf.query import (
+    EntityQuery,
+    name_query,
+    entity_matcher,
+    build_entity_attributes_matcher,
+    BoolExpression,
+    _compile_tokens,
+)
+from ezdxf.queryparser import EntityQueryParser
 from ezdxf.entities import Text
 
 
@@ -202,3 +210,48 @@ def test_match_default_values():
     assert text.dxf.hasattr("style") is False
     result = EntityQuery([text], "*[style=='Standard']")
     assert result.first is text
+
+
+def test_compiled_matchers_are_cached():
+    assert entity_matcher("LINE[color==7]") is entity_matcher("LINE[color==7]")
+    assert entity_matcher("LINE[color==7]") is not entity_matcher("LINE")
+
+
+def test_invalid_queries_are_not_cached():
+    with pytest.raises(Exception):
+        entity_matcher("LINE[color=7]")
+    with pytest.raises(Exception):
+        entity_matcher("LINE[color=7]")
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        '*[layer=="lay_lines"]',
+        '*[layer=="LAY_LINES"]i',
+        '*[layer!="lay_lines"]',
+        "*[color<7]",
+        "*[color>=7]",
+        '*[layer ? "lay_.*"]',
+        '*[layer !? "lay_.*"]',
+        '*[layer ? "LAY_.*"]i',
+        '*[text=="TEST"]',
+        '*[!layer=="lay_lines"]',
+        '*[!!layer=="lay_lines"]',
+        '*[layer=="lay_lines" & color==6]',
+        '*[layer=="lay_text" | color==7 | layer=="π"]',
+        '*[!layer=="lay_lines" & color==6 | layer=="π"]',
+        '*[!(layer=="lay_text" | color==7) & layer ? "lay.*"]',
+        '*[(color==7)]',
+    ],
+)
+def test_compiled_predicate_is_equal_to_bool_expression(modelspace, query):
+    args = EntityQueryParser.parseString(query, parseAll=True)
+    ignore_case = args.AttribQueryOptions == "i"
+    expr = BoolExpression(_compile_tokens(args.AttribQuery, ignore_case))
+    match = build_entity_attributes_matcher(
+        args.AttribQuery, args.AttribQueryOptions
+    )
+    expected = [expr.evaluate(e) for e in modelspace]
+    assert [match(e) for e in modelspace] == expected
+    assert any(expected) and not all(expected)
@@ -5,6 +5,7 @@ import ezdxf
 from ezdxf.entitydb import EntityDB
 from ezdxf.entities.dxfentity import DXFEntity
 from ezdxf.audit import Auditor
+from ezdxf.lldxf.const import DXFInternalEzdxfError
 
 ENTITY = DXFEntity.new(handle="FFFF")
 auditor = Auditor(ezdxf.new())
@@ -197,6 +198,23 @@ def test_trashcan_context_manager():
     assert entities[1].is_alive is False
 
 
+def test_next_handle_skips_used_handles():
+    db = EntityDB()
+    db["1"] = DXFEntity.new(handle="1")
+    db["3"] = DXFEntity.new(handle="3")
+    assert db.next_handle() == "2"
+    assert db.next_handle() == "4"
+
+
+def test_add_new_entity_to_locked_database():
+    db = EntityDB()
+    db.locked = True
+    entity = DXFEntity()
+    with pytest.raises(DXFInternalEzdxfError):
+        db.add(entity)
+    assert entity.dxf.handle is None
+
+
 def test_reset_entity_handle():
     db = EntityDB()
     entity = DXFEntity()
@@ -3,8 +3,15 @@
 from typing import List
 import pytest
 import ezdxf
-from ezdxf.disassemble import recursive_decompose
+from ezdxf.disassemble import (
+    recursive_decompose,
+    to_primitives,
+    to_vertices,
+    to_control_vertices,
+)
 from ezdxf.entities import Point, Insert
+from ezdxf.explode import BlockEntityView
+from ezdxf.math import BoundingBox
 
 
 @pytest.fixture(scope="module")
@@ -191,5 +198,110 @@ class TestSourceBlockReferences:
         assert blkref0.source_block_reference is None
 
 
+class TestFlyweightDecomposition:
+    @pytest.fixture(scope="class")
+    def doc(self):
+        doc_ = ezdxf.new()
+        blk = doc_.blocks.new("MIXED")
+        blk.add_circle((1, 1), 1)
+        blk.add_arc((0, 0), 2, 0, 90)
+        blk.add_lwpolyline(
+            [(0, 0, 0.5), (2, 0), (2, 1)], format="xyb", close=True
+        )
+        blk.add_text("TEXT", dxfattribs={"insert": (0, 3)})
+        blk.add_attdef("TAG", (0, 4))
+        # The rotation of nested block references is not exact for
+        # non-uniform scaled virtual entities:
+        blk.add_blockref("L0", (5, 5), dxfattribs=scale(2, 1, 1))
+        build_level_0(doc_.blocks.new("L0"))
+        return doc_
+
+    @pytest.mark.parametrize(
+        "sx,sy,sz", [(2, 2, 2), (-1, 3, 1), (0.5, 1, -2)]
+    )
+    def test_flyweight_extents_are_equal_to_virtual_entity_extents(
+        self, doc, sx, sy, sz
+    ):
+        msp = doc.modelspace()
+        msp.delete_all_entities()
+        insert = msp.add_blockref("MIXED", (7, 3), dxfattribs=scale(sx, sy, sz))
+        insert.dxf.rotation = 15
+        insert.add_attrib("TAG", "VALUE", (7, 3))
+        expected = BoundingBox(
+            to_vertices(to_primitives(recursive_decompose(msp), 0.001))
+        )
+        result = BoundingBox(
+            to_vertices(
+                to_primitives(recursive_decompose(msp, flyweight=True), 0.001)
+            )
+        )
+        assert result.extmin.isclose(expected.extmin, abs_tol=0.01)
+        assert result.extmax.isclose(expected.extmax, abs_tol=0.01)
+
+    def test_views_share_the_block_entities(self, doc):
+        msp = doc.modelspace()
+        msp.delete_all_entities()
+        msp.add_blockref("MIXED", (0, 0), dxfattribs=scale(2, 2, 2))
+        views = [
+            e
+            for e in recursive_decompose(msp, flyweight=True)
+            if isinstance(e, BlockEntityView)
+        ]
+        # CIRCLE, ARC, LWPOLYLINE and 4 LINES of the nested block reference:
+        assert len(views) == 7
+        block_entities = set(doc.blocks.get("MIXED")) | set(
+            doc.blocks.get("L0")
+        )
+        assert all(view.source in block_entities for view in views)
+
+    def test_text_entities_are_virtual_entities(self, doc):
+        msp = doc.modelspace()
+        msp.delete_all_entities()
+        msp.add_blockref("MIXED", (0, 0))
+        texts = [
+            e
+            for e in recursive_decompose(msp, flyweight=True)
+            if e.dxftype() == "TEXT"
+        ]
+        assert len(texts) == 1
+        assert texts[0].dxf.handle is None
+
+    def test_control_vertices_of_minsert(self, doc):
+        msp = doc.modelspace()
+        msp.delete_all_entities()
+        msp.add_blockref(
+            "L0",
+            (0, 0),
+            dxfattribs={
+                "row_count": 2,
+                "row_spacing": 5,
+                "column_count": 3,
+                "column_spacing": 5,
+            },
+        )
+        expected = list(
+            to_control_vertices(to_primitives(recursive_decompose(msp)))
+        )
+        result = list(
+            to_control_vertices(
+                to_primitives(recursive_decompose(msp, flyweight=True))
+            )
+        )
+        assert len(result) == 6 * 4 * 2
+        assert all(v1.isclose(v2) for v1, v2 in zip(result, expected))
+
+    def test_materialize_view(self, doc):
+        circle = doc.blocks.get("MIXED")[0]
+        insert = doc.modelspace().add_blockref(
+            "MIXED", (0, 0), dxfattribs=scale(2, 1, 1)
+        )
+        view = BlockEntityView(circle, insert.matrix44())
+        assert view.dxftype() == "CIRCLE"
+        entities = list(view.virtual_entities())
+        # non-uniform scaled CIRCLE:
+        assert entities[0].dxftype() == "ELLIPSE"
+        assert circle.dxf.center == (1, 1)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
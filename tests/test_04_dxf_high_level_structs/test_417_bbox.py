@@ -5,6 +5,7 @@ import pytest
 import ezdxf
 from ezdxf.layouts import VirtualLayout
 from ezdxf import bbox, disassemble
+from ezdxf.math import BoundingBox
 from ezdxf.render.forms import square, translate
 
 
@@ -82,7 +83,10 @@ def test_cache_usage_for_flat_multi_boxes(msp_solids, func):
 
     # This works because flat processing has not to yield bounding boxes for
     # sub entities, caching top level bounding boxes works well.
-    assert cache.misses == 2 + 2  # first 2xINSERT, 2xSOLID in INSERT
+    # first 2xINSERT, the SOLID in the block definition is processed once by
+    # the convex hull of the block content and not as sub entity:
+    assert cache.misses == 2
+    assert len(cache._block_hulls) == 1
     assert cache.hits == 9 * 2  # 9 x 2xINSERT
 
 
@@ -172,3 +176,72 @@ def test_bbox_from_precise_flattening(circle):
 
 if __name__ == "__main__":
     pytest.main([__file__])
+
+
+@pytest.fixture(scope="module")
+def furniture():
+    doc = ezdxf.new()
+    blk = doc.blocks.new("TABLE")
+    blk.add_lwpolyline([(0, 0), (2, 0), (2, 1), (0, 1)], close=True)
+    blk.add_circle((1, 0.5), radius=0.25)
+    blk.add_attdef("NAME", (10, 10))
+    return doc
+
+
+@pytest.mark.parametrize(
+    "dxfattribs",
+    [
+        {"insert": (5, 5)},
+        {"insert": (5, 5), "rotation": 30},
+        {"insert": (5, 5), "rotation": 45, "xscale": -2, "yscale": 2},
+        {"insert": (5, 5), "xscale": 2, "yscale": 3},  # exact fallback
+        {"insert": (5, 5), "rotation": 20, "extrusion": (1, 1, 1)},
+    ],
+)
+@pytest.mark.parametrize("flatten", [0.01, 0])
+def test_block_hull_extents_match_decomposition(furniture, dxfattribs, flatten):
+    insert = furniture.modelspace().add_blockref("TABLE", (0, 0), dxfattribs)
+    expected = BoundingBox()
+    for box in bbox.multi_recursive([insert], flatten=flatten):
+        expected.extend(box)
+    result = bbox.extents([insert], flatten=flatten)
+    assert result.extmin.isclose(expected.extmin, abs_tol=1e-6)
+    assert result.extmax.isclose(expected.extmax, abs_tol=1e-6)
+
+
+def test_block_hull_extents_include_attribs(furniture):
+    insert = furniture.modelspace().add_blockref("TABLE", (0, 0))
+    insert.add_attrib("NAME", "VALUE", (20, 20))
+    box = bbox.extents([insert])
+    assert box.extmin.isclose((0, 0))
+    assert box.extmax.y > 20
+
+
+def test_block_hull_extents_of_minsert(furniture):
+    insert = furniture.modelspace().add_blockref("TABLE", (0, 0))
+    insert.grid(size=(2, 3), spacing=(10, 10))
+    box = bbox.extents([insert])
+    assert box.extmin.isclose((0, 0))
+    assert box.extmax.isclose((22, 11))
+
+
+def test_non_planar_block_content_uses_exact_fallback():
+    doc = ezdxf.new()
+    blk = doc.blocks.new("3D")
+    blk.add_line((0, 0, 0), (1, 1, 1))
+    insert = doc.modelspace().add_blockref("3D", (0, 0), {"rotation": 90})
+    cache = bbox.Cache()
+    box = bbox.extents([insert], cache=cache)
+    assert box.extmin.isclose((-1, 0, 0))
+    assert box.extmax.isclose((0, 1, 1))
+    assert list(cache._block_hulls.values()) == [None]
+
+
+def test_block_entity_views_are_not_cached(furniture):
+    insert = furniture.modelspace().add_blockref("TABLE", (10, 0))
+    cache = bbox.Cache()
+    boxes = list(bbox.multi_recursive([insert], cache=cache))
+    assert len(boxes) > 0
+    assert cache.misses == len(boxes)
+    assert len(cache._boxes) == 0, "block entities share the handles"
+    assert boxes[0].extmin.x >= 10
@@ -0,0 +1,132 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.entitydb import LazyEntitySpace
+
+
+def test_lazy_loading_creates_lazy_entity_spaces(dxf):
+    doc = ezdxf.readfile(dxf, lazy=True)
+    msp = doc.modelspace()
+    assert isinstance(msp.entity_space, LazyEntitySpace)
+    assert len(msp) == 12
+    assert doc.entitydb.lazy_loader.pending_count > 12, "with linked entities"
+
+
+def test_layout_content_is_equal_to_eager_loading(dxf):
+    lazy_doc = ezdxf.readfile(dxf, lazy=True)
+    doc = ezdxf.readfile(dxf)
+    for lazy_layout, layout in [
+        (lazy_doc.modelspace(), doc.modelspace()),
+        (lazy_doc.layout(), doc.layout()),
+    ]:
+        lazy_entities = list(lazy_layout)
+        entities = list(layout)
+        assert [e.dxf.handle for e in lazy_entities] == [
+            e.dxf.handle for e in entities
+        ]
+        # DXF R12 has no BLOCK_RECORD entities, the layout keys are created
+        # at the loading process:
+        assert all(e.dxf.owner == lazy_layout.layout_key for e in lazy_entities)
+    assert lazy_doc.entitydb.lazy_loader is None, "all entities loaded"
+
+
+def test_load_single_entity_by_handle(dxf):
+    doc = ezdxf.readfile(dxf, lazy=True)
+    msp = doc.modelspace()
+    handle = msp.entity_space.entities[3]
+    assert isinstance(handle, str)
+    loader = doc.entitydb.lazy_loader
+    count = loader.pending_count
+    line = doc.entitydb[handle]
+    assert line.dxftype() == "LINE"
+    assert line.dxf.owner == msp.layout_key
+    assert loader.pending_count == count - 1
+    assert msp[3] is line
+
+
+def test_linked_entities_are_loaded_by_parent_entity(dxf):
+    doc = ezdxf.readfile(dxf, lazy=True)
+    polyline = doc.modelspace()[10]
+    assert polyline.dxftype() == "POLYLINE"
+    assert len(polyline.vertices) == 3
+    vertex = polyline.vertices[0]
+    assert doc.entitydb.get(vertex.dxf.handle) is vertex
+    insert = doc.modelspace()[11]
+    assert insert.get_attrib_text("TAG") == "VALUE"
+
+
+def test_pending_handles_are_not_reused(dxf):
+    doc = ezdxf.readfile(dxf, lazy=True)
+    msp = doc.modelspace()
+    pending = set(msp.entity_space.entities[:10])
+    circle = msp.add_circle((0, 0), 1)
+    assert circle.dxf.handle not in pending
+    assert len(msp) == 13
+
+
+def test_delete_pending_entity_loaded_by_entitydb(dxf):
+    doc = ezdxf.readfile(dxf, lazy=True)
+    msp = doc.modelspace()
+    line = doc.entitydb[msp.entity_space.entities[0]]
+    msp.delete_entity(line)
+    assert line.is_alive is False
+    assert len(msp) == 11
+
+
+def test_delete_multiple_entities_of_lazy_entity_space(dxf):
+    doc = ezdxf.readfile(dxf, lazy=True)
+    msp = doc.modelspace()
+    handles = list(msp.entity_space.entities[:10])
+    # loaded by the entity space:
+    first = msp[0]
+    # loaded by the entity database, the entity space stores the handle:
+    second = doc.entitydb[handles[1]]
+    msp.delete_entities([first, second])
+    assert first.is_alive is False
+    assert second.is_alive is False
+    assert len(msp) == 10
+    assert msp.entity_space.entities[:8] == handles[2:], "expected pending"
+    assert [e.dxf.handle for e in msp][:8] == handles[2:]
+
+
+def test_save_lazy_loaded_document_to_source_file(dxf, tmpdir):
+    filename = tmpdir.join("copy.dxf")
+    ezdxf.readfile(dxf).saveas(filename)
+    doc = ezdxf.readfile(filename, lazy=True)
+    doc.save()
+    # pending entities are written back without loading:
+    loader = doc.entitydb.lazy_loader
+    assert loader.pending_count > 0
+    assert loader.is_source_file(filename) is False, "file has to be detached"
+    doc = ezdxf.readfile(filename)
+    assert len(doc.modelspace()) == 12
+    assert len(doc.layout()) == 1
+
+
+def test_lazy_loading_of_windows_line_endings(dxf, tmpdir):
+    with open(dxf, "rb") as fp:
+        data = fp.read().replace(b"\n", b"\r\n")
+    filename = tmpdir.join("crlf.dxf")
+    with open(filename, "wb") as fp:
+        fp.write(data)
+    doc = ezdxf.readfile(filename, lazy=True)
+    msp = doc.modelspace()
+    assert [e.dxftype() for e in msp][:2] == ["LINE", "LINE"]
+    assert msp[0].dxf.layer == "0"
+
+
+def test_lazy_loading_of_entity_referenced_by_group(tmpdir):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    line = msp.add_line((0, 0), (1, 0))
+    msp.add_circle((0, 0), 1)
+    doc.groups.new("GROUP").extend([line])
+    filename = tmpdir.join("group.dxf")
+    doc.saveas(filename)
+
+    doc = ezdxf.readfile(filename, lazy=True)
+    group = doc.groups.get("GROUP")
+    assert [e.dxf.handle for e in group] == [line.dxf.handle]
+    # The CIRCLE is not referenced by the group:
+    assert doc.entitydb.lazy_loader.pending_count == 1
@@ -0,0 +1,93 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.document import Drawing
+from ezdxf.lldxf.parallelloader import ParallelLoader, compile_chunk
+
+
+def add_test_entities(doc):
+    msp = doc.modelspace()
+    for x in range(10, 20):
+        msp.add_line((x, 0), (x, 1))
+    # structure tag like values:
+    msp.add_text("0")
+    msp.add_text("ENDSEC")
+    msp.add_text("SECTION")
+
+
+def handles(layout):
+    return [e.dxf.handle for e in layout]
+
+
+def test_find_sections(dxf):
+    loader = ParallelLoader(dxf, "cp1252")
+    names = [name for name, start, end in loader.sections]
+    if ezdxf.readfile(dxf).dxfversion == "AC1009":
+        assert names == ["ENTITIES"]
+    else:
+        assert names == ["ENTITIES", "OBJECTS"]
+
+
+def test_split_entities_section_into_chunks(dxf):
+    loader = ParallelLoader(dxf, "cp1252", min_chunk_size=1)
+    section = loader.sections[0]
+    chunks = loader.chunks(section, 8)
+    assert len(chunks) > 1
+    assert chunks[0][0] == section[1]
+    assert chunks[-1][1] == section[2]
+    entities = []
+    for start, end in chunks:
+        data = compile_chunk(dxf, start, end, "cp1252", "surrogateescape")
+        assert data[0][0][0] == 0, "chunk has to start with a structure tag"
+        entities.extend(data)
+    dxftypes = [tags[0][1] for tags in entities]
+    assert dxftypes.count("LINE") == 20
+    assert dxftypes.count("TEXT") == 3
+    assert dxftypes.count("VERTEX") == 3
+
+
+def test_loaded_content_is_equal_to_sequential_loading(dxf):
+    doc = ezdxf.readfile(dxf)
+    loader = ParallelLoader(dxf, "cp1252", max_workers=2, min_chunk_size=1)
+    parallel_doc = Drawing()
+    loader.load(parallel_doc)
+    assert len(parallel_doc.entitydb) == len(doc.entitydb)
+    for name in ("Model", "Layout1"):
+        assert handles(parallel_doc.layout(name)) == handles(doc.layout(name))
+    msp = parallel_doc.modelspace()
+    assert [e.dxf.text for e in msp.query("TEXT")] == ["0", "ENDSEC", "SECTION"]
+    assert len(msp.query("POLYLINE")[0].vertices) == 3
+    assert msp.query("INSERT")[0].get_attrib_text("TAG") == "VALUE"
+    if doc.dxfversion > "AC1009":
+        assert len(parallel_doc.objects) == len(doc.objects)
+        assert parallel_doc.rootdict.dxf.handle == doc.rootdict.dxf.handle
+
+
+def test_readfile_max_workers(dxf):
+    doc = ezdxf.readfile(dxf, max_workers=2)
+    assert handles(doc.modelspace()) == handles(ezdxf.readfile(dxf).modelspace())
+
+
+def test_parallel_loading_of_windows_line_endings(dxf, tmpdir):
+    with open(dxf, "rb") as fp:
+        data = fp.read().replace(b"\n", b"\r\n")
+    filename = tmpdir.join("crlf.dxf")
+    with open(filename, "wb") as fp:
+        fp.write(data)
+    loader = ParallelLoader(
+        str(filename), "cp1252", max_workers=2, min_chunk_size=1
+    )
+    assert len(loader.chunks(loader.sections[0], 4)) > 1
+    doc = Drawing()
+    loader.load(doc)
+    msp = doc.modelspace()
+    assert len(msp) == 25
+    assert msp[0].dxf.layer == "0"
+
+
+def test_default_max_workers_splits_sections_into_chunks(dxf, monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    loader = ParallelLoader(dxf, "cp1252", min_chunk_size=1)
+    assert loader.chunk_count == 4
+    assert len(loader.chunks(loader.sections[0], loader.chunk_count)) > 1
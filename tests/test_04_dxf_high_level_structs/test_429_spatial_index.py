@@ -0,0 +1,120 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import pytest
+import ezdxf
+from ezdxf.spatialindex import SpatialIndex
+
+
+@pytest.fixture
+def msp():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for x in range(10):
+        for y in range(10):
+            msp.add_line((x, y), (x + 0.5, y + 0.5))
+    return msp
+
+
+def handles(entities):
+    return {e.dxf.handle for e in entities}
+
+
+def test_layout_spatial_index_is_persistent(msp):
+    index = msp.spatial_index()
+    assert isinstance(index, SpatialIndex)
+    assert msp.spatial_index() is index
+    assert len(index) == 100
+
+
+def test_window_query_returns_entity_query(msp):
+    result = msp.spatial_index().window((2, 2), (3.5, 3.5))
+    assert len(result) == 4
+    assert len(result.query("LINE[layer=='0']")) == 4
+
+
+def test_crossing_query(msp):
+    index = msp.spatial_index()
+    assert len(index.crossing((2.2, 2.2), (3.2, 3.2))) == 4
+    assert len(index.crossing((2.6, 2.6), (3.2, 3.2))) == 1
+
+
+def test_nearest_neighbors(msp):
+    index = msp.spatial_index()
+    result = index.nearest((-1, -1), count=3)
+    assert len(result) == 3
+    assert result[0].dxf.start.isclose((0, 0))
+    assert index.nearest((0, 0), count=0) == []
+
+
+def test_added_entities_are_indexed(msp):
+    index = msp.spatial_index()
+    circle = msp.add_circle((100, 100), radius=1)
+    assert list(index.window((98, 98), (102, 102))) == [circle]
+    assert index.nearest((200, 200)) == [circle]
+    assert len(index) == 101
+
+
+def test_deleted_entities_are_removed(msp):
+    index = msp.spatial_index()
+    line = index.window((0, 0), (0.5, 0.5))[0]
+    handle = line.dxf.handle
+    msp.delete_entity(line)
+    assert len(index.window((0, 0), (0.5, 0.5))) == 0
+    assert handle not in handles(index.nearest((0, 0), count=100))
+    assert len(index) == 99
+
+
+def test_destroyed_entities_are_ignored(msp):
+    index = msp.spatial_index()
+    line = index.window((0, 0), (0.5, 0.5))[0]
+    line.destroy()
+    assert len(index.window((0, 0), (0.5, 0.5))) == 0
+
+
+def test_transformed_entities_are_updated(msp):
+    index = msp.spatial_index()
+    line = index.window((0, 0), (0.5, 0.5))[0]
+    line.translate(50, 50, 0)
+    assert len(index.window((0, 0), (0.5, 0.5))) == 0
+    assert list(index.window((50, 50), (51, 51))) == [line]
+
+
+def test_moved_entities_are_removed(msp):
+    index = msp.spatial_index()
+    line = index.window((0, 0), (0.5, 0.5))[0]
+    msp.move_to_layout(line, msp.doc.layout())
+    assert len(index.window((0, 0), (0.5, 0.5))) == 0
+    assert len(msp.doc.layout().spatial_index()) == 1
+
+
+def test_tree_rebuild_after_many_modifications(msp):
+    index = msp.spatial_index()
+    for entity in list(msp):
+        entity.translate(100, 0, 0)
+    assert len(index.window((0, 0), (10, 10))) == 0
+    assert len(index.window((100, 0), (110, 10))) == 100
+    assert len(index._extra) == 0, "expected rebuild of the search tree"
+
+
+def test_manual_update(msp):
+    index = msp.spatial_index()
+    line = index.window((0, 0), (0.5, 0.5))[0]
+    line.dxf.end = (20, 20)
+    index.update(line)
+    assert list(index.crossing((19, 19), (21, 21))) == [line]
+
+
+def test_entities_without_bounding_box_are_not_indexed():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    msp.add_xline((0, 0), (1, 0))
+    assert len(msp.spatial_index()) == 0
+
+
+def test_bounding_box_of_indexed_entity(msp):
+    index = msp.spatial_index()
+    line = msp[0]
+    box = index.bbox(line)
+    assert box.extmin.isclose((0, 0))
+    assert box.extmax.isclose((0.5, 0.5))
+    assert index.bbox(line.copy()) is None, "not indexed"
@@ -0,0 +1,142 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import io
+import pytest
+import ezdxf
+from ezdxf.entities import Line
+from ezdxf.entities.dxfns import DYN_DXF_SOURCE_ATTRIBUTE
+
+
+def add_test_entities(doc):
+    msp = doc.modelspace()
+    msp.add_blockref("BLK", (1, 0))
+    msp.add_text("XDATA").set_xdata("ACAD", [(1000, "text")])
+
+
+def dxfstr(doc, fmt="asc") -> str:
+    stream = io.StringIO()
+    doc.write(stream, fmt=fmt)
+    return stream.getvalue()
+
+
+def entities_section(doc) -> str:
+    s = dxfstr(doc)
+    start = s.index("ENTITIES")
+    return s[start : s.index("ENDSEC", start)]
+
+
+def test_namespace_modifications_discard_dxf_source():
+    line = Line.new(dxfattribs={"layer": "0"})
+    line.set_dxf_source("  0\nLINE\n")
+    assert line.has_dxf_source is True
+    line.dxf.color = 1
+    assert line.has_dxf_source is False
+
+    line.set_dxf_source("  0\nLINE\n")
+    del line.dxf.color
+    assert line.has_dxf_source is False
+
+    line.set_dxf_source("  0\nLINE\n")
+    line.dxf.discard("not_existing_attribute")
+    assert line.has_dxf_source is True, "no modification"
+    line.dxf.discard("layer")
+    assert line.has_dxf_source is False
+
+
+def test_entities_without_tracked_state_ignore_dxf_source():
+    doc = ezdxf.new()
+    lwpolyline = doc.modelspace().add_lwpolyline([(0, 0), (1, 0)])
+    lwpolyline.set_dxf_source("  0\nLWPOLYLINE\n")
+    assert lwpolyline.has_dxf_source is False
+
+
+def test_xdata_invalidates_dxf_source():
+    line = Line.new()
+    line.set_dxf_source("  0\nLINE\n")
+    line.set_xdata("ACAD", [(1000, "text")])
+    assert line.has_dxf_source is False
+
+
+def test_loaded_entities_have_dxf_source(dxf):
+    doc = ezdxf.readfile(dxf, lazy=True)
+    msp = doc.modelspace()
+    assert all(e.has_dxf_source for e in msp.query("LINE POLYLINE INSERT"))
+    assert all(v.has_dxf_source for v in msp.query("POLYLINE")[0].vertices)
+    assert msp.query("TEXT")[0].has_dxf_source is False, "has XDATA"
+    assert doc.layout()[0].has_dxf_source is True
+
+
+def test_unmodified_document_is_equal_to_regular_export(dxf):
+    doc = ezdxf.readfile(dxf, lazy=True)
+    assert entities_section(doc) == entities_section(ezdxf.readfile(dxf))
+
+
+def test_loaded_document_is_equal_to_regular_export(dxf):
+    doc = ezdxf.readfile(dxf, lazy=True)
+    assert len(list(doc.modelspace())) == 14
+    assert len(list(doc.layout())) == 1
+    assert doc.entitydb.lazy_loader is None, "all entities loaded"
+    assert entities_section(doc) == entities_section(ezdxf.readfile(dxf))
+
+
+def modify(doc):
+    msp = doc.modelspace()
+    inserts = msp.query("INSERT")
+    inserts[0].attribs[0].dxf.text = "NEW VALUE"
+    inserts[1].add_attrib("TAG", "ADDED")
+    msp.query("LINE")[3].dxf.color = 3
+    msp.query("POLYLINE")[0].vertices[1].dxf.location = (7, 8, 9)
+    doc.layout()[0].dxf.radius = 2
+
+
+def test_modified_document_is_equal_to_regular_export(dxf):
+    doc = ezdxf.readfile(dxf, lazy=True)
+    modify(doc)
+    assert "NEW VALUE" in entities_section(doc)
+    expected = ezdxf.readfile(dxf)
+    modify(expected)
+    # The handles of the new ATTRIB entities depend on the handle seed:
+    assert entities_section(doc).count("\n") == entities_section(
+        expected
+    ).count("\n")
+    doc = ezdxf.read(io.StringIO(dxfstr(doc)))
+    msp = doc.modelspace()
+    inserts = msp.query("INSERT")
+    assert inserts[0].get_attrib_text("TAG") == "NEW VALUE"
+    assert inserts[1].get_attrib_text("TAG") == "ADDED"
+    assert msp.query("LINE")[3].dxf.color == 3
+    assert msp.query("POLYLINE")[0].vertices[1].dxf.location == (7, 8, 9)
+    assert doc.layout()[0].dxf.radius == 2
+
+
+def test_different_dxf_version_ignores_dxf_source(dxf):
+    doc = ezdxf.readfile(dxf, lazy=True)
+    line = doc.modelspace()[0]
+    source = getattr(line, DYN_DXF_SOURCE_ATTRIBUTE)
+    line.set_dxf_source(source.replace("LINE", "SOURCE"))
+    assert "SOURCE" in dxfstr(doc)
+    doc.dxfversion = "R2018"
+    assert "SOURCE" not in dxfstr(doc)
+
+
+def test_binary_export_of_pending_entities(dxf, tmpdir):
+    doc = ezdxf.readfile(dxf, lazy=True)
+    filename = tmpdir.join("binary.dxf")
+    doc.saveas(filename, fmt="bin")
+    doc = ezdxf.readfile(filename)
+    assert len(doc.modelspace()) == 14
+
+
+def test_overwrite_source_file_by_modified_document(dxf, tmpdir):
+    filename = tmpdir.join("copy.dxf")
+    ezdxf.readfile(dxf).saveas(filename)
+    doc = ezdxf.readfile(filename, lazy=True)
+    doc.modelspace().query("INSERT")[0].attribs[0].dxf.text = "NEW VALUE"
+    doc.save()
+    # save again from detached source data:
+    doc.save()
+    doc = ezdxf.readfile(filename)
+    msp = doc.modelspace()
+    assert len(msp) == 14
+    assert msp.query("INSERT")[0].get_attrib_text("TAG") == "NEW VALUE"
+    assert len(msp.query("POLYLINE")[0].vertices) == 3
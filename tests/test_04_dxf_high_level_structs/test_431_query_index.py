@@ -0,0 +1,130 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import pytest
+import ezdxf
+from ezdxf.queryindex import QueryIndex, _layer_terms
+from ezdxf.queryparser import EntityQueryParser
+
+
+@pytest.fixture
+def msp():
+    doc = ezdxf.new()
+    msp_ = doc.modelspace()
+    for index in range(30):
+        layer = ["WALLS", "Doors", "0"][index % 3]
+        attribs = {"layer": layer, "color": index % 5}
+        if index % 2:
+            msp_.add_line((index, 0), (index, 1), dxfattribs=attribs)
+        else:
+            msp_.add_circle((index, 0), 1, dxfattribs=attribs)
+    msp_.add_polyline2d([(0, 0), (1, 0)], dxfattribs={"layer": "WALLS"})
+    return msp_
+
+
+QUERIES = [
+    "*",
+    "LINE",
+    "LINE CIRCLE",
+    "* !LINE",
+    'LINE[layer=="WALLS"]',
+    '*[layer=="walls"]',
+    '*[layer=="walls"]i',
+    '*[layer=="DOORS" & color==2]i',
+    '*[layer=="WALLS" | color==2]',
+    '*[!layer=="WALLS"]',
+    '*[layer=="WALLS" & layer=="0"]',
+    '*[layer=="WALLS" & (color==1 | color==2)]',
+    "POLYLINE VERTEX",
+]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_indexed_query_is_equal_to_layout_query(msp, query):
+    expected = list(msp.query(query))
+    index = msp.query_index()
+    assert len(index) == len(msp)
+    assert list(msp.query(query)) == expected
+
+
+def test_index_tracks_added_and_deleted_entities(msp):
+    index = msp.query_index()
+    line = msp.add_line((0, 0), (1, 0), dxfattribs={"layer": "WALLS"})
+    assert line in index
+    assert msp.query('LINE[layer=="WALLS"]').last is line
+    msp.delete_entity(line)
+    assert line not in index
+    lines = msp.query("LINE")
+    msp.delete_entities(lines[:5])
+    assert list(msp.query("LINE")) == list(lines[5:])
+
+
+def test_index_tracks_layer_changes_and_preserves_layout_order(msp):
+    index = msp.query_index()
+    first_door = msp.query('*[layer=="DOORS"]i').first
+    first_door.dxf.layer = "WALLS"
+    walls = [e for e in msp if e.dxf.layer == "WALLS"]
+    assert list(index.query('*[layer=="WALLS"]')) == walls
+    assert walls[1] is first_door
+    assert first_door not in msp.query('*[layer=="DOORS"]i')
+
+
+def test_polyline_layer_change_updates_the_index(msp):
+    msp.query_index()
+    polyline = msp.query("POLYLINE").first
+    polyline.dxf.layer = "NEW"
+    assert list(msp.query('*[layer=="NEW"]')) == [polyline]
+
+
+def test_deleted_layer_attribute_updates_the_index(msp):
+    msp.query_index()
+    expected = 12  # 10 entities on layer "0" + 2 entities with deleted layer
+    walls = msp.query('LINE[layer=="WALLS"]')
+    walls[0].dxf.discard("layer")
+    del walls[1].dxf.layer
+    result = msp.query('*[layer=="0"]')
+    assert len(result) == expected
+    assert walls[0] in result
+    assert walls[1] in result
+    assert len(msp.query('LINE[layer=="WALLS"]')) == len(walls) - 2
+
+
+def test_deleted_polyline_layer_attribute_updates_the_index(msp):
+    msp.query_index()
+    polyline = msp.query("POLYLINE").first
+    del polyline.dxf.layer
+    assert polyline in msp.query('*[layer=="0"]')
+    assert all(v.dxf.layer == "0" for v in polyline.vertices)
+
+
+def test_destroyed_entities_are_ignored(msp):
+    msp.query_index()
+    line = msp.query("LINE").first
+    line.destroy()
+    assert line not in list(msp.query("LINE"))
+    assert line not in list(msp.query('*[layer=="WALLS"]'))
+
+
+def test_query_index_of_entity_list():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    point = msp.add_point((0, 0))
+    index = QueryIndex([point])
+    assert list(index.query("POINT")) == [point]
+
+
+@pytest.mark.parametrize(
+    "query,layers",
+    [
+        ('*[layer=="A"]', {"a"}),
+        ('*[layer=="A" & color==1]', {"a"}),
+        ('*[color==1 & layer=="A" & layer=="B"]', {"a", "b"}),
+        ('*[layer=="A" | color==1]', None),
+        ('*[!layer=="A"]', None),
+        ('*[layer!="A"]', None),
+        ('*[layer?"A.*"]', None),
+        ("*", None),
+    ],
+)
+def test_layer_terms(query, layers):
+    args = EntityQueryParser.parseString(query, parseAll=True)
+    assert _layer_terms(args.AttribQuery) == layers
@@ -0,0 +1,88 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf import snapshot
+
+
+def add_test_entities(doc):
+    for x, line in enumerate(doc.modelspace().query("LINE")):
+        line.dxf.layer = f"L{x % 2}"
+
+
+def content(doc):
+    return sorted(
+        (e.dxf.handle, e.dxftype(), e.dxf.all_existing_dxf_attribs())
+        for e in doc.entitydb.values()
+    )
+
+
+def test_reloaded_snapshot_is_equal_to_source_document(dxf, tmpdir):
+    doc = ezdxf.readfile(dxf)
+    filename = str(tmpdir.join("test.snapshot"))
+    doc.save_snapshot(filename)
+    doc2 = ezdxf.load_snapshot(filename)
+    assert doc2 is not doc
+    assert doc2.dxfversion == doc.dxfversion
+    assert content(doc2) == content(doc)
+
+
+def test_reloaded_entities_are_bound_to_the_reloaded_document(dxf):
+    doc = snapshot.loads(snapshot.dumps(ezdxf.readfile(dxf)))
+    msp = doc.modelspace()
+    assert len(msp) == 12
+    for entity in msp:
+        assert entity.doc is doc
+        assert doc.entitydb[entity.dxf.handle] is entity
+    insert = msp.query("INSERT").first
+    assert insert.attribs[0].dxf.text == "VALUE"
+    assert insert.block() is doc.blocks.get("BLK")
+
+
+def test_reloaded_document_is_editable(dxf):
+    doc = snapshot.loads(snapshot.dumps(ezdxf.readfile(dxf)))
+    msp = doc.modelspace()
+    line = msp.add_line((0, 0), (1, 1))
+    assert doc.entitydb[line.dxf.handle] is line
+    msp.delete_entity(msp[0])
+    assert len(msp) == 12
+
+
+def test_snapshot_loads_pending_entities_of_lazy_documents(dxf):
+    doc = ezdxf.readfile(dxf, lazy=True)
+    data = snapshot.dumps(doc)
+    assert doc.entitydb.lazy_loader is None
+    doc2 = snapshot.loads(data)
+    assert doc2.entitydb.lazy_loader is None
+    assert content(doc2) == content(doc)
+
+
+def test_snapshot_includes_persistent_indexes(dxf):
+    doc = ezdxf.readfile(dxf)
+    doc.modelspace().query_index()
+    doc2 = snapshot.loads(snapshot.dumps(doc))
+    msp = doc2.modelspace()
+    assert msp.block_record.query_index is not None
+    lines = msp.query('LINE[layer=="L1"]')
+    assert len(lines) == 5
+    assert all(line.doc is doc2 for line in lines)
+    # the reloaded index is updated:
+    msp.add_line((0, 0), (1, 0), dxfattribs={"layer": "L1"})
+    assert len(msp.query('LINE[layer=="L1"]')) == 6
+
+
+def test_invalid_snapshot_data():
+    with pytest.raises(IOError):
+        snapshot.loads(b"0\nSECTION\n")
+
+
+def test_incompatible_snapshot_version():
+    data = snapshot.dumps(ezdxf.new())
+    header, _, pickled = data.partition(b"\n")
+    with pytest.raises(IOError):
+        snapshot.loads(header + b".0\n" + pickled)
+
+
+def test_load_snapshot_from_dxf_file_raises_io_error(dxf):
+    with pytest.raises(IOError):
+        ezdxf.load_snapshot(dxf)
@@ -0,0 +1,89 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import pytest
+import random
+from ezdxf.math import RTree, BoundingBox2d
+
+
+def box(x, y, size=1):
+    return BoundingBox2d([(x, y), (x + size, y + size)])
+
+
+@pytest.fixture(scope="module")
+def grid():
+    return RTree(
+        [(box(x, y), (x, y)) for x in range(20) for y in range(20)],
+        max_node_size=4,
+    )
+
+
+def test_empty_tree():
+    tree = RTree([])
+    assert len(tree) == 0
+    assert list(tree.crossing((0, 0), (1, 1))) == []
+    assert list(tree.nearest((0, 0))) == []
+    assert tree.extents.has_data is False
+
+
+def test_ignore_empty_bounding_boxes():
+    tree = RTree([(BoundingBox2d(), 1), (box(0, 0), 2)])
+    assert list(tree) == [2]
+
+
+def test_invalid_node_size():
+    with pytest.raises(ValueError):
+        RTree([], max_node_size=1)
+
+
+def test_all_items_are_stored(grid):
+    assert len(grid) == 400
+    assert len(set(grid)) == 400
+    assert grid.extents.extmin.isclose((0, 0))
+    assert grid.extents.extmax.isclose((20, 20))
+
+
+def test_window_query(grid):
+    result = set(grid.window((2, 3), (4, 5)))
+    assert result == {(2, 3), (3, 3), (2, 4), (3, 4)}
+
+
+def test_window_query_with_reversed_corners(grid):
+    assert set(grid.window((4, 5), (2, 3))) == set(grid.window((2, 3), (4, 5)))
+
+
+def test_crossing_query(grid):
+    result = set(grid.crossing((2.5, 2.5), (2.6, 2.6)))
+    assert result == {(2, 2)}
+    # touching boxes are crossing:
+    result = set(grid.crossing((3, 3), (3, 3)))
+    assert result == {(2, 2), (3, 2), (2, 3), (3, 3)}
+
+
+def test_nearest_neighbor(grid):
+    distance, item = next(grid.nearest((-3, 0.5)))
+    assert item == (0, 0)
+    assert distance == pytest.approx(3)
+
+
+def test_nearest_neighbors_are_sorted_by_distance(grid):
+    distances = [d for d, _ in grid.nearest((7.5, 7.5))]
+    assert len(distances) == 400
+    assert distances == sorted(distances)
+    assert distances[0] == 0
+
+
+def test_random_queries_against_linear_search():
+    items = [
+        (box(random.uniform(0, 100), random.uniform(0, 100), 3), num)
+        for num in range(500)
+    ]
+    tree = RTree(items)
+    for _ in range(20):
+        x, y = random.uniform(0, 100), random.uniform(0, 100)
+        window = BoundingBox2d([(x, y), (x + 20, y + 20)])
+        expected = {
+            num
+            for b, num in items
+            if window.inside(b.extmin) and window.inside(b.extmax)
+        }
+        assert set(tree.window((x, y), (x + 20, y + 20))) == expected
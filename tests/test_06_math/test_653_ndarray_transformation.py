@@ -0,0 +1,91 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ezdxf.math import UCS, OCS, PassTroughUCS, Vec3
+from ezdxf.math._matrix44 import Matrix44
+from ezdxf.acc import USE_C_EXT
+from ezdxf.lldxf.packedtags import VertexArray
+from ezdxf.render import MeshBuilder
+
+m44_classes = [Matrix44]
+
+if USE_C_EXT:
+    from ezdxf.acc.matrix44 import Matrix44 as CMatrix44
+
+    m44_classes.append(CMatrix44)
+
+
+@pytest.fixture(params=m44_classes)
+def m44(request):
+    return request.param
+
+
+POINTS = [(1, 2, 3), (4, -5, 6), (-7, 8, 0)]
+
+
+def test_transform_array(m44):
+    m = m44.chain(m44.z_rotate(0.5), m44.scale(2), m44.translate(1, 2, 3))
+    result = m.transform_array(np.array(POINTS, dtype=np.float64))
+    assert result.shape == (3, 3)
+    expected = list(m.transform_vertices(POINTS))
+    assert np.allclose(result, expected)
+
+
+def test_transform_direction_array(m44):
+    m = m44.chain(m44.z_rotate(0.5), m44.translate(1, 2, 3))
+    result = m.transform_direction_array(POINTS, normalize=True)
+    expected = list(m.transform_directions(POINTS, normalize=True))
+    assert np.allclose(result, expected)
+
+
+def test_transform_array_requires_3d_vertices(m44):
+    with pytest.raises(ValueError):
+        m44().transform_array(np.zeros((3, 2)))
+
+
+def test_ucs_array_transformation():
+    ucs = UCS(origin=(1, 2, 3), ux=(0, 1, 0), uy=(-1, 0, 0))
+    wcs = ucs.to_wcs_array(POINTS)
+    assert np.allclose(wcs, [ucs.to_wcs(Vec3(p)) for p in POINTS])
+    assert np.allclose(ucs.from_wcs_array(wcs), POINTS)
+
+
+def test_ocs_array_transformation():
+    ocs = OCS((1, 1, 1))
+    wcs = ocs.to_wcs_array(POINTS)
+    assert np.allclose(wcs, [ocs.to_wcs(p) for p in POINTS])
+    assert np.allclose(ocs.from_wcs_array(wcs), POINTS)
+
+
+@pytest.mark.parametrize("cs", [OCS(), PassTroughUCS()])
+def test_array_without_transformation_is_not_copied(cs):
+    points = np.array(POINTS, dtype=np.float64)
+    assert cs.to_wcs_array(points) is points
+    assert cs.from_wcs_array(points) is points
+
+
+def test_vertex_array_as_ndarray_view():
+    vertices = VertexArray([1, 2, 3, 4, 5, 6])
+    view = vertices.as_ndarray()
+    assert view.shape == (2, 3)
+    view[1, 2] = 9
+    assert vertices[1] == (4, 5, 9)
+
+
+def test_vertex_array_set_ndarray():
+    vertices = VertexArray()
+    vertices.set_ndarray(np.array(POINTS))
+    assert list(vertices) == POINTS
+    with pytest.raises(ValueError):
+        vertices.set_ndarray(np.zeros((3, 2)))
+
+
+def test_mesh_builder_ndarray_interface():
+    mesh = MeshBuilder()
+    assert mesh.vertices_as_ndarray().shape == (0, 3)
+    assert mesh.add_ndarray_vertices(np.array(POINTS)) == (0, 1, 2)
+    assert mesh.vertices[1] == (4, -5, 6)
+    assert np.allclose(mesh.vertices_as_ndarray(), POINTS)
@@ -777,9 +777,9 @@ def p1():
 
 def test_path_cloning(p1):
     p2 = p1.clone()
-    # p1 and p2 share immutable data:
+    # path elements are views of the packed representation:
     for cmd1, cmd2 in zip(p1, p2):
-        assert cmd1 is cmd2
+        assert cmd1 == cmd2
 
     # but have different command lists:
     p2.line_to((4, 4))
@@ -1236,5 +1236,83 @@ class TestCloseSubPath:
         assert p.end == (1, 0, 0)
 
 
+class TestPackedRepresentation:
+    @pytest.fixture
+    def path(self):
+        path = Path((1, 2, 3))
+        path.line_to((2, 0))
+        path.curve4_to((4, 0), (2, 1), (4, 1))  # end, ctrl1, ctrl2
+        path.move_to((5, 5))
+        path.curve3_to((6, 0), (5, -1))  # end, ctrl
+        return path
+
+    def test_stores_vertices_as_flat_float_buffer(self, path):
+        assert path._vertices.typecode == "d"
+        assert len(path._vertices) == 8 * 3
+        assert list(path._commands) == [
+            Command.LINE_TO,
+            Command.CURVE4_TO,
+            Command.MOVE_TO,
+            Command.CURVE3_TO,
+        ]
+
+    def test_indexing_returns_path_elements(self, path):
+        assert path[0].type == Command.LINE_TO
+        assert path[1] == (Vec3(4, 0), Vec3(2, 1), Vec3(4, 1))
+        assert path[-1].type == Command.CURVE3_TO
+        assert path[-1].ctrl == (5, -1)
+        assert path[1:3] == [path[1], path[2]]
+
+    def test_invalid_index_raises_index_error(self, path):
+        with pytest.raises(IndexError):
+            _ = path[4]
+        with pytest.raises(IndexError):
+            _ = path[-5]
+
+    def test_iteration_matches_indexing(self, path):
+        assert list(path) == [path[i] for i in range(len(path))]
+
+    def test_bulk_transformation(self, path):
+        m = Matrix44.chain(Matrix44.z_rotate(0.5), Matrix44.translate(1, 2, 3))
+        result = path.transform(m)
+        assert result.has_sub_paths is True
+        assert close_vectors(
+            result.control_vertices(),
+            m.transform_vertices(path.control_vertices()),
+        )
+
+    def test_bulk_flattening(self, path):
+        expected = [path.start]
+        start = path.start
+        for cmd in path:
+            if cmd.type == Command.CURVE4_TO:
+                curve = Bezier4P((start, cmd.ctrl1, cmd.ctrl2, cmd.end))
+                expected.extend(list(curve.flattening(0.01, 4))[1:])
+            elif cmd.type == Command.CURVE3_TO:
+                curve = Bezier3P((start, cmd.ctrl, cmd.end))
+                expected.extend(list(curve.flattening(0.01, 4))[1:])
+            else:
+                expected.append(cmd.end)
+            start = cmd.end
+        assert close_vectors(path.flattening(0.01, 4), expected)
+
+    def test_sub_paths_of_packed_path(self, path):
+        p1, p2 = path.sub_paths()
+        assert p1.start == (1, 2, 3)
+        assert p1.end == (4, 0)
+        assert len(p1) == 2
+        assert p2.start == (5, 5)
+        assert len(p2) == 1
+        assert p2[0].ctrl == (5, -1)
+
+    def test_pickle_packed_path(self, path):
+        import pickle
+
+        path2 = pickle.loads(pickle.dumps(path))
+        assert list(path2) == list(path)
+        assert path2.start == path.start
+        assert path2.has_sub_paths is True
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -21,6 +21,7 @@ from ezdxf.path import (
     from_vertices,
     to_multi_path,
     single_paths,
+    flatten_paths,
 )
 from ezdxf.path import make_path, Command
 from ezdxf.entities import BoundaryPathType, EdgeType
@@ -180,6 +181,48 @@ class TestBoundingBox:
         assert result.extmax.y == pytest.approx(0.5)  # parabola
 
 
+class TestFlattenPaths:
+    @pytest.fixture(scope="class")
+    def paths(self):
+        p1 = Path((1, 2, 3))
+        p1.line_to((4, 5, 6))
+        p1.curve4_to((7, 0), (5, 1), (6, -1))
+        p2 = Path()  # empty path
+        p3 = Path()
+        p3.curve3_to((2, 0), (1, 1))
+        p3.move_to((5, 5))
+        p3.line_to((6, 6))
+        return [p1, p2, p3]
+
+    def test_no_paths(self):
+        vertices, offsets = flatten_paths([])
+        assert len(vertices) == 0
+        assert list(offsets) == [0]
+
+    def test_buffer_types(self, paths):
+        vertices, offsets = flatten_paths(paths)
+        assert vertices.typecode == "d"
+        assert offsets.typecode == "I"
+        assert len(offsets) == len(paths) + 1
+        assert len(vertices) == offsets[-1] * 3
+
+    def test_empty_path_has_no_vertices(self, paths):
+        _, offsets = flatten_paths(paths)
+        assert offsets[1] == offsets[2]
+
+    @pytest.mark.parametrize("distance, segments", [(0.01, 16), (0.1, 4)])
+    def test_vertices_match_path_flattening(self, paths, distance, segments):
+        vertices, offsets = flatten_paths(paths, distance, segments)
+        for index, path in enumerate(paths):
+            start = offsets[index] * 3
+            end = offsets[index + 1] * 3
+            it = iter(vertices[start:end])
+            result = Vec3.list(zip(it, it, it))
+            expected = list(path.flattening(distance, segments))
+            assert len(result) == len(expected)
+            assert close_vectors(result, expected)
+
+
 class TestFitPathsIntoBoxUniformScaling:
     @pytest.fixture(scope="class")
     def spath(self):
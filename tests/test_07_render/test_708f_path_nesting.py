@@ -2,6 +2,8 @@
 #  License: MIT License
 
 import pytest
+import random
+from ezdxf.math import BoundingBox2d
 from ezdxf.render.forms import square, translate
 from ezdxf.path import Path, nesting, from_vertices
 
@@ -55,6 +57,75 @@ def test_fast_bbox_detection(paths, polygons):
     assert nesting.fast_bbox_detection(paths) == polygons
 
 
+def partition_detection(paths):
+    # reference implementation of ezdxf v0.17.1: partitions the remaining
+    # paths for each exterior path
+    def separate(exterior, candidates):
+        holes = []
+        outside = []
+        for candidate in candidates:
+            (holes if exterior.inside(candidate[0].center) else outside).append(
+                candidate
+            )
+        return holes, outside
+
+    def polygon_structure(outside):
+        polygons = []
+        while outside:
+            exterior = outside.pop()
+            holes, outside = separate(exterior[0], outside)
+            if holes:
+                holes = polygon_structure(holes)
+            polygons.append([exterior, *holes])
+        return polygons
+
+    def as_nested_paths(polygons):
+        return [
+            polygon[1] if isinstance(polygon, tuple) else as_nested_paths(polygon)
+            for polygon in polygons
+        ]
+
+    def area(item):
+        width, height = item[0].size
+        return width * height
+
+    boxed_paths = [
+        (BoundingBox2d(path.control_vertices()), path)
+        for path in paths
+        if len(path)
+    ]
+    boxed_paths.sort(key=area)
+    return as_nested_paths(polygon_structure(boxed_paths))
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_fast_bbox_detection_matches_partition_detection(seed):
+    random.seed(seed)
+    paths = []
+    for _ in range(300):
+        size = random.choice([1, 2, 2, 5, 10, 20])  # equal sized paths
+        x = random.randint(0, 40)
+        y = random.randint(0, 40)
+        paths.append(from_vertices(translate(square(size), (x, y))))
+    assert nesting.fast_bbox_detection(paths) == partition_detection(paths)
+
+
+def test_exact_detection_of_paths_in_concave_paths():
+    # C-shaped exterior path, the bounding box center is outside of the path
+    c_shape = from_vertices(
+        [(0, 0), (10, 0), (10, 2), (2, 2), (2, 8), (10, 8), (10, 10), (0, 10)],
+        close=True,
+    )
+    inside = from_vertices(translate(square(1), (0.5, 4)))
+    outside = from_vertices(translate(square(1), (4, 4)))
+    assert nesting.fast_bbox_detection([inside, outside, c_shape]) == [
+        [c_shape, [outside], [inside]]
+    ]
+    assert nesting.fast_bbox_detection(
+        [inside, outside, c_shape], exact=True
+    ) == [[c_shape, [inside]], [outside]]
+
+
 @pytest.mark.parametrize(
     "polygons,exp_ccw,exp_cw",
     [
@@ -1,8 +1,15 @@
-#  Copyright (c) 2020, Manfred Moitzi
+#  Copyright (c) 2020-2021, Manfred Moitzi
 #  License: MIT License
 
 import pytest
-from ezdxf.render.linetypes import LineTypeRenderer
+import random
+from array import array
+from ezdxf.math import Vec3
+from ezdxf.render.linetypes import (
+    LineTypeRenderer,
+    dash_segments,
+    DenseLineTypeError,
+)
 
 
 def test_line_type_solid():
@@ -41,5 +48,84 @@ def test_dash_dot_2x_render_issue():
     assert last_segment[0].isclose(last_segment[1])
 
 
+def flat(vertices):
+    return array("d", [c for v in vertices for c in Vec3(v)])
+
+
+def as_vec3_segments(data):
+    it = iter(data)
+    return [
+        (Vec3(x0, y0, z0), Vec3(x1, y1, z1))
+        for x0, y0, z0, x1, y1, z1 in zip(it, it, it, it, it, it)
+    ]
+
+
+class TestDashSegments:
+    def test_less_than_two_vertices(self):
+        assert len(dash_segments(flat([]), (1, 1))) == 0
+        assert len(dash_segments(flat([(0, 0)]), (1, 1))) == 0
+
+    def test_solid_line_returns_polyline_segments(self):
+        vertices = flat([(0, 0), (2, 0), (2, 3)])
+        result = as_vec3_segments(dash_segments(vertices, ()))
+        assert result == [
+            (Vec3(0, 0), Vec3(2, 0)),
+            (Vec3(2, 0), Vec3(2, 3)),
+        ]
+
+    def test_dashed_line(self):
+        vertices = flat([(0, 0), (4, 0)])
+        result = as_vec3_segments(dash_segments(vertices, (1, 1)))
+        assert result == [
+            (Vec3(0, 0), Vec3(1, 0)),
+            (Vec3(2, 0), Vec3(3, 0)),
+        ]
+
+    def test_dash_is_split_at_polyline_vertices(self):
+        vertices = flat([(0, 0), (1, 0), (1, 2)])
+        result = as_vec3_segments(dash_segments(vertices, (1.5, 1)))
+        assert result == [
+            (Vec3(0, 0), Vec3(1, 0)),
+            (Vec3(1, 0), Vec3(1, 0.5)),
+            (Vec3(1, 1.5), Vec3(1, 2)),
+        ]
+
+    def test_zero_length_segments_are_skipped(self):
+        vertices = flat([(0, 0), (1, 0), (1, 0), (4, 0)])
+        result = as_vec3_segments(dash_segments(vertices, (1, 1)))
+        assert result == [
+            (Vec3(0, 0), Vec3(1, 0)),
+            (Vec3(2, 0), Vec3(3, 0)),
+        ]
+
+    def test_3d_polyline(self):
+        vertices = flat([(0, 0, 0), (0, 0, 3)])
+        result = as_vec3_segments(dash_segments(vertices, (1, 1)))
+        assert result == [
+            (Vec3(0, 0, 0), Vec3(0, 0, 1)),
+            (Vec3(0, 0, 2), Vec3(0, 0, 3)),
+        ]
+
+    def test_same_result_as_line_type_renderer(self):
+        random.seed(1)
+        vertices = [
+            Vec3(random.uniform(0, 10), random.uniform(0, 10))
+            for _ in range(50)
+        ]
+        dashes = (2.0, 0.2, 0.1, 0.2)
+        expected = list(LineTypeRenderer(dashes).line_segments(vertices))
+        result = as_vec3_segments(dash_segments(flat(vertices), dashes))
+        assert len(result) == len(expected)
+        for (s0, e0), (s1, e1) in zip(result, expected):
+            assert s0.isclose(s1)
+            assert e0.isclose(e1)
+
+    def test_dash_budget(self):
+        vertices = flat([(0, 0), (100, 0)])
+        assert len(dash_segments(vertices, (1, 1), max_dashes=51)) == 50 * 6
+        with pytest.raises(DenseLineTypeError):
+            dash_segments(vertices, (1, 1), max_dashes=50)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,198 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+import pytest
+import math
+import ezdxf
+from ezdxf.math import Vec2, Vec3, OCS
+from ezdxf.entities.pattern import PatternLine
+from ezdxf.path import from_vertices
+from ezdxf.render.hatching import (
+    hatch_line_segments,
+    hatch_entity,
+    DenseHatchingLinesError,
+)
+
+
+def segments(data):
+    it = iter(data)
+    return [
+        (Vec2(x0, y0), Vec2(x1, y1)) for x0, y0, x1, y1 in zip(it, it, it, it)
+    ]
+
+
+@pytest.fixture
+def square():
+    return from_vertices([(0, 0), (10, 0), (10, 10), (0, 10)], close=True)
+
+
+@pytest.fixture
+def hole():
+    return from_vertices([(4, 4), (6, 4), (6, 6), (4, 6)], close=True)
+
+
+def horizontal_line(dashes=tuple(), shift=0.0):
+    return PatternLine(0, Vec2(0, 0.5), Vec2(shift, 1), list(dashes))
+
+
+def test_no_boundary_paths_returns_empty_array():
+    assert len(hatch_line_segments([horizontal_line()], [])) == 0
+
+
+def test_continuous_lines(square):
+    result = segments(hatch_line_segments([horizontal_line()], [square]))
+    assert len(result) == 10
+    assert result[0] == (Vec2(0, 0.5), Vec2(10, 0.5))
+    assert result[-1] == (Vec2(0, 9.5), Vec2(10, 9.5))
+
+
+def test_even_odd_clipping_of_holes(square, hole):
+    result = segments(hatch_line_segments([horizontal_line()], [square, hole]))
+    assert len(result) == 12
+    assert (Vec2(0, 4.5), Vec2(4, 4.5)) in result
+    assert (Vec2(6, 4.5), Vec2(10, 4.5)) in result
+
+
+def test_sub_paths_are_separated_polygons(square, hole):
+    multi_path = square.clone()
+    multi_path.extend_multi_path(hole)
+    assert multi_path.has_sub_paths is True
+    assert hatch_line_segments(
+        [horizontal_line()], [multi_path]
+    ) == hatch_line_segments([horizontal_line()], [square, hole])
+
+
+def test_dashes_and_dots(square):
+    line = horizontal_line(dashes=[1, -1, 0, -1])
+    result = segments(hatch_line_segments([line], [square]))
+    first_row = [s for s in result if math.isclose(s[0].y, 0.5)]
+    assert first_row == [
+        (Vec2(0, 0.5), Vec2(1, 0.5)),
+        (Vec2(2, 0.5), Vec2(2, 0.5)),  # dot
+        (Vec2(3, 0.5), Vec2(4, 0.5)),
+        (Vec2(5, 0.5), Vec2(5, 0.5)),  # dot
+        (Vec2(6, 0.5), Vec2(7, 0.5)),
+        (Vec2(8, 0.5), Vec2(8, 0.5)),  # dot
+        (Vec2(9, 0.5), Vec2(10, 0.5)),
+    ]
+
+
+def test_dash_pattern_is_shifted_from_line_to_line(square):
+    line = horizontal_line(dashes=[1, -1], shift=0.5)
+    result = segments(hatch_line_segments([line], [square]))
+    second_row = [s for s in result if math.isclose(s[0].y, 1.5)]
+    assert second_row[0] == (Vec2(0.5, 1.5), Vec2(1.5, 1.5))
+    assert second_row[1] == (Vec2(2.5, 1.5), Vec2(3.5, 1.5))
+
+
+def test_dashes_are_clipped_at_the_boundary(square):
+    line = horizontal_line(dashes=[3, -1])
+    result = segments(hatch_line_segments([line], [square]))
+    first_row = [s for s in result if math.isclose(s[0].y, 0.5)]
+    assert first_row[-1] == (Vec2(8, 0.5), Vec2(10, 0.5))
+
+
+def test_pattern_without_dashes_creates_no_lines(square):
+    line = horizontal_line(dashes=[-1])
+    assert len(hatch_line_segments([line], [square])) == 0
+
+
+def test_coincident_hatch_lines_are_ignored(square):
+    line = PatternLine(0, Vec2(0, 0), Vec2(1, 0), [])
+    assert len(hatch_line_segments([line], [square])) == 0
+
+
+@pytest.mark.parametrize("angle", [30, 45, 90, 135, 210])
+def test_rotated_lines_inside_boundary(square, angle):
+    offset = Vec2.from_deg_angle(angle + 90, 0.7)
+    line = PatternLine(angle, Vec2(1, 1), offset, [])
+    result = segments(hatch_line_segments([line], [square]))
+    assert len(result) > 0
+    direction = Vec2.from_deg_angle(angle)
+    for start, end in result:
+        for v in (start, end):
+            assert -1e-9 <= v.x <= 10 + 1e-9
+            assert -1e-9 <= v.y <= 10 + 1e-9
+        assert abs((end - start).normalize().det(direction)) < 1e-9
+
+
+def test_pattern_lines_with_same_angle(square):
+    lines = [horizontal_line(), PatternLine(0, Vec2(0, 0.25), Vec2(0, 1), [])]
+    assert len(segments(hatch_line_segments(lines, [square]))) == 20
+
+
+def test_segment_budget(square):
+    line = horizontal_line()
+    assert len(hatch_line_segments([line], [square], max_segments=10)) == 40
+    with pytest.raises(DenseHatchingLinesError):
+        hatch_line_segments([line], [square], max_segments=9)
+
+
+def test_segment_budget_of_dense_dashes(square):
+    line = horizontal_line(dashes=[0.001, -0.001])
+    with pytest.raises(DenseHatchingLinesError):
+        hatch_line_segments([line], [square], max_segments=1000)
+
+
+@pytest.fixture
+def hatch():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    hatch = msp.add_hatch()
+    hatch.dxf.layer = "PATTERN"
+    hatch.set_pattern_fill("ANSI31", color=1, scale=0.5)
+    hatch.paths.add_polyline_path([(0, 0), (10, 0), (10, 10), (0, 10)])
+    return hatch
+
+
+def test_hatch_entity_solid_fill_has_no_lines(hatch):
+    hatch.set_solid_fill()
+    assert hatch_entity(hatch) == []
+
+
+def test_hatch_entity_in_wcs(hatch):
+    hatch.dxf.elevation = (0, 0, 2)
+    hatch.dxf.extrusion = (0, 0, -1)
+    lines = hatch_entity(hatch)
+    assert len(lines) > 0
+    ocs = OCS((0, 0, -1))
+    for start, end in lines:
+        assert isinstance(start, Vec3)
+        assert start.z == pytest.approx(-2)
+        x, y, z = ocs.from_wcs(end)
+        assert -1e-9 <= x <= 10 + 1e-9
+        assert -1e-9 <= y <= 10 + 1e-9
+
+
+def test_hatch_virtual_entities(hatch):
+    lines = list(hatch.virtual_entities())
+    assert len(lines) == len(hatch_entity(hatch))
+    line = lines[0]
+    assert line.dxftype() == "LINE"
+    assert line.dxf.layer == "PATTERN"
+    assert line.dxf.color == 1
+    assert line.dxf.linetype == "CONTINUOUS"
+    assert line.source_of_copy is hatch
+
+
+def test_hatch_virtual_entities_segment_budget(hatch):
+    with pytest.raises(DenseHatchingLinesError):
+        list(hatch.virtual_entities(max_segments=3))
+
+
+def test_explode_hatch(hatch):
+    msp = hatch.get_layout()
+    count = len(list(hatch.virtual_entities()))
+    lines = hatch.explode()
+    assert len(lines) == count
+    assert hatch.is_alive is False
+    assert len(msp.query("LINE")) == count
+
+
+def test_can_not_explode_solid_filled_hatch(hatch):
+    hatch.set_solid_fill()
+    with pytest.raises(ezdxf.DXFTypeError):
+        hatch.explode()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -6,6 +6,7 @@ import ezdxf
 from ezdxf.addons.drawing import Frontend, RenderContext, Properties
 from ezdxf.addons.drawing.backend import Backend, BackendScaler
 from ezdxf.addons.drawing.debug_backend import BasicBackend, PathBackend
+from ezdxf.addons.drawing.config import Configuration, HatchPolicy
 from ezdxf.document import Drawing
 from ezdxf.entities import DXFGraphic
 from ezdxf.render.forms import cube
@@ -307,6 +308,43 @@ def test_hatch(msp, path_backend):
     assert result[0][0] == "filled_polygon"  # default implementation
 
 
+@pytest.fixture
+def pattern_lines_frontend(ctx):
+    config = Configuration.defaults().with_changes(
+        hatch_policy=HatchPolicy.SHOW_PATTERN_LINES
+    )
+    return Frontend(ctx, PathBackend(), config=config)
+
+
+def add_pattern_hatch(msp):
+    hatch = msp.add_hatch()
+    hatch.set_pattern_fill("LINES", definition=[[0, (0, 0.5), (0, 1), []]])
+    hatch.paths.add_polyline_path([(0, 0), (10, 0), (10, 10), (0, 10)])
+    return hatch
+
+
+def test_hatch_pattern_lines(msp, pattern_lines_frontend):
+    add_pattern_hatch(msp)
+    pattern_lines_frontend.draw_entities(msp)
+    result = pattern_lines_frontend.out.collector
+    assert len(result) == 10
+    assert unique_types(result) == {"line"}
+    assert result[0][1:3] == (Vec3(0, 0.5), Vec3(10, 0.5))
+
+
+def test_hatch_pattern_lines_exceeding_the_budget(msp, ctx):
+    add_pattern_hatch(msp)
+    config = Configuration.defaults().with_changes(
+        hatch_policy=HatchPolicy.SHOW_PATTERN_LINES,
+        max_hatch_pattern_segments=9,
+    )
+    frontend = Frontend(ctx, PathBackend(), config=config)
+    frontend.draw_entities(msp)
+    result = frontend.out.collector
+    assert len(result) == 1
+    assert result[0][0] == "filled_polygon"
+
+
 def test_basic_spline(msp, basic):
     msp.add_spline(fit_points=[(0, 0), (3, 2), (4, 5), (6, 4), (12, 0)])
     basic.draw_entities(msp)
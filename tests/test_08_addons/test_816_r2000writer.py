@@ -0,0 +1,132 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import io
+import pytest
+import ezdxf
+from ezdxf.addons.r2000writer import r2000writer, R2000FastStreamWriter
+from ezdxf.lldxf.const import DXFVersionError, DXFTypeError
+
+
+@pytest.fixture
+def doc():
+    doc = ezdxf.new("R2013")
+    doc.layers.new("LAYER1")
+    doc.blocks.new("BLK").add_attdef("TAG", (0, 0))
+    return doc
+
+
+def stream_write(doc, func):
+    stream = io.StringIO()
+    with r2000writer(stream, doc) as writer:
+        func(writer)
+    stream.seek(0)
+    return ezdxf.read(stream)
+
+
+def test_r12_is_not_supported():
+    with pytest.raises(DXFVersionError):
+        R2000FastStreamWriter(io.StringIO(), ezdxf.new("R12"))
+
+
+def test_write_empty_document():
+    doc = stream_write(None, lambda writer: None)
+    assert doc.dxfversion == "AC1027"
+    assert len(doc.modelspace()) == 0
+    assert doc.header["$HANDSEED"] == "FFFFFFFFFFFF"
+
+
+def test_write_basic_entities(doc):
+    def write(w):
+        w.add_line((0, 0), (1, 0), dxfattribs={"layer": "LAYER1"})
+        w.add_circle((0, 0), radius=2)
+        w.add_text("TEXT")
+
+    doc = stream_write(doc, write)
+    msp = doc.modelspace()
+    assert [e.dxftype() for e in msp] == ["LINE", "CIRCLE", "TEXT"]
+    assert msp[0].dxf.layer == "LAYER1"
+    assert msp[1].dxf.radius == 2
+    assert msp[2].dxf.text == "TEXT"
+
+
+def test_modify_last_added_entity(doc):
+    def write(w):
+        hatch = w.add_hatch()
+        hatch.paths.add_polyline_path([(0, 0), (1, 0), (1, 1)])
+
+    hatch = stream_write(doc, write).modelspace()[0]
+    assert hatch.dxftype() == "HATCH"
+    assert len(hatch.paths) == 1
+
+
+def test_write_linked_entities(doc):
+    def write(w):
+        w.add_polyline3d([(0, 0, 0), (1, 0, 1), (1, 1, 2)])
+        w.add_blockref("BLK", (0, 0)).add_attrib("TAG", "VALUE")
+
+    msp = stream_write(doc, write).modelspace()
+    polyline, insert = msp
+    assert len(polyline.vertices) == 3
+    assert polyline.vertices[2].dxf.location == (1, 1, 2)
+    assert insert.get_attrib_text("TAG") == "VALUE"
+
+
+def test_unique_handles(doc):
+    def write(w):
+        w.add_lwpolyline([(0, 0), (1, 0)])
+        w.add_polyline2d([(0, 0), (1, 0)])
+        w.add_mtext("MTEXT")
+
+    doc = stream_write(doc, write)
+    handles = [e.dxf.handle for e in doc.entitydb.values()]
+    assert len(handles) == len(set(handles))
+    auditor = doc.audit()
+    assert len(auditor.errors) == 0
+    assert len(auditor.fixes) == 0
+
+
+def test_existing_modelspace_entities_of_template(doc):
+    doc.modelspace().add_point((0, 0))
+    msp = stream_write(doc, lambda w: w.add_point((1, 0))).modelspace()
+    assert [p.dxf.location.x for p in msp] == [0, 1]
+
+
+def test_add_virtual_entity(doc):
+    line = ezdxf.new().modelspace().add_line((0, 0), (1, 0)).copy()
+    msp = stream_write(doc, lambda w: w.add_entity(line)).modelspace()
+    assert msp[0].dxf.end == (1, 0)
+
+
+def test_write_binary_dxf(doc, tmp_path):
+    filename = tmp_path / "r2000writer.dxf"
+    with r2000writer(filename, doc, fmt="bin") as writer:
+        writer.add_lwpolyline([(0, 0), (1, 0)])
+    msp = ezdxf.readfile(filename).modelspace()
+    assert len(msp[0]) == 2
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        lambda w: w.add_linear_dim((0, 1), (0, 0), (1, 0)),
+        lambda w: w.add_auto_blockref("BLK", (0, 0), {}),
+    ],
+)
+def test_unsupported_entities(doc, func):
+    with pytest.raises(DXFTypeError):
+        func(R2000FastStreamWriter(io.StringIO(), doc))
+
+
+def test_closed_writer_does_not_accept_entities(doc):
+    writer = R2000FastStreamWriter(io.StringIO(), doc)
+    writer.close()
+    with pytest.raises(IOError):
+        writer.add_line((0, 0), (1, 0))
+
+
+def test_write_to_file(doc, tmp_path):
+    filename = tmp_path / "r2000writer.dxf"
+    with r2000writer(filename, doc) as writer:
+        writer.add_mtext("äöü")
+    doc = ezdxf.readfile(filename)
+    assert doc.modelspace()[0].text == "äöü"
@@ -0,0 +1,99 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import pickle
+import pytest
+import ezdxf
+from ezdxf.addons.drawing import Frontend, RenderContext
+from ezdxf.addons.drawing.parallel import ParallelFrontend, _dumps, _loads
+from ezdxf.addons.drawing.debug_backend import PathBackend
+
+
+@pytest.fixture(scope="module")
+def doc():
+    doc = ezdxf.new()
+    blk = doc.blocks.new("BLK")
+    blk.add_circle((0, 0), 1)
+    blk.add_line((0, 0), (1, 1), dxfattribs={"color": 0})
+    doc.blocks.new("TXT").add_text("BLOCK")
+    msp = doc.modelspace()
+    for i in range(20):
+        msp.add_lwpolyline([(i, 0), (i, 1), (i + 1, 1)], dxfattribs={"color": i})
+        msp.add_blockref("BLK", (i, 2), dxfattribs={"color": 1})
+        msp.add_mpolygon().paths.add_polyline_path(
+            [(i, 0), (i + 1, 0), (i + 1, 1)]
+        )
+        if i % 5 == 0:
+            msp.add_text(f"TEXT{i}")
+            msp.add_blockref("TXT", (i, 3))
+    return doc
+
+
+def draw(doc, frontend_class, **kwargs):
+    backend = PathBackend()
+    frontend_class(RenderContext(doc), backend, **kwargs).draw_layout(
+        doc.modelspace()
+    )
+    return backend.collector
+
+
+def normalize(commands):
+    result = []
+    for name, *args in commands:
+        data = [name]
+        for arg in args:
+            if hasattr(arg, "control_vertices"):  # Path()
+                data.append(list(arg.control_vertices()))
+            elif hasattr(arg, "color"):  # Properties()
+                data.append((arg.color, arg.layer, arg.lineweight))
+            elif hasattr(arg, "rows"):  # Matrix44()
+                data.append(list(arg))
+            else:
+                data.append(arg)
+        result.append(data)
+    return result
+
+
+def test_parallel_drawing_is_equal_to_sequential_drawing(doc):
+    expected = draw(doc, Frontend)
+    result = draw(doc, ParallelFrontend, max_workers=2, chunk_size=10)
+    assert len(expected) > 80
+    assert normalize(result) == normalize(expected)
+
+
+def test_backend_gets_database_entities(doc):
+    class Backend(PathBackend):
+        def enter_entity(self, entity, properties):
+            super().enter_entity(entity, properties)
+            entities.append(entity)
+
+    entities = []
+    ParallelFrontend(
+        RenderContext(doc), Backend(), max_workers=2, chunk_size=10
+    ).draw_layout(doc.modelspace())
+    assert entities[0] is doc.modelspace()[0]
+    assert all(e.doc is doc for e in entities)
+
+
+def test_small_layouts_are_drawn_by_the_main_process(doc):
+    frontend = ParallelFrontend(RenderContext(doc), PathBackend())
+    assert len(frontend._chunks(list(doc.modelspace()))) == 1
+
+
+def test_transfer_entity_references(doc):
+    line = doc.modelspace().add_line((0, 0), (1, 0))
+    virtual_line = line.copy()
+    data = _dumps([line, virtual_line, doc], doc)
+    line2, virtual_line2, doc2 = _loads(data, doc)
+    assert line2 is line
+    assert doc2 is doc
+    assert virtual_line2 is not virtual_line
+    assert virtual_line2.dxf.end == (1, 0)
+    doc.modelspace().delete_entity(line)
+
+
+def test_pickle_document(doc):
+    doc2 = pickle.loads(pickle.dumps(doc))
+    msp = doc2.modelspace()
+    assert len(msp) == len(doc.modelspace())
+    assert msp[0].doc is doc2
+    assert msp[0].dxf.color == 0
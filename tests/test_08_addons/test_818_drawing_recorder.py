@@ -0,0 +1,103 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.addons.drawing import Frontend, RenderContext
+from ezdxf.addons.drawing.recorder import Recorder, RecordedEntity
+from ezdxf.addons.drawing.debug_backend import BasicBackend, PathBackend
+from ezdxf.math import Matrix44
+
+
+@pytest.fixture(scope="module")
+def doc():
+    doc = ezdxf.new()
+    doc.layers.new("LAYER1")
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), dxfattribs={"layer": "LAYER1"})
+    msp.add_circle((0, 0), radius=1)
+    msp.add_point((2, 0), dxfattribs={"layer": "Layer1"})
+    msp.add_text("TEXT", dxfattribs={"layer": "LAYER1"})
+    hatch = msp.add_hatch(color=2)
+    hatch.paths.add_polyline_path([(0, 0), (1, 0), (1, 1)])
+    return doc
+
+
+def record(doc, measurement_backend=None) -> Recorder:
+    recorder = Recorder(measurement_backend)
+    Frontend(RenderContext(doc), recorder).draw_layout(doc.modelspace())
+    return recorder
+
+
+def names(commands):
+    return [command[0] for command in commands]
+
+
+def test_replay_is_equal_to_direct_drawing(doc):
+    expected = BasicBackend()
+    Frontend(RenderContext(doc), expected).draw_layout(doc.modelspace())
+    backend = BasicBackend()
+    record(doc, BasicBackend()).replay(backend)
+    assert names(backend.collector) == names(expected.collector)
+    assert backend.collector[1][1] == expected.collector[1][1]
+
+
+def test_record_text_without_measurement_backend(doc):
+    recorder = record(doc)
+    assert "draw_text" in names(recorder.commands)
+
+
+def test_replay_multiple_times(doc):
+    recorder = record(doc)
+    b1 = PathBackend()
+    b2 = PathBackend()
+    recorder.replay(b1)
+    recorder.replay(b2)
+    assert len(b1.collector) == len(b2.collector) > 0
+
+
+def test_replay_with_transformation(doc):
+    recorder = record(doc, BasicBackend())
+    backend = BasicBackend()
+    recorder.replay(backend, transform=Matrix44.translate(10, 0, 0))
+    line = backend.collector[0]
+    assert line[0] == "line"
+    assert line[1].isclose((10, 0))
+    assert line[2].isclose((11, 0))
+    point = [c for c in backend.collector if c[0] == "point"][0]
+    assert point[1].isclose((12, 0))
+
+
+def test_replay_with_layer_filter(doc):
+    recorder = record(doc, BasicBackend())
+    backend = BasicBackend()
+    recorder.replay(backend, layers=["layer1"])
+    collector = [c for c in backend.collector if c[0] != "bgcolor"]
+    assert set(names(collector)) == {"line", "point", "text"}
+    assert all(c[-1].layer.upper() == "LAYER1" for c in collector)
+
+
+def test_unchanged_properties_share_snapshots(doc):
+    commands = record(doc).commands
+    enter_entity, draw = commands[1:3]
+    assert enter_entity[0] == "enter_entity"
+    assert enter_entity[2] is draw[-1]
+
+
+def test_dumps_and_loads_with_document(doc):
+    data = record(doc).dumps()
+    recorder = Recorder.loads(data, doc)
+    assert recorder.commands[1][1] is doc.modelspace()[0]
+    backend = PathBackend()
+    recorder.replay(backend)
+    assert len(backend.collector) > 0
+
+
+def test_dumps_and_loads_without_document(doc):
+    recorder = Recorder.loads(record(doc).dumps())
+    entity = recorder.commands[1][1]
+    assert isinstance(entity, RecordedEntity)
+    assert entity.dxftype() == "LINE"
+    assert entity.handle == doc.modelspace()[0].dxf.handle
+    backend = BasicBackend()
+    recorder.replay(backend)
+    assert "text" in names(backend.collector)
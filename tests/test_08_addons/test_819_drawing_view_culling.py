@@ -0,0 +1,117 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.addons.drawing import Frontend, RenderContext
+from ezdxf.addons.drawing.config import Configuration
+from ezdxf.addons.drawing.culling import ViewCulling
+from ezdxf.addons.drawing.debug_backend import PathBackend
+from ezdxf.addons.drawing.parallel import ParallelFrontend
+
+
+@pytest.fixture(scope="module")
+def doc():
+    doc = ezdxf.new()
+    blk = doc.blocks.new("BLK")
+    blk.add_circle((0, 0), radius=1)
+    blk.add_line((-1, 0), (1, 0))
+    msp = doc.modelspace()
+    for x in range(10):
+        msp.add_line((x * 10, 0), (x * 10 + 5, 0))
+        msp.add_blockref("BLK", (x * 10, 10))
+    msp.add_circle((0, 20), radius=0.01)
+    return doc
+
+
+def draw(doc, frontend_class=Frontend, **kwargs):
+    backend = PathBackend()
+    config = Configuration.defaults().with_changes(**kwargs)
+    frontend_class(RenderContext(doc), backend, config).draw_layout(
+        doc.modelspace()
+    )
+    return [c for c in backend.collector if c[0] != "bgcolor"]
+
+
+def names(commands):
+    return [command[0] for command in commands]
+
+
+def test_default_configuration_draws_everything(doc):
+    assert names(draw(doc)).count("line") == 20
+
+
+def test_view_window_culls_entities(doc):
+    commands = draw(doc, view_window=(-1, -1, 16, 11))
+    assert names(commands) == ["line", "path", "line", "line", "path", "line"]
+
+
+def test_block_references_are_culled_by_block_extents(doc):
+    # only the first block reference intersects the view window, the block
+    # content is not culled:
+    commands = draw(doc, view_window=(0.5, 10.5, 2, 12))
+    assert names(commands) == ["path", "line"]
+
+
+def test_view_culling_does_not_create_a_spatial_index(doc):
+    draw(doc, view_window=(-1, -1, 16, 11), pixel_size=0.1)
+    assert doc.modelspace().block_record.spatial_index is None
+    assert doc.has_spatial_index is False
+
+
+def test_view_culling_uses_an_existing_spatial_index():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for x in range(10):
+        msp.add_line((x * 10, 0), (x * 10 + 5, 0))
+    msp.spatial_index()
+    assert names(draw(doc, view_window=(-1, -1, 16, 11))) == ["line", "line"]
+
+
+def test_subpixel_entities_are_drawn_as_points(doc):
+    commands = draw(doc, pixel_size=0.1)
+    assert names(commands).count("point") == 1
+    assert commands[-1][1].isclose((0, 20))
+    assert names(draw(doc, pixel_size=100)).count("point") == 21
+
+
+def test_pixel_size_sets_max_flattening_distance(doc):
+    config = Configuration.defaults().with_changes(pixel_size=1)
+    frontend = Frontend(RenderContext(doc), PathBackend(), config)
+    assert frontend.config.max_flattening_distance == 0.5
+
+
+def test_block_extents_are_cached(doc):
+    config = Configuration.defaults().with_changes(view_window=(0, 0, 1, 1))
+    culling = ViewCulling(config)
+    inserts = doc.modelspace().query("INSERT")
+    box = culling.bbox(inserts[0])
+    assert box.extmin.isclose((-1, 9))
+    assert box.extmax.isclose((1, 11))
+    assert culling.bbox(inserts[1]).extmin.isclose((9, 9))
+    assert len(culling._cache._block_hulls) == 1
+
+
+def test_parallel_frontend_supports_view_culling(doc):
+    expected = draw(doc, view_window=(-1, -1, 16, 11))
+    result = draw(
+        doc,
+        lambda ctx, out, config: ParallelFrontend(
+            ctx, out, config, max_workers=2, chunk_size=5
+        ),
+        view_window=(-1, -1, 16, 11),
+    )
+    assert names(result) == names(expected)
+
+
+def test_bounding_boxes_without_spatial_index():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    culling = ViewCulling(Configuration.defaults())
+    circle = msp.add_circle((1, 2), radius=1)
+    assert culling.bbox(circle).extmin.isclose((0, 1))
+    lwpolyline = msp.add_lwpolyline([(0, 0), (2, 1), (1, 3)])
+    assert culling.bbox(lwpolyline).extmax.isclose((2, 3))
+    # fallback to the control vertices for arc segments:
+    lwpolyline = msp.add_lwpolyline([(0, 0, 1), (2, 0)], format="xyb")
+    box = culling.bbox(lwpolyline)
+    assert box.extmin.y < -0.5 and box.extmax.isclose((2, 0))
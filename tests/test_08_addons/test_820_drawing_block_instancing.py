@@ -0,0 +1,140 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import math
+import pytest
+import ezdxf
+from ezdxf.addons.drawing import Frontend, RenderContext
+from ezdxf.addons.drawing.config import Configuration
+from ezdxf.addons.drawing.debug_backend import PathBackend
+from ezdxf.addons.drawing.frontend import is_instanceable
+from ezdxf.math import BoundingBox, Matrix44, Vec3
+
+
+@pytest.fixture(scope="module")
+def doc():
+    doc = ezdxf.new()
+    doc.layers.new("RED", dxfattribs={"color": 1})
+    blk = doc.blocks.new("SYMBOL", base_point=(1, 1))
+    blk.add_line((0, 0), (2, 0), dxfattribs={"color": 0})  # BYBLOCK
+    blk.add_circle((1, 1), radius=1)
+    blk.add_lwpolyline([(0, 0, 0, 0, 1), (2, 2)], format="xyseb")
+    blk.add_text("TEXT", dxfattribs={"height": 0.5})
+    blk.add_attdef("TAG", (0, 3))
+    nested = doc.blocks.new("NESTED")
+    nested.add_blockref("SYMBOL", (5, 5), dxfattribs={"rotation": 10})
+    msp = doc.modelspace()
+    msp.add_blockref("SYMBOL", (0, 0))
+    msp.add_blockref(
+        "SYMBOL", (10, 0), dxfattribs={"rotation": 30, "color": 3}
+    )
+    msp.add_blockref(
+        "SYMBOL",
+        (20, 0),
+        dxfattribs={
+            "xscale": 2,
+            "yscale": 2,
+            "zscale": 2,
+            "layer": "RED",
+        },
+    ).add_attrib("TAG", "VALUE", (20, 6))
+    msp.add_blockref("SYMBOL", (30, 0), dxfattribs={"xscale": -1})
+    msp.add_blockref("NESTED", (40, 0), dxfattribs={"rotation": 45})
+    msp.add_blockref("SYMBOL", (0, 20)).grid(size=(2, 2), spacing=(10, 10))
+    return doc
+
+
+class TextBackend(PathBackend):
+    def draw_text(self, text, transform, properties, cap_height):
+        self.collector.append(
+            ("text", text, transform, properties, cap_height)
+        )
+
+
+def draw(doc, block_instancing: bool):
+    backend = TextBackend()
+    config = Configuration.defaults().with_changes(
+        block_instancing=block_instancing
+    )
+    Frontend(RenderContext(doc), backend, config).draw_layout(doc.modelspace())
+    return backend.collector
+
+
+def normalize(commands):
+    result = []
+    for name, *args in commands:
+        if name == "text":
+            # The cap height can be a part of the text transformation:
+            text, m, properties, cap_height = args
+            args = [text, Matrix44.scale(cap_height) * m, properties]
+        data = [name]
+        for arg in args:
+            if hasattr(arg, "control_vertices"):  # Path()
+                # The start point of transformed circles can be different:
+                box = BoundingBox(arg.flattening(0.0001))
+                data.extend([box.extmin, box.extmax])
+            elif hasattr(arg, "color"):  # Properties()
+                data.append((arg.color, arg.layer, arg.lineweight))
+            elif hasattr(arg, "rows"):  # Matrix44()
+                data.extend(arg)
+            else:
+                data.append(arg)
+        result.append(data)
+    return result
+
+
+def test_block_instancing_is_equal_to_virtual_entities(doc):
+    expected = normalize(draw(doc, block_instancing=False))
+    result = normalize(draw(doc, block_instancing=True))
+    assert len(result) == len(expected)
+    for r, e in zip(result, expected):
+        assert len(r) == len(e)
+        for a, b in zip(r, e):
+            if isinstance(a, (Vec3, float)):
+                assert isclose(a, b, abs_tol=1e-3)
+            else:
+                assert a == b
+
+
+def isclose(a, b, abs_tol):
+    if isinstance(a, Vec3):
+        return a.isclose(b, abs_tol=abs_tol)
+    return math.isclose(a, b, abs_tol=abs_tol)
+
+
+def test_block_content_is_recorded_once_for_same_properties(doc):
+    config = Configuration.defaults().with_changes(block_instancing=True)
+    frontend = Frontend(RenderContext(doc), PathBackend(), config)
+    frontend.draw_layout(doc.modelspace())
+    # SYMBOL: default, color 3, layer RED and NESTED, the nested SYMBOL
+    # reference has the default properties:
+    assert len(frontend._block_instances) == 4
+
+
+def test_backend_gets_block_definition_entities(doc):
+    class Backend(PathBackend):
+        def enter_entity(self, entity, properties):
+            super().enter_entity(entity, properties)
+            entities.append(entity)
+
+    entities = []
+    config = Configuration.defaults().with_changes(block_instancing=True)
+    Frontend(RenderContext(doc), Backend(), config).draw_layout(
+        doc.modelspace()
+    )
+    block = doc.blocks.get("SYMBOL")
+    assert entities[1] is block[0]
+
+
+@pytest.mark.parametrize(
+    "dxfattribs, expected",
+    [
+        ({}, True),
+        ({"xscale": 2, "yscale": 2, "zscale": 2, "rotation": 30}, True),
+        ({"xscale": 2}, False),
+        ({"xscale": -1, "yscale": -1, "zscale": -1}, False),
+        ({"extrusion": (0, 0, -1)}, False),
+    ],
+)
+def test_is_instanceable(dxfattribs, expected):
+    insert = ezdxf.new().modelspace().add_blockref("TEST", (0, 0), dxfattribs)
+    assert is_instanceable(insert) is expected
@@ -0,0 +1,73 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import pytest
+from ezdxf.addons import iterdxf
+
+
+def entity_data(entity):
+    data = [entity.dxftype(), entity.dxf.handle, entity.dxf.layer]
+    if entity.dxftype() == "POLYLINE":
+        data.append(len(entity.vertices))
+    elif entity.dxftype() == "INSERT":
+        data.append([attrib.dxf.text for attrib in entity.attribs])
+    return tuple(data)
+
+
+def add_test_entities(doc):
+    msp = doc.modelspace()
+    for x in range(100):
+        msp.add_line((x, 0), (x, 1), dxfattribs={"layer": f"L{x % 3}"})
+        msp.add_polyline3d([(x, 0, 0), (x, 0, 1), (x, 1, 2)])
+        msp.add_blockref("BLK", (x, 0)).add_attrib("TAG", f"V{x}")
+        msp.add_circle((x, 0), 1)
+
+
+def test_chunks_do_not_separate_linked_entities(dxf):
+    doc = iterdxf.opendxf(dxf)
+    chunks = doc.chunks(size=100)
+    doc.close()
+    assert len(chunks) > 100
+    with open(dxf, "rb") as fp:
+        data = fp.read()
+    for start, end in chunks:
+        assert data[start:end].lstrip().startswith(b"0")
+        dxftype = data[start:end].split(b"\n", 2)[1].strip()
+        assert dxftype not in (b"VERTEX", b"SEQEND", b"ATTRIB")
+    # consecutive chunks:
+    for (_, end), (start, _) in zip(chunks, chunks[1:]):
+        assert end == start
+
+
+def test_default_chunk_size_creates_one_chunk_for_small_files(dxf):
+    doc = iterdxf.opendxf(dxf)
+    assert len(doc.chunks(count=4)) == 1
+    doc.close()
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1000])
+def test_results_are_equal_to_sequential_iteration(dxf, chunk_size):
+    doc = iterdxf.opendxf(dxf)
+    expected = [entity_data(e) for e in doc.modelspace()]
+    result = list(
+        doc.parallel_modelspace(
+            entity_data, max_workers=2, chunk_size=chunk_size
+        )
+    )
+    doc.close()
+    assert len(expected) == 412
+    assert result == expected
+
+
+def test_type_filter(dxf):
+    doc = iterdxf.opendxf(dxf)
+    types = ["LINE", "INSERT"]
+    expected = [entity_data(e) for e in doc.modelspace(types)]
+    result = list(
+        doc.parallel_modelspace(
+            entity_data, types, max_workers=2, chunk_size=1000
+        )
+    )
+    doc.close()
+    assert result == expected
+    assert [data[0] for data in result].count("LINE") == 110
+    assert [data[0] for data in result].count("INSERT") == 101
@@ -0,0 +1,118 @@
+# Copyright (c) 2021, Manfred Moitzi
+# License: MIT License
+import os
+import shutil
+import pytest
+import ezdxf
+from ezdxf.addons import iterdxf
+from ezdxf.lldxf import fileindex
+
+
+def add_test_entities(doc):
+    for x, line in enumerate(doc.modelspace().query("LINE")):
+        line.dxf.layer = f"Layer{x % 2}"
+
+
+@pytest.fixture
+def dxf_copy(dxf, tmpdir):
+    # The tests modify the DXF file and create sidecar files:
+    filename = str(tmpdir.join("test.dxf"))
+    shutil.copy(dxf, filename)
+    return filename
+
+
+def test_entity_records_of_main_entities(dxf_copy):
+    doc = iterdxf.opendxf(dxf_copy)
+    records = doc.entity_records()
+    doc.close()
+    assert len(records) == 13
+    assert [r.dxftype for r in records[9:12]] == ["LINE", "POLYLINE", "INSERT"]
+    assert records[0].layer == "Layer0"
+    assert records[-1].paperspace == 1
+    # consecutive file ranges including the linked entities:
+    for r1, r2 in zip(records, records[1:]):
+        assert r1.end == r2.start
+
+
+def test_get_entity_by_handle(dxf_copy):
+    doc = iterdxf.opendxf(dxf_copy)
+    expected = list(doc.modelspace())
+    for entity in expected:
+        handle = entity.dxf.handle
+        result = doc.get(handle)
+        assert result.dxftype() == entity.dxftype()
+        assert result.dxf.handle == handle
+        if result.dxftype() == "POLYLINE":
+            assert len(result.vertices) == 3
+        elif result.dxftype() == "INSERT":
+            assert result.attribs[0].dxf.text == entity.attribs[0].dxf.text
+    assert doc.get("FFFFFF") is None
+    doc.close()
+
+
+def test_query_by_types_and_layers(dxf_copy):
+    doc = iterdxf.opendxf(dxf_copy)
+    assert len(list(doc.query())) == 12, "only modelspace entities"
+    lines = list(doc.query(["LINE"], ["LAYER1"]))
+    assert len(lines) == 5
+    assert all(e.dxf.layer == "Layer1" for e in lines)
+    inserts = list(doc.query(["INSERT"]))
+    assert [e.attribs[0].dxf.text for e in inserts] == ["VALUE"]
+    doc.close()
+
+
+def test_random_access_while_iterating_modelspace(dxf_copy):
+    doc = iterdxf.opendxf(dxf_copy)
+    handles = [e.dxf.handle for e in doc.query()]
+    count = 0
+    for entity, handle in zip(doc.modelspace(), handles):
+        assert entity.dxf.handle == handle
+        assert doc.get(handle).dxf.handle == handle
+        assert len(list(doc.query(["LINE"]))) == 10
+        count += 1
+    assert count == 12
+    doc.close()
+
+
+def test_sidecar_is_used_for_reopening(dxf_copy, monkeypatch):
+    doc = iterdxf.opendxf(dxf_copy, sidecar=True)
+    expected = doc.entity_records()
+    doc.close()
+    assert os.path.exists(doc.sidecar_name)
+
+    def scan_dxf_file(name):
+        raise AssertionError("DXF file should not be scanned")
+
+    monkeypatch.setattr(fileindex, "load", scan_dxf_file)
+    doc = iterdxf.opendxf(dxf_copy, sidecar=True)
+    assert doc.entity_records() == expected
+    assert len(list(doc.modelspace())) == 12
+    assert doc.get(expected[0].handle).dxftype() == "LINE"
+    doc.close()
+
+
+def test_outdated_sidecar_is_replaced(dxf_copy):
+    doc = iterdxf.opendxf(dxf_copy, sidecar=True)
+    doc.entity_records()
+    doc.close()
+    new_doc = ezdxf.readfile(dxf_copy)
+    new_doc.modelspace().add_circle((0, 0), 1)
+    new_doc.save()
+
+    doc = iterdxf.opendxf(dxf_copy, sidecar=True)
+    assert len(doc.entity_records()) == 14
+    doc.close()
+    doc = iterdxf.opendxf(dxf_copy, sidecar=True)
+    assert doc._columns is not None, "expected loaded sidecar"
+    assert len(doc.entity_records()) == 14
+    doc.close()
+
+
+def test_invalid_sidecar_is_ignored(dxf_copy):
+    doc = iterdxf.opendxf(dxf_copy)
+    with open(doc.sidecar_name, "wt") as fp:
+        fp.write("{invalid")
+    doc.close()
+    doc = iterdxf.opendxf(dxf_copy, sidecar=True)
+    assert len(list(doc.query())) == 12
+    doc.close()
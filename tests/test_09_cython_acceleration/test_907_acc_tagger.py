@@ -0,0 +1,134 @@
+#  Copyright (c) 2021, Manfred Moitzi
+#  License: MIT License
+
+import pytest
+
+pytest.importorskip("ezdxf.acc.tagger")
+
+from io import StringIO
+from ezdxf.lldxf import tagger as py_tagger
+from ezdxf.acc import tagger as cy_tagger
+from ezdxf.lldxf.const import DXFStructureError
+from ezdxf.lldxf.types import DXFVertex, DXFBinaryTag
+
+
+def py_compile(s: str):
+    return list(
+        py_tagger.tag_compiler(iter(py_tagger.ascii_tags_loader(StringIO(s))))
+    )
+
+
+def cy_compile(s: str):
+    return list(
+        cy_tagger.tag_compiler(iter(cy_tagger.ascii_tags_loader(StringIO(s))))
+    )
+
+
+SAMPLE = """999
+comment
+  0
+LINE
+  5
+FF
+ 62
+7
+ 40
+1.5
+ 70
+1.0
+ 10
+1
+ 20
+2
+ 30
+3
+ 11
+4
+ 21
+5
+ 12
+6
+ 22
+7
+310
+0102FF
+1000
+text
+  0
+EOF
+"""
+
+
+@pytest.mark.parametrize("skip_comments", [True, False])
+def test_ascii_tags_loader_is_equal(skip_comments):
+    py_tags = list(
+        py_tagger.ascii_tags_loader(StringIO(SAMPLE), skip_comments)
+    )
+    cy_tags = list(
+        cy_tagger.ascii_tags_loader(StringIO(SAMPLE), skip_comments)
+    )
+    assert py_tags == cy_tags
+
+
+def test_invalid_group_code_raises_structure_error():
+    with pytest.raises(DXFStructureError):
+        list(cy_tagger.ascii_tags_loader(StringIO("XX\nLINE\n")))
+
+
+def test_tag_compiler_is_equal():
+    py_tags = py_compile(SAMPLE)
+    cy_tags = cy_compile(SAMPLE)
+    assert py_tags == cy_tags
+    assert [type(tag) for tag in py_tags] == [type(tag) for tag in cy_tags]
+
+
+def test_ascii_tag_compiler_is_equal():
+    py_tags = py_compile(SAMPLE)
+    cy_tags = list(cy_tagger.ascii_tag_compiler(StringIO(SAMPLE)))
+    assert py_tags == cy_tags
+    assert [type(tag) for tag in py_tags] == [type(tag) for tag in cy_tags]
+
+
+def test_2d_point_at_the_end_of_the_tag_stream():
+    s = " 10\n1.0\n 20\n2.0\n"
+    assert py_compile(s) == [(10, (1, 2))]
+    assert cy_compile(s) == [(10, (1, 2))]
+    assert list(cy_tagger.ascii_tag_compiler(StringIO(s))) == [(10, (1, 2))]
+
+
+def test_ascii_tag_compiler_raises_structure_error():
+    with pytest.raises(DXFStructureError):
+        list(cy_tagger.ascii_tag_compiler(StringIO(" 10\n1\n 30\n2\n")))
+
+
+def test_tag_compiler_value_types():
+    tags = cy_compile(SAMPLE)
+    assert tags[0] == (0, "LINE")
+    assert tags[1] == (5, "FF")
+    assert tags[2] == (62, 7)
+    assert tags[3] == (40, 1.5)
+    assert tags[4] == (70, 1), "ProE stores int values as floats"
+    assert isinstance(tags[5], DXFVertex)
+    assert tags[5] == (10, (1, 2, 3))
+    assert tags[6] == (11, (4, 5)), "expected 2D point, z-axis missing"
+    assert isinstance(tags[8], DXFBinaryTag)
+    assert tags[8].value == b"\x01\x02\xff"
+
+
+def test_missing_y_coordinate_raises_structure_error():
+    with pytest.raises(DXFStructureError):
+        cy_compile(" 10\n1\n 30\n2\n  0\nEOF\n")
+
+
+def test_invalid_float_raises_structure_error():
+    with pytest.raises(DXFStructureError):
+        cy_compile(" 40\nX\n  0\nEOF\n")
+
+
+def test_invalid_int_raises_structure_error():
+    with pytest.raises(DXFStructureError):
+        cy_compile(" 62\nX\n  0\nEOF\n")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])